@@ -1,4 +1,5 @@
 import argparse
+import importlib
 import os
 import sys
 from traceback import print_exc
@@ -12,22 +13,7 @@ os.environ['PYTHONPATH'] = f'{MYS_DIR}/pygments:' + os.environ.get('PYTHONPATH',
 sys.path.insert(0, f'{MYS_DIR}/pygments')
 
 from ..version import __version__
-from .subparsers import build
-from .subparsers import clean
-from .subparsers import delete
-from .subparsers import dependents
-from .subparsers import deps
-from .subparsers import doc
-from .subparsers import help as help_
-from .subparsers import install
-from .subparsers import list as list_
-from .subparsers import new
-from .subparsers import publish
-from .subparsers import run
-from .subparsers import style
-from .subparsers import test
-from .subparsers import transpile
-from .utils import create_file
+from .files import create_file
 
 DESCRIPTION = f'''\
 The Mys programming language package manager.
@@ -38,6 +24,7 @@ Available subcommands are:
     {cyan('build')}       Build the appliaction.
     {cyan('run')}         Build and run the application.
     {cyan('test')}        Build and run tests
+    {cyan('bench')}       Build and run benchmarks.
     {cyan('clean')}       Remove build output.
     {cyan('doc')}         Build the documentation.
     {cyan('style')}       Code styling.
@@ -47,9 +34,34 @@ Available subcommands are:
     {cyan('list')}        Show packages in registry.
     {cyan('deps')}        Show dependencies.
     {cyan('dependents')}  Show dependents.
+    {cyan('daemon')}      Keep the transpiler loaded for faster builds.
 '''
 
 
+# Subcommands, with the same names as their modules in the subparsers
+# package. Only the module of the executed subcommand is imported, as
+# some of them import packages that are slow to import.
+SUBCOMMANDS = [
+    'new',
+    'build',
+    'run',
+    'test',
+    'bench',
+    'clean',
+    'style',
+    'doc',
+    'publish',
+    'delete',
+    'install',
+    'list',
+    'deps',
+    'dependents',
+    'transpile',
+    'daemon',
+    'help'
+]
+
+
 def find_config_file():
     path = os.getenv('MYS_CONFIG')
     config_dir = os.path.expanduser('~/.config/mys')
@@ -81,7 +93,33 @@ def load_mys_config():
         raise Exception(f"failed to load Mys configuration file '{path}'")
 
 
-def create_parser():
+def find_subcommand(argv):
+    """Returns the subcommand in given command line arguments, or None if
+    not found before any other argument than the global options.
+
+    """
+
+    argv = iter(argv)
+
+    for arg in argv:
+        if arg in ['-d', '--debug']:
+            continue
+        elif arg in ['-C', '--directory', '--config']:
+            next(argv, None)
+        elif arg.startswith('-'):
+            return None
+        else:
+            return arg
+
+    return None
+
+
+def create_parser(subcommand=None):
+    """Returns a parser for given subcommand, or for all subcommands if
+    None or unknown.
+
+    """
+
     parser = argparse.ArgumentParser(
         description=DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter)
@@ -99,28 +137,20 @@ def create_parser():
     subparsers = parser.add_subparsers(dest='subcommand',
                                        help='Subcommand to execute.',
                                        metavar='subcommand')
+    if subcommand in SUBCOMMANDS:
+        subcommands = [subcommand]
+    else:
+        subcommands = SUBCOMMANDS
 
-    new.add_subparser(subparsers)
-    build.add_subparser(subparsers)
-    run.add_subparser(subparsers)
-    test.add_subparser(subparsers)
-    clean.add_subparser(subparsers)
-    style.add_subparser(subparsers)
-    doc.add_subparser(subparsers)
-    publish.add_subparser(subparsers)
-    delete.add_subparser(subparsers)
-    install.add_subparser(subparsers)
-    list_.add_subparser(subparsers)
-    deps.add_subparser(subparsers)
-    dependents.add_subparser(subparsers)
-    transpile.add_subparser(subparsers)
-    help_.add_subparser(subparsers)
+    for subcommand in subcommands:
+        importlib.import_module(f'.subparsers.{subcommand}',
+                                __name__).add_subparser(subparsers)
 
     return parser
 
 
 def main():
-    parser = create_parser()
+    parser = create_parser(find_subcommand(sys.argv[1:]))
     args = parser.parse_args()
 
     if not hasattr(args, 'func'):
@@ -0,0 +1,298 @@
+import array
+import contextlib
+import hashlib
+import io
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import traceback
+
+from ..version import __version__
+from .mys_dir import MYS_DIR
+
+DAEMON_CLIENT = os.path.join(MYS_DIR, 'cli', 'daemon_client.py')
+
+_PARSER = None
+
+
+def daemon_socket_path():
+    """Returns the path of the socket the daemon listens on. Unique per
+    mys installation, so Makefiles never use a daemon running another
+    version of mys.
+
+    """
+
+    path = os.getenv('MYS_DAEMON_SOCKET')
+
+    if path is not None:
+        return path
+
+    digest = hashlib.sha1(f'{MYS_DIR} {__version__}'.encode('utf-8'))
+
+    return os.path.expanduser(f'~/.cache/mys/daemon-{digest.hexdigest()[:12]}.sock')
+
+
+def connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+
+        raise
+
+    return sock
+
+
+def is_daemon_running(path):
+    try:
+        connect(path).close()
+    except OSError:
+        return False
+
+    return True
+
+
+def send_stop_request(path):
+    sock = connect(path)
+    request = json.dumps({'command': 'stop'}).encode('utf-8')
+    sock.sendall(b'%08d' % len(request) + request)
+    sock.recv(1)
+    sock.close()
+
+
+def receive_request(conn):
+    """Returns the request and file descriptors sent by the client, or
+    None if the client did not send a request, for example when only
+    checking if the daemon is running.
+
+    """
+
+    fds = array.array('i')
+    header, ancdata, _, _ = conn.recvmsg(8, socket.CMSG_LEN(2 * fds.itemsize))
+
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+
+    if len(header) != 8:
+        for fd in fds:
+            os.close(fd)
+
+        return None, []
+
+    size = int(header)
+    data = b''
+
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+
+        if not chunk:
+            break
+
+        data += chunk
+
+    return json.loads(data), list(fds)
+
+
+def is_peer_allowed(conn):
+    """Returns True if given connection is from a process run by the
+    same user as the daemon. Only the socket file permissions protect
+    the daemon on platforms without SO_PEERCRED.
+
+    """
+
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True
+
+    credentials = conn.getsockopt(socket.SOL_SOCKET,
+                                  socket.SO_PEERCRED,
+                                  struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', credentials)
+
+    return uid == os.getuid()
+
+
+def parse_transpile_arguments(argv):
+    """Returns parsed arguments of given transpile command, or None if
+    given arguments are not a valid transpile command. No other
+    commands are run by the daemon.
+
+    """
+
+    global _PARSER
+
+    if _PARSER is None:
+        from . import create_parser
+
+        _PARSER = create_parser('transpile')
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            with contextlib.redirect_stderr(io.StringIO()):
+                args = _PARSER.parse_args(argv)
+    except SystemExit:
+        return None
+
+    if args.subcommand != 'transpile':
+        return None
+
+    return args
+
+
+def add_parsed_trees(request, args):
+    """Parse the sources of given transpile request in the daemon, so
+    they are parsed once instead of once per request.
+
+    """
+
+    from ..transpiler import add_parsed_tree
+
+    directory = request['cwd']
+
+    if args.directory is not None:
+        directory = os.path.join(directory, args.directory)
+
+    for package_path, mysfile in zip(args.package_path, args.mysfiles):
+        mys_path = os.path.join(package_path, 'src', mysfile)
+
+        try:
+            with open(os.path.join(directory, mys_path), 'r') as fin:
+                add_parsed_tree(mys_path, fin.read())
+        except OSError:
+            pass
+
+
+def run_command(conn, request, fds):
+    """Run given command in this forked process and send its exit code to
+    the client.
+
+    """
+
+    from . import main
+
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(fds[0], 1)
+    os.dup2(fds[1], 2)
+    os.chdir(request['cwd'])
+    os.environ.clear()
+    os.environ.update(request['env'])
+    sys.argv = ['mys'] + request['argv']
+
+    try:
+        main()
+        code = 0
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.sendall(str(code).encode('utf-8'))
+
+
+def reject_request(conn, fds):
+    """Reject given request, which is not a transpile command.
+
+    """
+
+    if len(fds) == 2:
+        os.write(fds[1], b'error: the mys daemon only runs transpile commands\n')
+
+    conn.sendall(b'1')
+    conn.close()
+
+    for fd in fds:
+        os.close(fd)
+
+
+def serve(path):
+    """Run commands sent by clients until stopped. Each command is run in
+    a forked process, which inherits everything already imported and
+    parsed.
+
+    """
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    # Only the user running the daemon may connect to it, also while
+    # binding.
+    umask = os.umask(0o077)
+
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+
+    server.listen(64)
+    print(f'Serving on {path}.', flush=True)
+
+    # Forked processes are not waited for.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+
+            if not is_peer_allowed(conn):
+                conn.close()
+                continue
+
+            try:
+                request, fds = receive_request(conn)
+            except Exception:
+                conn.close()
+                continue
+
+            if request is None:
+                conn.close()
+                continue
+
+            if request['command'] == 'stop':
+                conn.sendall(b'0')
+                conn.close()
+                break
+
+            args = parse_transpile_arguments(request['argv'])
+
+            if args is None or len(fds) != 2:
+                reject_request(conn, fds)
+                continue
+
+            add_parsed_trees(request, args)
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            if os.fork() == 0:
+                try:
+                    server.close()
+                    run_command(conn, request, fds)
+                finally:
+                    os._exit(0)
+
+            conn.close()
+
+            for fd in fds:
+                os.close(fd)
+    finally:
+        server.close()
+        os.remove(path)
@@ -0,0 +1,65 @@
+"""Thin client running a mys command in the daemon, used by generated
+Makefiles instead of starting a new mys process per command. Runs as
+a script with as few imports as possible for a fast startup.
+
+Usage: python -S daemon_client.py <socket> <mys arguments>
+
+The command is run by a new mys process if the daemon is not running.
+
+"""
+
+import array
+import json
+import os
+import socket
+import sys
+
+
+def send_request(sock, request):
+    """The length of the request is sent together with the standard
+    output and error file descriptors, which the command writes to.
+
+    """
+
+    request = json.dumps(request).encode('utf-8')
+    fds = array.array('i', [1, 2])
+    sock.sendmsg([b'%08d' % len(request)],
+                 [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+    sock.sendall(request)
+
+
+def main():
+    path = sys.argv[1]
+    argv = sys.argv[2:]
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        sock.connect(path)
+    except OSError:
+        os.execv(sys.executable, [sys.executable, '-m', 'mys'] + argv)
+
+    send_request(sock,
+                 {
+                     'command': 'run',
+                     'cwd': os.getcwd(),
+                     'argv': argv,
+                     'env': dict(os.environ)
+                 })
+    response = b''
+
+    while True:
+        data = sock.recv(64)
+
+        if not data:
+            break
+
+        response += data
+
+    if not response:
+        sys.exit('mys daemon exited before the command finished')
+
+    sys.exit(int(response))
+
+
+if __name__ == '__main__':
+    main()
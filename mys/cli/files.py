@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+
+def create_file(path, data):
+    with open(path, 'w') as fout:
+        fout.write(data)
+
+
+def create_file_if_changed(path, data):
+    """Create given file only if it does not already exist with given
+    data, keeping the modification time of unchanged files so make
+    does not rebuild everything depending on them.
+
+    """
+
+    try:
+        with open(path, 'r') as fin:
+            if fin.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+
+    # A unique temporary file, as several processes may write the same
+    # file at the same time.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+
+    try:
+        with os.fdopen(fd, 'w') as fout:
+            fout.write(data)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+
+        raise
@@ -0,0 +1,212 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from ..version import __version__
+from .mys_dir import MYS_DIR
+
+# Environment variables read by mys when building. Variables read by
+# make are found in the Makefile.
+ENVIRONMENT_VARIABLES = [
+    'CC',
+    'CXX',
+    'CFLAGS',
+    'PKG_CONFIG_PATH'
+]
+
+RE_MAKEFILE_VARIABLE = re.compile(r'\$\(([A-Z_][A-Z0-9_]*)[:)]')
+RE_MAKEFILE_ASSIGNMENT = re.compile(r'^([A-Z_][A-Z0-9_]*)\s*:?=')
+RE_MAKEFILE_CONDITIONAL = re.compile(r'^(ifeq|ifneq|ifdef|ifndef)\b')
+
+# Files in the mys installation the build depends on. The transpiler
+# and the parser generate the C++ sources, the command line interface
+# and its templates the Makefile, and the library is compiled into
+# the build.
+MYS_INPUT_PATTERNS = [
+    'lib/**/*.[ch]',
+    'lib/**/*.[ch]pp',
+    'transpiler/**/*.py',
+    'parser/*.py',
+    'parser/*.so',
+    'cli/*.py',
+    'cli/subparsers/*.py',
+    'cli/templates/build/**'
+]
+
+# Build configuration not changing the build output.
+IGNORED_BUILD_CONFIG = [
+    'verbose',
+    'jobs',
+    'timings',
+    'download',
+    'url'
+]
+
+
+def fingerprint_path(build_dir):
+    return f'{build_dir}/fingerprint.json'
+
+
+def stat_file(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def find_tool(name):
+    path = shutil.which(name)
+
+    if path is not None:
+        path = os.path.realpath(path)
+
+    return [path, stat_file(path) if path is not None else None]
+
+
+def find_makefile_variables(path):
+    """Returns the names of all variables read by given Makefile that
+    may be set in the environment, that is, all but those always
+    assigned by the Makefile itself.
+
+    """
+
+    try:
+        with open(path) as fin:
+            lines = fin.read().splitlines()
+    except OSError:
+        return []
+
+    variables = set()
+    assigned = set()
+    depth = 0
+
+    for line in lines:
+        variables.update(RE_MAKEFILE_VARIABLE.findall(line))
+
+        if RE_MAKEFILE_CONDITIONAL.match(line):
+            depth += 1
+        elif line.startswith('endif'):
+            depth -= 1
+        elif depth == 0:
+            mo = RE_MAKEFILE_ASSIGNMENT.match(line)
+
+            if mo:
+                assigned.add(mo.group(1))
+
+    return sorted(variables - assigned)
+
+
+def create_key(build_config, build_dir):
+    """Returns a hash of everything but the sources the build depends on:
+    the mys installation, the build configuration, the environment and
+    the compiler, which is identified by its path and modification
+    time instead of running it, as that is slow.
+
+    """
+
+    environment_variables = (
+        ENVIRONMENT_VARIABLES
+        + find_makefile_variables(f'{build_dir}/Makefile'))
+
+    key = {
+        'mys': [__version__, MYS_DIR],
+        'build-config': {
+            name: value
+            for name, value in sorted(vars(build_config).items())
+            if name not in IGNORED_BUILD_CONFIG
+        },
+        'environment': {
+            name: os.getenv(name)
+            for name in environment_variables
+        },
+        'tools': [
+            find_tool(os.getenv('CXX', 'g++')),
+            find_tool('ccache'),
+            find_tool('make')
+        ]
+    }
+
+    return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+
+
+def find_input_paths(package_paths):
+    """Returns all files and directories in given packages the build
+    depends on. Directories are included to notice added and removed
+    files.
+
+    """
+
+    paths = ['package.lock']
+
+    for pattern in MYS_INPUT_PATTERNS:
+        paths += glob.glob(os.path.join(MYS_DIR, pattern), recursive=True)
+
+    for package_path in package_paths:
+        paths.append(os.path.join(package_path, 'package.toml'))
+
+        for name in ['src', 'assets']:
+            for root, _, files in os.walk(os.path.join(package_path, name)):
+                paths.append(root)
+
+                for file in files:
+                    paths.append(os.path.join(root, file))
+
+    return paths
+
+
+def stat_inputs(package_paths):
+    return {
+        path: stat_file(path)
+        for path in find_input_paths(package_paths)
+    }
+
+
+def write_fingerprint(build_config, build_dir, is_application, inputs, outputs):
+    """Write a fingerprint of given build to the build directory. Inputs
+    must be found before building, so changes made while building
+    are noticed in the next build.
+
+    """
+
+    fingerprint = {
+        'key': create_key(build_config, build_dir),
+        'is-application': is_application,
+        'inputs': inputs,
+        'outputs': {path: stat_file(path) for path in outputs}
+    }
+
+    with open(fingerprint_path(build_dir), 'w') as fout:
+        json.dump(fingerprint, fout)
+
+
+def remove_fingerprint(build_dir):
+    if os.path.exists(fingerprint_path(build_dir)):
+        os.remove(fingerprint_path(build_dir))
+
+
+def check_fingerprint(build_config, build_dir):
+    """Returns if given build is an application if nothing has changed
+    since its fingerprint was written, otherwise None.
+
+    """
+
+    try:
+        with open(fingerprint_path(build_dir)) as fin:
+            fingerprint = json.load(fin)
+    except (OSError, ValueError):
+        return None
+
+    if fingerprint['key'] != create_key(build_config, build_dir):
+        return None
+
+    for files in [fingerprint['inputs'], fingerprint['outputs']]:
+        for path, stat in files.items():
+            if stat_file(path) != stat:
+                return None
+
+    return fingerprint['is-application']
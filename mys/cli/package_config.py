@@ -3,7 +3,6 @@ import re
 
 import toml
 
-from ..transpiler.utils import is_snake_case
 from .mys_dir import MYS_DIR
 
 RE_SEMANTIC_VERSION = re.compile(
@@ -16,10 +15,19 @@ RE_SEMANTIC_VERSION = re.compile(
     r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$")
 
 
+# Same as names of functions and variables. Not imported from the
+# transpiler, as it is slow to import.
+RE_SNAKE_CASE = re.compile(r'^(_*[a-z][a-z0-9_]*)$')
+
+
 def is_semantic_version(version):
     return RE_SEMANTIC_VERSION.match(version) is not None
 
 
+def is_snake_case(value):
+    return RE_SNAKE_CASE.match(value) is not None
+
+
 class Author:
 
     def __init__(self, name, email):
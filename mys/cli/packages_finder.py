@@ -1,10 +1,10 @@
 import glob
+import hashlib
 import os
 import shutil
-import tarfile
+import tempfile
 
-import fasteners
-import requests
+import toml
 from xdg import xdg_cache_home
 
 from .package_config import PackageConfig
@@ -12,7 +12,10 @@ from .run import Spinner
 
 DOWNLOAD_DIRECTORY = 'build/dependencies'
 DOWNLOADS_CACHE_DIRECTORY = xdg_cache_home() / 'mys/downloads'
-LOCKFILE_PATH = xdg_cache_home() / 'mys/.lockfile'
+PACKAGE_LOCK_PATH = 'package.lock'
+
+# Maximum number of packages downloaded at the same time.
+DOWNLOAD_JOBS = 8
 
 
 class UpdateSpinnerStatus:
@@ -24,53 +27,173 @@ class UpdateSpinnerStatus:
         self.spinner.text = f'Downloading {path}'
 
 
-def rename_one_matching(pattern, to):
+def find_one_matching(pattern):
     paths = glob.glob(pattern)
 
     if len(paths) != 1:
         raise Exception(
             f'{len(paths)} paths are matching when expecting exactly one to match')
 
-    os.rename(paths[0], to)
+    return paths[0]
+
+
+def is_within_directory(directory, target):
+    abs_directory = os.path.abspath(directory)
+    abs_target = os.path.abspath(target)
+    prefix = os.path.commonprefix([abs_directory, abs_target])
+
+    return prefix == abs_directory
+
+
+def safe_extract(tar, path):
+    for member in tar.getmembers():
+        member_path = os.path.join(path, member.name)
+
+        if not is_within_directory(path, member_path):
+            raise Exception("Attempted Path Traversal in Tar File")
+
+    tar.extractall(path)
+
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+
+    with open(path, 'rb') as fin:
+        for chunk in iter(lambda: fin.read(65536), b''):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def write_to_cache(path, data):
+    """Atomically write given data to given path in the downloads cache,
+    so other processes hashing or extracting the file never see it
+    partially written.
+
+    """
+
+    DOWNLOADS_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=DOWNLOADS_CACHE_DIRECTORY)
+
+    try:
+        with os.fdopen(fd, 'wb') as fout:
+            fout.write(data)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+
+        raise
+
+
+def extract_to_cache(archive_path):
+    """Returns the package root of given archive extracted in the
+    downloads cache. Extracted archives are stored by the hash of
+    their contents, so all projects share them and each archive is
+    only extracted once.
+
+    """
+
+    extracted_directory = DOWNLOADS_CACHE_DIRECTORY / 'extracted'
+    package_directory = extracted_directory / hash_file(archive_path)
+
+    if not package_directory.exists():
+        extracted_directory.mkdir(parents=True, exist_ok=True)
+        tmp_directory = tempfile.mkdtemp(dir=extracted_directory)
 
+        # Imported here as it is slow to import and only needed when
+        # extracting.
+        import tarfile
 
-def prepare_download_dependency_from_registry(name, version):
-    archive = f'{name}-{version}.tar.gz'
-    archive_path = f'{DOWNLOAD_DIRECTORY}/{archive}'
+        try:
+            with tarfile.open(archive_path) as fin:
+                safe_extract(fin, tmp_directory)
 
-    return (name, version, archive, archive_path)
+            try:
+                os.rename(tmp_directory, package_directory)
+            except OSError:
+                # Extracted by another process.
+                pass
+        finally:
+            shutil.rmtree(tmp_directory, ignore_errors=True)
 
+    return os.path.abspath(find_one_matching(f'{package_directory}/*/'))
 
-def extract_dependency(name, version, archive_path):
-    if version == 'latest':
-        rename_one_matching(os.path.join(DOWNLOAD_DIRECTORY, f'{name}-*.tar.gz'),
-                            archive_path)
 
-    with tarfile.open(archive_path) as fin:
-        def is_within_directory(directory, target):
-            
-            abs_directory = os.path.abspath(directory)
-            abs_target = os.path.abspath(target)
-        
-            prefix = os.path.commonprefix([abs_directory, abs_target])
-            
-            return prefix == abs_directory
-        
-        def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-        
-            for member in tar.getmembers():
-                member_path = os.path.join(path, member.name)
-                if not is_within_directory(path, member_path):
-                    raise Exception("Attempted Path Traversal in Tar File")
-        
-            tar.extractall(path, members, numeric_owner=numeric_owner) 
-            
-        
-        safe_extract(fin, DOWNLOAD_DIRECTORY)
+def find_archive_hash(name, from_version):
+    """Returns the hash of the archive given registry dependency was
+    extracted from, which is part of its location in the downloads
+    cache.
 
-    if version == 'latest':
-        rename_one_matching(os.path.join(DOWNLOAD_DIRECTORY, f'{name}-*/'),
-                            os.path.join(DOWNLOAD_DIRECTORY, f'{name}-latest'))
+    """
+
+    dependency_root = os.path.join(DOWNLOAD_DIRECTORY, f'{name}-{from_version}')
+
+    if os.path.islink(dependency_root):
+        return os.path.basename(os.path.dirname(os.readlink(dependency_root)))
+
+    archive_cache_path = DOWNLOADS_CACHE_DIRECTORY / f'{name}-{from_version}.tar.gz'
+
+    if not archive_cache_path.exists():
+        raise Exception(
+            f"Archive of package '{name}' not found in downloads cache.")
+
+    return hash_file(archive_cache_path)
+
+
+def get_dependencies(config):
+    """Returns given package's dependencies, except fiber, which all
+    packages depend on.
+
+    """
+
+    return {
+        name: info
+        for name, info in config['dependencies'].items()
+        if name != 'fiber'
+    }
+
+
+def write_package_lock(config, dependencies_configs):
+    """Write package.lock with exact versions and archive hashes of all
+    dependencies of given package, so following builds do not have to
+    find them.
+
+    """
+
+    packages = []
+
+    for dependency_config in dependencies_configs:
+        if dependency_config.name == 'fiber':
+            continue
+
+        package = {'name': dependency_config.name}
+
+        if isinstance(dependency_config.from_version, str):
+            package['from-version'] = dependency_config.from_version
+            package['version'] = dependency_config.version
+            package['sha256'] = find_archive_hash(dependency_config.name,
+                                                  dependency_config.from_version)
+        else:
+            package['path'] = dependency_config.path
+
+        package['dependencies'] = list(get_dependencies(dependency_config))
+        packages.append(package)
+
+    with open(PACKAGE_LOCK_PATH, 'w') as fout:
+        fout.write('# Generated by mys deps --lock.\n\n')
+        fout.write(toml.dumps({
+            'dependencies': get_dependencies(config),
+            'package': packages
+        }))
+
+
+def read_package_lock():
+    try:
+        with open(PACKAGE_LOCK_PATH) as fin:
+            return toml.loads(fin.read())
+    except FileNotFoundError:
+        return None
 
 
 class PackagesFinder:
@@ -81,19 +204,30 @@ class PackagesFinder:
         self.config = None
         self.handled_dependencies = None
         self.dependencies_configs = None
+        self.session = None
+
+    def find_dependency_dependencies(self, configs):
+        """Returns not yet handled dependencies of given packages. The
+        latest version is used for them.
+
+        """
 
-    def download_dependency_dependencies(self, config):
         packages = []
 
-        for name in config['dependencies']:
-            if name not in self.handled_dependencies:
-                self.handled_dependencies.append(name)
-                packages.append(
-                    prepare_download_dependency_from_registry(name, 'latest'))
+        for config in configs:
+            for name in config['dependencies']:
+                if name not in self.handled_dependencies:
+                    self.handled_dependencies.append(name)
+                    packages.append((name, 'latest'))
+
+        return packages
 
-        self.download_and_extract_dependencies(packages)
+    def download_dependency(self, name, archive, callback=None):
+        """Download given archive to the downloads cache, if not already
+        there. Called concurrently by multiple threads.
+
+        """
 
-    def download_dependency(self, name, archive, archive_path, callback=None):
         archive_cache_path = DOWNLOADS_CACHE_DIRECTORY / archive
 
         if self.download or not archive_cache_path.exists():
@@ -102,34 +236,150 @@ class PackagesFinder:
             if callback is not None:
                 callback(path)
 
-            response = requests.get(path)
+            response = self.session.get(path)
 
             if response.status_code != 200:
                 print(response.text)
 
                 raise Exception(f"Package download failed of package '{name}'.")
 
-            DOWNLOADS_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
-
-            with fasteners.InterProcessLock(LOCKFILE_PATH):
-                with open(archive_cache_path, 'wb') as fout:
-                    fout.write(response.content)
+            write_to_cache(archive_cache_path, response.content)
 
         if not archive_cache_path.exists():
             raise Exception(f"Package '{name}' not found in downloads cache.")
 
-        with fasteners.InterProcessLock(LOCKFILE_PATH):
-            shutil.copy(archive_cache_path, archive_path)
+        return archive_cache_path
+
+    def download_dependencies(self, packages, callback=None):
+        """Download given packages concurrently, sharing connections. Returns
+        the archive paths in the downloads cache.
+
+        """
+
+        # Imported here as they are slow to import and only needed
+        # when downloading.
+        from concurrent.futures import ThreadPoolExecutor
+
+        import requests
+
+        with requests.Session() as self.session:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=DOWNLOAD_JOBS)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+
+            with ThreadPoolExecutor(DOWNLOAD_JOBS) as pool:
+                futures = [
+                    pool.submit(self.download_dependency,
+                                name,
+                                f'{name}-{version}.tar.gz',
+                                callback)
+                    for name, version in packages
+                ]
+
+                return [future.result() for future in futures]
+
+    def link_locked_dependency(self, package):
+        """Make given locked registry package available in the download
+        directory, downloading the exact locked version if not in the
+        downloads cache. Returns its root directory.
+
+        """
+
+        name = package['name']
+        dependency_root = os.path.join(DOWNLOAD_DIRECTORY,
+                                       f'{name}-{package["from-version"]}')
+
+        if os.path.islink(dependency_root):
+            if os.path.exists(dependency_root):
+                if find_archive_hash(name, package['from-version']) == package['sha256']:
+                    return dependency_root
+
+            os.remove(dependency_root)
+        elif os.path.exists(dependency_root):
+            shutil.rmtree(dependency_root)
+
+        package_directory = DOWNLOADS_CACHE_DIRECTORY / 'extracted' / package['sha256']
+
+        if package_directory.exists():
+            archive_root = find_one_matching(f'{package_directory}/*/')
+        else:
+            archive_path = self.download_dependencies(
+                [(name, package['version'])])[0]
+
+            if hash_file(archive_path) != package['sha256']:
+                raise Exception(
+                    f"Archive of package '{name}' does not match its hash in "
+                    f"{PACKAGE_LOCK_PATH}.")
+
+            archive_root = extract_to_cache(archive_path)
+
+        os.symlink(os.path.abspath(archive_root), dependency_root)
+
+        return dependency_root
+
+    def find_locked(self, lock):
+        """Returns dependencies as locked in given lock, or None if the lock
+        does not match the package's dependencies, for example as a
+        dependency was added after it was written.
+
+        """
+
+        if lock.get('dependencies') != get_dependencies(self.config):
+            return None
+
+        self.dependencies_configs = []
+        self.load_package_config(self.config['dependencies']['fiber']['path'],
+                                 self.config['dependencies']['fiber'])
+
+        for package in lock.get('package', []):
+            if 'path' in package:
+                package_config = self.load_package_config(
+                    package['path'],
+                    self.config['dependencies'].get(package['name']))
+
+                if list(get_dependencies(package_config)) != package['dependencies']:
+                    return None
+            else:
+                self.load_package_config(self.link_locked_dependency(package),
+                                         package['from-version'])
+
+        return self.dependencies_configs
 
     def download_and_extract_dependencies(self, packages, callback=None):
-        for name, version, archive, archive_path in packages:
-            if not os.path.exists(archive_path):
-                self.download_dependency(name, archive, archive_path, callback)
-                extract_dependency(name, version, archive_path)
+        """Make given registry packages available in the download directory,
+        as links to their extracted archives in the downloads cache.
+        Returns their configurations.
+
+        """
 
+        missing_packages = []
+
+        for name, version in packages:
             dependency_root = os.path.join(DOWNLOAD_DIRECTORY, f'{name}-{version}')
-            self.download_dependency_dependencies(
-                self.load_package_config(dependency_root, version))
+
+            if os.path.exists(dependency_root):
+                continue
+
+            # The link is broken if the downloads cache was removed.
+            if os.path.islink(dependency_root):
+                os.remove(dependency_root)
+
+            missing_packages.append((name, version))
+
+        if missing_packages:
+            archive_paths = self.download_dependencies(missing_packages, callback)
+
+            for (name, version), archive_path in zip(missing_packages,
+                                                     archive_paths):
+                os.symlink(extract_to_cache(archive_path),
+                           os.path.join(DOWNLOAD_DIRECTORY, f'{name}-{version}'))
+
+        return [
+            self.load_package_config(
+                os.path.join(DOWNLOAD_DIRECTORY, f'{name}-{version}'),
+                version)
+            for name, version in packages
+        ]
 
     def load_package_config(self, path, from_version):
         package_config = PackageConfig(path, from_version)
@@ -137,31 +387,65 @@ class PackagesFinder:
 
         return package_config
 
-    def find(self, config):
+    def find(self, config, lock):
+        """Find all dependencies of given package, one level at a time, as
+        dependencies of dependencies are only known once they have
+        been downloaded. All packages of a level are downloaded at
+        the same time.
+
+        Given lock is used instead if it matches the package's
+        dependencies.
+
+        """
+
         self.config = config
         self.handled_dependencies = list(self.config['dependencies'])
         self.dependencies_configs = []
         message = "Downloading dependencies"
 
         with Spinner(text=message) as spinner:
+            if lock is not None:
+                dependencies_configs = self.find_locked(lock)
+
+                if dependencies_configs is not None:
+                    return dependencies_configs
+
+                self.dependencies_configs = []
+
+            callback = UpdateSpinnerStatus(spinner)
             packages = []
+            configs = []
 
             for name, info in self.config['dependencies'].items():
                 if isinstance(info, str):
-                    packages.append(
-                        prepare_download_dependency_from_registry(name, info))
+                    packages.append((name, info))
                 else:
-                    self.download_dependency_dependencies(
-                        self.load_package_config(info['path'], info))
+                    configs.append(self.load_package_config(info['path'], info))
+
+            configs += self.download_and_extract_dependencies(packages, callback)
+
+            while configs:
+                packages = self.find_dependency_dependencies(configs)
+                configs = self.download_and_extract_dependencies(packages,
+                                                                 callback)
 
-            self.download_and_extract_dependencies(packages,
-                                                   UpdateSpinnerStatus(spinner))
             spinner.text = message
 
         return self.dependencies_configs
 
 
-def download_dependencies(config, url, download):
+def download_dependencies(config, url, download, use_lock=True):
+    """Returns configurations of all dependencies of given package. They
+    are found using package.lock, if any and use_lock is True, unless
+    dependencies are downloaded again.
+
+    """
+
+    if use_lock and not download:
+        lock = read_package_lock()
+    else:
+        lock = None
+
     package_finder = PackagesFinder(url, download)
 
-    return package_finder.find(config)
+    return package_finder.find(config, lock)
@@ -3,10 +3,8 @@ import subprocess
 import sys
 import time
 
-import yaspin
 from colors import green
 from colors import red
-from humanfriendly import format_timespan
 
 
 class Duration:
@@ -15,6 +13,9 @@ class Duration:
         self.start_time = time.time()
 
     def stop(self):
+        # Imported here as it is slow to import.
+        from humanfriendly import format_timespan
+
         end_time = time.time()
         duration = format_timespan(end_time - self.start_time)
 
@@ -41,17 +42,27 @@ def format_result(ok, message):
         return format_result_fail(message)
 
 
-class _Spinner(yaspin.api.Yaspin):
+def _create_spinner(text):
+    """Returns a spinner. yaspin is imported here as it is slow to import
+    and only needed when standard output is a terminal.
 
-    def __init__(self, text):
-        super().__init__(yaspin.Spinner(SPINNER, 80), text=text, color='yellow')
-        self._duration = Duration()
+    """
 
-    def __exit__(self, exc_type, exc_val, traceback):
-        duration = self._duration.stop()
-        self.write(format_result(exc_type is None, self.text + duration))
+    import yaspin
+
+    class _Spinner(yaspin.api.Yaspin):
+
+        def __init__(self, text):
+            super().__init__(yaspin.Spinner(SPINNER, 80), text=text, color='yellow')
+            self._duration = Duration()
+
+        def __exit__(self, exc_type, exc_val, traceback):
+            duration = self._duration.stop()
+            self.write(format_result(exc_type is None, self.text + duration))
 
-        return super().__exit__(exc_type, exc_val, traceback)
+            return super().__exit__(exc_type, exc_val, traceback)
+
+    return _Spinner(text)
 
 
 class Spinner:
@@ -61,7 +72,7 @@ class Spinner:
         self._duration = Duration()
 
         if sys.stdout.isatty():
-            self._spinner = _Spinner(text)
+            self._spinner = _create_spinner(text)
         else:
             self._spinner = None
 
@@ -93,32 +104,89 @@ class Spinner:
             return self._spinner.__exit__(exc_type, exc_val, traceback)
 
 
-def get_status(status_path, default):
-    status = default
+def parse_status_line(line, default_time):
+    """Returns the kind, time and message of given status line. Lines are
+    '<kind> <seconds since the epoch> <message>'. Given default time
+    is used for lines without a time.
+
+    """
+
+    kind = line[0]
+    parts = line[2:].split(' ', 1)
 
     try:
-        messages = []
+        return kind, float(parts[0]), parts[1]
+    except (ValueError, IndexError):
+        return kind, default_time, line[2:]
 
-        with open(status_path) as fin:
-            for line in fin:
-                line = line.strip()
 
-                if line[0] == '>':
-                    messages.append(line[2:])
-                else:
-                    messages.remove(line[2:])
+class Status:
+    """Build status read from given file, which make and the test and
+    benchmark executables append lines to. A line starting with '>'
+    starts an operation and a line starting with '<' ends it. Each line
+    has the time it was written.
 
-        if len(messages) == 1:
-            status = messages[-1]
-        else:
-            status = f'{messages[-1]} ({len(messages)} ongoing)'
-    except Exception:
-        pass
+    Only lines appended since the previous update are read. Ended
+    operations are added to given timings list, if any, as (message,
+    start time, end time) tuples.
+
+    """
 
-    return status
+    def __init__(self, path, timings=None):
+        self._path = path
+        self._offset = 0
+        self._partial_line = b''
+        self._ongoing = {}
+        self._timings = timings
 
+    def update(self):
+        if self._path is None:
+            return
 
-def run_verbose(command, message, env, status_path, message_as_final):
+        try:
+            with open(self._path, 'rb') as fin:
+                fin.seek(self._offset)
+                data = fin.read()
+        except OSError:
+            return
+
+        if not data:
+            return
+
+        now = time.time()
+        self._offset += len(data)
+        lines = (self._partial_line + data).split(b'\n')
+        self._partial_line = lines.pop()
+
+        for line in lines:
+            line = line.decode('utf-8', 'replace').strip()
+
+            if not line:
+                continue
+
+            kind, line_time, message = parse_status_line(line, now)
+
+            if kind == '>':
+                self._ongoing[message] = line_time
+            else:
+                start_time = self._ongoing.pop(message, None)
+
+                if start_time is not None and self._timings is not None:
+                    self._timings.append((message, start_time, line_time))
+
+    def get(self, default):
+        if not self._ongoing:
+            return default
+
+        message = next(reversed(self._ongoing))
+
+        if len(self._ongoing) == 1:
+            return message
+        else:
+            return f'{message} ({len(self._ongoing)} ongoing)'
+
+
+def run_verbose(command, message, env, status, message_as_final):
     duration = Duration()
 
     try:
@@ -136,14 +204,16 @@ def run_verbose(command, message, env, status_path, message_as_final):
                 text = proc.stdout.readline()
                 print(text, end="")
                 output.append(text)
+                status.update()
 
             print(proc.stdout.read(), end="")
+            status.update()
 
             if proc.returncode != 0:
                 raise Exception(f'command failed with {proc.returncode}')
 
         if not message_as_final:
-            message = get_status(status_path, message)
+            message = status.get(message)
 
         print(format_result_ok(message + duration.stop()), flush=True)
 
@@ -153,7 +223,7 @@ def run_verbose(command, message, env, status_path, message_as_final):
         raise
 
 
-def run_with_spinner(command, message, env, status_path, message_as_final):
+def run_with_spinner(command, message, env, status, message_as_final):
     output = ''
 
     try:
@@ -166,15 +236,17 @@ def run_with_spinner(command, message, env, status_path, message_as_final):
                                   env=env) as proc:
 
                 while proc.poll() is None:
-                    spinner.text = get_status(status_path, spinner.text)
+                    status.update()
+                    spinner.text = status.get(spinner.text)
                     time.sleep(0.1)
 
                 output = proc.stdout.read()
+                status.update()
 
                 if message_as_final:
                     spinner.text = message
                 else:
-                    spinner.text = get_status(status_path, spinner.text)
+                    spinner.text = status.get(spinner.text)
 
                 if proc.returncode != 0:
                     raise Exception(f'command failed with {proc.returncode}')
@@ -192,12 +264,20 @@ def run_with_spinner(command, message, env, status_path, message_as_final):
     return output
 
 
-def run(command, message, verbose, env=None, status_path=None, message_as_final=True):
+def run(command,
+        message,
+        verbose,
+        env=None,
+        status_path=None,
+        message_as_final=True,
+        timings=None):
     if status_path is not None:
         if os.path.exists(status_path):
             os.remove(status_path)
 
+    status = Status(status_path, timings)
+
     if verbose:
-        return run_verbose(command, message, env, status_path, message_as_final)
+        return run_verbose(command, message, env, status, message_as_final)
     else:
-        return run_with_spinner(command, message, env, status_path, message_as_final)
+        return run_with_spinner(command, message, env, status, message_as_final)
@@ -0,0 +1,114 @@
+import os
+
+from ..run import run
+from ..utils import BuildConfig
+from ..utils import add_download_argument
+from ..utils import add_jobs_argument
+from ..utils import add_lto_argument
+from ..utils import add_no_ccache_argument
+from ..utils import add_optimize_argument
+from ..utils import add_timings_argument
+from ..utils import add_unity_argument
+from ..utils import add_url_argument
+from ..utils import add_verbose_argument
+from ..utils import build_prepare
+from ..utils import print_timings
+
+
+def do_bench(_parser, args, _mys_config):
+    build_config = BuildConfig(args.debug,
+                               args.verbose,
+                               args.optimize,
+                               False,
+                               args.no_ccache,
+                               False,
+                               False,
+                               args.jobs,
+                               args.url,
+                               args.download,
+                               False,
+                               unity=args.unity,
+                               lto=args.lto,
+                               timings=args.timings)
+    _, build_dir, _ = build_prepare(build_config)
+
+    command = [
+        'make', '-f', f'{build_dir}/Makefile', 'bench', 'BENCH=yes'
+    ]
+
+    if os.getenv('MAKEFLAGS') is None:
+        command += ['-j', str(args.jobs)]
+
+    if args.debug:
+        command += ['TRANSPILE_DEBUG=--debug']
+
+    if args.optimize == 'debug':
+        command += ['TRACEBACK=yes']
+
+    if args.timings:
+        timings = []
+    else:
+        timings = None
+
+    status_path = f'{build_dir}/status.txt'
+    run(command,
+        'Building benchmarks',
+        args.verbose,
+        status_path=status_path,
+        timings=timings)
+    print_timings(timings)
+
+    if args.no_run:
+        return
+
+    command = [
+        f'./{build_dir}/bench', '-s', status_path, '--time', str(args.time)
+    ]
+
+    if args.json is not None:
+        command += ['--json', args.json]
+
+    if args.bench_pattern is not None:
+        command += [args.bench_pattern]
+
+    output = run(command,
+                 'Running benchmarks',
+                 args.verbose,
+                 status_path=status_path,
+                 message_as_final=False)
+
+    if not args.verbose:
+        print(output, end='')
+
+
+def add_subparser(subparsers):
+    subparser = subparsers.add_parser(
+        'bench',
+        description='Build and run benchmarks.')
+    add_verbose_argument(subparser)
+    add_jobs_argument(subparser)
+    add_optimize_argument(subparser, 'speed')
+    add_no_ccache_argument(subparser)
+    add_url_argument(subparser)
+    add_download_argument(subparser)
+    add_unity_argument(subparser)
+    add_timings_argument(subparser)
+    add_lto_argument(subparser)
+    subparser.add_argument(
+        '--no-run',
+        action='store_true',
+        help="Do not run the benchmarks, only build them.")
+    subparser.add_argument(
+        '-t', '--time',
+        type=float,
+        default=1.0,
+        help='Seconds to measure each benchmark (default: %(default)s).')
+    subparser.add_argument(
+        '--json',
+        help='Write results as JSON to given file.')
+    subparser.add_argument(
+        'bench_pattern',
+        nargs='?',
+        help=("Only run benchmarks matching given pattern. '^' matches the "
+              "beginning and '$' matches the end of the benchmark name."))
+    subparser.set_defaults(func=do_bench)
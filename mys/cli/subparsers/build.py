@@ -1,19 +1,24 @@
+from ..trace import Trace
 from ..utils import BuildConfig
 from ..utils import add_coverage_argument
 from ..utils import add_debug_symbols_argument
 from ..utils import add_download_argument
 from ..utils import add_jobs_argument
+from ..utils import add_lto_argument
 from ..utils import add_no_ccache_argument
 from ..utils import add_optimize_argument
 from ..utils import add_sanitize_argument
+from ..utils import add_timings_argument
+from ..utils import add_unity_argument
 from ..utils import add_unsafe_argument
 from ..utils import add_url_argument
 from ..utils import add_verbose_argument
-from ..utils import build_app
+from ..utils import build_app_if_changed
+from ..utils import build_pgo
 from ..utils import build_prepare
 
 
-def do_build(_parser, args, _mys_config):
+def build(args):
     build_config = BuildConfig(args.debug,
                                args.verbose,
                                args.optimize,
@@ -24,9 +29,25 @@ def do_build(_parser, args, _mys_config):
                                args.jobs,
                                args.url,
                                args.download,
-                               args.sanitize)
-    is_application, build_dir, _ = build_prepare(build_config)
-    build_app(build_config, is_application, build_dir)
+                               args.sanitize,
+                               unity=args.unity,
+                               lto=args.lto,
+                               pgo=args.pgo or args.pgo_train is not None,
+                               timings=args.timings)
+
+    if build_config.pgo:
+        is_application, build_dir, _ = build_prepare(build_config)
+        build_pgo(build_config, is_application, build_dir, args.pgo_train)
+    else:
+        build_app_if_changed(build_config)
+
+
+def do_build(_parser, args, _mys_config):
+    if args.trace is None:
+        build(args)
+    else:
+        with Trace(args.trace):
+            build(args)
 
 
 def add_subparser(subparsers):
@@ -43,4 +64,24 @@ def add_subparser(subparsers):
     add_coverage_argument(subparser)
     add_unsafe_argument(subparser)
     add_sanitize_argument(subparser)
+    add_unity_argument(subparser)
+    add_timings_argument(subparser)
+    add_lto_argument(subparser)
+    subparser.add_argument(
+        '--pgo',
+        action='store_true',
+        help=('Profile guided optimization. Builds an instrumented binary, '
+              'trains it and builds again using the collected profile.'))
+    subparser.add_argument(
+        '--pgo-train',
+        metavar='COMMAND',
+        help=('Shell command training the instrumented application, '
+              'build/<build>/app, instead of running the benchmarks. '
+              'Implies --pgo.'))
+    subparser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help=('Write when dependencies were downloaded, each transpile phase '
+              'and each compile and link was run to given file in Chrome\'s '
+              'trace event format.'))
     subparser.set_defaults(func=do_build)
@@ -0,0 +1,35 @@
+from ..daemon import daemon_socket_path
+from ..daemon import is_daemon_running
+from ..daemon import send_stop_request
+from ..daemon import serve
+
+
+def do_daemon(_parser, args, _mys_config):
+    path = daemon_socket_path()
+
+    if args.stop:
+        if not is_daemon_running(path):
+            raise Exception('the daemon is not running')
+
+        send_stop_request(path)
+    else:
+        if is_daemon_running(path):
+            raise Exception('the daemon is already running')
+
+        try:
+            serve(path)
+        except KeyboardInterrupt:
+            pass
+
+
+def add_subparser(subparsers):
+    subparser = subparsers.add_parser(
+        'daemon',
+        description=('Run mys commands sent by builds in this process, which '
+                     'keeps the transpiler loaded and sources parsed, instead '
+                     'of starting a new mys process per command. Used by '
+                     'builds started while the daemon is running.'))
+    subparser.add_argument('--stop',
+                           action='store_true',
+                           help='Stop the running daemon.')
+    subparser.set_defaults(func=do_daemon)
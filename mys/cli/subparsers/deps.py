@@ -1,4 +1,6 @@
+from ..packages_finder import PACKAGE_LOCK_PATH
 from ..packages_finder import download_dependencies
+from ..packages_finder import write_package_lock
 from ..utils import add_download_argument
 from ..utils import add_url_argument
 from ..utils import add_verbose_argument
@@ -47,8 +49,18 @@ def versions(url, download):
         print(f'{name} = "{current_version}"')
 
 
+def lock(url, download):
+    config = read_package_configuration()
+    setup_build(download)
+    dependencies_configs = download_dependencies(config, url, download, False)
+    write_package_lock(config, dependencies_configs)
+    print(f'Wrote {PACKAGE_LOCK_PATH}.')
+
+
 def do_deps(_parser, args, _mys_config):
-    if args.versions:
+    if args.lock:
+        lock(args.url, args.download)
+    elif args.versions:
         versions(args.url, args.download)
     else:
         show(args.url, args.download)
@@ -65,4 +77,10 @@ def add_subparser(subparsers):
         '--versions',
         action='store_true',
         help='Show all package versions currently used by this package.')
+    subparser.add_argument(
+        '--lock',
+        action='store_true',
+        help=('Find all dependencies and write their versions and archive '
+              'hashes to package.lock, which is then used by builds instead of '
+              'finding dependencies again.'))
     subparser.set_defaults(func=do_deps)
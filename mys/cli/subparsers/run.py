@@ -1,9 +1,6 @@
 import subprocess
 
 from colors import cyan
-from pygments import highlight
-from pygments.formatters import Terminal256Formatter
-from pygments.lexers import PythonLexer
 
 from ..utils import BULB
 from ..utils import BuildConfig
@@ -11,9 +8,12 @@ from ..utils import add_coverage_argument
 from ..utils import add_debug_symbols_argument
 from ..utils import add_download_argument
 from ..utils import add_jobs_argument
+from ..utils import add_lto_argument
 from ..utils import add_no_ccache_argument
 from ..utils import add_optimize_argument
 from ..utils import add_sanitize_argument
+from ..utils import add_timings_argument
+from ..utils import add_unity_argument
 from ..utils import add_unsafe_argument
 from ..utils import add_url_argument
 from ..utils import add_verbose_argument
@@ -33,6 +33,12 @@ def run_app(args, verbose, build_dir):
 
 
 def style_source(code):
+    # Imported here as it is slow to import and only needed when
+    # the package is not executable.
+    from pygments import highlight
+    from pygments.formatters import Terminal256Formatter
+    from pygments.lexers import PythonLexer
+
     return highlight(code,
                      PythonLexer(),
                      Terminal256Formatter(style='monokai')).rstrip()
@@ -49,7 +55,10 @@ def do_run(_parser, args, _mys_config):
                                args.jobs,
                                args.url,
                                args.download,
-                               args.sanitize)
+                               args.sanitize,
+                               unity=args.unity,
+                               lto=args.lto,
+                               timings=args.timings)
     is_application, build_dir, _ = build_prepare(build_config)
 
     if is_application:
@@ -88,5 +97,8 @@ def add_subparser(subparsers):
     add_coverage_argument(subparser)
     add_unsafe_argument(subparser)
     add_sanitize_argument(subparser)
+    add_unity_argument(subparser)
+    add_timings_argument(subparser)
+    add_lto_argument(subparser)
     subparser.add_argument('args', nargs='*')
     subparser.set_defaults(func=do_run)
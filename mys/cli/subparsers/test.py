@@ -1,4 +1,6 @@
+import argparse
 import os
+import re
 
 from ..run import run
 from ..utils import BuildConfig
@@ -8,11 +10,14 @@ from ..utils import add_jobs_argument
 from ..utils import add_no_ccache_argument
 from ..utils import add_optimize_argument
 from ..utils import add_sanitize_argument
+from ..utils import add_timings_argument
+from ..utils import add_unity_argument
 from ..utils import add_unsafe_argument
 from ..utils import add_url_argument
 from ..utils import add_verbose_argument
 from ..utils import build_prepare
 from ..utils import create_coverage_report
+from ..utils import print_timings
 
 
 def do_test(_parser, args, _mys_config):
@@ -26,7 +31,9 @@ def do_test(_parser, args, _mys_config):
                                args.jobs,
                                args.url,
                                args.download,
-                               args.sanitize)
+                               args.sanitize,
+                               unity=args.unity,
+                               timings=args.timings)
     _, build_dir, _ = build_prepare(build_config)
 
     command = [
@@ -53,14 +60,31 @@ def do_test(_parser, args, _mys_config):
     else:
         test_pattern = [args.test_pattern]
 
+    if args.timings:
+        timings = []
+    else:
+        timings = None
+
     status_path = f'{build_dir}/status.txt'
-    run(command, 'Building tests', args.verbose, status_path=status_path)
+    run(command,
+        'Building tests',
+        args.verbose,
+        status_path=status_path,
+        timings=timings)
+    print_timings(timings)
 
     if args.no_run:
         return
 
+    command = [
+        f'./{build_dir}/test', '-s', status_path, '-j', str(args.jobs)
+    ]
+
+    if args.shard is not None:
+        command += ['--shard', args.shard]
+
     try:
-        run([f'./{build_dir}/test', '-s', status_path] + test_pattern,
+        run(command + test_pattern,
             'Running tests',
             args.verbose,
             status_path=status_path,
@@ -70,6 +94,16 @@ def do_test(_parser, args, _mys_config):
             create_coverage_report(['./src/**'])
 
 
+def shard(value):
+    mo = re.match(r'^(\d+)/(\d+)$', value)
+
+    if not mo or not 1 <= int(mo.group(1)) <= int(mo.group(2)):
+        raise argparse.ArgumentTypeError(
+            f"invalid shard '{value}', expected i/n where i is 1 to n")
+
+    return value
+
+
 def add_subparser(subparsers):
     subparser = subparsers.add_parser(
         'test',
@@ -83,10 +117,17 @@ def add_subparser(subparsers):
     add_coverage_argument(subparser)
     add_unsafe_argument(subparser)
     add_sanitize_argument(subparser)
+    add_unity_argument(subparser)
+    add_timings_argument(subparser)
     subparser.add_argument(
         '--no-run',
         action='store_true',
         help="Do not run the test, only build them.")
+    subparser.add_argument(
+        '--shard',
+        type=shard,
+        help=('Only run shard i of n, given as i/n, where i is 1 to n. Tests '
+              'are assigned to shards in turn.'))
     subparser.add_argument(
         'test_pattern',
         nargs='?',
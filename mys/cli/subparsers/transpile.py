@@ -1,10 +1,14 @@
 import os
 
 from ...transpiler import Source
+from ...transpiler import create_interface
 from ...transpiler import transpile
+from ...transpiler.cache import read_interface
+from ...transpiler.cache import write_interface
+from ..files import create_file_if_changed
 from ..utils import add_coverage_argument
+from ..utils import add_jobs_argument
 from ..utils import add_unsafe_argument
-from ..utils import create_file
 
 
 def do_transpile(_parser, args, _mys_config):
@@ -32,14 +36,33 @@ def do_transpile(_parser, args, _mys_config):
                                   cpp_path,
                                   args.main[i] == 'yes'))
 
-    generated = transpile(sources, args.coverage)
+    if args.interface_output is not None:
+        if len(sources) != 1:
+            raise Exception('--interface-output requires exactly one Mys file')
 
-    for source, (hpp_1_code, hpp_2_code, cpp_code) in zip(sources, generated):
+        write_interface(args.interface_output,
+                        create_interface(sources[0], args.coverage))
+
+        return
+
+    generated = transpile(sources,
+                          args.coverage,
+                          args.cache_directory,
+                          args.jobs,
+                          args.module,
+                          not args.no_application_init,
+                          [read_interface(path) for path in args.interface])
+
+    for source, generated_code in zip(sources, generated):
+        if generated_code is None:
+            continue
+
+        hpp_1_code, hpp_2_code, cpp_code = generated_code
         os.makedirs(os.path.dirname(source.hpp_path), exist_ok=True)
         os.makedirs(os.path.dirname(source.cpp_path), exist_ok=True)
-        create_file(source.hpp_path[:-3] + 'early.hpp', hpp_1_code)
-        create_file(source.hpp_path, hpp_2_code)
-        create_file(source.cpp_path, cpp_code)
+        create_file_if_changed(source.hpp_path[:-3] + 'early.hpp', hpp_1_code)
+        create_file_if_changed(source.hpp_path, hpp_2_code)
+        create_file_if_changed(source.cpp_path, cpp_code)
 
 
 def add_subparser(subparsers):
@@ -69,6 +92,33 @@ def add_subparser(subparsers):
                            action='append',
                            choices=['yes', 'no'],
                            help='Contains main().')
+    subparser.add_argument(
+        '--cache-directory',
+        help=('Only transpile modules that have changed since last time, using '
+              'generated code cached in given directory for the rest.'))
+    subparser.add_argument(
+        '--module',
+        action='append',
+        help=('Only generate code for given module. May be given multiple '
+              'times. All other given Mys files are only used for their '
+              'definitions and specializations.'))
+    subparser.add_argument(
+        '--no-application-init',
+        action='store_true',
+        help=('Do not add application initialization and exit to the last '
+              'module in import order.'))
+    subparser.add_argument(
+        '--interface-output',
+        help=('Only write the interface of given Mys file, that is, its '
+              'definitions, to given file. No code is generated.'))
+    subparser.add_argument(
+        '--interface',
+        action='append',
+        default=[],
+        help=('Interface of an imported module, written with '
+              '--interface-output, used instead of its Mys file. May be given '
+              'multiple times.'))
+    add_jobs_argument(subparser)
     add_coverage_argument(subparser)
     add_unsafe_argument(subparser)
     subparser.add_argument('mysfiles', nargs='+')
@@ -0,0 +1,107 @@
+import glob
+import json
+import os
+import shutil
+import tempfile
+
+from ..trace import add_event
+
+
+def add_status_events(timings):
+    """Add build steps read from the status file, as returned by run(),
+    to the trace. Their start and end times are the times written in
+    the status lines, not when the lines were read.
+
+    """
+
+    for message, start_time, end_time in timings:
+        add_event(message, message.split(' ')[0].lower(), start_time, end_time)
+
+
+def read_events(directory):
+    events = []
+
+    for path in glob.glob(os.path.join(directory, '*.jsonl')):
+        with open(path) as fin:
+            for line in fin:
+                events.append(json.loads(line))
+
+    return events
+
+
+def assign_threads(events):
+    """Each process' events are shown on a single thread, but parallel
+    build steps overlap. Put overlapping events on different threads,
+    reusing the first free thread.
+
+    """
+
+    threads_end_times = {}
+
+    for event in sorted(events, key=lambda e: (e['pid'], e['ts'], -e['dur'])):
+        end_times = threads_end_times.setdefault(event['pid'], [])
+
+        for tid, end_time in enumerate(end_times):
+            if end_time <= event['ts']:
+                break
+        else:
+            tid = len(end_times)
+            end_times.append(0)
+
+        end_times[tid] = event['ts'] + event['dur']
+        event['tid'] = tid
+
+
+def create_process_names(events):
+    pid = os.getpid()
+    names = []
+
+    for event_pid in sorted({event['pid'] for event in events}):
+        if event_pid == pid:
+            name = 'mys build'
+        else:
+            name = 'mys transpile'
+
+        names.append({
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': event_pid,
+            'args': {'name': name}
+        })
+
+    return names
+
+
+class Trace:
+    """Collects events added by this process and all mys processes it
+    starts, and writes them to given file in Chrome's trace event
+    format, viewable in Perfetto or chrome://tracing.
+
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._directory = None
+
+    def __enter__(self):
+        self._directory = tempfile.mkdtemp(prefix='mys-trace-')
+        os.environ['MYS_TRACE_DIRECTORY'] = self._directory
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback):
+        del os.environ['MYS_TRACE_DIRECTORY']
+
+        try:
+            events = read_events(self._directory)
+            assign_threads(events)
+
+            with open(self._path, 'w') as fout:
+                json.dump(
+                    {
+                        'traceEvents': create_process_names(events) + events,
+                        'displayTimeUnit': 'ms'
+                    },
+                    fout)
+        finally:
+            shutil.rmtree(self._directory)
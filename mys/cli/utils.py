@@ -1,24 +1,43 @@
+import argparse
 import glob
-import multiprocessing
+import hashlib
+import json
 import os
-import platform
 import shutil
 import sys
+import tempfile
+import time
 
 from colors import blue
 from colors import cyan
 from colors import red
 from colors import strip_color
 from colors import yellow
-
-from ..coverage import Coverage
-from ..coverage import CoverageData
+from xdg import xdg_cache_home
+
+from ..trace import add_event
+from ..trace import is_tracing
+from ..version import __version__
+from .daemon import DAEMON_CLIENT
+from .daemon import daemon_socket_path
+from .daemon import is_daemon_running
+from .files import create_file
+from .files import create_file_if_changed
+from .fingerprint import check_fingerprint
+from .fingerprint import find_tool
+from .fingerprint import remove_fingerprint
+from .fingerprint import stat_inputs
+from .fingerprint import write_fingerprint
 from .mys_dir import MYS_DIR
 from .package_config import PackageConfig
 from .packages_finder import DOWNLOAD_DIRECTORY
 from .packages_finder import download_dependencies
 from .run import Spinner
+from .run import format_result_ok
 from .run import run
+from .trace import add_status_events
+
+RUNTIME_LIBRARIES_CACHE_DIRECTORY = xdg_cache_home() / 'mys/runtime'
 
 BULB = yellow('💡', style='bold')
 INFO = blue('🛈 ', style='bold')
@@ -33,6 +52,29 @@ OPTIMIZE = {
 TRANSPILE_OPTIONS_FMT = (
     '-n {package_name} -v {package_version} -p {package_path} {flags}')
 
+INTERFACE_MODULE_FMT = '''\
+{interface}: {path}
+\t@echo "> $(NOW) Parsing {module}" >> $(STATUS_PATH)
+\t$(MYS) $(TRANSPILE_DEBUG) transpile $(TRANSPILE_COVERAGE) \\
+\t--interface-output $@ {transpile_options} {src}
+\t@echo "< $(NOW) Parsing {module}" >> $(STATUS_PATH)
+'''
+
+TRANSPILE_MODULE_FMT = '''\
+$(BUILD)/transpiled/{module}: {transpile_srcs_paths}{interfaces}
+\t@echo "> $(NOW) Transpiling {module}" >> $(STATUS_PATH)
+\t$(MYS) $(TRANSPILE_DEBUG) transpile $(TRANSPILE_COVERAGE) \\
+\t--cache-directory $(BUILD)/transpile-cache --module {module} {flags}\\
+\t{interface_options}{transpile_options} -o $(BUILD)/cpp {transpile_srcs}
+\tmkdir -p $(dir $@)
+\ttouch $@
+\t@echo "< $(NOW) Transpiling {module}" >> $(STATUS_PATH)
+
+{outputs}: $(BUILD)/transpiled/{module} ;
+
+{obj}: {headers}{hpps}
+'''
+
 COPY_HPP_AND_CPP_FMT = '''\
 {dst}: {src}
 \tmkdir -p $(dir $@)
@@ -47,6 +89,10 @@ COPY_ASSET_FMT = '''\
 
 
 def system():
+    # Imported here as it is slow to import and not needed by builds
+    # that are up to date.
+    import platform
+
     value = platform.system()
 
     if value.startswith('CYGWIN'):
@@ -68,7 +114,11 @@ class BuildConfig:
                  jobs,
                  url,
                  download,
-                 sanitize):
+                 sanitize,
+                 unity=0,
+                 lto=False,
+                 pgo=False,
+                 timings=False):
         self.debug = debug
         self.verbose = verbose
         self.optimize = optimize
@@ -80,11 +130,10 @@ class BuildConfig:
         self.url = url
         self.download = download
         self.sanitize = sanitize
-
-
-def create_file(path, data):
-    with open(path, 'w') as fout:
-        fout.write(data)
+        self.unity = unity
+        self.lto = lto
+        self.pgo = pgo
+        self.timings = timings
 
 
 def read_template_file(path):
@@ -93,7 +142,7 @@ def read_template_file(path):
 
 
 def default_jobs():
-    return max(1, multiprocessing.cpu_count() - 1)
+    return max(1, (os.cpu_count() or 1) - 1)
 
 
 def box_print(lines, icon, width=None):
@@ -112,6 +161,35 @@ def box_print(lines, icon, width=None):
     print(f'└{"─" * (width + 2)}┘')
 
 
+def print_timings(timings):
+    """Print durations of given build steps, slowest first, followed by
+    the total duration of each kind of step.
+
+    """
+
+    if not timings:
+        return
+
+    totals = {}
+
+    print('Timings:')
+    print()
+
+    for message, start_time, end_time in sorted(timings,
+                                                key=lambda t: t[1] - t[2]):
+        duration = end_time - start_time
+        kind = message.split(' ')[0]
+        totals[kind] = totals.get(kind, 0.0) + duration
+        print(f'  {duration:7.2f} s  {message}')
+
+    print()
+
+    for kind, duration in totals.items():
+        print(f'  {duration:7.2f} s  {kind} in total')
+
+    print()
+
+
 def create_file_from_template_path(path, template_path, **kwargs):
     template = read_template_file(template_path)
     create_file(path, template.format(**kwargs))
@@ -128,6 +206,79 @@ def setup_build(download):
     os.makedirs(DOWNLOAD_DIRECTORY, exist_ok=True)
 
 
+def get_runtime_libraries_directory():
+    """Returns the directory pcre2 and libuv are built in. They are built
+    with the same flags for all builds, so they are shared by all
+    builds of all packages using the same mys installation, C compiler,
+    C flags and system.
+
+    """
+
+    key = json.dumps([
+        __version__,
+        MYS_DIR,
+        find_tool(os.getenv('CC', 'cc')),
+        os.getenv('CFLAGS'),
+        system()
+    ])
+
+    return (RUNTIME_LIBRARIES_CACHE_DIRECTORY
+            / hashlib.sha256(key.encode('utf-8')).hexdigest()[:16])
+
+
+def build_runtime_libraries(build_config):
+    """Build pcre2 and libuv if not already in the cache. A lock makes
+    sure only one process builds them, and they are built in a
+    temporary directory, so other processes never see partially built
+    libraries.
+
+    """
+
+    directory = get_runtime_libraries_directory()
+
+    if directory.exists():
+        return
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+
+    # Imported here as it is slow to import and only needed when
+    # building the libraries.
+    import fasteners
+
+    with fasteners.InterProcessLock(f'{directory}.lock'):
+        if directory.exists():
+            return
+
+        tmp_directory = tempfile.mkdtemp(dir=directory.parent)
+
+        if not build_config.no_ccache and shutil.which('ccache'):
+            ccache = 'ccache '
+        else:
+            ccache = ''
+
+        env = dict(os.environ)
+        env['CC'] = ccache + os.getenv('CC', 'cc')
+
+        try:
+            for name in ['pcre2', 'uv']:
+                shutil.copytree(os.path.join(MYS_DIR, name),
+                                os.path.join(tmp_directory, name))
+                command = [
+                    'make',
+                    '-C', os.path.join(tmp_directory, name),
+                    f'SYSTEM={system()}'
+                ]
+
+                if os.getenv('MAKEFLAGS') is None:
+                    command += ['-j', str(build_config.jobs)]
+
+                run(command, f'Building {name}', build_config.verbose, env=env)
+
+            os.rename(tmp_directory, directory)
+        finally:
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+
+
 def read_package_configuration():
     try:
         with Spinner('Reading package configuration'):
@@ -243,7 +394,185 @@ def find_c_dependencies_flags(configs, verbose):
     return cflags, libs
 
 
-def create_makefile(config, dependencies_configs, build_config):
+class MakefileModule:
+
+    def __init__(self, package_config, src, transpile_options):
+        self.src = src
+        self.path = os.path.join(package_config.path, 'src', src)
+        self.module = f'{package_config.name}.{src[:-4].replace("/", ".")}'
+        self.transpile_options = transpile_options
+        self.cpp = f'$(BUILD)/cpp/src/{package_config.name}/{src}.cpp'
+        self.unity_include = f'../src/{package_config.name}/{src}.cpp'
+        self.obj = f'$(BUILD)/cpp/src/{package_config.name}/{src}.$(OBJ_SUFFIX)'
+        self.hpp = f'$(BUILD)/cpp/include/{package_config.name}/{src}.hpp'
+        self.early_hpp = f'$(BUILD)/cpp/include/{package_config.name}/{src}.early.hpp'
+        self.interface = f'$(BUILD)/interfaces/{self.module}.pickle'
+
+        # Imported here as the transpiler is slow to import and not
+        # needed by builds that are up to date.
+        from ..transpiler import Source
+        from ..transpiler import find_module_dependencies
+
+        with open(self.path, 'r') as fin:
+            source = Source(fin.read(), module=self.module, mys_path=self.path)
+
+        self.imported_modules, self.owns_generics = find_module_dependencies(
+            source)
+
+
+def create_transpile_rules(makefile_modules, hpps):
+    """Returns rules creating the interface of each module, that is, its
+    definitions, and one rule per module transpiling it.
+
+    Interfaces only depend on their module, so all are created in
+    parallel. A module is transpiled given the interfaces of the
+    modules it imports, directly or indirectly, instead of their
+    sources. A module owning generic functions or classes is also
+    given the sources of the modules importing it, as they are visited
+    for the specializations they request. The module initializing the
+    application is given the interfaces of all other modules, as it
+    initializes them in import order.
+
+    Objects depend on the headers of the modules they depend on, so
+    transpilation and compilation of different modules runs in
+    parallel.
+
+    """
+
+    from ..transpiler import find_importing_modules
+    from ..transpiler.cache import find_imported_modules
+    from ..transpiler.import_order import resolve_import_order
+
+    modules = {
+        makefile_module.module: makefile_module
+        for makefile_module in makefile_modules
+    }
+    module_imports = {
+        makefile_module.module: [
+            imported_module
+            for imported_module in makefile_module.imported_modules
+            if imported_module in modules
+        ]
+        for makefile_module in makefile_modules
+    }
+    last_module = resolve_import_order(module_imports)[-1]
+    rules = []
+
+    for makefile_module in makefile_modules:
+        rules.append(INTERFACE_MODULE_FMT.format(
+            interface=makefile_module.interface,
+            path=makefile_module.path,
+            module=makefile_module.module,
+            transpile_options=makefile_module.transpile_options,
+            src=makefile_module.src))
+
+    for makefile_module in makefile_modules:
+        module = makefile_module.module
+        sources = {module}
+
+        if makefile_module.owns_generics:
+            sources.update(find_importing_modules(module, module_imports))
+
+        if module == last_module:
+            imported = set(modules)
+            flags = ''
+        else:
+            imported = set()
+
+            for source in sources:
+                imported.update(find_imported_modules(source, module_imports))
+
+            flags = '--no-application-init '
+
+        imported -= sources
+
+        # Keep source order to generate the same code as when
+        # transpiling all modules at once.
+        sources = [
+            dependency
+            for dependency in makefile_modules
+            if dependency.module in sources
+        ]
+        imported = [
+            dependency
+            for dependency in makefile_modules
+            if dependency.module in imported
+        ]
+        headers = []
+
+        for dependency in makefile_modules:
+            if dependency in sources or dependency in imported:
+                headers += [dependency.early_hpp, dependency.hpp]
+
+        rules.append(TRANSPILE_MODULE_FMT.format(
+            module=module,
+            flags=flags,
+            transpile_srcs_paths=' '.join([
+                dependency.path for dependency in sources
+            ]),
+            interfaces=''.join([
+                f' {dependency.interface}' for dependency in imported
+            ]),
+            interface_options=''.join([
+                f'--interface {dependency.interface} ' for dependency in imported
+            ]),
+            transpile_options=' '.join([
+                dependency.transpile_options for dependency in sources
+            ]),
+            transpile_srcs=' '.join([
+                dependency.src for dependency in sources
+            ]),
+            outputs=' '.join([
+                makefile_module.cpp,
+                makefile_module.hpp,
+                makefile_module.early_hpp
+            ]),
+            obj=makefile_module.obj,
+            headers=' '.join(headers),
+            hpps=f' | {" ".join(hpps)}' if hpps else ''))
+
+    return rules
+
+
+def create_unity_sources(makefile_modules, unity, build_dir):
+    """Splits given modules into given number of batches, keeping source
+    order, and creates one source file per batch including the
+    generated sources of its modules. Each batch is compiled as a
+    single translation unit, so templates used by many modules are
+    only instantiated once per batch.
+
+    The object of each module is replaced by the object of its
+    batch. Returns rules making batch objects depend on the generated
+    sources they include.
+
+    """
+
+    unity = min(unity, len(makefile_modules))
+    size, rest = divmod(len(makefile_modules), unity)
+    os.makedirs(f'{build_dir}/cpp/unity', exist_ok=True)
+    rules = []
+    begin = 0
+
+    for index in range(unity):
+        end = begin + size + (index < rest)
+        batch = makefile_modules[begin:end]
+        begin = end
+        lines = ['// This file was generated by mys. DO NOT EDIT!!!']
+        obj = f'$(BUILD)/cpp/unity/{index}.mys.$(OBJ_SUFFIX)'
+
+        for makefile_module in batch:
+            lines.append(f'#include "{makefile_module.unity_include}"')
+            makefile_module.obj = obj
+
+        create_file_if_changed(f'{build_dir}/cpp/unity/{index}.mys.cpp',
+                               '\n'.join(lines) + '\n')
+        cpps = ' '.join([makefile_module.cpp for makefile_module in batch])
+        rules.append(f'{obj}: {cpps}')
+
+    return rules
+
+
+def get_build_directory(build_config):
     combo = build_config.optimize
 
     if build_config.coverage:
@@ -255,8 +584,17 @@ def create_makefile(config, dependencies_configs, build_config):
     if build_config.sanitize:
         combo += '-sanitize'
 
-    build_dir = f'build/{combo}'
+    if build_config.lto:
+        combo += '-lto'
+
+    if build_config.pgo:
+        combo += '-pgo'
+
+    return f'build/{combo}'
 
+
+def create_makefile(config, dependencies_configs, build_config):
+    build_dir = get_build_directory(build_config)
     os.makedirs(f'{build_dir}/cpp', exist_ok=True)
     srcs_mys, srcs_hpp, srcs_cpp = find_package_sources(config)
     cflags, libs = find_c_dependencies_flags([config] + dependencies_configs,
@@ -273,13 +611,13 @@ def create_makefile(config, dependencies_configs, build_config):
         srcs_hpp += srcs[1]
         srcs_cpp += srcs[2]
 
-    transpile_options = []
-    transpile_srcs = []
-    transpile_srcs_paths = []
+    makefile_modules = []
     copy_hpp_and_cpp = []
     objs = []
     is_application = False
     transpiled_cpp = []
+    transpiled_hpp = []
+    cpp_objs = []
     hpps = []
 
     if build_config.debug_symbols:
@@ -304,17 +642,30 @@ def create_makefile(config, dependencies_configs, build_config):
 
         flags = ' '.join(flags)
 
-        module_path = f'$(BUILD)/cpp/src/{package_name}/{src}'
-        transpile_options.append(
+        makefile_module = MakefileModule(
+            package_config,
+            src,
             TRANSPILE_OPTIONS_FMT.format(package_name=package_name,
                                          package_version=package_config.version,
                                          package_path=package_config.path,
                                          flags=flags))
+        makefile_modules.append(makefile_module)
+        transpiled_cpp.append(f'SRC += {makefile_module.cpp}')
+        transpiled_hpp.append(f'HPP += {makefile_module.early_hpp}')
+        transpiled_hpp.append(f'HPP += {makefile_module.hpp}')
+
+    if build_config.unity > 0:
+        unity_rules = create_unity_sources(makefile_modules,
+                                           build_config.unity,
+                                           build_dir)
+    else:
+        unity_rules = []
 
-        transpile_srcs.append(src)
-        transpile_srcs_paths.append(os.path.join(package_config.path, 'src', src))
-        objs.append(f'OBJ += {module_path}.$(OBJ_SUFFIX)')
-        transpiled_cpp.append(f'SRC += {module_path}.cpp')
+    for makefile_module in makefile_modules:
+        obj = f'OBJ += {makefile_module.obj}'
+
+        if obj not in objs:
+            objs.append(obj)
 
     for package_config, src in srcs_hpp:
         src_path = os.path.join(package_config.path, 'src', src)
@@ -329,8 +680,17 @@ def create_makefile(config, dependencies_configs, build_config):
         copy_hpp_and_cpp.append(COPY_HPP_AND_CPP_FMT.format(src=src_path,
                                                             dst=module_path))
         objs.append(f'OBJ += {module_path}.o')
+        cpp_objs.append(f'{module_path}.o')
         transpiled_cpp.append(f'SRC += {module_path}.cpp')
 
+    transpile_rules = create_transpile_rules(makefile_modules, hpps)
+
+    if cpp_objs:
+        # Any generated header may be included.
+        cpp_objs_rule = f'{" ".join(cpp_objs)}: | $(HPP) {" ".join(hpps)}'
+    else:
+        cpp_objs_rule = ''
+
     copy_assets = []
     assets_targets = []
 
@@ -354,29 +714,34 @@ def create_makefile(config, dependencies_configs, build_config):
     mys = sys.executable
 
     if not is_bundled():
-        mys += ' -m mys'
+        daemon_socket = daemon_socket_path()
+
+        if is_daemon_running(daemon_socket):
+            mys += f' -S {DAEMON_CLIENT} {daemon_socket}'
+        else:
+            mys += ' -m mys'
 
     create_file_from_template_path(
         f'{build_dir}/Makefile',
         'build/Makefile',
         build=build_dir,
+        runtime_libraries=get_runtime_libraries_directory(),
         status_path=f'{build_dir}/status.txt',
         mys_dir=MYS_DIR,
         mys=mys,
         ccache=ccache,
         objs='\n'.join(objs),
         optimize=OPTIMIZE[build_config.optimize],
-        transpile_options=' '.join(transpile_options),
-        transpile_srcs_paths=' '.join(transpile_srcs_paths),
-        transpile_srcs=' '.join(transpile_srcs),
-        number_of_modules=len(srcs_mys),
-        hpps=' '.join(hpps),
+        transpile_rules='\n'.join(transpile_rules),
+        unity_rules='\n'.join(unity_rules),
+        cpp_objs_rule=cpp_objs_rule,
         copy_hpp_and_cpp='\n'.join(copy_hpp_and_cpp),
         copy_assets='\n'.join(copy_assets),
         assets=' '.join(assets_targets),
         all_deps=all_deps,
         package_name=config.name,
         transpiled_cpp='\n'.join(transpiled_cpp),
+        transpiled_hpp='\n'.join(transpiled_hpp),
         cflags=cflags,
         libs=libs,
         system=system())
@@ -394,19 +759,27 @@ def build_prepare(build_config, config=None):
         config = read_package_configuration()
 
     setup_build(build_config.download)
+    start_time = time.time()
     dependencies_configs = download_dependencies(config,
                                                  build_config.url,
                                                  build_config.download)
+    add_event('Downloading dependencies', 'download', start_time, time.time())
     is_application, build_dir = create_makefile(config,
                                                 dependencies_configs,
                                                 build_config)
     create_feature_cpp(build_dir)
+    build_runtime_libraries(build_config)
 
     return is_application, build_dir, dependencies_configs
 
 
-def build_app(build_config, is_application, build_dir):
-    command = ['make', '-f', f'{build_dir}/Makefile', 'all']
+def build_app(build_config,
+              is_application,
+              build_dir,
+              target='all',
+              variables=None,
+              message='Building'):
+    command = ['make', '-f', f'{build_dir}/Makefile', target]
 
     if os.getenv('MAKEFLAGS') is None:
         command += ['-j', str(build_config.jobs)]
@@ -432,10 +805,178 @@ def build_app(build_config, is_application, build_dir):
     if build_config.sanitize == 'sanitize':
         command += ['SANITIZE=yes']
 
+    if build_config.lto:
+        command += ['LTO=yes']
+
+    if variables is not None:
+        command += variables
+
+    if build_config.timings or is_tracing():
+        timings = []
+    else:
+        timings = None
+
     run(command,
-        'Building',
+        message,
         build_config.verbose,
-        status_path=f'{build_dir}/status.txt')
+        status_path=f'{build_dir}/status.txt',
+        timings=timings)
+
+    if build_config.timings:
+        print_timings(timings)
+
+    if timings is not None:
+        add_status_events(timings)
+
+
+def build_app_if_changed(build_config):
+    """Build the package unless nothing has changed since it was last
+    built. Checking that is much faster than finding dependencies,
+    creating the Makefile and running make. Returns if the package is
+    an application and the build directory.
+
+    """
+
+    build_dir = get_build_directory(build_config)
+
+    if not build_config.download:
+        is_application = check_fingerprint(build_config, build_dir)
+
+        if is_application is not None:
+            print(format_result_ok('Building (up to date)'), flush=True)
+
+            return is_application, build_dir
+
+    remove_fingerprint(build_dir)
+    is_application, build_dir, dependencies_configs = build_prepare(build_config)
+    inputs = stat_inputs(['.'] + [config.path for config in dependencies_configs])
+    build_app(build_config, is_application, build_dir)
+    outputs = [f'{build_dir}/Makefile']
+
+    if is_application:
+        outputs.append(f'{build_dir}/app')
+
+    write_fingerprint(build_config, build_dir, is_application, inputs, outputs)
+
+    return is_application, build_dir
+
+
+def remove_objects(build_dir):
+    """Removes all objects and precompiled headers in given build
+    directory, as make does not rebuild them when compiler flags
+    changes.
+
+    """
+
+    paths = glob.glob(f'{build_dir}/cpp/**/*.o', recursive=True)
+    paths += glob.glob(f'{build_dir}/*.o')
+    paths += glob.glob(f'{build_dir}/*.gch')
+
+    for path in paths:
+        os.remove(path)
+
+
+def find_pgo_training_target(config):
+    """Returns 'bench' if given package has any benchmarks, otherwise
+    'test' if it has any tests, and otherwise None.
+
+    """
+
+    from ..transpiler import Source
+    from ..transpiler import find_tests_and_benchmarks
+
+    has_tests = False
+
+    for package_config, src in find_package_sources(config)[0]:
+        path = os.path.join(package_config.path, 'src', src)
+
+        with open(path, 'r') as fin:
+            source = Source(fin.read(), mys_path=path)
+
+        src_has_tests, src_has_benchmarks = find_tests_and_benchmarks(source)
+
+        if src_has_benchmarks:
+            return 'bench'
+
+        has_tests = has_tests or src_has_tests
+
+    if has_tests:
+        return 'test'
+
+    return None
+
+
+def build_pgo(build_config, is_application, build_dir, train):
+    """Profile guided optimization. Builds an instrumented binary, trains
+    it and then builds again using the collected profile.
+
+    Given shell command trains the instrumented application. The
+    package's benchmarks are used if no command is given, or its tests
+    if it has no benchmarks. Their objects have the same names as the
+    application's objects, so their profile is found when building the
+    application.
+
+    """
+
+    if train is None:
+        target = find_pgo_training_target(read_package_configuration())
+
+        if target is None:
+            box_print([
+                'There is nothing to train the instrumented build with.',
+                'Add benchmarks or tests, or give a training command with',
+                f"{cyan('--pgo-train')}."
+            ], ERROR)
+
+            raise Exception()
+
+    pgo_dir = f'{build_dir}/pgo'
+    shutil.rmtree(pgo_dir, ignore_errors=True)
+    remove_objects(build_dir)
+
+    if train is None and target == 'bench':
+        build_app(build_config,
+                  False,
+                  build_dir,
+                  'bench',
+                  ['BENCH=yes', 'OBJ_SUFFIX=o', 'PGO=generate'],
+                  'Building instrumented benchmarks')
+        run([f'./{build_dir}/bench', '--time', '0.1'],
+            'Training with benchmarks',
+            build_config.verbose)
+    elif train is None:
+        build_app(build_config,
+                  False,
+                  build_dir,
+                  'test',
+                  ['TEST=yes', 'OBJ_SUFFIX=o', 'PGO=generate'],
+                  'Building instrumented tests')
+        run([f'./{build_dir}/test'],
+            'Training with tests',
+            build_config.verbose)
+    else:
+        build_app(build_config,
+                  is_application,
+                  build_dir,
+                  variables=['PGO=generate'],
+                  message='Building instrumented')
+        run(['sh', '-c', train], 'Training', build_config.verbose)
+
+    # Clang writes raw profiles that must be merged.
+    profraws = glob.glob(f'{pgo_dir}/*.profraw')
+
+    if profraws:
+        run(['llvm-profdata', 'merge', '-o', f'{pgo_dir}/default.profdata']
+            + profraws,
+            'Merging profiles',
+            build_config.verbose)
+
+    remove_objects(build_dir)
+    build_app(build_config,
+              is_application,
+              build_dir,
+              variables=['PGO=use'],
+              message='Building with profile')
 
 
 def add_verbose_argument(subparser):
@@ -499,6 +1040,40 @@ def add_unsafe_argument(subparser):
         help='Less runtime checks in favour of better performance.')
 
 
+def unity(value):
+    value = int(value)
+
+    if value < 0:
+        raise argparse.ArgumentTypeError('must be zero or more')
+
+    return value
+
+
+def add_unity_argument(subparser):
+    subparser.add_argument(
+        '--unity',
+        type=unity,
+        default=0,
+        metavar='N',
+        help=('Compile transpiled modules in N batches, each a single '
+              'translation unit, instead of one per module. Faster full '
+              'builds, slower incremental builds. 0 to disable (default: '
+              '%(default)s).'))
+
+
+def add_lto_argument(subparser):
+    subparser.add_argument('--lto',
+                           action='store_true',
+                           help='Link time optimization.')
+
+
+def add_timings_argument(subparser):
+    subparser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Print how long each module took to transpile and compile.')
+
+
 def add_sanitize_argument(subparser):
     subparser.add_argument(
         '--sanitize',
@@ -541,6 +1116,11 @@ def _create_coverage_report(include):
             if path is not None:
                 _add_lines(line_data, path, linenos)
 
+    # Imported here as it is slow to import and only needed when
+    # creating the report.
+    from ..coverage import Coverage
+    from ..coverage import CoverageData
+
     coverage_data = CoverageData()
 
     for path, linenos in line_data.items():
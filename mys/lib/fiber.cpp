@@ -1,7 +1,167 @@
 #include "mys.hpp"
 
+// Fibers are coroutines with their own stacks by default. Define
+// MYS_FIBER_THREADS to instead run each fiber in its own thread, only
+// one at a time. Threads are always used with the address sanitizer,
+// as it does not know about our stacks.
+#if !defined(MYS_FIBER_THREADS)
+#    if defined(__SANITIZE_ADDRESS__)
+#        define MYS_FIBER_THREADS
+#    elif defined(__has_feature)
+#        if __has_feature(address_sanitizer)
+#            define MYS_FIBER_THREADS
+#        endif
+#    endif
+#endif
+
+#if !defined(MYS_FIBER_THREADS)
+#    include <cxxabi.h>
+#    include <sys/mman.h>
+#    include <unistd.h>
+#    if !defined(__x86_64__) || !defined(__linux__)
+#        include <ucontext.h>
+#    endif
+#endif
+
+// Stack size of each fiber, excluding the guard page. Same as the
+// default thread stack size on Linux, as each fiber used to run in its
+// own thread. Only used pages take memory.
+#if !defined(MYS_FIBER_STACK_SIZE)
+#    define MYS_FIBER_STACK_SIZE (8 * 1024 * 1024)
+#endif
+
+#if !defined(MAP_NORESERVE)
+#    define MAP_NORESERVE 0
+#endif
+
 namespace mys {
 
+#if !defined(MYS_FIBER_THREADS)
+
+#if defined(__x86_64__) && defined(__linux__)
+
+// Saves callee-saved registers and floating point control words on
+// current stack, stores the stack pointer in *out_sp_p and restores
+// the registers saved on in_sp.
+extern "C" void mys_fiber_switch(void **out_sp_p, void *in_sp);
+
+asm(R"(
+    .text
+    .globl mys_fiber_switch
+    .hidden mys_fiber_switch
+    .type mys_fiber_switch, @function
+mys_fiber_switch:
+    pushq %rbp
+    pushq %rbx
+    pushq %r12
+    pushq %r13
+    pushq %r14
+    pushq %r15
+    subq $8, %rsp
+    stmxcsr (%rsp)
+    fnstcw 4(%rsp)
+    movq %rsp, (%rdi)
+    movq %rsi, %rsp
+    ldmxcsr (%rsp)
+    fldcw 4(%rsp)
+    addq $8, %rsp
+    popq %r15
+    popq %r14
+    popq %r13
+    popq %r12
+    popq %rbx
+    popq %rbp
+    ret
+    .size mys_fiber_switch, .-mys_fiber_switch
+)");
+
+struct Context {
+    void *sp;
+};
+
+#else
+
+struct Context {
+    ucontext_t context;
+};
+
+#endif
+
+// Exception handling state is per thread, but must be per fiber as a
+// fiber may switch while handling an exception.
+struct EhGlobals {
+    void *caught_exceptions_p;
+    unsigned int uncaught_exceptions;
+#if defined(__ARM_EABI_UNWINDER__)
+    void *propagating_exceptions_p;
+#endif
+};
+
+// Stacks with a guard page at the bottom. Stacks of stopped fibers
+// are kept for new fibers.
+class StackPool {
+private:
+    std::vector<void *> m_stacks;
+    size_t m_page_size;
+
+public:
+    static const size_t MAX_POOLED = 128;
+
+    StackPool()
+    {
+        m_page_size = sysconf(_SC_PAGESIZE);
+    }
+
+    size_t size() const
+    {
+        return m_page_size + MYS_FIBER_STACK_SIZE;
+    }
+
+    void *alloc()
+    {
+        void *stack_p;
+
+        if (!m_stacks.empty()) {
+            stack_p = m_stacks.back();
+            m_stacks.pop_back();
+
+            return stack_p;
+        }
+
+        stack_p = mmap(NULL,
+                       size(),
+                       PROT_READ | PROT_WRITE,
+                       MAP_PRIVATE | MAP_ANONYMOUS | MAP_NORESERVE,
+                       -1,
+                       0);
+
+        if (stack_p == MAP_FAILED) {
+            return NULL;
+        }
+
+        if (mprotect(stack_p, m_page_size, PROT_NONE) != 0) {
+            munmap(stack_p, size());
+
+            return NULL;
+        }
+
+        return stack_p;
+    }
+
+    void free(void *stack_p)
+    {
+        if (m_stacks.size() < MAX_POOLED) {
+            m_stacks.push_back(stack_p);
+        } else {
+            munmap(stack_p, size());
+        }
+    }
+};
+
+static StackPool stack_pool;
+
+#endif
+
 struct SchedulerFiber {
     enum State {
         CURRENT = 0,
@@ -12,8 +172,17 @@ struct SchedulerFiber {
     };
 
     mys::shared_ptr<Fiber> m_fiber;
+#if defined(MYS_FIBER_THREADS)
     uv_thread_t thread;
     uv_cond_t cond;
+#else
+    Context context;
+    void *stack_p;
+    EhGlobals eh_globals;
+#endif
+    // Created when first switched to, so that fibers waiting to run
+    // for the first time use neither a thread nor a stack.
+    bool has_context;
     SchedulerFiber *next_p;
     SchedulerFiber *waiter_p;
     int prio;
@@ -27,7 +196,13 @@ struct SchedulerFiber {
     SchedulerFiber(const mys::shared_ptr<Fiber>& fiber)
     {
         m_fiber = fiber;
+#if defined(MYS_FIBER_THREADS)
         uv_cond_init(&cond);
+#else
+        stack_p = NULL;
+        eh_globals = {};
+#endif
+        has_context = false;
         state = State::SUSPENDED;
         prio = 0;
         waiter_p = NULL;
@@ -38,74 +213,148 @@ struct SchedulerFiber {
     }
 };
 
+#if defined(MYS_FIBER_THREADS)
+
+static void start_fiber_main(void *arg_p);
+
+// Creates the thread of given fiber.
+static void create_context(SchedulerFiber *fiber_p)
+{
+    if (uv_thread_create(&fiber_p->thread, start_fiber_main, fiber_p) != 0) {
+        std::cout << "error: out of fiber threads" << std::endl;
+        exit(1);
+    }
+
+    // Never joined, so its resources are freed when it exits.
+    pthread_detach(fiber_p->thread);
+    fiber_p->has_context = true;
+}
+
+#else
+
+static void start_fiber_main();
+
+// Creates the stack and context of given fiber.
+static void create_context(SchedulerFiber *fiber_p)
+{
+    fiber_p->stack_p = stack_pool.alloc();
+
+    if (fiber_p->stack_p == NULL) {
+        std::cout << "error: out of fiber stacks" << std::endl;
+        exit(1);
+    }
+
+    char *stack_top_p = (char *)fiber_p->stack_p + stack_pool.size();
+
+#if defined(__x86_64__) && defined(__linux__)
+    uint64_t *sp_p = (uint64_t *)stack_top_p;
+
+    // Return address of start_fiber_main(), which never returns.
+    *--sp_p = 0;
+    // Return address of mys_fiber_switch().
+    *--sp_p = (uint64_t)start_fiber_main;
+
+    // rbp, rbx, r12, r13, r14 and r15.
+    for (int i = 0; i < 6; i++) {
+        *--sp_p = 0;
+    }
+
+    // Default x87 control word and MXCSR.
+    *--sp_p = (0x037fULL << 32) | 0x1f80;
+    fiber_p->context.sp = sp_p;
+#else
+    getcontext(&fiber_p->context.context);
+    fiber_p->context.context.uc_stack.ss_sp = fiber_p->stack_p;
+    fiber_p->context.context.uc_stack.ss_size = stack_pool.size();
+    fiber_p->context.context.uc_link = NULL;
+    makecontext(&fiber_p->context.context, start_fiber_main, 0);
+#endif
+
+    fiber_p->has_context = true;
+}
+
+#endif
+
+// Fiber priorities, with 0 being the highest.
+static const int NUMBER_OF_PRIOS = 128;
+
 struct Scheduler {
+#if defined(MYS_FIBER_THREADS)
     // To ensure that only one fiber is running at a time.
     uv_mutex_t mutex;
+#else
+    // A stopped fiber cannot free its own stack.
+    SchedulerFiber *stopped_p;
+#endif
     SchedulerFiber *current_p;
-    SchedulerFiber *ready_head_p;
+    // One FIFO of ready fibers per priority, and a bit per non-empty
+    // FIFO.
+    SchedulerFiber *ready_heads_p[NUMBER_OF_PRIOS];
+    SchedulerFiber *ready_tails_p[NUMBER_OF_PRIOS];
+    uint64_t ready_bitmap[NUMBER_OF_PRIOS / 64];
+
+    bool ready_is_empty()
+    {
+        return (ready_bitmap[0] | ready_bitmap[1]) == 0;
+    }
 
+    // Returns the first fiber with highest priority.
     SchedulerFiber *ready_pop()
     {
         SchedulerFiber *elem_p;
+        int prio;
 
-        elem_p = ready_head_p;
-
-        if (elem_p == NULL) {
+        if (ready_bitmap[0] != 0) {
+            prio = __builtin_ctzll(ready_bitmap[0]);
+        } else if (ready_bitmap[1] != 0) {
+            prio = 64 + __builtin_ctzll(ready_bitmap[1]);
+        } else {
             std::cout << "error: no ready fiber" << std::endl;
             exit(1);
         }
 
-        ready_head_p = elem_p->next_p;
+        elem_p = ready_heads_p[prio];
+        ready_heads_p[prio] = elem_p->next_p;
+
+        if (ready_heads_p[prio] == NULL) {
+            ready_tails_p[prio] = NULL;
+            ready_bitmap[prio / 64] &= ~(1ULL << (prio % 64));
+        }
 
         return elem_p;
     }
 
+    // Adds given fiber last among fibers with the same priority.
     void ready_push(SchedulerFiber *elem_p)
     {
-        SchedulerFiber *curr_p;
-        SchedulerFiber *prev_p;
-        int prio;
+        int prio = elem_p->prio;
 
         elem_p->next_p = NULL;
 
-        if (ready_head_p == NULL) {
-            /* Empty list. */
-            ready_head_p = elem_p;
+        if (ready_tails_p[prio] == NULL) {
+            ready_heads_p[prio] = elem_p;
+            ready_bitmap[prio / 64] |= (1ULL << (prio % 64));
         } else {
-            /* Add in prio order, with highest prio first. */
-            curr_p = ready_head_p;
-            prev_p = NULL;
-            prio = elem_p->prio;
-
-            while (curr_p != NULL) {
-                if (prio < curr_p->prio) {
-                    /* Insert before the 'curr_p' element. */
-                    if (prev_p != NULL) {
-                        elem_p->next_p = prev_p->next_p;
-                        prev_p->next_p = elem_p;
-                    } else {
-                        elem_p->next_p = ready_head_p;
-                        ready_head_p = elem_p;
-                    }
-
-                    return;
-                }
-
-                prev_p = curr_p;
-                curr_p = curr_p->next_p;
-            }
-
-            /* End of the list. */
-            prev_p->next_p = elem_p;
+            ready_tails_p[prio]->next_p = elem_p;
         }
+
+        ready_tails_p[prio] = elem_p;
     }
 
+#if defined(MYS_FIBER_THREADS)
     void swap(SchedulerFiber *in_p, SchedulerFiber *out_p, bool end)
     {
         // Signal scheduled fiber to start;
         out_p->traceback_top_p = mys::traceback_top_p;
         out_p->traceback_bottom_p = mys::traceback_bottom_p;
-        uv_cond_signal(&in_p->cond);
+
+        if (!in_p->has_context) {
+            create_context(in_p);
+        } else {
+            uv_cond_signal(&in_p->cond);
+        }
+
+        out_p->has_context = true;
 
         if (!end) {
             // Pause current fiber.
@@ -115,6 +364,48 @@ struct Scheduler {
         mys::traceback_top_p = out_p->traceback_top_p;
         mys::traceback_bottom_p = out_p->traceback_bottom_p;
     }
+#else
+    void free_stopped_stack()
+    {
+        if (stopped_p != NULL) {
+            stack_pool.free(stopped_p->stack_p);
+            stopped_p->stack_p = NULL;
+            stopped_p = NULL;
+        }
+    }
+
+    void swap(SchedulerFiber *in_p, SchedulerFiber *out_p, bool end)
+    {
+        EhGlobals *eh_globals_p = (EhGlobals *)abi::__cxa_get_globals();
+
+        out_p->traceback_top_p = mys::traceback_top_p;
+        out_p->traceback_bottom_p = mys::traceback_bottom_p;
+        out_p->eh_globals = *eh_globals_p;
+        *eh_globals_p = in_p->eh_globals;
+
+        if (end) {
+            stopped_p = out_p;
+        }
+
+        if (!in_p->has_context) {
+            create_context(in_p);
+        }
+
+        // Saved by the switch below.
+        out_p->has_context = true;
+
+#if defined(__x86_64__) && defined(__linux__)
+        mys_fiber_switch(&out_p->context.sp, in_p->context.sp);
+#else
+        swapcontext(&out_p->context.context, &in_p->context.context);
+#endif
+
+        // Resumed.
+        free_stopped_stack();
+        mys::traceback_top_p = out_p->traceback_top_p;
+        mys::traceback_bottom_p = out_p->traceback_bottom_p;
+    }
+#endif
 
     bool reschedule(bool end = false)
     {
@@ -196,6 +487,26 @@ public:
     }
 };
 
+static uv_prepare_t poll_prepare;
+static uv_idle_t poll_nowait;
+
+static void poll_nowait_callback(uv_idle_t *handle_p)
+{
+}
+
+// Called just before polling for IO. Timers run first, and if they
+// made any fiber ready the poll must not block, or the fiber would be
+// delayed until next IO event or timeout. An active idle handle makes
+// the poll return immediately.
+static void poll_prepare_callback(uv_prepare_t *handle_p)
+{
+    if (scheduler.ready_is_empty()) {
+        uv_idle_stop(&poll_nowait);
+    } else {
+        uv_idle_start(&poll_nowait, poll_nowait_callback);
+    }
+}
+
 class Idle final : public Fiber {
 public:
     Idle()
@@ -209,7 +520,7 @@ public:
         while (true) {
             res = uv_run(uv_default_loop(), UV_RUN_ONCE);
 
-            if ((res == 0) && (scheduler.ready_head_p == NULL)) {
+            if ((res == 0) && scheduler.ready_is_empty()) {
                 std::cout
                     << "error: all fibers suspended and no pending IO"
                     << std::endl;
@@ -256,17 +567,8 @@ mys::shared_ptr<Fiber> current()
     return scheduler.current_p->m_fiber;
 }
 
-// Fiber (currently thread) entry function.
-static void start_fiber_main(void *arg_p)
+static void run_fiber(SchedulerFiber *fiber_p)
 {
-    SchedulerFiber *fiber_p = (SchedulerFiber *)arg_p;
-
-    uv_mutex_lock(&scheduler.mutex);
-
-    if (fiber_p->state != SchedulerFiber::State::CURRENT) {
-        uv_cond_wait(&fiber_p->cond, &scheduler.mutex);
-    }
-
     __MYS_TRACEBACK_INIT();
     fiber_p->traceback_top_p = traceback_top_p;
     fiber_p->traceback_bottom_p = traceback_bottom_p;
@@ -290,18 +592,30 @@ static void start_fiber_main(void *arg_p)
 
     fiber_p->waiter_p = NULL;
     scheduler.reschedule(true);
-    uv_mutex_unlock(&scheduler.mutex);
 }
 
-static void start_detailed(SchedulerFiber *fiber_p)
+#if defined(MYS_FIBER_THREADS)
+
+// Fiber thread entry function.
+static void start_fiber_main(void *arg_p)
 {
-    if (uv_thread_create(&fiber_p->thread, start_fiber_main, fiber_p) != 0) {
-        throw std::exception();
-    }
+    uv_mutex_lock(&scheduler.mutex);
+    run_fiber((SchedulerFiber *)arg_p);
+    uv_mutex_unlock(&scheduler.mutex);
+}
 
-    scheduler.resume(fiber_p);
+#else
+
+// Fiber entry function, first called when switched to. Never
+// returns, as the stack is freed by the next fiber.
+static void start_fiber_main()
+{
+    scheduler.free_stopped_stack();
+    run_fiber(scheduler.current_p);
 }
 
+#endif
+
 void start(const mys::shared_ptr<Fiber>& fiber)
 {
     if (fiber->data_p != NULL) {
@@ -311,7 +625,7 @@ void start(const mys::shared_ptr<Fiber>& fiber)
     auto fiber_p = new SchedulerFiber(fiber);
 
     fiber->data_p = fiber_p;
-    start_detailed(fiber_p);
+    scheduler.resume(fiber_p);
 }
 
 bool join(const mys::shared_ptr<Fiber>& fiber)
@@ -389,9 +703,25 @@ void init()
 {
     uv_signal_init(uv_default_loop(), &sigint);
     uv_signal_init(uv_default_loop(), &sigterm);
+    uv_idle_init(uv_default_loop(), &poll_nowait);
+    uv_unref((uv_handle_t *)&poll_nowait);
+    uv_prepare_init(uv_default_loop(), &poll_prepare);
+    uv_prepare_start(&poll_prepare, poll_prepare_callback);
+    uv_unref((uv_handle_t *)&poll_prepare);
+#if defined(MYS_FIBER_THREADS)
     uv_mutex_init(&scheduler.mutex);
     uv_mutex_lock(&scheduler.mutex);
-    scheduler.ready_head_p = NULL;
+#else
+    scheduler.stopped_p = NULL;
+#endif
+
+    for (int prio = 0; prio < NUMBER_OF_PRIOS; prio++) {
+        scheduler.ready_heads_p[prio] = NULL;
+        scheduler.ready_tails_p[prio] = NULL;
+    }
+
+    scheduler.ready_bitmap[0] = 0;
+    scheduler.ready_bitmap[1] = 0;
 
     main_fiber = mys::make_shared<Main>();
     main_fiber->data_p = new SchedulerFiber(main_fiber);
@@ -404,7 +734,7 @@ void init()
     auto fiber_p = new SchedulerFiber(idle_fiber);
     idle_fiber->data_p = fiber_p;
     fiber_p->prio = 127;
-    start_detailed(fiber_p);
+    scheduler.resume(fiber_p);
 }
 
 Fiber::Fiber()
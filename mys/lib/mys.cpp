@@ -1,6 +1,9 @@
 #include <iomanip>
 #include <alloca.h>
+#include <cerrno>
+#include <cstring>
 #include <getopt.h>
+#include <unistd.h>
 #include "mys.hpp"
 
 #include "unicodectype.cpp"
@@ -12,10 +15,15 @@ extern void __application_init(void);
 extern void __application_exit(void);
 extern void package_main(int argc, char * const argv[]);
 
-#if defined(MYS_TEST)
+#if defined(MYS_TEST) || defined(MYS_BENCH)
 #    include <chrono>
 #endif
 
+#if defined(MYS_TEST)
+#    include <sys/mman.h>
+#    include <sys/wait.h>
+#endif
+
 namespace mys {
 
 TracebackEntry *traceback_bottom_p;
@@ -115,16 +123,14 @@ operator<<(std::ostream& os, const std::exception& e)
     return os;
 }
 
+static void write_utf8(std::ostream& os, const CharVector& chars);
+
 std::ostream&
 operator<<(std::ostream& os, const String& obj)
 {
     if (obj.m_string) {
         os << "\"";
-
-        for (u64 i = 0; i < obj.m_string->size(); i++) {
-            os << PrintChar((*obj.m_string)[i]);
-        }
-
+        write_utf8(os, *obj.m_string);
         os << "\"";
     } else {
         os << "None";
@@ -136,9 +142,7 @@ operator<<(std::ostream& os, const String& obj)
 std::ostream& operator<<(std::ostream& os, const PrintString& obj)
 {
     if (obj.m_value.m_string) {
-        for (u64 i = 0; i < obj.m_value.m_string->size(); i++) {
-            os << PrintChar((*obj.m_value.m_string)[i]);
-        }
+        write_utf8(os, *obj.m_value.m_string);
     } else {
         os << "None";
     }
@@ -177,7 +181,7 @@ operator<<(std::ostream& os, const Bytes& obj)
 std::ofstream mys_coverage_file(".mys-coverage.txt");
 #endif
 
-#if defined(MYS_TEST)
+#if defined(MYS_TEST) || defined(MYS_BENCH)
 
 #define ANSI_COLOR_RED "\x1b[31m"
 #define ANSI_COLOR_GREEN "\x1b[32m"
@@ -196,62 +200,31 @@ std::ofstream mys_coverage_file(".mys-coverage.txt");
 #define COLOR_BOLD(color, ...)                                          \
     ANSI_RESET ANSI_COLOR_##color ANSI_BOLD __VA_ARGS__ ANSI_RESET
 
-Test *tests_head_p = NULL;
-Test *tests_tail_p = NULL;
-
-Test::Test(const char *name_p, test_func_t func)
-{
-    m_name_p = name_p;
-    m_func = func;
-    m_next_p = NULL;
-
-    if (tests_head_p == NULL) {
-        tests_head_p = this;
-    } else {
-        tests_tail_p->m_next_p = this;
-    }
-
-    tests_tail_p = this;
-}
-
 using namespace std::chrono;
 
-static int count_tests(Test *test_p)
-{
-    int total = 0;
-
-    while (test_p != NULL) {
-        total++;
-        test_p = test_p->m_next_p;
-    }
-
-    return total;
-}
-
-static bool is_test_match(Test *test_p, const char *test_pattern_p)
+static bool is_name_match(const char *full_name_p, const char *name_pattern_p)
 {
-    const char *full_test_name_p;
-    size_t full_test_name_length;
+    size_t full_name_length;
     size_t pattern_length;
     size_t offset;
     bool match_beginning;
     bool match_end;
     char *pattern_p;
 
-    if (test_pattern_p == NULL) {
+    if (name_pattern_p == NULL) {
         return true;
     }
 
-    pattern_length = strlen(test_pattern_p);
+    pattern_length = strlen(name_pattern_p);
 
     if (pattern_length == 0) {
         return (true);
     }
 
-    match_beginning = (test_pattern_p[0] == '^');
-    match_end = (test_pattern_p[pattern_length - 1] == '$');
+    match_beginning = (name_pattern_p[0] == '^');
+    match_end = (name_pattern_p[pattern_length - 1] == '$');
     pattern_p = (char *)alloca(pattern_length + 1);
-    strcpy(pattern_p, test_pattern_p);
+    strcpy(pattern_p, name_pattern_p);
 
     if (match_beginning) {
         pattern_p++;
@@ -262,10 +235,9 @@ static bool is_test_match(Test *test_p, const char *test_pattern_p)
         pattern_length--;
     }
 
-    full_test_name_p = test_p->m_name_p;
-    full_test_name_length = strlen(full_test_name_p);
+    full_name_length = strlen(full_name_p);
 
-    if (pattern_length > full_test_name_length) {
+    if (pattern_length > full_name_length) {
         return false;
     }
 
@@ -275,30 +247,84 @@ static bool is_test_match(Test *test_p, const char *test_pattern_p)
         }
 
         if (match_beginning) {
-            if (strncmp(full_test_name_p, pattern_p, pattern_length) != 0) {
+            if (strncmp(full_name_p, pattern_p, pattern_length) != 0) {
                 return false;
             }
         }
 
         if (match_end) {
-            offset = (full_test_name_length - pattern_length);
+            offset = (full_name_length - pattern_length);
 
-            if (strncmp(&full_test_name_p[offset],
+            if (strncmp(&full_name_p[offset],
                         pattern_p,
                         pattern_length) != 0) {
                 return false;
             }
         }
-    } else if (strstr(full_test_name_p, pattern_p) == NULL) {
+    } else if (strstr(full_name_p, pattern_p) == NULL) {
         return false;
     }
 
     return true;
 }
 
+// Starts a status file line with given kind and the current time in
+// seconds since the epoch, so the mys command knows when each step
+// started and ended.
+static void print_status_prefix(std::fstream& status, char kind)
+{
+    char prefix[48];
+
+    snprintf(prefix,
+             sizeof(prefix),
+             "%c %.6f ",
+             kind,
+             duration<double>(system_clock::now().time_since_epoch()).count());
+    status << prefix;
+}
+
+#endif
+
+#if defined(MYS_TEST)
+
+Test *tests_head_p = NULL;
+Test *tests_tail_p = NULL;
+
+Test::Test(const char *name_p, test_func_t func)
+{
+    m_name_p = name_p;
+    m_func = func;
+    m_next_p = NULL;
+
+    if (tests_head_p == NULL) {
+        tests_head_p = this;
+    } else {
+        tests_tail_p->m_next_p = this;
+    }
+
+    tests_tail_p = this;
+}
+
+static int count_tests(Test *test_p)
+{
+    int total = 0;
+
+    while (test_p != NULL) {
+        total++;
+        test_p = test_p->m_next_p;
+    }
+
+    return total;
+}
+
+static bool is_test_match(Test *test_p, const char *test_pattern_p)
+{
+    return is_name_match(test_p->m_name_p, test_pattern_p);
+}
+
 static void print_usage_and_exit(const char *program_name_p, int exit_code)
 {
-    printf("usage: %s [-h] [-s] [<test-pattern>]\n"
+    printf("usage: %s [-h] [-s] [-j] [--shard] [<test-pattern>]\n"
            "\n"
            "Run tests.\n"
            "\n"
@@ -311,28 +337,57 @@ static void print_usage_and_exit(const char *program_name_p, int exit_code)
            "\n"
            "optional arguments:\n"
            "  -h, --help                    Show this help message and exit.\n"
-           "  -s, --status-path             Status file path.\n",
+           "  -s, --status-path             Status file path.\n"
+           "  -j, --jobs                    Number of processes running tests "
+           "(default: 1).\n"
+           "  --shard                       Only run shard i of n, given as i/n, "
+           "where i is\n"
+           "                                1 to n.\n",
            program_name_p);
     exit(exit_code);
 }
 
+static void parse_shard(const char *program_name_p,
+                        const char *shard_p,
+                        int *shard_index_p,
+                        int *shard_count_p)
+{
+    if (sscanf(shard_p, "%d/%d", shard_index_p, shard_count_p) != 2) {
+        print_usage_and_exit(program_name_p, 1);
+    }
+
+    if ((*shard_count_p < 1)
+        || (*shard_index_p < 1)
+        || (*shard_index_p > *shard_count_p)) {
+        print_usage_and_exit(program_name_p, 1);
+    }
+}
+
 static void parse_args(int argc,
                        char * const argv[],
                        const char **status_path_pp,
-                       const char **test_pattern_pp)
+                       const char **test_pattern_pp,
+                       int *jobs_p,
+                       int *shard_index_p,
+                       int *shard_count_p)
 {
     static struct option long_options[] = {
         { "help",        no_argument,       NULL, 'h' },
         { "status-path", required_argument, NULL, 's' },
+        { "jobs",        required_argument, NULL, 'j' },
+        { "shard",       required_argument, NULL, 'S' },
         { NULL,          no_argument,       NULL, 0 }
     };
     int option;
 
     *status_path_pp = NULL;
     *test_pattern_pp = NULL;
+    *jobs_p = 1;
+    *shard_index_p = 1;
+    *shard_count_p = 1;
 
     while (1) {
-        option = getopt_long(argc, argv, "hs:", &long_options[0], NULL);
+        option = getopt_long(argc, argv, "hs:j:", &long_options[0], NULL);
 
         if (option == -1) {
             break;
@@ -348,6 +403,19 @@ static void parse_args(int argc,
             *status_path_pp = optarg;
             break;
 
+        case 'j':
+            *jobs_p = atoi(optarg);
+
+            if (*jobs_p < 1) {
+                print_usage_and_exit(argv[0], 1);
+            }
+
+            break;
+
+        case 'S':
+            parse_shard(argv[0], optarg, shard_index_p, shard_count_p);
+            break;
+
         default:
             print_usage_and_exit(argv[0], 1);
             break;
@@ -366,9 +434,9 @@ static void print_status_message(std::shared_ptr<std::fstream> &status,
                                  int total)
 {
     if (status) {
+        print_status_prefix(*status, kind);
         *status
-            << kind
-            << " Running test "
+            << "Running test "
             << test
             << "/"
             << total
@@ -412,25 +480,41 @@ static void print_summary(int passed, int failed, int skipped, int total)
     std::cout << total << " total\n";
 }
 
-int main(int argc, char * const argv[])
-{
+struct SelectedTest {
     Test *test_p;
-    int passed = 0;
-    int failed = 0;
-    int skipped = 0;
-    const char *result_p;
-    const char *test_pattern_p;
-    const char *status_path_p;
+    // Position among all tests, starting at 1.
+    int number;
+};
 
-    parse_args(argc,
-               argv,
-               &status_path_p,
-               &test_pattern_p);
+// Returns tests matching given pattern and in given shard.
+static std::vector<SelectedTest> select_tests(const char *test_pattern_p,
+                                              int shard_index,
+                                              int shard_count)
+{
+    std::vector<SelectedTest> tests;
+    Test *test_p = tests_head_p;
+    int number = 1;
+    int matched = 0;
 
-    ignore_sigpipe();
+    while (test_p != NULL) {
+        if (is_test_match(test_p, test_pattern_p)) {
+            if ((matched % shard_count) == (shard_index - 1)) {
+                tests.push_back({test_p, number});
+            }
+
+            matched++;
+        }
+
+        number++;
+        test_p = test_p->m_next_p;
+    }
 
+    return tests;
+}
+
+static bool application_init()
+{
     __MYS_TRACEBACK_INIT();
-    init();
 
     try {
         __application_init();
@@ -438,153 +522,861 @@ int main(int argc, char * const argv[])
         __MYS_TRACEBACK_RESTORE();
         print_error_traceback(e.m_error, std::cout);
         std::cout << PrintString(e.m_error->__str__()) << std::endl;
-        __MYS_TRACEBACK_EXIT_MAIN();
-
-        return 1;
-    }
 
-    std::shared_ptr<std::fstream> status;
-
-    if (status_path_p != NULL) {
-        status = std::make_shared<std::fstream>(status_path_p, std::fstream::out);
+        return false;
     }
 
-    int total = count_tests(tests_head_p);
-    test_p = tests_head_p;
-    int test = 1;
+    return true;
+}
 
-    while (test_p != NULL) {
-        if (is_test_match(test_p, test_pattern_p)) {
-            print_status_message(status, '>', test_p, test, total);
-
-            auto begin = steady_clock::now();
-
-            try {
-                test_p->m_func();
-                result_p = COLOR(GREEN, " ✔");
-                passed++;
-            } catch (const __Error &e) {
-                __MYS_TRACEBACK_RESTORE();
-                print_error_traceback(e.m_error, std::cout);
-                std::cout << PrintString(e.m_error->__str__()) << std::endl;
-                result_p = COLOR(RED, " ✘");
-                failed++;
-            }
+static bool application_exit()
+{
+    __MYS_TRACEBACK_INIT();
 
-            auto end = steady_clock::now();
-            auto duration = duration_cast<milliseconds>(end - begin).count();
+    try {
+        __application_exit();
+    } catch (const __Error &e) {
+        __MYS_TRACEBACK_RESTORE();
+        print_error_traceback(e.m_error, std::cout);
+        std::cout << PrintString(e.m_error->__str__()) << std::endl;
 
-            std::cout
-                << result_p
-                << " " << test_p->m_name_p
-                << " (" <<  duration << " ms)"
-                << std::endl;
+        return false;
+    }
 
-            print_status_message(status, '<', test_p, test, total);
-        } else {
-            skipped++;
-        }
+    return true;
+}
 
-        test++;
-        test_p = test_p->m_next_p;
-    }
+// Runs given test and prints the result. Returns true if it passed.
+static bool run_test(Test *test_p)
+{
+    const char *result_p;
+    bool passed;
 
-    print_summary(passed, failed, skipped, total);
+    __MYS_TRACEBACK_INIT();
 
-    if (status != nullptr) {
-        *status
-            << "> Running "
-            << total
-            << " test"
-            << (total == 1 ? "" : "s")
-            << std::endl;
-    }
+    auto begin = steady_clock::now();
 
     try {
-        __application_exit();
+        test_p->m_func();
+        result_p = COLOR(GREEN, " ✔");
+        passed = true;
     } catch (const __Error &e) {
         __MYS_TRACEBACK_RESTORE();
         print_error_traceback(e.m_error, std::cout);
         std::cout << PrintString(e.m_error->__str__()) << std::endl;
-        __MYS_TRACEBACK_EXIT_MAIN();
+        result_p = COLOR(RED, " ✘");
+        passed = false;
+    }
+
+    auto end = steady_clock::now();
+    auto duration = duration_cast<milliseconds>(end - begin).count();
 
+    std::cout
+        << result_p
+        << " " << test_p->m_name_p
+        << " (" <<  duration << " ms)"
+        << std::endl;
+
+    return passed;
+}
+
+static int run_tests_serially(std::vector<SelectedTest>& tests,
+                              std::shared_ptr<std::fstream> &status,
+                              int total,
+                              int *passed_p,
+                              int *failed_p)
+{
+    init();
+
+    if (!application_init()) {
         return 1;
     }
 
-    __MYS_TRACEBACK_EXIT_MAIN();
+    for (auto& test : tests) {
+        print_status_message(status, '>', test.test_p, test.number, total);
 
-    if (failed == 0) {
-        return 0;
-    } else {
+        if (run_test(test.test_p)) {
+            (*passed_p)++;
+        } else {
+            (*failed_p)++;
+        }
+
+        print_status_message(status, '<', test.test_p, test.number, total);
+    }
+
+    if (!application_exit()) {
         return 1;
     }
+
+    return 0;
 }
 
-#elif defined(MYS_APPLICATION)
+// State shared by the test worker processes.
+struct Workers {
+    pthread_mutex_t mutex;
+    // Next test to run.
+    int next;
+    int passed;
+    int failed;
+    // Test each worker is running, or -1.
+    int running[];
+};
 
-int main(int argc, char * const argv[])
+// Writes output captured in given file to given file descriptor and
+// empties the file.
+static void flush_output(int output_fd, int stdout_fd)
 {
-    int res = 1;
+    char buf[4096];
+    ssize_t size;
 
-    ignore_sigpipe();
+    std::cout.flush();
+    fflush(stdout);
+    lseek(output_fd, 0, SEEK_SET);
 
-    __MYS_TRACEBACK_INIT();
+    while ((size = read(output_fd, &buf[0], sizeof(buf))) > 0) {
+        if (write(stdout_fd, &buf[0], size) != size) {
+            break;
+        }
+    }
+
+    if (ftruncate(output_fd, 0) != 0) {
+        return;
+    }
+
+    lseek(output_fd, 0, SEEK_SET);
+}
+
+// Runs tests in a forked process until all tests have been started.
+// Output of each test is written at once when the test has finished.
+static void run_tests_in_worker(Workers *workers_p,
+                                int worker,
+                                std::vector<SelectedTest>& tests,
+                                std::shared_ptr<std::fstream> &status,
+                                int total,
+                                int output_fd,
+                                int stdout_fd)
+{
+    int res = 0;
+
+    dup2(output_fd, STDOUT_FILENO);
     init();
 
-    try {
-        __application_init();
-        package_main(argc, argv);
-        res = 0;
-    } catch (const __SystemExitError &e) {
-        __MYS_TRACEBACK_RESTORE();
+    if (!application_init()) {
+        pthread_mutex_lock(&workers_p->mutex);
+        flush_output(output_fd, stdout_fd);
+        pthread_mutex_unlock(&workers_p->mutex);
+        _exit(1);
+    }
 
-        // This exception should probably contain the exit code.
-        auto error = static_cast<mys::shared_ptr<SystemExitError>>(e.m_error);
+    while (true) {
+        int index = __atomic_fetch_add(&workers_p->next, 1, __ATOMIC_SEQ_CST);
 
-        if (error->m_message.m_string) {
-            std::cerr << PrintString(error->m_message) << std::endl;
+        if (index >= (int)tests.size()) {
+            break;
+        }
+
+        SelectedTest& test = tests[index];
+
+        pthread_mutex_lock(&workers_p->mutex);
+        workers_p->running[worker] = index;
+        print_status_message(status, '>', test.test_p, test.number, total);
+        pthread_mutex_unlock(&workers_p->mutex);
+
+        bool passed = run_test(test.test_p);
+
+        pthread_mutex_lock(&workers_p->mutex);
+        flush_output(output_fd, stdout_fd);
+        print_status_message(status, '<', test.test_p, test.number, total);
+        workers_p->running[worker] = -1;
+
+        if (passed) {
+            workers_p->passed++;
         } else {
-            res = 0;
+            workers_p->failed++;
         }
-    } catch (const __Error &e) {
-        __MYS_TRACEBACK_RESTORE();
-        print_error_traceback(e.m_error, std::cerr);
-        std::cerr << e.m_error << std::endl;
+
+        pthread_mutex_unlock(&workers_p->mutex);
     }
 
-    __application_exit();
-    __MYS_TRACEBACK_EXIT_MAIN();
+    if (!application_exit()) {
+        res = 1;
+    }
 
-    return (res);
+    pthread_mutex_lock(&workers_p->mutex);
+    flush_output(output_fd, stdout_fd);
+    pthread_mutex_unlock(&workers_p->mutex);
+    _exit(res);
 }
 
-#endif
-
-std::ostream& operator<<(std::ostream& os, const Bool& obj)
+static int run_tests_in_parallel(std::vector<SelectedTest>& tests,
+                                 std::shared_ptr<std::fstream> &status,
+                                 int total,
+                                 int jobs,
+                                 int *passed_p,
+                                 int *failed_p)
 {
-    if (obj.m_value) {
-        os << "True";
-    } else {
-        os << "False";
+    pthread_mutexattr_t mutexattr;
+    std::vector<pid_t> pids;
+    std::vector<int> output_fds;
+    size_t size = sizeof(Workers) + jobs * sizeof(int);
+    int res = 0;
+
+    Workers *workers_p = (Workers *)mmap(NULL,
+                                         size,
+                                         PROT_READ | PROT_WRITE,
+                                         MAP_SHARED | MAP_ANONYMOUS,
+                                         -1,
+                                         0);
+
+    if (workers_p == MAP_FAILED) {
+        std::cout << "error: failed to create test workers" << std::endl;
+
+        return 1;
     }
 
-    return os;
-}
+    pthread_mutexattr_init(&mutexattr);
+    pthread_mutexattr_setpshared(&mutexattr, PTHREAD_PROCESS_SHARED);
+    pthread_mutex_init(&workers_p->mutex, &mutexattr);
+    workers_p->next = 0;
+    workers_p->passed = 0;
+    workers_p->failed = 0;
 
-size_t encode_utf8(char *dst_p, i32 ch)
-{
-    size_t size;
+    for (int worker = 0; worker < jobs; worker++) {
+        workers_p->running[worker] = -1;
+    }
 
-    if (ch < 0x80) {
-        dst_p[0] = ch;
-        size = 1;
-    } else if (ch < 0x800) {
-        dst_p[0] = (ch >> 6) | 0xc0;
-        dst_p[1] = (ch & 0x3f) | 0x80;
-        size = 2;
-    } else if (ch < 0x10000) {
-        dst_p[0] = (ch >> 0xc) | 0xe0;
-        dst_p[1] = ((ch >> 6) & 0x3f) | 0x80;
+    std::cout.flush();
+    fflush(stdout);
+    int stdout_fd = dup(STDOUT_FILENO);
+
+    for (int worker = 0; worker < jobs; worker++) {
+        // Created by the parent to print the output of a crashed
+        // worker.
+        FILE *output_p = tmpfile();
+
+        if (output_p == NULL) {
+            std::cout
+                << "error: failed to create test output file: "
+                << strerror(errno)
+                << std::endl;
+            exit(1);
+        }
+
+        int output_fd = fileno(output_p);
+        pid_t pid = fork();
+
+        if (pid == 0) {
+            run_tests_in_worker(workers_p,
+                                worker,
+                                tests,
+                                status,
+                                total,
+                                output_fd,
+                                stdout_fd);
+        } else if (pid < 0) {
+            std::cout << "error: failed to create test workers" << std::endl;
+            exit(1);
+        }
+
+        pids.push_back(pid);
+        output_fds.push_back(output_fd);
+    }
+
+    for (int worker = 0; worker < jobs; worker++) {
+        int wstatus;
+
+        waitpid(pids[worker], &wstatus, 0);
+
+        if (WIFEXITED(wstatus) && (WEXITSTATUS(wstatus) == 0)) {
+            continue;
+        }
+
+        res = 1;
+        int index = workers_p->running[worker];
+
+        if (index != -1) {
+            SelectedTest& test = tests[index];
+
+            flush_output(output_fds[worker], STDOUT_FILENO);
+            std::cout
+                << COLOR(RED, " ✘")
+                << " " << test.test_p->m_name_p
+                << " (crashed)"
+                << std::endl;
+            print_status_message(status, '<', test.test_p, test.number, total);
+            workers_p->failed++;
+        } else {
+            flush_output(output_fds[worker], STDOUT_FILENO);
+        }
+    }
+
+    *passed_p = workers_p->passed;
+    *failed_p = workers_p->failed;
+
+    return res;
+}
+
+int main(int argc, char * const argv[])
+{
+    int passed = 0;
+    int failed = 0;
+    const char *test_pattern_p;
+    const char *status_path_p;
+    int jobs;
+    int shard_index;
+    int shard_count;
+    int res;
+
+    parse_args(argc,
+               argv,
+               &status_path_p,
+               &test_pattern_p,
+               &jobs,
+               &shard_index,
+               &shard_count);
+
+    ignore_sigpipe();
+
+    __MYS_TRACEBACK_INIT();
+
+    std::shared_ptr<std::fstream> status;
+
+    if (status_path_p != NULL) {
+        status = std::make_shared<std::fstream>(status_path_p, std::fstream::out);
+    }
+
+    int total = count_tests(tests_head_p);
+    auto tests = select_tests(test_pattern_p, shard_index, shard_count);
+
+#if defined(MYS_COVERAGE)
+    // All processes would write to the same coverage file.
+    jobs = 1;
+#endif
+
+    if (jobs > (int)tests.size()) {
+        jobs = std::max((int)tests.size(), 1);
+    }
+
+    if (jobs == 1) {
+        res = run_tests_serially(tests, status, total, &passed, &failed);
+    } else {
+        res = run_tests_in_parallel(tests,
+                                    status,
+                                    total,
+                                    jobs,
+                                    &passed,
+                                    &failed);
+    }
+
+    print_summary(passed, failed, total - (int)tests.size(), total);
+
+    if (status != nullptr) {
+        print_status_prefix(*status, '>');
+        *status
+            << "Running "
+            << total
+            << " test"
+            << (total == 1 ? "" : "s")
+            << std::endl;
+    }
+
+    __MYS_TRACEBACK_EXIT_MAIN();
+
+    if ((res == 0) && (failed == 0)) {
+        return 0;
+    } else {
+        return 1;
+    }
+}
+
+#elif defined(MYS_BENCH)
+
+Bench *benches_head_p = NULL;
+Bench *benches_tail_p = NULL;
+
+Bench::Bench(const char *name_p, bench_func_t func)
+{
+    m_name_p = name_p;
+    m_func = func;
+    m_next_p = NULL;
+
+    if (benches_head_p == NULL) {
+        benches_head_p = this;
+    } else {
+        benches_tail_p->m_next_p = this;
+    }
+
+    benches_tail_p = this;
+}
+
+// Number of samples taken of each benchmark, unless it is slow.
+static const int SAMPLES = 100;
+
+// Samples taken of slow benchmarks.
+static const int MIN_SAMPLES = 5;
+
+struct BenchResult {
+    const char *name_p;
+    bool passed;
+    i64 iterations;
+    int samples;
+    // All times are nanoseconds per iteration.
+    double mean;
+    double median;
+    double p90;
+    double p99;
+    double min;
+    double max;
+};
+
+static void print_usage_and_exit(const char *program_name_p, int exit_code)
+{
+    printf("usage: %s [-h] [-s] [-t] [--json] [<bench-pattern>]\n"
+           "\n"
+           "Run benchmarks.\n"
+           "\n"
+           "positional arguments:\n"
+           "  bench-pattern                 Only run benchmarks matching given "
+           "pattern. '^'\n"
+           "                                matches the beginning and '$' "
+           "matches the end of\n"
+           "                                the benchmark name.\n"
+           "\n"
+           "optional arguments:\n"
+           "  -h, --help                    Show this help message and exit.\n"
+           "  -s, --status-path             Status file path.\n"
+           "  -t, --time                    Seconds to measure each benchmark "
+           "(default: 1).\n"
+           "  --json                        Write results as JSON to given "
+           "file.\n",
+           program_name_p);
+    exit(exit_code);
+}
+
+static void parse_args(int argc,
+                       char * const argv[],
+                       const char **status_path_pp,
+                       const char **json_path_pp,
+                       double *time_p,
+                       const char **bench_pattern_pp)
+{
+    static struct option long_options[] = {
+        { "help",        no_argument,       NULL, 'h' },
+        { "status-path", required_argument, NULL, 's' },
+        { "time",        required_argument, NULL, 't' },
+        { "json",        required_argument, NULL, 'J' },
+        { NULL,          no_argument,       NULL, 0 }
+    };
+    int option;
+
+    *status_path_pp = NULL;
+    *json_path_pp = NULL;
+    *time_p = 1.0;
+    *bench_pattern_pp = NULL;
+
+    while (1) {
+        option = getopt_long(argc, argv, "hs:t:", &long_options[0], NULL);
+
+        if (option == -1) {
+            break;
+        }
+
+        switch (option) {
+
+        case 'h':
+            print_usage_and_exit(argv[0], 0);
+            break;
+
+        case 's':
+            *status_path_pp = optarg;
+            break;
+
+        case 't':
+            *time_p = atof(optarg);
+
+            if (*time_p <= 0.0) {
+                print_usage_and_exit(argv[0], 1);
+            }
+
+            break;
+
+        case 'J':
+            *json_path_pp = optarg;
+            break;
+
+        default:
+            print_usage_and_exit(argv[0], 1);
+            break;
+        }
+    }
+
+    if (optind < argc) {
+        *bench_pattern_pp = argv[optind];
+    }
+}
+
+static void print_status_message(std::shared_ptr<std::fstream> &status,
+                                 char kind,
+                                 Bench *bench_p,
+                                 int bench,
+                                 int total)
+{
+    if (status) {
+        print_status_prefix(*status, kind);
+        *status
+            << "Running benchmark "
+            << bench
+            << "/"
+            << total
+            << ": "
+            << bench_p->m_name_p
+            << std::endl;
+    }
+}
+
+// Returns nanoseconds it took to call given benchmark given number of
+// times.
+static double run_iterations(Bench *bench_p, i64 iterations)
+{
+    auto begin = steady_clock::now();
+
+    for (i64 i = 0; i < iterations; i++) {
+        bench_p->m_func();
+    }
+
+    auto end = steady_clock::now();
+
+    return duration<double, std::nano>(end - begin).count();
+}
+
+// Warms up given benchmark for a tenth of given time and returns the
+// number of iterations per sample for SAMPLES samples to take given
+// time.
+static i64 calibrate(Bench *bench_p, double time)
+{
+    double elapsed = 0.0;
+    i64 total_iterations = 0;
+    i64 iterations = 1;
+
+    while (elapsed < time / 10.0) {
+        elapsed += run_iterations(bench_p, iterations);
+        total_iterations += iterations;
+        iterations *= 2;
+    }
+
+    double iteration_time = elapsed / (double)total_iterations;
+
+    return std::max((i64)(time / SAMPLES / iteration_time), (i64)1);
+}
+
+// Returns given percentile of given sorted samples, using the nearest
+// rank method.
+static double percentile(const std::vector<double>& samples, int percent)
+{
+    size_t rank = (percent * samples.size() + 99) / 100;
+
+    return samples[std::max(rank, (size_t)1) - 1];
+}
+
+static void measure(Bench *bench_p, double time, BenchResult& result)
+{
+    std::vector<double> samples;
+    double elapsed = 0.0;
+
+    result.iterations = calibrate(bench_p, time);
+
+    while ((samples.size() < (size_t)MIN_SAMPLES)
+           || ((elapsed < time) && (samples.size() < (size_t)SAMPLES))) {
+        double sample = run_iterations(bench_p, result.iterations);
+        elapsed += sample;
+        samples.push_back(sample / (double)result.iterations);
+    }
+
+    std::sort(samples.begin(), samples.end());
+    result.samples = samples.size();
+    result.mean = (elapsed
+                   / (double)result.iterations
+                   / (double)result.samples);
+    result.median = percentile(samples, 50);
+    result.p90 = percentile(samples, 90);
+    result.p99 = percentile(samples, 99);
+    result.min = samples.front();
+    result.max = samples.back();
+}
+
+static std::string format_time(double time)
+{
+    std::stringstream ss;
+
+    ss << std::fixed << std::setprecision(2);
+
+    if (time < 1e3) {
+        ss << time << " ns";
+    } else if (time < 1e6) {
+        ss << time / 1e3 << " µs";
+    } else if (time < 1e9) {
+        ss << time / 1e6 << " ms";
+    } else {
+        ss << time / 1e9 << " s";
+    }
+
+    return ss.str();
+}
+
+// Runs given benchmark and prints the result.
+static void run_bench(Bench *bench_p, double time, BenchResult& result)
+{
+    __MYS_TRACEBACK_INIT();
+
+    result.name_p = bench_p->m_name_p;
+
+    try {
+        measure(bench_p, time, result);
+        result.passed = true;
+    } catch (const __Error &e) {
+        __MYS_TRACEBACK_RESTORE();
+        print_error_traceback(e.m_error, std::cout);
+        std::cout << PrintString(e.m_error->__str__()) << std::endl;
+        result.passed = false;
+    }
+
+    if (result.passed) {
+        std::cout
+            << COLOR(GREEN, " ✔")
+            << " " << bench_p->m_name_p
+            << ": " << format_time(result.median) << " median"
+            << ", " << format_time(result.p90) << " p90"
+            << ", " << format_time(result.p99) << " p99"
+            << " (" << result.samples << " samples of "
+            << result.iterations << " iterations)"
+            << std::endl;
+    } else {
+        std::cout << COLOR(RED, " ✘") << " " << bench_p->m_name_p << std::endl;
+    }
+}
+
+static void write_json(const char *json_path_p,
+                       std::vector<BenchResult>& results)
+{
+    std::ofstream fout(json_path_p);
+
+    fout << std::setprecision(15);
+    fout << "{\n    \"benchmarks\": [";
+
+    for (size_t i = 0; i < results.size(); i++) {
+        BenchResult& result = results[i];
+
+        fout << (i == 0 ? "\n" : ",\n")
+             << "        {\n"
+             << "            \"name\": \"" << result.name_p << "\",\n";
+
+        if (result.passed) {
+            fout << "            \"passed\": true,\n"
+                 << "            \"iterations\": " << result.iterations << ",\n"
+                 << "            \"samples\": " << result.samples << ",\n"
+                 << "            \"mean_ns\": " << result.mean << ",\n"
+                 << "            \"median_ns\": " << result.median << ",\n"
+                 << "            \"p90_ns\": " << result.p90 << ",\n"
+                 << "            \"p99_ns\": " << result.p99 << ",\n"
+                 << "            \"min_ns\": " << result.min << ",\n"
+                 << "            \"max_ns\": " << result.max << "\n";
+        } else {
+            fout << "            \"passed\": false\n";
+        }
+
+        fout << "        }";
+    }
+
+    fout << "\n    ]\n}\n";
+}
+
+int main(int argc, char * const argv[])
+{
+    const char *bench_pattern_p;
+    const char *status_path_p;
+    const char *json_path_p;
+    double time;
+    std::vector<BenchResult> results;
+    int failed = 0;
+
+    parse_args(argc,
+               argv,
+               &status_path_p,
+               &json_path_p,
+               &time,
+               &bench_pattern_p);
+
+    ignore_sigpipe();
+
+    __MYS_TRACEBACK_INIT();
+    init();
+
+    try {
+        __application_init();
+    } catch (const __Error &e) {
+        __MYS_TRACEBACK_RESTORE();
+        print_error_traceback(e.m_error, std::cout);
+        std::cout << PrintString(e.m_error->__str__()) << std::endl;
+        __MYS_TRACEBACK_EXIT_MAIN();
+
+        return 1;
+    }
+
+    std::shared_ptr<std::fstream> status;
+
+    if (status_path_p != NULL) {
+        status = std::make_shared<std::fstream>(status_path_p, std::fstream::out);
+    }
+
+    int total = 0;
+
+    for (Bench *bench_p = benches_head_p;
+         bench_p != NULL;
+         bench_p = bench_p->m_next_p) {
+        total++;
+    }
+
+    int bench = 1;
+
+    for (Bench *bench_p = benches_head_p;
+         bench_p != NULL;
+         bench_p = bench_p->m_next_p) {
+        if (is_name_match(bench_p->m_name_p, bench_pattern_p)) {
+            BenchResult result;
+
+            print_status_message(status, '>', bench_p, bench, total);
+            run_bench(bench_p, 1e9 * time, result);
+            print_status_message(status, '<', bench_p, bench, total);
+
+            if (!result.passed) {
+                failed++;
+            }
+
+            results.push_back(result);
+        }
+
+        bench++;
+    }
+
+    if (json_path_p != NULL) {
+        write_json(json_path_p, results);
+    }
+
+    if (status != nullptr) {
+        print_status_prefix(*status, '>');
+        *status
+            << "Running "
+            << results.size()
+            << " benchmark"
+            << (results.size() == 1 ? "" : "s")
+            << std::endl;
+    }
+
+    try {
+        __application_exit();
+    } catch (const __Error &e) {
+        __MYS_TRACEBACK_RESTORE();
+        print_error_traceback(e.m_error, std::cout);
+        std::cout << PrintString(e.m_error->__str__()) << std::endl;
+        __MYS_TRACEBACK_EXIT_MAIN();
+
+        return 1;
+    }
+
+    __MYS_TRACEBACK_EXIT_MAIN();
+
+    if (failed == 0) {
+        return 0;
+    } else {
+        return 1;
+    }
+}
+
+#elif defined(MYS_APPLICATION)
+
+// Standard output is line buffered if it is a terminal and fully
+// buffered otherwise. MYS_STDOUT_BUFFERING=line makes it line buffered
+// when piped as well, and MYS_STDOUT_BUFFERING=full makes it fully
+// buffered with a larger buffer.
+static void set_stdout_buffering()
+{
+    const char *mode_p = getenv("MYS_STDOUT_BUFFERING");
+
+    if ((mode_p == NULL) || isatty(STDOUT_FILENO)) {
+        return;
+    }
+
+    if (strcmp(mode_p, "line") == 0) {
+        setvbuf(stdout, NULL, _IOLBF, BUFSIZ);
+    } else if (strcmp(mode_p, "full") == 0) {
+        setvbuf(stdout, NULL, _IOFBF, 65536);
+    }
+}
+
+int main(int argc, char * const argv[])
+{
+    int res = 1;
+
+    ignore_sigpipe();
+    set_stdout_buffering();
+
+    __MYS_TRACEBACK_INIT();
+    init();
+
+    try {
+        __application_init();
+        package_main(argc, argv);
+        res = 0;
+    } catch (const __SystemExitError &e) {
+        __MYS_TRACEBACK_RESTORE();
+
+        // This exception should probably contain the exit code.
+        auto error = static_cast<mys::shared_ptr<SystemExitError>>(e.m_error);
+
+        if (error->m_message.m_string) {
+            std::cerr << PrintString(error->m_message) << std::endl;
+        } else {
+            res = 0;
+        }
+    } catch (const __Error &e) {
+        __MYS_TRACEBACK_RESTORE();
+        print_error_traceback(e.m_error, std::cerr);
+        std::cerr << e.m_error << std::endl;
+    }
+
+    __application_exit();
+    __MYS_TRACEBACK_EXIT_MAIN();
+
+    return (res);
+}
+
+#endif
+
+std::ostream& operator<<(std::ostream& os, const Bool& obj)
+{
+    if (obj.m_value) {
+        os << "True";
+    } else {
+        os << "False";
+    }
+
+    return os;
+}
+
+size_t encode_utf8(char *dst_p, i32 ch)
+{
+    size_t size;
+
+    if (ch < 0x80) {
+        dst_p[0] = ch;
+        size = 1;
+    } else if (ch < 0x800) {
+        dst_p[0] = (ch >> 6) | 0xc0;
+        dst_p[1] = (ch & 0x3f) | 0x80;
+        size = 2;
+    } else if (ch < 0x10000) {
+        dst_p[0] = (ch >> 0xc) | 0xe0;
+        dst_p[1] = ((ch >> 6) & 0x3f) | 0x80;
         dst_p[2] = (ch & 0x3f) | 0x80;
         size = 3;
     } else if (ch < 0x200000) {
@@ -624,136 +1416,406 @@ size_t decode_utf8(char *src_p, size_t size, i32 *ch)
         size = 0;
     }
 
-    return size;
+    return size;
+}
+
+std::ostream& operator<<(std::ostream& os, const Char& obj)
+{
+    char buf[4];
+    size_t size;
+
+    size = encode_utf8(&buf[0], obj.m_value);
+
+    os << "'";
+    os.write(&buf[0], size);
+    os << "'";
+
+    return os;
+}
+
+std::ostream& operator<<(std::ostream& os, const PrintChar& obj)
+{
+    char buf[4];
+    size_t size;
+
+    size = encode_utf8(&buf[0], obj.m_value.m_value);
+    os.write(&buf[0], size);
+
+    return os;
+}
+
+#if !defined(MYS_UNSAFE)
+void abort_is_none()
+{
+    print_traceback();
+    std::cerr << "\nPanic(message=\"Object is None.\")\n";
+    abort();
+}
+
+const String& string_not_none(const String& obj)
+{
+    if (!obj.m_string) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
+String& string_not_none(String& obj)
+{
+    if (!obj.m_string) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
+const Regex& regex_not_none(const Regex& obj)
+{
+    if (!obj.m_compiled) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
+const RegexMatch& regexmatch_not_none(const RegexMatch& obj)
+{
+    if (!obj.m_match_data) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+
+Bytes bytes_not_none(Bytes obj)
+{
+    if (!obj.m_bytes) {
+        abort_is_none();
+    }
+
+    return obj;
+}
+#endif
+
+std::ostream& operator<<(std::ostream& os, Object& obj)
+{
+    os << PrintString(obj.__str__());
+
+    return os;
+}
+
+void CharVector::widen(int width)
+{
+    if (width <= m_width) {
+        return;
+    }
+
+    size_t length = size();
+    std::vector<u8> data(length * width);
+
+    visit([&data, length, width](auto data_p) {
+        if (width == 2) {
+            std::copy(data_p, data_p + length, reinterpret_cast<u16 *>(data.data()));
+        } else {
+            std::copy(data_p, data_p + length, reinterpret_cast<u32 *>(data.data()));
+        }
+    });
+
+    m_data.swap(data);
+    m_width = width;
+}
+
+void CharVector::append(const CharVector& other, size_t begin, size_t end)
+{
+    size_t length = size();
+
+    widen(other.m_width);
+    m_data.resize((length + end - begin) * m_width);
+
+    visit([&other, begin, end, length](auto data_p) {
+        other.visit([data_p, begin, end, length](auto other_data_p) {
+            std::copy(other_data_p + begin, other_data_p + end, data_p + length);
+        });
+    });
+}
+
+void CharVector::append(const u8 *data_p, size_t size)
+{
+    size_t length = this->size();
+
+    m_data.resize((length + size) * m_width);
+
+    visit([data_p, size, length](auto this_data_p) {
+        std::copy(data_p, data_p + size, this_data_p + length);
+    });
 }
 
-std::ostream& operator<<(std::ostream& os, const Char& obj)
+void CharVector::replace(const Char& old, const Char& _new)
 {
-    char buf[4];
-    size_t size;
+    size_t length = size();
 
-    size = encode_utf8(&buf[0], obj.m_value);
+    // Not found if wider than all code points.
+    if (width_of(old.m_value) > m_width) {
+        return;
+    }
 
-    os << "'";
+    size_t first = visit([&old, length](auto data_p) {
+        return (size_t)(std::find(data_p, data_p + length, old.m_value) - data_p);
+    });
 
-    for (size_t i = 0; i < size; i++) {
-        os << buf[i];
+    if (first == length) {
+        return;
     }
 
-    os << "'";
+    widen(width_of(_new.m_value));
 
-    return os;
+    visit([&old, &_new, first, length](auto data_p) {
+        typedef std::remove_pointer_t<decltype(data_p)> T;
+
+        std::replace(data_p + first, data_p + length, (T)old.m_value, (T)_new.m_value);
+    });
 }
 
-std::ostream& operator<<(std::ostream& os, const PrintChar& obj)
+bool CharVector::operator==(const CharVector& other) const
 {
-    char buf[4];
-    size_t size;
+    size_t length = size();
 
-    size = encode_utf8(&buf[0], obj.m_value.m_value);
+    if (length != other.size()) {
+        return false;
+    }
 
-    for (size_t i = 0; i < size; i++) {
-        os << buf[i];
+    if (m_width == other.m_width) {
+        return m_data == other.m_data;
     }
 
-    return os;
+    return visit([&other, length](auto data_p) {
+        return other.visit([data_p, length](auto other_data_p) {
+            return std::equal(data_p, data_p + length, other_data_p);
+        });
+    });
 }
 
-#if !defined(MYS_UNSAFE)
-void abort_is_none()
+bool CharVector::operator<(const CharVector& other) const
 {
-    print_traceback();
-    std::cerr << "\nPanic(message=\"Object is None.\")\n";
-    abort();
+    size_t length = size();
+    size_t other_length = other.size();
+
+    return visit([&other, length, other_length](auto data_p) {
+        return other.visit([data_p, length, other_length](auto other_data_p) {
+            // Compare as Char, which is signed.
+            return std::lexicographical_compare(
+                data_p,
+                data_p + length,
+                other_data_p,
+                other_data_p + other_length,
+                [](i32 left, i32 right) {
+                    return left < right;
+                });
+        });
+    });
 }
 
-const String& string_not_none(const String& obj)
+static const u64 HASH_SECRET[3] = {
+    0xa0761d6478bd642f,
+    0xe7037ed1a0b428db,
+    0x8ebc6af09c88c6e3
+};
+
+static inline u64 hash_mix(u64 left, u64 right)
 {
-    if (!obj.m_string) {
-        abort_is_none();
-    }
+    __uint128_t product = left;
 
-    return obj;
+    product *= right;
+
+    return (u64)product ^ (u64)(product >> 64);
 }
 
-String& string_not_none(String& obj)
+// A hash in the style of wyhash of count 64 bit words, read by given
+// function, followed by given zero padded last word. Two independent
+// lanes are mixed per iteration.
+template <typename F>
+static u64 hash_words(F word, size_t count, u64 last, u64 size)
 {
-    if (!obj.m_string) {
-        abort_is_none();
+    u64 seed = hash_mix(size ^ HASH_SECRET[0], HASH_SECRET[1]);
+    u64 seed_2 = seed;
+    size_t i = 0;
+
+    for (; i + 4 <= count; i += 4) {
+        seed = hash_mix(word(i) ^ HASH_SECRET[1], word(i + 1) ^ seed);
+        seed_2 = hash_mix(word(i + 2) ^ HASH_SECRET[2], word(i + 3) ^ seed_2);
     }
 
-    return obj;
+    if (i > 0) {
+        seed ^= seed_2;
+    }
+
+    for (; i + 2 <= count; i += 2) {
+        seed = hash_mix(word(i) ^ HASH_SECRET[1], word(i + 1) ^ seed);
+    }
+
+    u64 left = last;
+    u64 right = 0;
+
+    if (i < count) {
+        left = word(i);
+        right = last;
+    }
+
+    return hash_mix(HASH_SECRET[1] ^ size,
+                    hash_mix(left ^ HASH_SECRET[1], right ^ seed));
 }
 
-const Regex& regex_not_none(const Regex& obj)
+size_t CharVector::calculate_hash() const
 {
-    if (!obj.m_compiled) {
-        abort_is_none();
-    }
+    size_t length = size();
 
-    return obj;
+    // Two code points of 32 bits per word, so that equal strings of
+    // different widths have the same hash.
+    return visit([length](auto data_p) {
+        u64 last = 0;
+
+        if (length % 2 == 1) {
+            last = (u32)data_p[length - 1];
+        }
+
+        return hash_words(
+            [data_p](size_t i) {
+                return (u64)(u32)data_p[2 * i] | ((u64)(u32)data_p[2 * i + 1] << 32);
+            },
+            length / 2,
+            last,
+            length);
+    });
 }
 
-const RegexMatch& regexmatch_not_none(const RegexMatch& obj)
+size_t hash_bytes(const u8 *data_p, size_t size)
 {
-    if (!obj.m_match_data) {
-        abort_is_none();
+    u64 last = 0;
+
+    if (size % 8 != 0) {
+        memcpy(&last, &data_p[size - size % 8], size % 8);
     }
 
-    return obj;
+    return hash_words(
+        [data_p](size_t i) {
+            u64 value;
+
+            memcpy(&value, &data_p[8 * i], 8);
+
+            return value;
+        },
+        size / 8,
+        last,
+        size);
 }
 
-Bytes bytes_not_none(Bytes obj)
+static size_t utf8_size(i32 ch)
 {
-    if (!obj.m_bytes) {
-        abort_is_none();
+    if (ch < 0x80) {
+        return 1;
+    } else if (ch < 0x800) {
+        return 2;
+    } else if (ch < 0x10000) {
+        return 3;
+    } else if (ch < 0x200000) {
+        return 4;
+    } else {
+        return 0;
+    }
+}
+
+static bool is_ascii(const u8 *data_p, size_t size)
+{
+    u8 bits = 0;
+
+    // No early exit, so that the loop is vectorized.
+    for (size_t i = 0; i < size; i++) {
+        bits |= data_p[i];
     }
 
-    return obj;
+    return bits < 0x80;
 }
-#endif
 
-std::ostream& operator<<(std::ostream& os, Object& obj)
+// Append given characters, one per char. ASCII is copied in bulk.
+static void append_chars(CharVector& chars, const char *str_p, size_t size)
 {
-    os << PrintString(obj.__str__());
+    const u8 *data_p = reinterpret_cast<const u8 *>(str_p);
 
-    return os;
+    if (is_ascii(data_p, size)) {
+        chars.append(data_p, size);
+    } else {
+        chars.reserve(size);
+
+        for (size_t i = 0; i < size; i++) {
+            chars.push_back(Char(str_p[i]));
+        }
+    }
+}
+
+// Append given UTF-8 encoded data. ASCII is copied as is, and only
+// other characters are decoded.
+static void append_utf8(CharVector& chars, const u8 *data_p, size_t size)
+{
+    size_t pos = 0;
+    size_t ascii_end;
+    size_t ch_size;
+    i32 ch;
+
+    if (is_ascii(data_p, size)) {
+        chars.append(data_p, size);
+
+        return;
+    }
+
+    chars.reserve(size);
+
+    while (pos < size) {
+        ascii_end = pos;
+
+        while ((ascii_end < size) && (data_p[ascii_end] < 0x80)) {
+            ascii_end++;
+        }
+
+        chars.append(&data_p[pos], ascii_end - pos);
+        pos = ascii_end;
+
+        if (pos == size) {
+            break;
+        }
+
+        ch_size = decode_utf8((char *)&data_p[pos], size - pos, &ch);
+
+        if (ch_size == 0) {
+            mys::make_shared<ValueError>("invalid UTF-8")->__throw();
+        }
+
+        chars.push_back(Char(ch));
+        pos += ch_size;
+    }
 }
 
 String::String(const char *str)
 {
     if (str) {
         m_string = mys::make_shared<CharVector>();
-        for (size_t i = 0; i < strlen(str); i++) {
-            append(Char(str[i]));
-        }
+        append_chars(*m_string, str, strlen(str));
     } else {
         m_string = nullptr;
     }
 }
 
-String::String(const Bytes& bytes)
+String::String(const std::string& str)
 {
-    size_t size;
-    i32 ch;
-    size_t pos;
+    m_string = mys::make_shared<CharVector>();
+    append_chars(*m_string, str.data(), str.size());
+}
 
+String::String(const Bytes& bytes)
+{
     if (bytes.m_bytes) {
         m_string = mys::make_shared<CharVector>();
-        pos = 0;
-
-        while (pos < bytes.m_bytes->size()) {
-            size = decode_utf8((char *)&bytes.m_bytes->data()[pos],
-                               bytes.m_bytes->size() - pos,
-                               &ch);
-
-            if (size == 0) {
-                mys::make_shared<ValueError>("invalid UTF-8")->__throw();
-            }
-
-            m_string->push_back(Char(ch));
-            pos += size;
-        }
+        append_utf8(*m_string, bytes.m_bytes->data(), bytes.m_bytes->size());
     } else {
         m_string = nullptr;
     }
@@ -761,9 +1823,6 @@ String::String(const Bytes& bytes)
 
 String::String(const Bytes& bytes, i64 begin, i64 end)
 {
-    size_t size;
-    i32 ch;
-
     if (bytes.m_bytes) {
         if (begin > bytes.m_bytes->size()) {
             begin = bytes.m_bytes->size();
@@ -775,51 +1834,59 @@ String::String(const Bytes& bytes, i64 begin, i64 end)
 
         m_string = mys::make_shared<CharVector>();
 
-        while (begin < end) {
-            size = decode_utf8((char *)&bytes.m_bytes->data()[begin],
-                               end - begin,
-                               &ch);
-
-            if (size == 0) {
-                mys::make_shared<ValueError>("invalid UTF-8")->__throw();
-            }
-
-            m_string->push_back(Char(ch));
-            begin += size;
+        if (begin < end) {
+            append_utf8(*m_string, &bytes.m_bytes->data()[begin], end - begin);
         }
     } else {
         m_string = nullptr;
     }
 }
 
+void String::operator+=(const String& other)
+{
+    auto string = mys::make_shared<CharVector>();
+
+    string->reserve(m_string->size() + other.m_string->size(),
+                    std::max(m_string->width(), other.m_string->width()));
+    string->append(*m_string);
+    string->append(*other.m_string);
+    m_string = string;
+}
+
+void String::operator+=(const Char& other)
+{
+    auto string = mys::make_shared<CharVector>();
+
+    string->reserve(m_string->size() + 1, m_string->width());
+    string->append(*m_string);
+    string->push_back(other);
+    m_string = string;
+}
+
 String String::operator+(const String& other)
 {
-    String res("");
+    String res(*this);
 
-    res.append(*this);
-    res.append(other);
+    res += other;
 
     return res;
 }
 
 void String::operator*=(int value)
 {
-    String copy("");
-    copy.append(*this);
-
-    m_string = mys::make_shared<CharVector>();
-    for (int i = 0; i < value; i++) {
-        append(copy);
-    }
+    m_string = (*this * value).m_string;
 }
 
 String String::operator*(int value) const
 {
     String res("");
-    int i;
 
-    for (i = 0; i < value; i++) {
-        res.append(*this);
+    if (value > 0) {
+        res.m_string->reserve(m_string->size() * value, m_string->width());
+
+        for (int i = 0; i < value; i++) {
+            res.m_string->append(*m_string);
+        }
     }
 
     return res;
@@ -828,20 +1895,60 @@ String String::operator*(int value) const
 Bytes String::to_utf8() const
 {
     Bytes res({});
-    size_t size;
-    char buf[4];
+    size_t length = m_string->size();
 
-    for (const auto & ch : *m_string) {
-        size = encode_utf8(&buf[0], ch.m_value);
+    chars().visit([&res, length](auto data_p) {
+        size_t size = 0;
 
-        for (size_t i = 0; i < size; i++) {
-            res += buf[i];
+        for (size_t i = 0; i < length; i++) {
+            size += utf8_size(data_p[i]);
         }
-    }
+
+        res.resize(size);
+        u8 *res_p = res.m_bytes->data();
+
+        // Only ASCII.
+        if (size == length) {
+            std::copy(data_p, data_p + length, res_p);
+        } else {
+            for (size_t i = 0; i < length; i++) {
+                res_p += encode_utf8((char *)res_p, data_p[i]);
+            }
+        }
+    });
 
     return res;
 }
 
+// Encodes given characters as UTF-8 and writes them to given stream,
+// in chunks of a stack buffer, or directly if only ASCII.
+static void write_utf8(std::ostream& os, const CharVector& chars)
+{
+    size_t length = chars.size();
+
+    chars.visit([&os, length](auto data_p) {
+        if (sizeof(*data_p) == 1 && is_ascii((const u8 *)data_p, length)) {
+            os.write((const char *)data_p, length);
+
+            return;
+        }
+
+        char buf[4096];
+        size_t size = 0;
+
+        for (size_t i = 0; i < length; i++) {
+            if (size > sizeof(buf) - 4) {
+                os.write(&buf[0], size);
+                size = 0;
+            }
+
+            size += encode_utf8(&buf[size], data_p[i]);
+        }
+
+        os.write(&buf[0], size);
+    });
+}
+
 void String::from_unsigned(std::stringstream& ss, u64 value, char radix)
 {
     int msb = 0;
@@ -876,9 +1983,8 @@ void String::from_unsigned(std::stringstream& ss, u64 value, char radix)
         break;
     }
 
-    for (auto ch : ss.str()) {
-        append(Char(ch));
-    }
+    std::string digits = ss.str();
+    append_chars(*m_string, digits.data(), digits.size());
 }
 
 String::String(i64 value, char radix)
@@ -907,41 +2013,42 @@ String::String(u64 value, char radix)
 
 String String::set_case(CaseMode mode) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
+    String res("");
+    size_t size = m_string->size();
 
-    auto i = res.m_string->begin();
-    int index = 0;
-    while (i != res.m_string->end()) {
+    res.m_string->reserve(size);
+
+    for (size_t index = 0; index < size; index++) {
+        Py_UCS4 ch = (*m_string)[index];
         Py_UCS4 mapped[3];
         int n;
 
         if (mode == CaseMode::CAPITALIZE && index == 0) {
-            n = _PyUnicode_ToTitleFull(*i, mapped);
+            n = _PyUnicode_ToTitleFull(ch, mapped);
         }
         else if ((mode == CaseMode::LOWER || mode == CaseMode::CAPITALIZE)
-                 && i->m_value == GREEK_CAPTIAL_LETTER_SIGMA) {
+                 && ch == GREEK_CAPTIAL_LETTER_SIGMA) {
             uint32_t c;
-            int j;
+            i64 j;
 
             // Lower case sigma at the end of a word is different than
             // in other positions, use the following regexp to detect this situation:
             // \p{cased}\p{case-ignorable}*U+03A3!(\p{case-ignorable}*\p{cased})
 
-            for (j = index - 1; j >= 0; j--) {
-                c = res.m_string->at(j).m_value;
+            for (j = res.m_string->size() - 1; j >= 0; j--) {
+                c = (*res.m_string)[j];
                 if (!_PyUnicode_IsCaseIgnorable(c)) {
                     break;
                 }
             }
             bool final_sigma = j >= 0 && _PyUnicode_IsCased(c);
             if (final_sigma) {
-                for (j = index + 1; j < res.m_string->size(); j++) {
-                    c = res.m_string->at(j).m_value;
+                for (j = index + 1; j < size; j++) {
+                    c = (*m_string)[j];
                     if (!_PyUnicode_IsCaseIgnorable(c))
                         break;
                 }
-                final_sigma = j == res.m_string->size() || !_PyUnicode_IsCased(c);
+                final_sigma = j == size || !_PyUnicode_IsCased(c);
             }
             mapped[0] = final_sigma ? GREEK_SMALL_LETTER_FINAL_SIGMA : GREEK_SMALL_LETTER_SIGMA;
             n = 1;
@@ -950,33 +2057,19 @@ String String::set_case(CaseMode mode) const
             switch (mode) {
               case CaseMode::LOWER:
               case CaseMode::CAPITALIZE:
-                  n = _PyUnicode_ToLowerFull(*i, mapped);
+                  n = _PyUnicode_ToLowerFull(ch, mapped);
                   break;
               case CaseMode::UPPER:
-                  n = _PyUnicode_ToUpperFull(*i, mapped);
+                  n = _PyUnicode_ToUpperFull(ch, mapped);
                   break;
               case CaseMode::FOLD:
-                  n = _PyUnicode_ToFoldedFull(*i, mapped);
+                  n = _PyUnicode_ToFoldedFull(ch, mapped);
                   break;
             }
         }
 
-        if (n == 1) {
-            *i = mapped[0];
-            ++i;
-            index += 1;
-        }
-        else {
-            CharVector vmapped;
-            vmapped.resize(n);
-            for (int j = 0; j < n; ++j)  {
-                vmapped[j] = mapped[j];
-            }
-
-            i = res.m_string->erase(i);
-            auto j = res.m_string->insert(i, vmapped.begin(), vmapped.end());
-            i = j + vmapped.size();
-            index += vmapped.size();
+        for (int j = 0; j < n; ++j)  {
+            res.m_string->push_back(mapped[j]);
         }
     }
 
@@ -1047,9 +2140,18 @@ String String::__str__()
 {
     String res("");
 
-    res.m_string->insert(res.m_string->end(),
-                         shared_ptr_not_none(m_string)->begin(),
-                         shared_ptr_not_none(m_string)->end());
+    res.m_string->append(*shared_ptr_not_none(m_string));
+
+    return res;
+}
+
+String String::slice(size_t begin, size_t end) const
+{
+    String res;
+
+    res.m_string = mys::make_shared<CharVector>();
+    res.m_string->reserve(end - begin, m_string->width());
+    res.m_string->append(*m_string, begin, end);
 
     return res;
 }
@@ -1094,10 +2196,9 @@ String String::get(std::optional<i64> _begin, std::optional<i64> _end,
     int i = begin;
 
     if (step == 1) {
-        res.m_string->resize(end - begin);
-        std::copy(m_string->begin() + begin,
-                  m_string->begin() + end,
-                  res.m_string->begin());
+        if (end > begin) {
+            res.m_string->append(*m_string, begin, end);
+        }
     } else if (step > 0) {
         while (i < end) {
             res.append((*m_string)[i]);
@@ -1115,7 +2216,7 @@ String String::get(std::optional<i64> _begin, std::optional<i64> _end,
 
 #if !defined(MYS_UNSAFE)
 
-Char& String::get(i64 index) const
+Char String::get(i64 index) const
 {
     if (index < 0) {
         index = m_string->size() + index;
@@ -1299,15 +2400,29 @@ String input(String prompt)
 
 String String::join(const mys::shared_ptr<List<String>>& list) const
 {
+    const auto& items = list->m_list;
     String res("");
-    size_t j = 0;
+    size_t size = 0;
+    int width = 1;
+
+    if (items.size() > 1) {
+        size = m_string->size() * (items.size() - 1);
+        width = m_string->width();
+    }
+
+    for (const auto& item : items) {
+        size += item.m_string->size();
+        width = std::max(width, item.m_string->width());
+    }
+
+    res.m_string->reserve(size, width);
 
-    for (const auto &i : list->m_list) {
-        res.append(i);
-        if (j < list->m_list.size() - 1) {
-            res.append(*this);
+    for (size_t i = 0; i < items.size(); i++) {
+        if (i > 0) {
+            res.m_string->append(*m_string);
         }
-        ++j;
+
+        res.m_string->append(*items[i].m_string);
     }
 
     return res;
@@ -1365,33 +2480,26 @@ i64 String::find(const String& sub, std::optional<i64> _begin, std::optional<i64
         return -1;
     }
 
-    if (reverse) {
-        auto it_begin = m_string->rbegin() + (size - end);
-        auto it_end = m_string->rbegin() + (size - begin);
-        auto it_match = std::search(it_begin,
-                                    it_end,
-                                    sub.m_string->rbegin(),
-                                    sub.m_string->rend());
-
-        if (it_match == it_end) {
-            return -1;
-        }
+    if (reverse && (sub.m_string->size() == 0)) {
+        return end;
+    }
 
-        return it_end - it_match - sub.m_string->size() + begin;
-    } else {
-        auto it_begin = m_string->begin() + begin;
-        auto it_end = m_string->begin() + end;
-        auto it_match = std::search(it_begin,
-                                    it_end,
-                                    sub.m_string->begin(),
-                                    sub.m_string->end());
+    return chars().visit([&sub, begin, end, reverse](auto data_p) {
+        return sub.chars().visit([data_p, &sub, begin, end, reverse](auto sub_p) {
+            auto it_begin = data_p + begin;
+            auto it_end = data_p + end;
+            auto sub_end = sub_p + sub.m_string->size();
+            auto it_match = reverse
+                ? std::find_end(it_begin, it_end, sub_p, sub_end)
+                : std::search(it_begin, it_end, sub_p, sub_end);
 
-        if (it_match == it_end) {
-            return -1;
-        }
+            if (it_match == it_end) {
+                return (i64)-1;
+            }
 
-        return it_match - it_begin + begin;
-    }
+            return it_match - it_begin + begin;
+        });
+    });
 }
 
 mys::shared_ptr<List<String>> String::split(const String& separator) const
@@ -1403,28 +2511,30 @@ mys::shared_ptr<List<String>> String::split(const String& separator) const
             mys::make_shared<ValueError>("empty separator")->__throw();
         }
 
-        auto it = m_string->begin();
+        size_t size = m_string->size();
+        size_t separator_size = separator.m_string->size();
 
-        while (it != m_string->end()) {
-            auto it_sep = std::search(it,
-                                      m_string->end(),
-                                      separator.m_string->begin(),
-                                      separator.m_string->end());
+        chars().visit([this, &separator, &list, size, separator_size](auto data_p) {
+            separator.chars().visit([this, &list, data_p, size, separator_size](
+                                          auto separator_p) {
+                auto it = data_p;
+                auto it_end = data_p + size;
 
-            String part("");
-            part.m_string->resize(it_sep - it);
-            std::copy(it, it_sep, part.m_string->begin());
-            it = it_sep + separator.m_string->size();
-            list->append(part);
+                while (true) {
+                    auto it_separator = std::search(it,
+                                                    it_end,
+                                                    separator_p,
+                                                    separator_p + separator_size);
+                    list->append(slice(it - data_p, it_separator - data_p));
 
-            if (it_sep == m_string->end()) {
-                break;
-            }
-        }
+                    if (it_separator == it_end) {
+                        break;
+                    }
 
-        if (it == m_string->end()) {
-            list->append(String(""));
-        }
+                    it = it_separator + separator_size;
+                }
+            });
+        });
     } else {
         list->append(*this);
     }
@@ -1434,9 +2544,6 @@ mys::shared_ptr<List<String>> String::split(const String& separator) const
 
 String String::strip_left_right(std::optional<const String> chars, bool left, bool right) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
-
     // Characters to strip not given or given as None.
     bool whitespace = !chars.has_value() || !chars->m_string;
 
@@ -1445,42 +2552,30 @@ String String::strip_left_right(std::optional<const String> chars, bool left, bo
         return *this;
     }
 
+    auto is_stripped = [&chars, whitespace](Char ch) {
+        if (whitespace) {
+            return _PyUnicode_IsWhitespace(ch) != 0;
+        } else {
+            return chars->find(ch, std::nullopt, std::nullopt) != -1;
+        }
+    };
+
+    size_t begin = 0;
+    size_t end = m_string->size();
+
     if (left) {
-        auto begin = res.m_string->begin();
-        for (; begin != res.m_string->end(); ++begin) {
-            if (whitespace) {
-                if (!_PyUnicode_IsWhitespace(*begin)) {
-                    break;
-                }
-            }
-            else {
-                auto i = std::find(chars->m_string->begin(), chars->m_string->end(), *begin);
-                if (i == chars->m_string->end()) {
-                    break;
-                }
-            }
+        while ((begin < end) && is_stripped((*m_string)[begin])) {
+            begin++;
         }
-        res.m_string->erase(res.m_string->begin(), begin);
     }
 
     if (right) {
-        auto end = res.m_string->rbegin();
-        for (; end != res.m_string->rend(); ++end) {
-            if (whitespace) {
-                if (!_PyUnicode_IsWhitespace(*end)) {
-                    break;
-                }
-            }
-            else {
-                auto i = std::find(chars->m_string->begin(), chars->m_string->end(), *end);
-                if (i == chars->m_string->end()) {
-                    break;
-                }
-            }
+        while ((end > begin) && is_stripped((*m_string)[end - 1])) {
+            end--;
         }
-        res.m_string->erase(end.base(), res.m_string->end());
     }
-    return res;
+
+    return slice(begin, end);
 }
 
 String String::strip(std::optional<const String> chars) const
@@ -1500,17 +2595,15 @@ String String::strip_right(std::optional<const String> chars) const
 
 SharedTuple<String, String, String> String::partition(const Char& chr) const
 {
-    auto i = std::find(m_string->begin(), m_string->end(), chr);
-    if (i == m_string->end()) {
+    i64 i = find(chr, std::nullopt, std::nullopt);
+    if (i == -1) {
         return mys::make_shared<Tuple<String, String, String>>(*this, "", "");
     }
 
-    String a("");
-    a.m_string->insert(a.m_string->end(), m_string->begin(), i);
+    String a = slice(0, i);
     String b("");
     b.append(chr);
-    String c("");
-    c.m_string->insert(c.m_string->end(), i + 1, m_string->end());
+    String c = slice(i + 1, m_string->size());
 
     return mys::make_shared<Tuple<String, String, String>>(a, b, c);
 }
@@ -1521,16 +2614,13 @@ SharedTuple<String, String, String> String::partition(const String& str) const
         mys::make_shared<ValueError>("separator is None")->__throw();
     }
 
-    auto i = std::search(m_string->begin(), m_string->end(),
-                         str.m_string->begin(), str.m_string->end());
-    if (i == m_string->end()) {
+    i64 i = find(str, std::nullopt, std::nullopt);
+    if (i == -1) {
         return mys::make_shared<Tuple<String, String, String>>(*this, "", "");
     }
 
-    String a("");
-    a.m_string->insert(a.m_string->end(), m_string->begin(), i);
-    String b("");
-    b.m_string->insert(b.m_string->end(), i + str.length(), m_string->end());
+    String a = slice(0, i);
+    String b = slice(i + str.length(), m_string->size());
 
     return mys::make_shared<Tuple<String, String, String>>(a, str, b);
 }
@@ -1539,33 +2629,61 @@ String String::replace(const Char& old, const Char& _new) const
 {
     String res;
     res.m_string = mys::make_shared<CharVector>(*m_string.get());
-
-    for (auto& ch : *res.m_string) {
-        if (ch.m_value == old.m_value) {
-            ch.m_value = _new.m_value;
-        }
-    }
+    res.m_string->replace(old, _new);
 
     return res;
 }
 
 String String::replace(const String& old, const String& _new) const
 {
-    String res;
-    res.m_string = mys::make_shared<CharVector>(*m_string.get());
+    size_t size = m_string->size();
+    size_t old_size = old.m_string->size();
+    std::vector<size_t> matches;
 
-    auto i = res.m_string->begin();
-    while (i != res.m_string->end()) {
-        auto s = std::search(i, res.m_string->end(),
-                             old.m_string->begin(), old.m_string->end());
-        if (s == res.m_string->end()) {
-            break;
+    // An empty string matches before every character and at the end.
+    if (old_size == 0) {
+        for (size_t i = 0; i <= size; i++) {
+            matches.push_back(i);
         }
-        i = res.m_string->erase(s, s + old.m_string->size());
-        i = res.m_string->insert(i, _new.m_string->begin(), _new.m_string->end());
-        i += _new.m_string->size();
+    } else {
+        chars().visit([&old, &matches, size, old_size](auto data_p) {
+            old.chars().visit([&matches, data_p, size, old_size](auto old_p) {
+                auto it = data_p;
+                auto it_end = data_p + size;
+
+                while (true) {
+                    it = std::search(it, it_end, old_p, old_p + old_size);
+
+                    if (it == it_end) {
+                        break;
+                    }
+
+                    matches.push_back(it - data_p);
+                    it += old_size;
+                }
+            });
+        });
+    }
+
+    if (matches.empty()) {
+        return slice(0, size);
+    }
+
+    String res("");
+    size_t pos = 0;
+
+    res.m_string->reserve(size - matches.size() * old_size
+                          + matches.size() * _new.m_string->size(),
+                          std::max(m_string->width(), _new.m_string->width()));
+
+    for (auto match : matches) {
+        res.m_string->append(*m_string, pos, match);
+        res.m_string->append(*_new.m_string);
+        pos = match + old_size;
     }
 
+    res.m_string->append(*m_string, pos, size);
+
     return res;
 }
 
@@ -1581,7 +2699,7 @@ Bool String::is_alpha() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsAlpha(c.m_value);
                        });
 }
@@ -1593,7 +2711,7 @@ Bool String::is_digit() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsDigit(c.m_value);
                        });
 }
@@ -1605,7 +2723,7 @@ Bool String::is_numeric() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsNumeric(c.m_value);
                        });
 }
@@ -1617,7 +2735,7 @@ Bool String::is_space() const
     }
 
     return std::all_of(m_string->begin(), m_string->end(),
-                       [](Char& c) {
+                       [](Char c) {
                            return _PyUnicode_IsWhitespace(c.m_value);
                        });
 }
@@ -1629,7 +2747,7 @@ Bool String::is_upper() const
     }
 
     if (!std::any_of(m_string->begin(), m_string->end(),
-                     [](Char& c) {
+                     [](Char c) {
                          return _PyUnicode_IsCased(c.m_value);
                      })) {
         return false;
@@ -1647,7 +2765,7 @@ Bool String::is_lower() const
     }
 
     if (!std::any_of(m_string->begin(), m_string->end(),
-                     [](Char& c) {
+                     [](Char c) {
                          return _PyUnicode_IsCased(c.m_value);
                      })) {
         return false;
@@ -1685,7 +2803,9 @@ RegexMatch String::match(const Regex& regex) const
 
 mys::shared_ptr<List<String>> String::split() const
 {
-    return Regex("\\s+", "").split(*this);
+    static const Regex regex("\\s+", "");
+
+    return regex.split(*this);
 }
 
 mys::shared_ptr<List<String>> String::split(const Regex& regex) const
@@ -1707,9 +2827,7 @@ String string_str(const String& value)
     if (value.m_string) {
         String res("");
 
-        res.m_string->insert(res.m_string->end(),
-                             value.m_string->begin(),
-                             value.m_string->end());
+        res.m_string->append(*value.m_string);
 
         return res;
     } else {
@@ -1722,9 +2840,7 @@ String string_with_quotes(const String& value)
     if (value.m_string) {
         String res("\"");
 
-        res.m_string->insert(res.m_string->end(),
-                             value.m_string->begin(),
-                             value.m_string->end());
+        res.m_string->append(*value.m_string);
         res += "\"";
 
         return res;
@@ -1917,8 +3033,11 @@ String RegexMatch::group(int index) const
     }
 
     String res("");
-    res.m_string->resize(length);
-    std::copy(buffer, buffer + length, res.m_string->begin());
+    res.m_string->reserve(length);
+
+    for (PCRE2_SIZE i = 0; i < length; i++) {
+        res.m_string->push_back(Char(buffer[i]));
+    }
 
     pcre2_substring_free(buffer);
 
@@ -1993,9 +3112,8 @@ String Regex::get_error(int error)
     buffer.resize(1024);
 
     length = pcre2_get_error_message(error, buffer.data(), buffer.size());
-    if (length > 0) {
-        res.m_string->resize(length);
-        std::copy(buffer.begin(), buffer.begin() + length, res.m_string->begin());
+    for (int i = 0; i < length; i++) {
+        res.m_string->push_back(Char(buffer[i]));
     }
     return res;
 }
@@ -2004,7 +3122,7 @@ Regex::Regex(const String& regex, const String& flags)
 {
     int pcreError;
     PCRE2_SIZE pcreErrorOffset;
-    PCRE2_SPTR regex_sptr = reinterpret_cast<PCRE2_SPTR>(regex.m_string->data());
+    PCRE2_SPTR regex_sptr = regex.m_string->ucs4();
     PCRE2_SIZE length = regex.m_string->size();
     uint32_t options = PCRE2_UTF | PCRE2_UCP;
     PCRE2_UCHAR empty[] = { 0 };
@@ -2051,16 +3169,42 @@ Regex::Regex(const String& regex, const String& flags)
         mys::make_shared<ValueError>(message)->__throw();
     }
 
+    // Matching uses the JIT compiled code if PCRE2 was built with JIT
+    // support, and the interpreter otherwise.
+    pcre2_jit_compile(compiled_p, PCRE2_JIT_COMPLETE);
+
     m_compiled.reset(compiled_p,
                      [](pcre2_code *code) {
                          pcre2_code_free(code);
                      });
 }
 
+std::shared_ptr<pcre2_match_data> Regex::get_match_data() const
+{
+    // Match data still used by a match cannot be reused.
+    for (auto& match_data : m_match_data) {
+        if (!match_data) {
+            match_data.reset(
+                pcre2_match_data_create_from_pattern(m_compiled.get(), NULL),
+                [](pcre2_match_data *data) {
+                    pcre2_match_data_free(data);
+                });
+
+            return match_data;
+        } else if (match_data.use_count() == 1) {
+            return match_data;
+        }
+    }
+
+    m_match_data[0] = nullptr;
+
+    return get_match_data();
+}
+
 RegexMatch Regex::match(const String& string) const
 {
-    std::shared_ptr<pcre2_match_data> match_data;
-    PCRE2_SPTR string_sptr = reinterpret_cast<PCRE2_SPTR>(string.m_string->data());
+    std::shared_ptr<pcre2_match_data> match_data = get_match_data();
+    PCRE2_SPTR string_sptr = string.m_string->ucs4();
     PCRE2_SIZE length = string.m_string->size();
     PCRE2_UCHAR empty[] = { 0 };
     int error;
@@ -2069,11 +3213,6 @@ RegexMatch Regex::match(const String& string) const
         string_sptr = empty;
     }
 
-    match_data.reset(pcre2_match_data_create_from_pattern(m_compiled.get(), NULL),
-                     [](pcre2_match_data *data) {
-                         pcre2_match_data_free(data);
-                     });
-
     error = pcre2_match(m_compiled.get(), string_sptr, length, 0, 0,
                         match_data.get(), NULL);
     if (error == PCRE2_ERROR_NOMATCH) {
@@ -2088,9 +3227,9 @@ RegexMatch Regex::match(const String& string) const
 
 String Regex::replace(const String& subject, const String& replacement, int flags) const
 {
-    PCRE2_SPTR subject_sptr = reinterpret_cast<PCRE2_SPTR>(subject.m_string->data());
+    PCRE2_SPTR subject_sptr = subject.m_string->ucs4();
     PCRE2_SIZE subject_length = subject.m_string->size();
-    PCRE2_SPTR replacement_sptr = reinterpret_cast<PCRE2_SPTR>(replacement.m_string->data());
+    PCRE2_SPTR replacement_sptr = replacement.m_string->ucs4();
     PCRE2_SIZE replacement_length = replacement.m_string->size();
     auto pcre_output = std::vector<PCRE2_UCHAR>();
     PCRE2_SIZE out_length = 1024;
@@ -2115,7 +3254,7 @@ String Regex::replace(const String& subject, const String& replacement, int flag
         pcre_output.resize(out_length);
         error = pcre2_substitute(m_compiled.get(),
                                  subject_sptr, subject_length,
-                                 0, options, NULL, NULL,
+                                 0, options, get_match_data().get(), NULL,
                                  replacement_sptr, replacement_length,
                                  pcre_output.data(), &out_length);
         if (error != PCRE2_ERROR_NOMEMORY) {
@@ -2426,7 +3565,7 @@ String assets(const char *package_p)
 
 }
 
-#if defined(MYS_APPLICATION) || defined(MYS_TEST)
+#if defined(MYS_APPLICATION) || defined(MYS_TEST) || defined(MYS_BENCH)
 
 int main(int argc, char * const argv[])
 {
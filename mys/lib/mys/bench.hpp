@@ -0,0 +1,22 @@
+#pragma once
+
+namespace mys {
+
+class Bench;
+
+extern Bench *benches_head_p;
+extern Bench *benches_tail_p;
+
+typedef void (*bench_func_t)(void);
+
+class Bench {
+
+public:
+    const char *m_name_p;
+    bench_func_t m_func;
+    Bench *m_next_p;
+
+    Bench(const char *name_p, bench_func_t func);
+};
+
+}
@@ -138,16 +138,7 @@ namespace std
         std::size_t operator()(mys::Bytes const& s) const noexcept
         {
             if (s.m_bytes) {
-
-                int p1 = 7;
-                int p2 = 31;
-                std::size_t hash = p1;
-
-                for (auto v : *s.m_bytes) {
-                    hash = hash * p2 + v;
-                }
-
-                return hash;
+                return mys::hash_bytes(s.m_bytes->data(), s.m_bytes->size());
             } else {
                 return 0;
             }
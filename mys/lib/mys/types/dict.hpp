@@ -3,6 +3,7 @@
 #include "../common.hpp"
 #include "../utils.hpp"
 #include "../errors/key.hpp"
+#include "hash_table.hpp"
 #include "string.hpp"
 #include "tuple.hpp"
 #include "list.hpp"
@@ -14,9 +15,9 @@ template<typename TK, typename TV>
 class Dict final
 {
 public:
-    std::unordered_map<TK, TV> m_map;
+    HashMap<TK, TV> m_map;
 
-    Dict() : m_map(std::unordered_map<TK, TV>())
+    Dict()
     {
     }
 
@@ -27,7 +28,7 @@ public:
 
     void __setitem__(const TK& key, const TV& value)
     {
-        m_map[key] = value;
+        m_map.insert_or_assign(key, value);
     }
 
     const TV& get(const TK& key, const TV& default_value, bool insert_if_missing)
@@ -81,6 +82,7 @@ public:
     mys::shared_ptr<List<TK>> keys() const
     {
         std::vector<TK> keys;
+        keys.reserve(m_map.size());
         for (const auto& kv : m_map) {
             keys.push_back(kv.first);
         }
@@ -90,6 +92,7 @@ public:
     mys::shared_ptr<List<TV>> values() const
     {
         std::vector<TV> values;
+        values.reserve(m_map.size());
         for (const auto& kv : m_map) {
             values.push_back(kv.second);
         }
@@ -118,7 +121,7 @@ public:
     void update(const mys::shared_ptr<Dict<TK, TV>>& other)
     {
         for (const auto& i : other->m_map) {
-            m_map[i.first] = i.second;
+            m_map.insert_or_assign(i.first, i.second);
         }
     }
 
@@ -0,0 +1,442 @@
+#pragma once
+
+#include "../common.hpp"
+#include "number.hpp"
+
+namespace mys {
+
+template<typename Table, typename Reference>
+class HashTableIterator
+{
+public:
+    typedef std::forward_iterator_tag iterator_category;
+    typedef std::remove_cv_t<std::remove_reference_t<Reference>> value_type;
+    typedef std::ptrdiff_t difference_type;
+    typedef std::remove_reference_t<Reference> *pointer;
+    typedef Reference reference;
+
+    Table *m_table_p;
+    size_t m_index;
+
+    HashTableIterator(Table *table_p, size_t index) :
+        m_table_p(table_p),
+        m_index(index)
+    {
+    }
+
+    Reference operator*() const
+    {
+        return m_table_p->m_items[m_index];
+    }
+
+    pointer operator->() const
+    {
+        return &m_table_p->m_items[m_index];
+    }
+
+    HashTableIterator& operator++()
+    {
+        m_index++;
+        skip_erased();
+
+        return *this;
+    }
+
+    HashTableIterator operator++(int)
+    {
+        HashTableIterator it = *this;
+
+        ++(*this);
+
+        return it;
+    }
+
+    bool operator==(const HashTableIterator& other) const
+    {
+        return m_index == other.m_index;
+    }
+
+    bool operator!=(const HashTableIterator& other) const
+    {
+        return m_index != other.m_index;
+    }
+
+    HashTableIterator& skip_erased()
+    {
+        while ((m_index < m_table_p->m_items.size())
+               && m_table_p->m_erased[m_index]) {
+            m_index++;
+        }
+
+        return *this;
+    }
+};
+
+// An open addressing hash table with linear probing. Items are stored
+// in insertion order in a vector, and each slot holds the index of an
+// item and 32 bits of its hash, so that most probes only read the
+// slots. Erased items are marked as such until the table is rehashed.
+//
+// The items are moved when the table grows, so references to them are
+// only valid until the next insertion.
+template<typename Key, typename Item, typename KeyOf>
+class HashTable
+{
+public:
+    typedef HashTableIterator<HashTable, Item&> iterator;
+    typedef HashTableIterator<const HashTable, const Item&> const_iterator;
+
+    struct Slot {
+        // Index of the item plus one, or EMPTY or ERASED.
+        u32 m_index;
+        // High 32 bits of the hash.
+        u32 m_tag;
+    };
+
+    static constexpr u32 EMPTY = 0;
+    static constexpr u32 ERASED = 0xffffffff;
+    static constexpr size_t NOT_FOUND = SIZE_MAX;
+
+    std::vector<Item> m_items;
+    std::vector<bool> m_erased;
+    std::vector<Slot> m_slots;
+    // Number of items not erased.
+    size_t m_size;
+    // Number of slots not empty.
+    size_t m_used;
+
+    HashTable() : m_size(0), m_used(0)
+    {
+    }
+
+    template<typename Iterator> HashTable(Iterator first, Iterator last) :
+        HashTable()
+    {
+        insert(first, last);
+    }
+
+    HashTable(std::initializer_list<Item> il) : HashTable()
+    {
+        insert(il.begin(), il.end());
+    }
+
+    iterator begin()
+    {
+        return iterator(this, 0).skip_erased();
+    }
+
+    iterator end()
+    {
+        return iterator(this, m_items.size());
+    }
+
+    const_iterator begin() const
+    {
+        return const_iterator(this, 0).skip_erased();
+    }
+
+    const_iterator end() const
+    {
+        return const_iterator(this, m_items.size());
+    }
+
+    size_t size() const
+    {
+        return m_size;
+    }
+
+    bool empty() const
+    {
+        return m_size == 0;
+    }
+
+    void clear()
+    {
+        m_items.clear();
+        m_erased.clear();
+        std::fill(m_slots.begin(), m_slots.end(), Slot{EMPTY, 0});
+        m_size = 0;
+        m_used = 0;
+    }
+
+    iterator find(const Key& key)
+    {
+        size_t index = find_index(key, hash_of(key));
+
+        if (index == NOT_FOUND) {
+            return end();
+        } else {
+            return iterator(this, index);
+        }
+    }
+
+    const_iterator find(const Key& key) const
+    {
+        size_t index = find_index(key, hash_of(key));
+
+        if (index == NOT_FOUND) {
+            return end();
+        } else {
+            return const_iterator(this, index);
+        }
+    }
+
+    // Taken by value, as it may refer to an item moved when growing.
+    std::pair<iterator, bool> insert(Item item)
+    {
+        u64 hash = hash_of(KeyOf::get(item));
+        size_t index = find_index(KeyOf::get(item), hash);
+
+        if (index != NOT_FOUND) {
+            return {iterator(this, index), false};
+        }
+
+        return {iterator(this, add(std::move(item), hash)), true};
+    }
+
+    template<typename Iterator> void insert(Iterator first, Iterator last)
+    {
+        for (; first != last; ++first) {
+            insert(*first);
+        }
+    }
+
+    iterator erase(iterator it)
+    {
+        size_t index = it.m_index;
+        size_t mask = m_slots.size() - 1;
+        size_t slot = hash_of(KeyOf::get(m_items[index])) & mask;
+
+        while (m_slots[slot].m_index != index + 1) {
+            slot = (slot + 1) & mask;
+        }
+
+        m_slots[slot].m_index = ERASED;
+        m_erased[index] = true;
+        m_size--;
+
+        if (m_size == 0) {
+            clear();
+
+            return end();
+        }
+
+        // Release what the item refers to now.
+        m_items[index] = Item();
+
+        return ++it;
+    }
+
+    // Make room for given number of items without rehashing.
+    void reserve(size_t size)
+    {
+        if (2 * size > m_slots.size()) {
+            rehash(size);
+        }
+
+        m_items.reserve(size);
+    }
+
+protected:
+    static u64 hash_of(const Key& key)
+    {
+        u64 hash = std::hash<Key>{}(key);
+
+        // Spread all bits to the low bits used to select a slot, as
+        // many hashes, for example of integers, are the value itself.
+        hash ^= hash >> 32;
+        hash *= 0x9e3779b97f4a7c15;
+        hash ^= hash >> 32;
+
+        return hash;
+    }
+
+    size_t find_index(const Key& key, u64 hash) const
+    {
+        if (m_size == 0) {
+            return NOT_FOUND;
+        }
+
+        size_t mask = m_slots.size() - 1;
+        u32 tag = hash >> 32;
+
+        for (size_t slot = hash & mask; true; slot = (slot + 1) & mask) {
+            u32 index = m_slots[slot].m_index;
+
+            if (index == EMPTY) {
+                return NOT_FOUND;
+            }
+
+            if ((m_slots[slot].m_tag == tag)
+                && (index != ERASED)
+                && std::equal_to<Key>{}(KeyOf::get(m_items[index - 1]), key)) {
+                return index - 1;
+            }
+        }
+    }
+
+    // Adds given item, which must not already be in the table, and
+    // returns its index.
+    size_t add(Item&& item, u64 hash)
+    {
+        if (2 * (m_used + 1) > m_slots.size()) {
+            rehash(m_size + 1);
+        }
+
+        size_t mask = m_slots.size() - 1;
+        size_t slot = hash & mask;
+
+        while ((m_slots[slot].m_index != EMPTY)
+               && (m_slots[slot].m_index != ERASED)) {
+            slot = (slot + 1) & mask;
+        }
+
+        if (m_slots[slot].m_index == EMPTY) {
+            m_used++;
+        }
+
+        m_slots[slot] = Slot{(u32)(m_items.size() + 1), (u32)(hash >> 32)};
+        m_items.push_back(std::move(item));
+        m_erased.push_back(false);
+        m_size++;
+
+        return m_items.size() - 1;
+    }
+
+    // Removes erased items and makes room for given number of items
+    // with at most half of the slots used. Probes are then short
+    // enough to rarely mispredict branches.
+    void rehash(size_t size)
+    {
+        size_t capacity = 8;
+
+        while (capacity < 2 * size) {
+            capacity *= 2;
+        }
+
+        if (m_size < m_items.size()) {
+            size_t index = 0;
+
+            for (size_t i = 0; i < m_items.size(); i++) {
+                if (!m_erased[i]) {
+                    m_items[index] = std::move(m_items[i]);
+                    index++;
+                }
+            }
+
+            m_items.resize(index);
+            m_erased.assign(index, false);
+        }
+
+        m_slots.assign(capacity, Slot{EMPTY, 0});
+        m_used = m_items.size();
+
+        size_t mask = capacity - 1;
+
+        for (size_t i = 0; i < m_items.size(); i++) {
+            u64 hash = hash_of(KeyOf::get(m_items[i]));
+            size_t slot = hash & mask;
+
+            while (m_slots[slot].m_index != EMPTY) {
+                slot = (slot + 1) & mask;
+            }
+
+            m_slots[slot] = Slot{(u32)(i + 1), (u32)(hash >> 32)};
+        }
+    }
+};
+
+template<typename Key, typename Value> struct HashMapKeyOf
+{
+    static const Key& get(const std::pair<Key, Value>& item)
+    {
+        return item.first;
+    }
+};
+
+// A hash map iterated in insertion order.
+template<typename Key, typename Value>
+class HashMap final :
+    public HashTable<Key, std::pair<Key, Value>, HashMapKeyOf<Key, Value>>
+{
+public:
+    using HashTable<Key, std::pair<Key, Value>, HashMapKeyOf<Key, Value>>::HashTable;
+
+    Value& operator[](Key key)
+    {
+        u64 hash = this->hash_of(key);
+        size_t index = this->find_index(key, hash);
+
+        if (index == this->NOT_FOUND) {
+            index = this->add({std::move(key), Value()}, hash);
+        }
+
+        return this->m_items[index].second;
+    }
+
+    // Taken by value, as they may refer to an item moved when growing.
+    void insert_or_assign(Key key, Value value)
+    {
+        (*this)[std::move(key)] = std::move(value);
+    }
+
+    bool operator==(const HashMap& other) const
+    {
+        if (this->size() != other.size()) {
+            return false;
+        }
+
+        for (const auto& [key, value] : *this) {
+            auto it = other.find(key);
+
+            if ((it == other.end()) || !(it->second == value)) {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    bool operator!=(const HashMap& other) const
+    {
+        return !(*this == other);
+    }
+};
+
+template<typename Key> struct HashSetKeyOf
+{
+    static const Key& get(const Key& item)
+    {
+        return item;
+    }
+};
+
+// A hash set iterated in insertion order.
+template<typename Key>
+class HashSet final : public HashTable<Key, Key, HashSetKeyOf<Key>>
+{
+public:
+    using HashTable<Key, Key, HashSetKeyOf<Key>>::HashTable;
+
+    bool operator==(const HashSet& other) const
+    {
+        if (this->size() != other.size()) {
+            return false;
+        }
+
+        for (const auto& key : *this) {
+            if (other.find(key) == other.end()) {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    bool operator!=(const HashSet& other) const
+    {
+        return !(*this == other);
+    }
+};
+
+}
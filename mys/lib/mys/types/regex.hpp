@@ -85,12 +85,33 @@ public:
 
 class Regex final
 {
+private:
+    // Match data reused by matches. Two as a match is often kept
+    // while matching again. Not shared with copies.
+    mutable std::shared_ptr<pcre2_match_data> m_match_data[2];
+
+    std::shared_ptr<pcre2_match_data> get_match_data() const;
+
 public:
     std::shared_ptr<pcre2_code> m_compiled;
 
     static String get_error(int error);
     Regex() : m_compiled(nullptr) {};
     Regex(const String& regex, const String& flags);
+
+    Regex(const Regex& other) : m_compiled(other.m_compiled)
+    {
+    }
+
+    Regex& operator=(const Regex& other)
+    {
+        m_compiled = other.m_compiled;
+        m_match_data[0] = nullptr;
+        m_match_data[1] = nullptr;
+
+        return *this;
+    }
+
     RegexMatch match(const String& string) const;
     String replace(const String& subject, const String& replacement, int flags = 0) const;
     mys::shared_ptr<List<String>> split(const String& string) const;
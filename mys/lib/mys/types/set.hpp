@@ -3,6 +3,7 @@
 #include "../common.hpp"
 #include "../errors/value.hpp"
 #include "../errors/key.hpp"
+#include "hash_table.hpp"
 
 namespace mys {
 
@@ -12,7 +13,7 @@ template <typename T>
 using SharedSet = mys::shared_ptr<Set<T>>;
 
 template<typename T>
-static bool contains(const std::unordered_set<T>& set, const T& e)
+static bool contains(const HashSet<T>& set, const T& e)
 {
     return set.find(e) != set.end();
 }
@@ -21,7 +22,7 @@ template<typename T>
 class Set final
 {
 public:
-    std::unordered_set<T> m_set;
+    HashSet<T> m_set;
 
     Set() {}
     Set(const Set<T>& other) : m_set(other.m_set) {}
@@ -15,6 +15,224 @@ template <class ...T> using SharedTuple = mys::shared_ptr<Tuple<T...>>;
 class Regex;
 class RegexMatch;
 
+// Code points of a string. They are stored with 1, 2 or 4 bytes each,
+// the smallest width fitting all code points added so far, like
+// CPython's flexible string representation (PEP 393). Mostly ASCII
+// text thereby uses a quarter of the memory of one Char per code
+// point. Strings with equal code points may have different widths,
+// so code points must always be compared by value.
+class CharVector final {
+private:
+    std::vector<u8> m_data;
+    int m_width;
+    // Cached hash, or zero if not yet calculated. Cleared when the
+    // code points are modified.
+    mutable size_t m_hash;
+
+    static int width_of(i32 value)
+    {
+        if ((u32)value < 0x100) {
+            return 1;
+        } else if ((u32)value < 0x10000) {
+            return 2;
+        } else {
+            return 4;
+        }
+    }
+
+public:
+    class Iterator {
+    public:
+        typedef std::forward_iterator_tag iterator_category;
+        typedef Char value_type;
+        typedef std::ptrdiff_t difference_type;
+        typedef const Char *pointer;
+        typedef Char reference;
+
+        const CharVector *m_chars_p;
+        size_t m_index;
+
+        Iterator(const CharVector *chars_p, size_t index) :
+            m_chars_p(chars_p),
+            m_index(index)
+        {
+        }
+
+        Char operator*() const
+        {
+            return (*m_chars_p)[m_index];
+        }
+
+        Iterator& operator++()
+        {
+            m_index++;
+
+            return *this;
+        }
+
+        Iterator operator++(int)
+        {
+            Iterator res(*this);
+
+            m_index++;
+
+            return res;
+        }
+
+        bool operator==(const Iterator& other) const
+        {
+            return m_index == other.m_index;
+        }
+
+        bool operator!=(const Iterator& other) const
+        {
+            return m_index != other.m_index;
+        }
+    };
+
+    CharVector() : m_width(1), m_hash(0)
+    {
+    }
+
+    CharVector(std::initializer_list<Char> il) : m_width(1), m_hash(0)
+    {
+        reserve(il.size());
+
+        for (auto ch : il) {
+            push_back(ch);
+        }
+    }
+
+    // Number of code points.
+    size_t size() const
+    {
+        // Width 1, 2 and 4 shifted right once is 0, 1 and 2.
+        return m_data.size() >> (m_width >> 1);
+    }
+
+    // Bytes per code point.
+    int width() const
+    {
+        return m_width;
+    }
+
+    // Calls given function with a pointer to the code points, as u8,
+    // u16 or u32 depending on the width.
+    template <typename F> auto visit(F function) const
+    {
+        switch (m_width) {
+        case 1:
+            return function(m_data.data());
+        case 2:
+            return function(reinterpret_cast<const u16 *>(m_data.data()));
+        default:
+            return function(reinterpret_cast<const u32 *>(m_data.data()));
+        }
+    }
+
+    // Clears the cached hash, as the code points may be modified.
+    template <typename F> auto visit(F function)
+    {
+        m_hash = 0;
+
+        switch (m_width) {
+        case 1:
+            return function(m_data.data());
+        case 2:
+            return function(reinterpret_cast<u16 *>(m_data.data()));
+        default:
+            return function(reinterpret_cast<u32 *>(m_data.data()));
+        }
+    }
+
+    Char operator[](size_t index) const
+    {
+        return visit([index](auto data_p) { return Char((i32)data_p[index]); });
+    }
+
+    Iterator begin() const
+    {
+        return Iterator(this, 0);
+    }
+
+    Iterator end() const
+    {
+        return Iterator(this, size());
+    }
+
+    // Store code points with given width, if wider than current width.
+    void widen(int width);
+
+    // Reserve memory for given number of code points of current width.
+    void reserve(size_t size)
+    {
+        m_data.reserve(size * m_width);
+    }
+
+    // Reserve memory for given number of code points of given width,
+    // which is the width of all following code points.
+    void reserve(size_t size, int width)
+    {
+        widen(width);
+        reserve(size);
+    }
+
+    void set(size_t index, const Char& value)
+    {
+        widen(width_of(value.m_value));
+        visit([index, value](auto data_p) { data_p[index] = value.m_value; });
+    }
+
+    void push_back(const Char& value)
+    {
+        size_t index = size();
+
+        widen(width_of(value.m_value));
+        m_data.resize(m_data.size() + m_width);
+        set(index, value);
+    }
+
+    // Append code points in range [begin, end) of given vector, which
+    // may be this vector.
+    void append(const CharVector& other, size_t begin, size_t end);
+
+    void append(const CharVector& other)
+    {
+        append(other, 0, other.size());
+    }
+
+    // Append given Latin-1 code points.
+    void append(const u8 *data_p, size_t size);
+
+    // Replace all occurrences of old with new.
+    void replace(const Char& old, const Char& _new);
+
+    // Returns the code points as UCS-4, widening them if needed. Used
+    // by regular expressions, as PCRE2 is built for 32 bit code units.
+    const u32 *ucs4()
+    {
+        widen(4);
+
+        return reinterpret_cast<const u32 *>(m_data.data());
+    }
+
+    bool operator==(const CharVector& other) const;
+    bool operator<(const CharVector& other) const;
+
+    // Same hash for all widths.
+    size_t hash() const
+    {
+        if (m_hash == 0) {
+            m_hash = calculate_hash();
+        }
+
+        return m_hash;
+    }
+
+private:
+    size_t calculate_hash() const;
+};
+
 // A string.
 class String final {
 private:
@@ -25,8 +243,16 @@ private:
     enum class CaseMode { LOWER, UPPER, FOLD, CAPITALIZE };
     String set_case(CaseMode mode) const;
 
+    // Characters in range [begin, end).
+    String slice(size_t begin, size_t end) const;
+
+    // Read only access to the characters, keeping the cached hash.
+    const CharVector& chars() const
+    {
+        return *m_string;
+    }
+
 public:
-    typedef std::vector<Char> CharVector;
     mys::shared_ptr<CharVector> m_string;
 
     String() : m_string(nullptr)
@@ -35,9 +261,7 @@ public:
 
     String(const char *str);
 
-    String(const std::string& str) : String(str.c_str())
-    {
-    }
+    String(const std::string& str);
 
     String(std::initializer_list<Char> il) :
         m_string(mys::make_shared<CharVector>(il))
@@ -96,9 +320,7 @@ public:
 
     void append(const String& other)
     {
-        m_string->insert(m_string->end(),
-                         other.m_string->begin(),
-                         other.m_string->end());
+        m_string->append(*other.m_string);
     }
 
     void append(const Char& other)
@@ -106,17 +328,9 @@ public:
         m_string->push_back(other);
     }
 
-    void operator+=(const String& other)
-    {
-        m_string = mys::make_shared<CharVector>(*m_string.get());
-        append(other);
-    }
+    void operator+=(const String& other);
 
-    void operator+=(const Char& other)
-    {
-        m_string = mys::make_shared<CharVector>(*m_string.get());
-        append(other);
-    }
+    void operator+=(const Char& other);
 
     String operator+(const String& other);
 
@@ -160,9 +374,9 @@ public:
     Bytes to_utf8() const;
 
 #if !defined(MYS_UNSAFE)
-    Char& get(i64 index) const;
+    Char get(i64 index) const;
 #else
-    Char& get(i64 index) const
+    Char get(i64 index) const
     {
         if (index < 0) {
             index = m_string->size() + index;
@@ -263,17 +477,7 @@ namespace std
         std::size_t operator()(mys::String const& s) const noexcept
         {
             if (s.m_string) {
-                std::size_t hash = 0;
-                int p = 53;
-                int m = 1e9 + 9;
-                long long power_of_p = 1;
-
-                for (auto v : *s.m_string) {
-                    hash = (hash + (v - 'a' + 1) * power_of_p) % m;
-                    power_of_p = (power_of_p * p) % m;
-                }
-
-                return hash;
+                return s.m_string->hash();
             } else {
                 return 0;
             }
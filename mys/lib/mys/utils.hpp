@@ -17,6 +17,8 @@ shared_ptr_not_none(const mys::shared_ptr<T>& obj);
 
 size_t encode_utf8(char *dst_p, i32 ch);
 
+size_t hash_bytes(const u8 *data_p, size_t size);
+
 // Exception output.
 std::ostream& operator<<(std::ostream& os, const std::exception& e);
 
@@ -0,0 +1,66 @@
+import json
+import os
+import time
+
+
+def is_tracing():
+    return 'MYS_TRACE_DIRECTORY' in os.environ
+
+
+def add_event(name, category, start_time, end_time, args=None):
+    """Add given complete event to this process' trace file in the
+    directory given by the environment variable MYS_TRACE_DIRECTORY,
+    if set. Times are in seconds since the epoch, to compare them
+    between processes.
+
+    """
+
+    directory = os.getenv('MYS_TRACE_DIRECTORY')
+
+    if directory is None:
+        return
+
+    event = {
+        'name': name,
+        'cat': category,
+        'ph': 'X',
+        'ts': int(start_time * 1000000),
+        'dur': int(end_time * 1000000) - int(start_time * 1000000),
+        'pid': os.getpid(),
+        'tid': 0
+    }
+
+    if args is not None:
+        event['args'] = args
+
+    with open(os.path.join(directory, f'{os.getpid()}.jsonl'), 'a') as fout:
+        fout.write(json.dumps(event) + '\n')
+
+
+class Phases:
+    """Traces consecutive phases. A phase ends when the next phase starts
+    or when end() is called.
+
+    """
+
+    def __init__(self, category, args=None):
+        self._category = category
+        self._args = args
+        self._name = None
+        self._start_time = None
+
+    def start(self, name):
+        self.end()
+        self._name = name
+        self._start_time = time.time()
+
+    def end(self):
+        if self._name is None:
+            return
+
+        add_event(self._name,
+                  self._category,
+                  self._start_time,
+                  time.time(),
+                  self._args)
+        self._name = None
@@ -1,4 +1,5 @@
 import traceback
+from collections import defaultdict
 
 from pygments import highlight
 from pygments.formatters import Terminal256Formatter
@@ -13,16 +14,27 @@ from pygments.token import Number
 from pygments.token import Text
 
 from ..parser import ast
+from ..trace import Phases
+from .cache import Cache
+from .cache import CacheEntry
+from .cache import Interface
+from .cache import find_imported_modules
+from .cache import make_interface_hash
+from .cache import make_module_key
 from .class_transformer import ClassTransformer
 from .coverage_transformer import CoverageTransformer
 from .definitions import find_definitions
+from .definitions import is_bench
+from .definitions import is_test
 from .definitions import make_fully_qualified_names_module
 from .header_visitor import HeaderVisitor
 from .import_order import resolve_import_order
 from .imports_visitor import ImportsVisitor
+from .parallel import create_pool
 from .source_visitor import SourceVisitor
 from .traits import ensure_that_trait_methods_are_implemented
 from .utils import CompileError
+from .utils import get_import_from_info
 from .utils import split_full_name
 
 
@@ -61,6 +73,15 @@ def style_traceback(tb):
                      Terminal256Formatter(style='monokai'))
 
 
+def format_syntax_error():
+    lines = traceback.format_exc(0).splitlines()
+
+    if 'Traceback (most recent call last):' in lines[0]:
+        lines = lines[1:]
+
+    return style_traceback('\n'.join(lines))
+
+
 def transpile_file(tree,
                    source_lines,
                    filename,
@@ -139,40 +160,401 @@ class Source:
             f'  skip_tests: {self.skip_tests}'
         ])
 
-def transpile(sources, coverage=False):
+
+def _is_generic(node):
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+
+        if isinstance(decorator, ast.Name) and decorator.id == 'generic':
+            return True
+
+    return False
+
+
+def find_module_dependencies(source):
+    """Returns modules imported by given source and if it owns any generic
+    functions or classes. Much faster than transpiling as the source is
+    only parsed. Errors are ignored, as they are reported when
+    transpiling.
+
+    """
+
+    imported_modules = []
+    owns_generics = False
+
+    try:
+        tree = ast.parse(source.contents, source.mys_path)
+    except SyntaxError:
+        return imported_modules, owns_generics
+
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            try:
+                imported_module = get_import_from_info(node, source.module_levels)[0]
+            except CompileError:
+                continue
+
+            if imported_module not in imported_modules:
+                imported_modules.append(imported_module)
+        elif isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            if _is_generic(node):
+                owns_generics = True
+
+    return imported_modules, owns_generics
+
+
+def find_tests_and_benchmarks(source):
+    """Returns if given source has any tests and if it has any
+    benchmarks. Errors are ignored, as they are reported when
+    transpiling.
+
+    """
+
+    has_tests = False
+    has_benchmarks = False
+
+    try:
+        tree = ast.parse(source.contents, source.mys_path)
+    except SyntaxError:
+        return has_tests, has_benchmarks
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            if is_test(node):
+                has_tests = True
+            elif is_bench(node):
+                has_benchmarks = True
+
+    return has_tests, has_benchmarks
+
+
+def find_module_imports(modules, definitions):
+    """Returns imported modules per given module. Modules that do not
+    exist are ignored, as they are reported when transpiling.
+
+    """
+
+    module_imports = {}
+
+    for module in modules:
+        module_imports[module] = []
+
+        for imports in definitions[module].imports.values():
+            for imported_module, _ in imports:
+                if imported_module not in definitions:
+                    continue
+
+                if imported_module not in module_imports[module]:
+                    module_imports[module].append(imported_module)
+
+    return module_imports
+
+
+def find_importing_modules(module, module_imports):
+    """Returns all modules importing given module, directly or indirectly.
+
+    """
+
+    return [
+        importing_module
+        for importing_module in module_imports
+        if module in find_imported_modules(importing_module, module_imports)
+    ]
+
+
+def find_modules_to_visit(cached, module_specializations, targets):
+    """Returns cached modules that must be visited again to get all
+    specializations right. A target module owning generic functions
+    or classes has to be visited if its set of requested
+    specializations has changed, and so does all modules requesting
+    specializations from a visited target owner, as they create the
+    specialized definitions.
+
+    """
+
+    requested = defaultdict(set)
+    requesters = defaultdict(set)
+    module_requests = [
+        (module, list(functions) + list(classes))
+        for module, (functions, classes) in module_specializations.items()
+    ]
+    module_requests += [
+        (module, entry.requested_specializations())
+        for module, entry in cached.items()
+    ]
+
+    for module, names in module_requests:
+        for name in names:
+            owner = split_full_name(name)[0]
+            requested[owner].add(name)
+            requesters[owner].add(module)
+
+    modules = set()
+
+    for module, entry in cached.items():
+        if module not in targets:
+            continue
+
+        if entry.owned_specializations != sorted(requested[module]):
+            modules.add(module)
+
+    for owner, owner_requesters in requesters.items():
+        if owner not in targets:
+            continue
+
+        if owner in module_specializations or owner in modules:
+            modules |= owner_requesters
+
+    return modules & set(cached)
+
+
+# Set before forking workers, which inherits it.
+_WORKER_STATE = None
+
+# Parsed trees by path and contents, kept by long-lived processes like
+# the daemon. Trees are transformed in place when transpiled, so they
+# must only be used by processes forked after they were added.
+_PARSED_TREES = {}
+_PARSED_TREES_MAX = 4096
+
+
+def add_parsed_tree(mys_path, contents):
+    """Parse given source and keep the tree for transpilations in
+    processes forked later. Syntax errors are raised when transpiling.
+
+    """
+
+    key = (mys_path, contents)
+
+    if key in _PARSED_TREES:
+        return
+
+    if len(_PARSED_TREES) >= _PARSED_TREES_MAX:
+        _PARSED_TREES.clear()
+
+    try:
+        _PARSED_TREES[key] = ast.parse(contents, mys_path)
+    except SyntaxError:
+        pass
+
+
+def parse_source(source):
+    tree = _PARSED_TREES.get((source.mys_path, source.contents))
+
+    if tree is None:
+        tree = ast.parse(source.contents, source.mys_path)
+
+    return tree
+
+
+def transform_tree(source, tree, coverage):
+    """Returns given parsed tree transformed for finding definitions and
+    generating code.
+
+    """
+
+    ImportsVisitor().visit(tree)
+
+    if coverage:
+        coverage_transformer = CoverageTransformer(source.contents)
+        tree = ast.fix_missing_locations(coverage_transformer.visit(tree))
+        source.coverage_variables = coverage_transformer.variables()
+
+    return ast.fix_missing_locations(ClassTransformer().visit(tree))
+
+
+def create_interface(source, coverage=False):
+    """Returns the interface of given source, that is, its definitions.
+    Only given source is parsed, so interfaces of all modules can be
+    created in parallel and then be used instead of the sources when
+    transpiling modules importing them.
+
+    """
+
+    phases = Phases('interface', {'module': source.module})
+    phases.start('Parse')
+
+    try:
+        tree = parse_source(source)
+    except SyntaxError:
+        raise Exception(format_syntax_error())
+
+    try:
+        interface_hash = make_interface_hash(tree)
+        phases.start('Class transform')
+        tree = transform_tree(source, tree, coverage)
+        phases.start('Definitions')
+        definitions = find_definitions(tree,
+                                       source.source_lines,
+                                       source.module_levels,
+                                       source.module)
+        make_fully_qualified_names_module(source.module, definitions)
+        phases.end()
+    except CompileError as e:
+        raise TranspilerError(
+            style_traceback(
+                format_location_source(source, e.lineno, e.offset)
+                + f'CompileError: {e.message}'))
+
+    return Interface(source.module, interface_hash, definitions)
+
+
+def transpile_module(source,
+                     tree,
+                     definitions,
+                     specialized_functions,
+                     specialized_classes):
+    return transpile_file(tree,
+                          source.source_lines,
+                          source.mys_path,
+                          source.version,
+                          source.module_hpp,
+                          source.module_levels,
+                          definitions[source.module],
+                          definitions,
+                          source.skip_tests,
+                          source.has_main,
+                          specialized_functions,
+                          specialized_classes,
+                          source.coverage_variables)
+
+
+def transpile_module_worker(index):
+    """Generate code for given module, which does not own any generic
+    functions or classes, as specializations are generated in the main
+    process. Returns None on failure.
+
+    """
+
+    sources, trees, definitions, ordered_modules, application_init = _WORKER_STATE
+    source = sources[index]
+    specialized_functions = {}
+    specialized_classes = {}
+
+    try:
+        header_visitor, source_visitor = transpile_module(source,
+                                                          trees[index],
+                                                          definitions,
+                                                          specialized_functions,
+                                                          specialized_classes)
+
+        if application_init and source.module == ordered_modules[-1]:
+            source_visitor.add_application_init(ordered_modules)
+            source_visitor.add_application_exit(ordered_modules)
+
+        return ((header_visitor.format_early_hpp(),
+                 header_visitor.format_hpp(),
+                 source_visitor.format_cpp()),
+                (specialized_functions, specialized_classes))
+    except Exception:
+        return None
+
+
+def has_generics(definitions):
+    for functions in definitions.functions.values():
+        for function in functions:
+            if function.generic_types:
+                return True
+
+    for klass in definitions.classes.values():
+        if klass.is_generic():
+            return True
+
+    return False
+
+
+def transpile(sources,
+              coverage=False,
+              cache_directory=None,
+              jobs=1,
+              modules=None,
+              application_init=True,
+              interfaces=None):
+    """Transpile given sources to C++. Generated code for modules that
+    have not changed since last transpilation is taken from given
+    cache directory, if any. Modules are transpiled in parallel if
+    jobs is more than one.
+
+    Only given modules are generated if modules is not None, and None
+    is returned for the other sources. They must still be given, as
+    all imported modules are needed for their definitions, and all
+    modules importing a module owning generic functions or classes
+    are needed for its specializations.
+
+    Application initialization and exit is added to the last module in
+    import order if application_init is True.
+
+    Modules given as interfaces, created by create_interface(), are
+    only used for their definitions. They are not parsed and no code
+    is generated for them. Modules importing a module owning generic
+    functions or classes must still be given as sources, as they are
+    visited for its specializations.
+
+    """
+
+    global _WORKER_STATE
+
     visitors = {}
+    generated_by_workers = {}
     specialized_functions = {}
     specialized_classes = {}
+    module_specializations = {}
     trees = []
     definitions = {}
+    interface_hashes = {}
+    cached = {}
     source_by_module = {source.module: source for source in sources}
 
+    if interfaces is None:
+        interfaces = []
+
+    if modules is None:
+        targets = set(source_by_module)
+    else:
+        targets = set(modules)
+
+    phases = Phases('transpile', {'modules': sorted(targets)})
+    phases.start('Parse')
+
     try:
         for source in sources:
-            trees.append(ast.parse(source.contents, source.mys_path))
+            trees.append(parse_source(source))
     except SyntaxError:
-        lines = traceback.format_exc(0).splitlines()
+        raise Exception(format_syntax_error())
 
-        if 'Traceback (most recent call last):' in lines[0]:
-            lines = lines[1:]
+    if cache_directory is not None:
+        cache = Cache(cache_directory)
+
+        for source, tree in zip(sources, trees):
+            interface_hashes[source.module] = make_interface_hash(tree)
+    else:
+        cache = None
 
-        raise Exception(style_traceback('\n'.join(lines)))
+    for interface in interfaces:
+        definitions[interface.module] = interface.definitions
+        interface_hashes[interface.module] = interface.interface_hash
 
     source = None
 
+    def visit_module(source, tree):
+        module_specialized_functions = {}
+        module_specialized_classes = {}
+        visitors[source.module] = transpile_module(source,
+                                                   tree,
+                                                   definitions,
+                                                   module_specialized_functions,
+                                                   module_specialized_classes)
+        module_specializations[source.module] = (module_specialized_functions,
+                                                 module_specialized_classes)
+
     try:
-        for source, tree in zip(sources, trees):
-            ImportsVisitor().visit(tree)
+        phases.start('Class transform')
 
-        if coverage:
-            for source, i in zip(sources, range(len(trees))):
-                coverage_transformer = CoverageTransformer(source.contents)
-                trees[i] = ast.fix_missing_locations(
-                    coverage_transformer.visit(trees[i]))
-                source.coverage_variables = coverage_transformer.variables()
+        for i, source in enumerate(sources):
+            trees[i] = transform_tree(source, trees[i], coverage)
 
-        for source, i in zip(sources, range(len(trees))):
-            trees[i] = ast.fix_missing_locations(ClassTransformer().visit(trees[i]))
+        phases.start('Definitions')
 
         for source, tree in zip(sources, trees):
             definitions[source.module] = find_definitions(tree,
@@ -188,25 +570,156 @@ def transpile(sources, coverage=False):
             make_fully_qualified_names_module(source.module,
                                               definitions[source.module])
 
+        module_imports = find_module_imports(list(definitions), definitions)
+        ordered_modules = resolve_import_order(module_imports)
+        keys = {}
+
+        if cache is not None:
+            for source in sources:
+                if application_init and source.module == ordered_modules[-1]:
+                    extra = ordered_modules
+                else:
+                    extra = []
+
+                keys[source.module] = make_module_key(source,
+                                                      coverage,
+                                                      interface_hashes,
+                                                      module_imports,
+                                                      extra)
+                entry = cache.load(source.module, keys[source.module])
+
+                if entry is not None:
+                    cached[source.module] = entry
+
+        phases.start('Code generation')
+        futures = {}
+        worker_modules = [
+            i
+            for i, source in enumerate(sources)
+            if (source.module in targets
+                and source.module not in cached
+                and not has_generics(definitions[source.module]))
+        ]
+
+        if jobs > 1 and len(worker_modules) > 1:
+            _WORKER_STATE = (sources,
+                             trees,
+                             definitions,
+                             ordered_modules,
+                             application_init)
+            pool = create_pool(min(jobs, len(worker_modules)))
+
+            for i in worker_modules:
+                futures[sources[i].module] = pool.submit(transpile_module_worker, i)
+        else:
+            pool = None
+
+        errors = {}
+
+        try:
+            # Modules not transpiled by workers first to run in parallel
+            # with them.
+            for source, tree in zip(sources, trees):
+                if source.module not in targets:
+                    continue
+
+                if source.module in cached or source.module in futures:
+                    continue
+
+                try:
+                    visit_module(source, tree)
+                except Exception as e:
+                    if pool is None:
+                        raise
+
+                    errors[source.module] = e
+
+            # Raise the error in the first failing module, as if
+            # modules were transpiled one by one.
+            for source, tree in zip(sources, trees):
+                if source.module in errors:
+                    raise errors[source.module]
+
+                if source.module not in futures:
+                    continue
+
+                try:
+                    result = futures[source.module].result()
+                except Exception:
+                    result = None
+
+                if result is None:
+                    # Raises the error found by the worker.
+                    visit_module(source, tree)
+                else:
+                    generated, specializations = result
+                    generated_by_workers[source.module] = generated
+                    module_specializations[source.module] = specializations
+        finally:
+            if pool is not None:
+                for future in futures.values():
+                    future.cancel()
+
+                pool.shutdown()
+                _WORKER_STATE = None
+
+        phases.start('Specialization')
+
+        # Target modules owning generic functions or classes needs
+        # specializations requested by all modules importing them.
+        target_owners = [
+            module
+            for module in targets
+            if has_generics(definitions[module])
+        ]
+        importing_modules = set()
+
+        for module in target_owners:
+            importing_modules.update(find_importing_modules(module,
+                                                            module_imports))
+
         for source, tree in zip(sources, trees):
-            header_visitor, source_visitor = transpile_file(
-                tree,
-                source.source_lines,
-                source.mys_path,
-                source.version,
-                source.module_hpp,
-                source.module_levels,
-                definitions[source.module],
-                definitions,
-                source.skip_tests,
-                source.has_main,
-                specialized_functions,
-                specialized_classes,
-                source.coverage_variables)
-            visitors[source.module] = (header_visitor, source_visitor)
+            if source.module not in importing_modules:
+                continue
+
+            if source.module in cached or source.module in module_specializations:
+                continue
+
+            visit_module(source, tree)
+
+        while True:
+            modules_to_visit = find_modules_to_visit(cached,
+                                                     module_specializations,
+                                                     targets)
+
+            if not modules_to_visit:
+                break
+
+            for source, tree in zip(sources, trees):
+                if source.module in modules_to_visit:
+                    del cached[source.module]
+                    visit_module(source, tree)
+
+        # Merge in source order to make the output deterministic.
+        for source in sources:
+            if source.module not in module_specializations:
+                continue
+
+            functions, classes = module_specializations[source.module]
+
+            for name, function in functions.items():
+                specialized_functions.setdefault(name, function)
+
+            for name, klass in classes.items():
+                specialized_classes.setdefault(name, klass)
 
         for name, function in specialized_functions.items():
-            header_visitor, source_visitor = visitors[split_full_name(name)[0]]
+            module_name = split_full_name(name)[0]
+
+            if module_name not in visitors or module_name not in targets:
+                continue
+
+            header_visitor, source_visitor = visitors[module_name]
             header_visitor.visit_specialized_function(function.function)
 
             try:
@@ -225,7 +738,12 @@ def transpile(sources, coverage=False):
                         + f'CompileError: {e.message}'))
 
         for name, klass in specialized_classes.items():
-            header_visitor, source_visitor = visitors[split_full_name(name)[0]]
+            module_name = split_full_name(name)[0]
+
+            if module_name not in visitors or module_name not in targets:
+                continue
+
+            header_visitor, source_visitor = visitors[module_name]
             header_visitor.visit_specialized_class(split_full_name(name)[1],
                                                    klass.definitions)
 
@@ -245,27 +763,56 @@ def transpile(sources, coverage=False):
                             e.offset)
                         + f'CompileError: {e.message}'))
 
-        module_imports = {}
-
-        for source in sources:
-            module_imports[source.module] = []
+        if (application_init
+            and ordered_modules[-1] in visitors
+            and ordered_modules[-1] in targets):
+            last_source_visitor = visitors[ordered_modules[-1]][1]
+            last_source_visitor.add_application_init(ordered_modules)
+            last_source_visitor.add_application_exit(ordered_modules)
 
-            for imports in definitions[source.module].imports.values():
-                for imported_module, _ in imports:
-                    if imported_module not in module_imports[source.module]:
-                        module_imports[source.module].append(imported_module)
+        phases.start('Formatting')
+        generated = []
 
-        ordered_modules = resolve_import_order(module_imports)
-        last_source_visitor = visitors[ordered_modules[-1]][1]
-        last_source_visitor.add_application_init(ordered_modules)
-        last_source_visitor.add_application_exit(ordered_modules)
-
-        return [
-            (header_visitor.format_early_hpp(),
-             header_visitor.format_hpp(),
-             source_visitor.format_cpp())
-            for header_visitor, source_visitor in visitors.values()
-        ]
+        for source in sources:
+            if source.module not in targets:
+                generated.append(None)
+                continue
+
+            if source.module in cached:
+                entry = cached[source.module]
+            else:
+                if source.module in visitors:
+                    header_visitor, source_visitor = visitors[source.module]
+                    early_hpp_code = header_visitor.format_early_hpp()
+                    hpp_code = header_visitor.format_hpp()
+                    cpp_code = source_visitor.format_cpp()
+                else:
+                    early_hpp_code, hpp_code, cpp_code = (
+                        generated_by_workers[source.module])
+
+                functions, classes = module_specializations[source.module]
+                entry = CacheEntry(
+                    keys.get(source.module),
+                    early_hpp_code,
+                    hpp_code,
+                    cpp_code,
+                    list(functions),
+                    list(classes),
+                    sorted([
+                        name
+                        for name in list(specialized_functions)
+                        + list(specialized_classes)
+                        if split_full_name(name)[0] == source.module
+                    ]))
+
+                if cache is not None:
+                    cache.store(source.module, entry)
+
+            generated.append((entry.early_hpp, entry.hpp, entry.cpp))
+
+        phases.end()
+
+        return generated
     except CompileError as e:
         raise TranspilerError(
             style_traceback(
@@ -1,3 +1,4 @@
+import re
 import textwrap
 
 from ..parser import ast
@@ -332,6 +333,10 @@ def is_ascii(value):
     return len(value) == len(value.encode('utf-8'))
 
 
+# A statement like 'Bytes(__constant_1);' declares a variable.
+CONSTANT_DECLARATION_RE = re.compile(r'^[\w:]+\(__constant_\d+(\(\))?\)$')
+
+
 def handle_string(value):
     if is_ascii(value):
         value = value.encode("unicode_escape").decode('utf-8')
@@ -402,11 +407,11 @@ class BaseVisitor(ast.NodeVisitor):
             elif name == '__line__':
                 return str(node.lineno)
             elif name == '__name__':
-                return handle_string(self.context.name)
+                return self.create_string_constant(self.context.name)
             elif name == '__file__':
-                return handle_string(self.filename)
+                return self.create_string_constant(self.filename)
             elif name == '__version__':
-                return handle_string(self.version)
+                return self.create_string_constant(self.version)
             elif name == '__assets__':
                 return f'mys::assets("{self.context.package}")'
             else:
@@ -1289,7 +1294,7 @@ class BaseVisitor(ast.NodeVisitor):
         elif isinstance(node.value, str):
             self.context.mys_type = 'string'
 
-            return handle_string(node.value)
+            return self.create_string_constant(node.value)
         elif isinstance(node.value, bool):
             self.context.mys_type = 'bool'
 
@@ -1313,13 +1318,18 @@ class BaseVisitor(ast.NodeVisitor):
             return f'Bytes({{{values}}})'
         elif is_regex(node.value):
             self.context.mys_type = 'regex'
-            args = ', '.join([handle_string(s) for s in node.value])
-            return f'Regex({args})'
+
+            return self.create_regex_constant(*node.value)
         else:
             raise InternalError(f"constant node {ast.dump(node)}", node)
 
     def visit_Expr(self, node):
-        return self.visit(node.value) + ';'
+        value = self.visit(node.value)
+
+        if CONSTANT_DECLARATION_RE.match(value):
+            value = f'({value})'
+
+        return value + ';'
 
     def visit_binop_class(self, node, left_value_type):
         left = self.visit_check_type(node.left, left_value_type)
@@ -2059,24 +2069,69 @@ class BaseVisitor(ast.NodeVisitor):
 
         return f'{value}->{make_name(name)}{weak_lock}'
 
+    def add_constant(self, cpp_type, value, key=None):
+        variable = self.unique('constant')
+
+        if key is None:
+            key = variable
+
+        self.context.constants[key] = (
+            variable,
+            f'static const {cpp_type} {variable} = {value};')
+        self.context.constant_variables.add(variable)
+
+        return variable
+
     def create_constant(self, cpp_type, value):
         if value == 'nullptr':
             return value
         elif is_primitive_type(cpp_type):
             return value
+        elif value in self.context.constant_variables:
+            return value
 
         constant = self.context.constants.get(value)
 
         if constant is None:
-            variable = self.unique('constant')
-            self.context.constants[value] = (
-                variable,
-                f'static const {cpp_type} {variable} = {value};')
+            variable = self.add_constant(cpp_type, value, value)
         else:
             variable = constant[0]
 
         return variable
 
+    def create_string_constant(self, value):
+        """A string literal is created once instead of every time it is
+        evaluated, as creating a string allocates memory. Equal literals
+        are not shared as strings may be compared by identity.
+
+        """
+
+        return self.add_constant('mys::String', handle_string(value))
+
+    def create_regex_constant(self, regex, flags):
+        """A regex literal is compiled once, when first evaluated, as
+        compiling is slow. Not at startup, as an invalid regex raises an
+        error.
+
+        """
+
+        variable = self.unique('constant')
+        self.context.constants[variable] = (
+            variable,
+            '\n'.join([
+                f'static const Regex& {variable}()',
+                '{',
+                f'    static const Regex regex({handle_string(regex)}, '
+                f'{handle_string(flags)});',
+                '',
+                '    return regex;',
+                '}'
+            ]))
+        variable += '()'
+        self.context.constant_variables.add(variable)
+
+        return variable
+
     def visit_compare(self, node):
         if len(node.comparators) != 1:
             raise CompileError("can only compare two values", node)
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import pickle
+
+from ..parser import ast
+from ..version import __version__
+
+
+def _dump_without_bodies(node):
+    if isinstance(node, ast.FunctionDef):
+        return ast.dump(ast.FunctionDef(name=node.name,
+                                        args=node.args,
+                                        body=[],
+                                        decorator_list=node.decorator_list,
+                                        returns=node.returns))
+    elif isinstance(node, ast.ClassDef):
+        parts = [
+            ast.dump(ast.ClassDef(name=node.name,
+                                  bases=node.bases,
+                                  keywords=node.keywords,
+                                  body=[],
+                                  decorator_list=node.decorator_list))
+        ]
+        parts += [_dump_without_bodies(item) for item in node.body]
+
+        return ''.join(parts)
+    else:
+        return ast.dump(node)
+
+
+def make_interface_hash(tree):
+    """Returns a hash of the public interface of given module, that is,
+    everything but function and method bodies. Must be called before
+    the tree is transformed.
+
+    """
+
+    hasher = hashlib.sha256()
+
+    for node in tree.body:
+        hasher.update(_dump_without_bodies(node).encode('utf-8'))
+
+    return hasher.hexdigest()
+
+
+def find_imported_modules(module, module_imports):
+    """Returns all modules given module imports, directly or indirectly.
+
+    """
+
+    imported = set()
+    stack = [module]
+
+    while stack:
+        for imported_module in module_imports.get(stack.pop(), []):
+            if imported_module not in imported:
+                imported.add(imported_module)
+                stack.append(imported_module)
+
+    imported.discard(module)
+
+    return sorted(imported)
+
+
+def make_module_key(source,
+                    coverage,
+                    interface_hashes,
+                    module_imports,
+                    extra=None):
+    """Returns a key that changes whenever the generated code for given
+    module may change, except for specializations requested by other
+    modules. `extra` is a sequence of strings that also goes into the
+    key.
+
+    """
+
+    if extra is None:
+        extra = []
+    else:
+        extra = list(extra)
+
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([
+        __version__,
+        coverage,
+        source.contents,
+        source.filename,
+        source.version,
+        source.module,
+        source.mys_path,
+        source.module_hpp,
+        source.skip_tests,
+        source.has_main,
+        extra
+    ]).encode('utf-8'))
+
+    for imported_module in find_imported_modules(source.module, module_imports):
+        hasher.update(imported_module.encode('utf-8'))
+        hasher.update(interface_hashes.get(imported_module, '').encode('utf-8'))
+
+    return hasher.hexdigest()
+
+
+class Interface:
+    """Definitions of a module, used instead of its source when
+    transpiling modules importing it.
+
+    """
+
+    def __init__(self, module, interface_hash, definitions):
+        self.module = module
+        self.interface_hash = interface_hash
+        self.definitions = definitions
+
+
+def write_interface(path, interface):
+    directory = os.path.dirname(path)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Written atomically as it may be read by concurrent transpilations.
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+
+    with open(tmp_path, 'wb') as fout:
+        pickle.dump(interface, fout, pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_path, path)
+
+
+def read_interface(path):
+    with open(path, 'rb') as fin:
+        return pickle.load(fin)
+
+
+class CacheEntry:
+
+    def __init__(self,
+                 key,
+                 early_hpp,
+                 hpp,
+                 cpp,
+                 specialized_functions,
+                 specialized_classes,
+                 owned_specializations):
+        self.key = key
+        self.early_hpp = early_hpp
+        self.hpp = hpp
+        self.cpp = cpp
+        self.specialized_functions = specialized_functions
+        self.specialized_classes = specialized_classes
+        self.owned_specializations = owned_specializations
+
+    def requested_specializations(self):
+        return self.specialized_functions + self.specialized_classes
+
+
+class Cache:
+    """Generated code per module, stored in given directory between
+    transpilations.
+
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, module):
+        return os.path.join(self.directory, module + '.json')
+
+    def load(self, module, key):
+        """Returns the cache entry for given module, or None if missing or
+        stale.
+
+        """
+
+        try:
+            with open(self._path(module), 'r') as fin:
+                entry = CacheEntry(**json.load(fin))
+        except Exception:
+            return None
+
+        if entry.key != key:
+            return None
+
+        return entry
+
+    def store(self, module, entry):
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Written atomically as the cache may be shared by concurrent
+        # transpilations.
+        path = self._path(module)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+
+        with open(tmp_path, 'w') as fout:
+            json.dump(vars(entry), fout)
+
+        os.replace(tmp_path, path)
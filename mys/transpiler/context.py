@@ -102,6 +102,7 @@ class Context:
         self.mys_type = None
         self.unique_count = 0
         self.constants = {}
+        self.constant_variables = set()
         self._name_to_full_name = {}
         self.specialized_functions = specialized_functions
         self.specialized_classes = specialized_classes
@@ -70,10 +70,10 @@ class CoverageTransformer(ast.NodeTransformer):
         return node
 
     def visit_FunctionDef(self, node):
-        # Ignore tests in coverage.
+        # Ignore tests and benchmarks in coverage.
         for decorator in node.decorator_list:
             if isinstance(decorator, ast.Name):
-                if decorator.id == 'test':
+                if decorator.id in ['test', 'bench']:
                     return node
 
         body = []
@@ -144,6 +144,14 @@ class Test:
         self.docstring = docstring
 
 
+class Bench:
+
+    def __init__(self, name, node, docstring=None):
+        self.name = name
+        self.node = node
+        self.docstring = docstring
+
+
 class Param:
 
     def __init__(self, name, type_, node):
@@ -264,6 +272,7 @@ class Definitions:
         self.functions = defaultdict(list)
         self.imports = defaultdict(list)
         self.tests = {}
+        self.benches = {}
 
     def _check_unique_name(self, name, node, is_function=False):
         if name in self.variables:
@@ -322,6 +331,13 @@ class Definitions:
 
         self.tests[name] = value
 
+    def define_bench(self, name, value, node):
+        if name in self.benches:
+            raise CompileError(f"there is already a benchmark called '{name}'",
+                               node)
+
+        self.benches[name] = value
+
     def add_import(self, module, name, asname, node):
         self._check_unique_name(asname, node)
         self.imports[asname].append((module, name))
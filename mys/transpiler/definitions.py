@@ -1,6 +1,7 @@
 from collections import defaultdict
 
 from ..parser import ast
+from .definition_types import Bench
 from .definition_types import Class
 from .definition_types import Definitions
 from .definition_types import Enum
@@ -37,6 +38,15 @@ def is_test(node):
     return False
 
 
+def is_bench(node):
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Name):
+            if decorator.id == 'bench':
+                return True
+
+    return False
+
+
 def get_docstring(node, body_iter=None):
     if has_docstring(node):
         docstring = node.body[0].value.value
@@ -247,6 +257,24 @@ class TestVisitor(TypeVisitor):
         return Test(node.name, node, get_docstring(node))
 
 
+class BenchVisitor(TypeVisitor):
+
+    def visit_FunctionDef(self, node):
+        if len(node.decorator_list) != 1:
+            raise CompileError('benchmarks cannot have other decorators', node)
+
+        if len(node.args.args) != 0:
+            raise CompileError('benchmarks cannot have parameters', node)
+
+        if node.returns is not None:
+            raise CompileError('benchmarks cannot return any value', node)
+
+        if not is_snake_case(node.name):
+            raise CompileError("benchmark names must be snake case", node)
+
+        return Bench(node.name, node, get_docstring(node))
+
+
 class MethodVisitor(FunctionVisitor):
 
     def visit_arguments(self, node):
@@ -604,6 +632,10 @@ class DefinitionsVisitor(ast.NodeVisitor):
             self._definitions.define_test(node.name,
                                           TestVisitor().visit(node),
                                           node)
+        elif is_bench(node):
+            self._definitions.define_bench(node.name,
+                                           BenchVisitor().visit(node),
+                                           node)
         else:
             self._definitions.define_function(node.name,
                                               FunctionVisitor().visit(node),
@@ -0,0 +1,44 @@
+import copyreg
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from ..parser import _ast
+from ..parser import ast
+
+
+def _make_node(name, state):
+    node_class = getattr(ast, name)
+    node = node_class.__new__(node_class)
+    node.__dict__.update(state)
+
+    return node
+
+
+def _reduce_node(node):
+    return _make_node, (type(node).__name__, dict(vars(node)))
+
+
+def _register_ast_pickling():
+    """Nodes claim to be defined in the ast module, which is Python's
+    own ast module, and not in ours. Pickle them by name instead.
+
+    """
+
+    for name in dir(_ast):
+        value = getattr(_ast, name)
+
+        if isinstance(value, type) and issubclass(value, _ast.AST):
+            copyreg.pickle(value, _reduce_node)
+
+
+_register_ast_pickling()
+
+
+def create_pool(jobs):
+    """Returns a process pool with given number of workers. Workers are
+    forked so they inherit the transpiler state instead of getting it
+    pickled per task.
+
+    """
+
+    return ProcessPoolExecutor(jobs, multiprocessing.get_context('fork'))
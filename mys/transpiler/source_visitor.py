@@ -37,6 +37,10 @@ from .value_check_type_visitor import ValueCheckTypeVisitor
 def make_test_name(name):
     return f'mys_test_{name}'
 
+
+def make_bench_name(name):
+    return f'mys_bench_{name}'
+
 def create_coverage_exit(module_path, coverage_variables):
     code = [
         '#if defined(MYS_COVERAGE)',
@@ -267,6 +271,9 @@ class SourceVisitor(ast.NodeVisitor):
             for test in self.module_definitions.tests.values():
                 self.body += self.visit_test_definition(test)
 
+            for bench in self.module_definitions.benches.values():
+                self.body += self.visit_bench_definition(bench)
+
     def visit_specialized_function(self, function):
         self.body += self.visit_function_defaults(function)
         self.body += self.visit_function_definition(function)
@@ -710,6 +717,18 @@ class SourceVisitor(ast.NodeVisitor):
         raise CompileError("iterators are not yet implemented", function.node)
 
     def visit_test_definition(self, function):
+        return self.visit_test_or_bench_definition(function,
+                                                   'MYS_TEST',
+                                                   'Test',
+                                                   make_test_name(function.name))
+
+    def visit_bench_definition(self, function):
+        return self.visit_test_or_bench_definition(function,
+                                                   'MYS_BENCH',
+                                                   'Bench',
+                                                   make_bench_name(function.name))
+
+    def visit_test_or_bench_definition(self, function, define, cpp_class, name):
         self.context.push()
 
         self.context.return_mys_type = None
@@ -728,15 +747,14 @@ class SourceVisitor(ast.NodeVisitor):
 
         body.append(self.context.traceback.exit())
         namespace = '::'.join(self.module_levels[1:])
-        test_name = make_test_name(function.name)
         code = [
-            '#if defined(MYS_TEST)',
-            f'static void {test_name}(void)',
+            f'#if defined({define})',
+            f'static void {name}(void)',
             '{'
         ] + body + [
             '}',
-            f'static Test __{test_name}("{namespace}::{function.name}", '
-            f'{test_name});',
+            f'static {cpp_class} __{name}("{namespace}::{function.name}", '
+            f'{name});',
             '#endif'
         ]
 
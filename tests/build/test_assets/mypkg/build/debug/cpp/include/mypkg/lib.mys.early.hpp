@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_EARLY_HPP
+#define mys_mypkg_lib_EARLY_HPP
+namespace mys::mypkg::lib
+{
+}
+#include "mypkg1/lib.mys.early.hpp"
+namespace mys::mypkg::lib
+{
+}
+#endif
\ No newline at end of file
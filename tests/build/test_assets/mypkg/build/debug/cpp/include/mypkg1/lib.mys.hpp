@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1_lib_HPP
+#define mys_mypkg1_lib_HPP
+#include "mypkg1/lib.mys.early.hpp"
+namespace mys::mypkg1::lib
+{
+}
+#endif
\ No newline at end of file
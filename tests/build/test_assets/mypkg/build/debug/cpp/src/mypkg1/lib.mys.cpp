@@ -0,0 +1,32 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/lib.mys.hpp"
+namespace mys::mypkg1::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "foo", 2, "return f\"{__assets__}/foo.txt\"" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("/foo.txt");
+mys::String foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    mys::String __res_2 = (string_str(mys::assets("mypkg1")) + __constant_1);
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_HPP
+#define mys_mypkg_lib_HPP
+#include "mypkg/lib.mys.early.hpp"
+namespace mys::mypkg::lib
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,22 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_circular_imports_mod1_HPP
+#define mys_circular_imports_mod1_HPP
+#include "circular_imports/mod1.mys.early.hpp"
+#include "circular_imports/mod2.mys.hpp"
+namespace mys::circular_imports::mod1
+{
+class Foo1 : public mys::circular_imports::mod2::Base2 {
+public:
+    mys::shared_ptr<mys::circular_imports::mod1::Foo1> a;
+    mys::shared_ptr<mys::circular_imports::mod2::Foo2> b;
+    mys::shared_ptr<mys::circular_imports::mod1::Base1> c;
+    mys::shared_ptr<mys::circular_imports::mod2::Base2> d;
+    Foo1(mys::shared_ptr<mys::circular_imports::mod1::Foo1> a, mys::shared_ptr<mys::circular_imports::mod2::Foo2> b, mys::shared_ptr<mys::circular_imports::mod1::Base1> c, mys::shared_ptr<mys::circular_imports::mod2::Base2> d);
+    virtual ~Foo1(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::circular_imports::mod1::Foo1> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::circular_imports::mod1::Foo1> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
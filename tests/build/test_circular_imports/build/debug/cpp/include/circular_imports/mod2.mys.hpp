@@ -0,0 +1,22 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_circular_imports_mod2_HPP
+#define mys_circular_imports_mod2_HPP
+#include "circular_imports/mod2.mys.early.hpp"
+#include "circular_imports/mod1.mys.hpp"
+namespace mys::circular_imports::mod2
+{
+class Foo2 : public mys::circular_imports::mod1::Base1 {
+public:
+    mys::shared_ptr<mys::circular_imports::mod1::Foo1> i;
+    mys::shared_ptr<mys::circular_imports::mod2::Foo2> j;
+    mys::shared_ptr<mys::circular_imports::mod1::Base1> k;
+    mys::shared_ptr<mys::circular_imports::mod2::Base2> l;
+    Foo2(mys::shared_ptr<mys::circular_imports::mod1::Foo1> i, mys::shared_ptr<mys::circular_imports::mod2::Foo2> j, mys::shared_ptr<mys::circular_imports::mod1::Base1> k, mys::shared_ptr<mys::circular_imports::mod2::Base2> l);
+    virtual ~Foo2(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::circular_imports::mod2::Foo2> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::circular_imports::mod2::Foo2> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
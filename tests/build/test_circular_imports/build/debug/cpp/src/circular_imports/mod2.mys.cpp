@@ -0,0 +1,200 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "circular_imports/mod2.mys.hpp"
+namespace mys::circular_imports::mod2
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 9, "class Foo2(Base1):" },
+    { "__init__", 9, "class Foo2(Base1):" },
+    { "__init__", 9, "class Foo2(Base1):" },
+    { "__init__", 9, "class Foo2(Base1):" },
+    { "__str__", 9, "class Foo2(Base1):" },
+    { "__eq__", 9, "class Foo2(Base1):" },
+    { "__lt__", 9, "class Foo2(Base1):" },
+    { "__hash__", 9, "class Foo2(Base1):" },
+    { "__hash__", 9, "class Foo2(Base1):" },
+    { "func2", 18, "pass" },
+    { "foo_1", 21, "print(Foo1(None, None, None, None))" },
+    { "foo_2", 24, "print(Foo2(None, None, None, None))" },
+    { "var_1", 27, "assert VAR1.a is None" },
+    { "var_1", 28, "assert VAR1.b is not None" },
+    { "var_2", 31, "assert VAR2.i is not None" },
+    { "var_2", 32, "assert VAR2.j is None" },
+    { "func_1", 35, "func1()" },
+    { "func_2", 38, "func2()" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod2.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Foo2(");
+static const mys::String __constant_2 = mys::String("i=");
+static const mys::String __constant_3 = mys::String(", j=");
+static const mys::String __constant_4 = mys::String(", k=");
+static const mys::String __constant_5 = mys::String(", l=");
+static const mys::String __constant_6 = mys::String(")");
+mys::shared_ptr<mys::circular_imports::mod2::Foo2> VAR2;
+Foo2::Foo2(mys::shared_ptr<mys::circular_imports::mod1::Foo1> i, mys::shared_ptr<mys::circular_imports::mod2::Foo2> j, mys::shared_ptr<mys::circular_imports::mod1::Base1> k, mys::shared_ptr<mys::circular_imports::mod2::Base2> l)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->i = i;
+    __MYS_TRACEBACK_SET(1);
+    this->j = j;
+    __MYS_TRACEBACK_SET(2);
+    this->k = k;
+    __MYS_TRACEBACK_SET(3);
+    this->l = l;
+    __MYS_TRACEBACK_EXIT();
+}
+Foo2::~Foo2(void)
+{
+}
+mys::String Foo2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    mys::String __res_7 = (__constant_1 + __constant_2 + object_str(this->i) + __constant_3 + object_str(this->j) + __constant_4 + object_str(this->k) + __constant_5 + object_str(this->l) + __constant_6);
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo2::__eq__(mys::shared_ptr<mys::circular_imports::mod2::Foo2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    mys::Bool __res_8 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo2::__lt__(mys::shared_ptr<mys::circular_imports::mod2::Foo2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+    mys::Bool __res_9 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_9;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(8);
+    i64 __res_10 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_10;
+    __MYS_TRACEBACK_EXIT();
+}
+void func2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_foo_1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    std::cout << mys::make_shared<mys::circular_imports::mod1::Foo1>(nullptr, nullptr, nullptr, nullptr) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_foo_1("mod2::foo_1", mys_test_foo_1);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_foo_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+    std::cout << mys::make_shared<mys::circular_imports::mod2::Foo2>(nullptr, nullptr, nullptr, nullptr) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_foo_2("mod2::foo_2", mys_test_foo_2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_var_1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(12);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::circular_imports::mod1::Foo1> __var_11 = mys::circular_imports::mod1::VAR1->a;
+    const mys::shared_ptr<mys::circular_imports::mod1::Foo1> __var_12 = nullptr;
+    if (!(is(__var_11, __var_12))) {
+        std::cout << "./src/mod2.mys:27: assert " << PrintString(object_str(__var_11) + " is " + object_str(__var_12)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_11) + " is " + object_str(__var_12) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(13);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::circular_imports::mod2::Foo2> __var_13 = mys::circular_imports::mod1::VAR1->b;
+    const mys::shared_ptr<mys::circular_imports::mod2::Foo2> __var_14 = nullptr;
+    if (!(!is(__var_13, __var_14))) {
+        std::cout << "./src/mod2.mys:28: assert " << PrintString(object_str(__var_13) + " is not " + object_str(__var_14)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_13) + " is not " + object_str(__var_14) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_var_1("mod2::var_1", mys_test_var_1);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_var_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(14);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::circular_imports::mod1::Foo1> __var_15 = mys::circular_imports::mod2::VAR2->i;
+    const mys::shared_ptr<mys::circular_imports::mod1::Foo1> __var_16 = nullptr;
+    if (!(!is(__var_15, __var_16))) {
+        std::cout << "./src/mod2.mys:31: assert " << PrintString(object_str(__var_15) + " is not " + object_str(__var_16)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_15) + " is not " + object_str(__var_16) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(15);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::circular_imports::mod2::Foo2> __var_17 = mys::circular_imports::mod2::VAR2->j;
+    const mys::shared_ptr<mys::circular_imports::mod2::Foo2> __var_18 = nullptr;
+    if (!(is(__var_17, __var_18))) {
+        std::cout << "./src/mod2.mys:32: assert " << PrintString(object_str(__var_17) + " is " + object_str(__var_18)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_17) + " is " + object_str(__var_18) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_var_2("mod2::var_2", mys_test_var_2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_func_1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(16);
+    mys::circular_imports::mod1::func1();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_func_1("mod2::func_1", mys_test_func_1);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_func_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+    mys::circular_imports::mod2::func2();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_func_2("mod2::func_2", mys_test_func_2);
+#endif
+void __module_init()
+{
+    VAR2 = mys::make_shared<mys::circular_imports::mod2::Foo2>(mys::make_shared<mys::circular_imports::mod1::Foo1>(nullptr, nullptr, nullptr, nullptr), nullptr, nullptr, nullptr);
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod2.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
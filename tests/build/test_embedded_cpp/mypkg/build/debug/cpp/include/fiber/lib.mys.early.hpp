@@ -0,0 +1,40 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_fiber_lib_EARLY_HPP
+#define mys_fiber_lib_EARLY_HPP
+namespace mys::fiber::lib
+{
+class TimerHandler;
+class Message;
+class CancelledError;
+class QueueError;
+class Queue;
+class Lock;
+class EventError;
+class Event;
+class Timer;
+class _TimerHandler;
+class MessageTimer;
+class MessageQueue;
+class Bus;
+}
+namespace mys::fiber::lib
+{
+class TimerHandler : public mys::Object {
+public:
+    virtual ~TimerHandler() {}
+    virtual void on_timeout(void) = 0;
+};
+class Message : public mys::Object {
+public:
+    virtual ~Message() {}
+};
+extern mys::shared_ptr<mys::fiber::lib::Bus> _BUS;
+void suspend(void);
+void resume(mys::shared_ptr<Fiber> fiber);
+void sleep(f64 seconds);
+mys::shared_ptr<Fiber> current(void);
+void broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message);
+void subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue);
+void unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue);
+}
+#endif
\ No newline at end of file
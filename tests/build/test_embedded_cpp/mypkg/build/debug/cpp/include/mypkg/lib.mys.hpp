@@ -0,0 +1,23 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_HPP
+#define mys_mypkg_lib_HPP
+#include "mypkg/lib.mys.early.hpp"
+#include "mypkg1/lib.mys.hpp"
+namespace mys::mypkg::lib
+{
+class Foo : public mys::Object {
+public:
+    /* c-string start */
+    int m_a;
+    bool m_b;
+    /* c-string stop */
+    mys::shared_ptr<mys::Tuple<i64, mys::Bool>> members(void);
+    Foo(void);
+    virtual ~Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::lib::Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::lib::Foo> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1_lib_EARLY_HPP
+#define mys_mypkg1_lib_EARLY_HPP
+namespace mys::mypkg1::lib
+{
+}
+namespace mys::mypkg1::lib
+{
+i32 foo(void);
+}
+#endif
\ No newline at end of file
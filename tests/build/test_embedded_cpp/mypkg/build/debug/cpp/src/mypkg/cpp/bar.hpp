@@ -0,0 +1,3 @@
+#pragma once
+
+// Just an empty file.
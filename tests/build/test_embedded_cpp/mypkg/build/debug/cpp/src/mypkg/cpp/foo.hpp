@@ -0,0 +1,7 @@
+#pragma once
+
+// It's good practice to use the package namespace is possible.
+namespace mys::mypkg::foo
+{
+int foobar(int v);
+};
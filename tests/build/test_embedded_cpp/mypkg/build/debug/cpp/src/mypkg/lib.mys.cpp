@@ -0,0 +1,188 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/lib.mys.hpp"
+/* c-string-source-before-namespace start */
+#include "cpp/foo.hpp"
+/* c-string-source-before-namespace stop */
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::mypkg1::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::mypkg1::lib::__module_init();
+    mys::mypkg::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg1::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::mypkg1::lib::__module_exit();
+    mys::mypkg::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::mypkg::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "members", 31, "a: i64 = 0" },
+    { "members", 32, "b: bool = False" },
+    { "members", 34, "c\"\"\"" },
+    { "members", 41, "return (a, b)" },
+    { "__init__", 24, "class Foo:" },
+    { "__str__", 24, "class Foo:" },
+    { "__eq__", 24, "class Foo:" },
+    { "__lt__", 24, "class Foo:" },
+    { "__hash__", 24, "class Foo:" },
+    { "__hash__", 24, "class Foo:" },
+    { "foo", 12, "a = foo2()" },
+    { "foo", 14, "c\"\"\"" },
+    { "foo", 18, "return a" },
+    { "foo", 21, "assert foo2() == 4" },
+    { "foo", 22, "assert foo() == 13" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+/* c-string start */
+static int global_variable = 0;
+/* c-string stop */
+static const mys::String __constant_2 = mys::String("Foo(");
+static const mys::String __constant_3 = mys::String(")");
+mys::shared_ptr<mys::Tuple<i64, mys::Bool>> Foo::members(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    i64 a = 0;
+    __MYS_TRACEBACK_SET(1);
+    mys::Bool b = mys::Bool(false);
+    __MYS_TRACEBACK_SET(2);
+    /* c-string start */
+    // Backslash should work.
+    std::cout << "Hi\n";
+    a = m_a;
+    b = Bool(m_b);
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(3);
+    mys::shared_ptr<mys::Tuple<i64, mys::Bool>> __res_1 = mys::make_shared<mys::Tuple<i64, mys::Bool>>(a, b);
+    __MYS_TRACEBACK_EXIT();
+    return __res_1;
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::Foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::~Foo(void)
+{
+}
+mys::String Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    mys::String __res_4 = (__constant_2 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__eq__(mys::shared_ptr<mys::mypkg::lib::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+    mys::Bool __res_5 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__lt__(mys::shared_ptr<mys::mypkg::lib::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::Bool __res_6 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(9);
+    i64 __res_7 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+i32 foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    i32 a = mys::mypkg1::lib::foo();
+    __MYS_TRACEBACK_SET(11);
+    /* c-string start */
+    a += foo::foobar(3) + global_variable;
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(12);
+    i32 __res_8 = a;
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_9 = mys::mypkg1::lib::foo();
+    const i32 __var_10 = 4;
+    if (!((__var_9 == __var_10))) {
+        std::cout << "./src/lib.mys:21: assert " << PrintString(mys::String(__var_9) + " == " + mys::String(__var_10)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_9) + " == " + mys::String(__var_10) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(14);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_11 = mys::mypkg::lib::foo();
+    const i32 __var_12 = 13;
+    if (!((__var_11 == __var_12))) {
+        std::cout << "./src/lib.mys:22: assert " << PrintString(mys::String(__var_11) + " == " + mys::String(__var_12)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_11) + " == " + mys::String(__var_12) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_foo("lib::foo", mys_test_foo);
+#endif
+void __module_init()
+{
+;
+;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,43 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg1/lib.mys.hpp"
+/* c-string-source-before-namespace start */
+#include "foo.hpp"
+/* c-string-source-before-namespace stop */
+namespace mys::mypkg1::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "foo", 6, "a: i32 = 0" },
+    { "foo", 8, "c\"\"\"" },
+    { "foo", 12, "return a" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../mypkg1/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i32 foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    i32 a = 0;
+    __MYS_TRACEBACK_SET(1);
+    /* c-string start */
+    a = foo::foobar(2);
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(2);
+    i32 __res_1 = a;
+    __MYS_TRACEBACK_EXIT();
+    return __res_1;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../mypkg1/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
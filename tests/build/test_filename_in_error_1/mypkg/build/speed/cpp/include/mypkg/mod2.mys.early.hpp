@@ -0,0 +1,15 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod2_EARLY_HPP
+#define mys_mypkg_mod2_EARLY_HPP
+namespace mys::mypkg::mod2
+{
+class Ko;
+}
+namespace mys::mypkg::mod2
+{
+class Ko : public mys::Object {
+public:
+    virtual ~Ko() {}
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,143 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod3.mys.hpp"
+namespace mys::mypkg::mod3
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "fum", 4, "return 10" },
+    { "__init__", 1, "class Fie:" },
+    { "__str__", 1, "class Fie:" },
+    { "__eq__", 1, "class Fie:" },
+    { "__lt__", 1, "class Fie:" },
+    { "__hash__", 1, "class Fie:" },
+    { "__hash__", 1, "class Fie:" },
+    { "__init__", 6, "class Fam:" },
+    { "__str__", 6, "class Fam:" },
+    { "__eq__", 6, "class Fam:" },
+    { "__lt__", 6, "class Fam:" },
+    { "__hash__", 6, "class Fam:" },
+    { "__hash__", 6, "class Fam:" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod3.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_2 = mys::String("Fie(");
+static const mys::String __constant_3 = mys::String(")");
+static const mys::String __constant_8 = mys::String("Fam(");
+static const mys::String __constant_9 = mys::String(")");
+u8 Fie::fum(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    u8 __res_1 = 10;
+    __MYS_TRACEBACK_EXIT();
+    return __res_1;
+    __MYS_TRACEBACK_EXIT();
+}
+Fie::Fie(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Fie::~Fie(void)
+{
+}
+mys::String Fie::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_4 = (__constant_2 + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Fie::__eq__(mys::shared_ptr<mys::mypkg::mod3::Fie> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_5 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Fie::__lt__(mys::shared_ptr<mys::mypkg::mod3::Fie> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_6 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Fie::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(6);
+    i64 __res_7 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+Fam::Fam(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Fam::~Fam(void)
+{
+}
+mys::String Fam::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    mys::String __res_10 = (__constant_8 + __constant_9);
+    __MYS_TRACEBACK_EXIT();
+    return __res_10;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Fam::__eq__(mys::shared_ptr<mys::mypkg::mod3::Fam> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    mys::Bool __res_11 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_11;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Fam::__lt__(mys::shared_ptr<mys::mypkg::mod3::Fam> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    mys::Bool __res_12 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Fam::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(12);
+    i64 __res_13 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_13;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod3.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
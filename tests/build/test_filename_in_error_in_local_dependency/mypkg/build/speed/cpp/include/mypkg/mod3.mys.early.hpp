@@ -0,0 +1,12 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod3_EARLY_HPP
+#define mys_mypkg_mod3_EARLY_HPP
+namespace mys::mypkg::mod3
+{
+class Fie;
+class Fam;
+}
+namespace mys::mypkg::mod3
+{
+}
+#endif
\ No newline at end of file
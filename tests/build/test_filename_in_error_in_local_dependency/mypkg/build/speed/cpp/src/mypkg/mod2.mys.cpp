@@ -0,0 +1,22 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod2.mys.hpp"
+namespace mys::mypkg::mod2
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod2.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod2.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_HPP
+#define mys_mypkg_lib_HPP
+#include "mypkg/lib.mys.early.hpp"
+#include "mypkg/mod1.mys.hpp"
+#include "mypkg/mod2.mys.hpp"
+namespace mys::mypkg::lib
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,16 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod1_EARLY_HPP
+#define mys_mypkg_mod1_EARLY_HPP
+namespace mys::mypkg::mod1
+{
+}
+#include "mypkg/mod2.mys.early.hpp"
+namespace mys::mypkg::mod1
+{
+extern mys::String A;
+extern i64 B;
+extern mys::String C;
+mys::String a(void);
+mys::String c(void);
+}
+#endif
\ No newline at end of file
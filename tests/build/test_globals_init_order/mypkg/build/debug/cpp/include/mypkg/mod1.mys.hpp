@@ -0,0 +1,9 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod1_HPP
+#define mys_mypkg_mod1_HPP
+#include "mypkg/mod1.mys.early.hpp"
+#include "mypkg/mod2.mys.hpp"
+namespace mys::mypkg::mod1
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,147 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/lib.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::mypkg::mod2 {
+extern void __module_init();
+}
+namespace mys::mypkg::mod1 {
+extern void __module_init();
+}
+namespace mys::mypkg::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::mypkg::mod2::__module_init();
+    mys::mypkg::mod1::__module_init();
+    mys::mypkg::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod2 {
+extern void __module_exit();
+}
+namespace mys::mypkg::mod1 {
+extern void __module_exit();
+}
+namespace mys::mypkg::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::mypkg::mod2::__module_exit();
+    mys::mypkg::mod1::__module_exit();
+    mys::mypkg::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::mypkg::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "f", 8, "print(\"lib\")" },
+    { "f", 10, "return 3" },
+    { "variables", 15, "assert A is None" },
+    { "variables", 16, "assert B == 10" },
+    { "variables", 17, "assert C == \"Hello\"" },
+    { "variables", 18, "assert X is None" },
+    { "variables", 19, "assert Y == 5" },
+    { "variables", 20, "assert F == 3" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("lib");
+static const mys::String __constant_7 = mys::String("Hello");
+i64 F;
+i64 f(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    __MYS_TRACEBACK_SET(1);
+    i64 __res_2 = 3;
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_variables(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_3 = mys::mypkg::mod1::A;
+    const mys::String __var_4 = nullptr;
+    if (!(is(__var_3.m_string, __var_4.m_string))) {
+        std::cout << "./src/lib.mys:15: assert " << PrintString(string_with_quotes(__var_3) + " is " + string_with_quotes(__var_4)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_3) + " is " + string_with_quotes(__var_4) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(3);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_5 = mys::mypkg::mod1::B;
+    const i64 __var_6 = 10;
+    if (!((__var_5 == __var_6))) {
+        std::cout << "./src/lib.mys:16: assert " << PrintString(mys::String(__var_5) + " == " + mys::String(__var_6)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_5) + " == " + mys::String(__var_6) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(4);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_8 = mys::mypkg::mod1::C;
+    const mys::String __var_9 = __constant_7;
+    if (!((__var_8 == __var_9))) {
+        std::cout << "./src/lib.mys:17: assert " << PrintString(string_with_quotes(__var_8) + " == " + string_with_quotes(__var_9)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_8) + " == " + string_with_quotes(__var_9) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(5);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_10 = mys::mypkg::mod2::X;
+    const mys::String __var_11 = nullptr;
+    if (!(is(__var_10.m_string, __var_11.m_string))) {
+        std::cout << "./src/lib.mys:18: assert " << PrintString(string_with_quotes(__var_10) + " is " + string_with_quotes(__var_11)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_10) + " is " + string_with_quotes(__var_11) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(6);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_12 = mys::mypkg::mod2::Y;
+    const i64 __var_13 = 5;
+    if (!((__var_12 == __var_13))) {
+        std::cout << "./src/lib.mys:19: assert " << PrintString(mys::String(__var_12) + " == " + mys::String(__var_13)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_12) + " == " + mys::String(__var_13) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(7);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_14 = mys::mypkg::lib::F;
+    const i64 __var_15 = 3;
+    if (!((__var_14 == __var_15))) {
+        std::cout << "./src/lib.mys:20: assert " << PrintString(mys::String(__var_14) + " == " + mys::String(__var_15)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_14) + " == " + mys::String(__var_15) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_variables("lib::variables", mys_test_variables);
+#endif
+void __module_init()
+{
+    F = mys::mypkg::lib::f();
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,56 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod1.mys.hpp"
+namespace mys::mypkg::mod1
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "a", 5, "print(\"mod1 a\")" },
+    { "a", 7, "return X" },
+    { "c", 10, "print(\"mod1 c\")" },
+    { "c", 12, "return \"Hello\"" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod1.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("mod1 a");
+static const mys::String __constant_3 = mys::String("mod1 c");
+static const mys::String __constant_4 = mys::String("Hello");
+mys::String A;
+i64 B;
+mys::String C;
+mys::String a(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_2 = mys::mypkg::mod2::X;
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String c(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    std::cout << PrintString(__constant_3) << "\n";
+    __MYS_TRACEBACK_SET(3);
+    mys::String __res_5 = __constant_4;
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+    A = mys::mypkg::mod1::a();
+    B = (2 * mys::mypkg::mod2::Y);
+    C = mys::mypkg::mod1::c();
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod1.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
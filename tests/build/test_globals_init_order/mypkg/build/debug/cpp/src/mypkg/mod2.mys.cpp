@@ -0,0 +1,39 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/mod2.mys.hpp"
+namespace mys::mypkg::mod2
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "x", 4, "print(\"mod2\")" },
+    { "x", 6, "return C" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/mod2.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("mod2");
+mys::String X;
+i64 Y;
+mys::String x(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_2 = mys::mypkg::mod1::C;
+    __MYS_TRACEBACK_EXIT();
+    return __res_2;
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+    X = mys::mypkg::mod2::x();
+    Y = 5;
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/mod2.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,26 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_lib_EARLY_HPP
+#define mys_mypkg_lib_EARLY_HPP
+namespace mys::mypkg::lib
+{
+class Class2;
+class Foo;
+class ImplementsTrait1;
+class ImplementsTrait2;
+class EnumMember;
+class MatchBar;
+class Circ;
+}
+#include "mypkg/mod1.mys.early.hpp"
+#include "mypkg/mod2.mys.early.hpp"
+#include "mypkg/mod3.mys.early.hpp"
+#include "mypkg1/lib.mys.early.hpp"
+#include "mypkg1/subpkg1/mod1.mys.early.hpp"
+#include "mypkg2/lib.mys.early.hpp"
+namespace mys::mypkg::lib
+{
+i64 func8(void);
+mys::String trait_foo(mys::shared_ptr<mys::mypkg::mod1::Base> v);
+i64 match_foo(mys::shared_ptr<mys::mypkg::mod1::MatchBase> base);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,71 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod1_EARLY_HPP
+#define mys_mypkg_mod1_EARLY_HPP
+namespace mys::mypkg::mod1
+{
+class Base;
+class Base2;
+class MatchBase;
+class Match2Base;
+class Foo;
+class Bar;
+class Kam;
+class Foo2;
+class GenClass;
+class GenClass2;
+class MatchFoo;
+class Match2Foo;
+class MemberClass;
+class MemberClass2;
+class MemberClass3;
+class MemberClass4;
+class MemberClass5;
+class MemberClass6;
+class MyError;
+class WeakIn;
+class Weak;
+class Imp1;
+class GenClass_i64;
+class GenClass2_i64;
+}
+#include "mypkg/lib.mys.early.hpp"
+#include "mypkg/mod2.mys.early.hpp"
+#include "mypkg/mod3.mys.early.hpp"
+namespace mys::mypkg::mod1
+{
+enum class Enum1 : i64 {
+    A = 0,
+};
+i64 Enum1_from_value(i64 value);
+class Base : public mys::Object {
+public:
+    virtual ~Base() {}
+    virtual mys::String foo(void) = 0;
+    virtual mys::String bar(void) = 0;
+    virtual mys::Char fie(void) = 0;
+};
+class Base2 : public mys::Object {
+public:
+    virtual ~Base2() {}
+};
+class MatchBase : public mys::Object {
+public:
+    virtual ~MatchBase() {}
+};
+class Match2Base : public mys::Object {
+public:
+    virtual ~Match2Base() {}
+};
+extern i64 GLOB_IN_TRAIT_METHOD;
+extern mys::shared_ptr<mys::mypkg::mod3::Fam> VAR4;
+extern mys::shared_ptr<mys::mypkg::mod1::WeakIn> _WEAK_IN;
+extern i64 _MACRO_VALUE;
+mys::shared_ptr<mys::mypkg::mod1::Kam> func4_kam_default();
+mys::shared_ptr<mys::mypkg::mod1::Foo> func4(i32 a, mys::shared_ptr<mys::mypkg::mod3::Fam> fam, mys::shared_ptr<mys::mypkg::mod1::Kam> kam);
+void foo2(mys::shared_ptr<mys::mypkg::mod1::Base2> a);
+mys::shared_ptr<mys::mypkg::mod1::Match2Base> match_2(i64 v);
+mys::shared_ptr<mys::mypkg::lib::Circ> circ(void);
+mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> implicit_set_import(void);
+i64 genfunc_i64(void);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,27 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod3_HPP
+#define mys_mypkg_mod3_HPP
+#include "mypkg/mod3.mys.early.hpp"
+namespace mys::mypkg::mod3
+{
+class Fie : public mys::Object {
+public:
+    u8 fum(void);
+    Fie(void);
+    virtual ~Fie(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod3::Fie> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod3::Fie> other);
+    i64 __hash__(void);
+};
+class Fam : public mys::Object {
+public:
+    Fam(void);
+    virtual ~Fam(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod3::Fam> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod3::Fam> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,12 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod4_EARLY_HPP
+#define mys_mypkg_mod4_EARLY_HPP
+namespace mys::mypkg::mod4
+{
+class ImplementsTrait;
+}
+#include "mypkg/mod1.mys.early.hpp"
+namespace mys::mypkg::mod4
+{
+}
+#endif
\ No newline at end of file
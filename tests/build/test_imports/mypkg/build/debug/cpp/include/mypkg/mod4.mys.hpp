@@ -0,0 +1,21 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg_mod4_HPP
+#define mys_mypkg_mod4_HPP
+#include "mypkg/mod4.mys.early.hpp"
+#include "mypkg/mod1.mys.hpp"
+namespace mys::mypkg::mod4
+{
+class ImplementsTrait : public mys::mypkg::mod1::Base {
+public:
+    mys::String foo(void);
+    ImplementsTrait(void);
+    virtual ~ImplementsTrait(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg::mod4::ImplementsTrait> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg::mod4::ImplementsTrait> other);
+    i64 __hash__(void);
+    mys::String bar(void);
+    mys::Char fie(void);
+};
+}
+#endif
\ No newline at end of file
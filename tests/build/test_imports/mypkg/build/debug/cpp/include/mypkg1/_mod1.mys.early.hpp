@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1__mod1_EARLY_HPP
+#define mys_mypkg1__mod1_EARLY_HPP
+namespace mys::mypkg1::_mod1
+{
+class Foo;
+}
+namespace mys::mypkg1::_mod1
+{
+}
+#endif
\ No newline at end of file
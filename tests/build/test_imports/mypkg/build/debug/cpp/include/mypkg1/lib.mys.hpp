@@ -0,0 +1,22 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1_lib_HPP
+#define mys_mypkg1_lib_HPP
+#include "mypkg1/lib.mys.early.hpp"
+#include "mypkg1/_mod1.mys.hpp"
+#include "mypkg1/_subpkg2/mod1.mys.hpp"
+#include "mypkg2/lib.mys.hpp"
+#include "mypkg2/mod1.mys.hpp"
+namespace mys::mypkg1::lib
+{
+class Class1 : public mys::Object {
+public:
+    mys::shared_ptr<mys::mypkg1::_subpkg2::mod1::Foo> _x;
+    Class1(void);
+    virtual ~Class1(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::mypkg1::lib::Class1> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::mypkg1::lib::Class1> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,15 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg1_subpkg1_mod1_EARLY_HPP
+#define mys_mypkg1_subpkg1_mod1_EARLY_HPP
+namespace mys::mypkg1::subpkg1::mod1
+{
+class Class1;
+class Class2;
+}
+#include "mypkg1/lib.mys.early.hpp"
+namespace mys::mypkg1::subpkg1::mod1
+{
+i32 func1(i32 first, i32 second);
+i32 func2(i32 first, i32 second);
+}
+#endif
\ No newline at end of file
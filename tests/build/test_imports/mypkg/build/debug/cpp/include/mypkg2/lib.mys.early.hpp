@@ -0,0 +1,16 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg2_lib_EARLY_HPP
+#define mys_mypkg2_lib_EARLY_HPP
+namespace mys::mypkg2::lib
+{
+class Class1;
+class Class2;
+}
+#include "mypkg2/mod1.mys.early.hpp"
+namespace mys::mypkg2::lib
+{
+extern mys::shared_ptr<mys::mypkg2::lib::Class1> VAR1;
+i32 func2(i32 first);
+void fum(mys::shared_ptr<mys::mypkg2::mod1::Foo> a);
+}
+#endif
\ No newline at end of file
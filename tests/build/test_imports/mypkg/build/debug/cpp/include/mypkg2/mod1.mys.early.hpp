@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_mypkg2_mod1_EARLY_HPP
+#define mys_mypkg2_mod1_EARLY_HPP
+namespace mys::mypkg2::mod1
+{
+class Foo;
+}
+namespace mys::mypkg2::mod1
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,1133 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "mypkg/lib.mys.hpp"
+namespace mys::mypkg::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 31, "class Class2(Ko):" },
+    { "__init__", 31, "class Class2(Ko):" },
+    { "__str__", 31, "class Class2(Ko):" },
+    { "__eq__", 31, "class Class2(Ko):" },
+    { "__lt__", 31, "class Class2(Ko):" },
+    { "__hash__", 31, "class Class2(Ko):" },
+    { "__hash__", 31, "class Class2(Ko):" },
+    { "kalle", 64, "return a" },
+    { "bobo", 67, "pass" },
+    { "__init__", 60, "class Foo:" },
+    { "__str__", 60, "class Foo:" },
+    { "__str__", 60, "class Foo:" },
+    { "__eq__", 60, "class Foo:" },
+    { "__lt__", 60, "class Foo:" },
+    { "__hash__", 60, "class Foo:" },
+    { "__hash__", 60, "class Foo:" },
+    { "foo", 87, "return \"1\"" },
+    { "__init__", 84, "class ImplementsTrait1(Base):" },
+    { "__str__", 84, "class ImplementsTrait1(Base):" },
+    { "__eq__", 84, "class ImplementsTrait1(Base):" },
+    { "__lt__", 84, "class ImplementsTrait1(Base):" },
+    { "__hash__", 84, "class ImplementsTrait1(Base):" },
+    { "__hash__", 84, "class ImplementsTrait1(Base):" },
+    { "bar", 36, "return 5" },
+    { "fie", 39, "assert func1(1, 5) == 6" },
+    { "foo", 92, "return \"2\"" },
+    { "bar", 95, "return \"3\"" },
+    { "__init__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "__str__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "__eq__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "__lt__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "__hash__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "__hash__", 89, "class ImplementsTrait2(BaseTrait):" },
+    { "fie", 39, "assert func1(1, 5) == 6" },
+    { "foo", 129, "self.a = b" },
+    { "__init__", 125, "class EnumMember:" },
+    { "__str__", 125, "class EnumMember:" },
+    { "__eq__", 125, "class EnumMember:" },
+    { "__lt__", 125, "class EnumMember:" },
+    { "__hash__", 125, "class EnumMember:" },
+    { "__hash__", 125, "class EnumMember:" },
+    { "__init__", 131, "class MatchBar(MatchBase):" },
+    { "__str__", 131, "class MatchBar(MatchBase):" },
+    { "__eq__", 131, "class MatchBar(MatchBase):" },
+    { "__eq__", 131, "class MatchBar(MatchBase):" },
+    { "__eq__", 131, "class MatchBar(MatchBase):" },
+    { "__lt__", 131, "class MatchBar(MatchBase):" },
+    { "__lt__", 131, "class MatchBar(MatchBase):" },
+    { "__lt__", 131, "class MatchBar(MatchBase):" },
+    { "__hash__", 131, "class MatchBar(MatchBase):" },
+    { "__hash__", 131, "class MatchBar(MatchBase):" },
+    { "__hash__", 131, "class MatchBar(MatchBase):" },
+    { "__init__", 174, "class Circ:" },
+    { "__str__", 174, "class Circ:" },
+    { "__eq__", 174, "class Circ:" },
+    { "__lt__", 174, "class Circ:" },
+    { "__hash__", 174, "class Circ:" },
+    { "__hash__", 174, "class Circ:" },
+    { "func8", 36, "return 5" },
+    { "trait_foo", 98, "return v.foo()" },
+    { "match_foo", 135, "match base:" },
+    { "match_foo", 137, "return foo.x" },
+    { "match_foo", 139, "return 20" },
+    { "match_foo", 141, "return -1" },
+    { "all", 39, "assert func1(1, 5) == 6" },
+    { "all", 41, "class_1 = Class1(10)" },
+    { "all", 42, "assert class_1.value == 10" },
+    { "all", 44, "assert func2(99) == 99" },
+    { "all", 45, "assert VAR1.value == 5" },
+    { "all", 46, "assert VAR2.value == 5" },
+    { "all", 47, "assert VAR3 == 1" },
+    { "all", 48, "VAR3 += 1" },
+    { "all", 49, "assert VAR3 == 2" },
+    { "all", 50, "VAR3 = 0" },
+    { "all", 51, "assert VAR3 == 0" },
+    { "all", 52, "my_pkg_class_1 = MyPkgClass1(3)" },
+    { "all", 53, "assert my_pkg_class_1.value == 3" },
+    { "all", 54, "assert VAR4 is None" },
+    { "all", 55, "VAR4 = Fam()" },
+    { "all", 56, "assert VAR4 is not None" },
+    { "no_import_needed_of_returned_class_nor_default_paramter_class", 73, "assert my_func4(5, Fam()).a == 5" },
+    { "no_import_needed_of_returned_class_nor_default_paramter_class", 74, "assert Bar().fie(None).fum() == 10" },
+    { "local_foo_not_returned_foo", 77, "v = Foo(\"hi\")" },
+    { "local_foo_not_returned_foo", 78, "assert v.apa == \"hi\"" },
+    { "enum_", 81, "v = Enum1.A" },
+    { "enum_", 82, "assert v == Enum1(0)" },
+    { "imported_trait", 101, "assert ImplementsTrait1().foo() == \"1\"" },
+    { "imported_trait", 102, "assert ImplementsTrait2().foo() == \"2\"" },
+    { "imported_trait", 104, "assert ImplementsTrait1().bar() == \"base\"" },
+    { "imported_trait", 105, "assert ImplementsTrait2().bar() == \"3\"" },
+    { "imported_trait", 107, "assert trait_foo(ImplementsTrait1()) == \"1\"" },
+    { "imported_trait", 108, "assert trait_foo(ImplementsTrait2()) == \"2\"" },
+    { "no_import_needed_of_paramter_trait_type", 114, "foo2(Foo2())" },
+    { "genfunc_as_genfunc2", 117, "assert genfunc2[i64]() == 5" },
+    { "genclass_as_mygenclass", 120, "assert MyGenClass[i64](5).a == 5" },
+    { "genclass2", 123, "assert GenClass2[i64](5).b == 5" },
+    { "match_imported_trait", 144, "assert match_foo(MatchFoo(5)) == 5" },
+    { "match_imported_trait", 145, "assert match_foo(MatchBar(10)) == 20" },
+    { "match_imported_trait_2", 148, "res = -1" },
+    { "match_imported_trait_2", 150, "match match_2(5):" },
+    { "match_imported_trait_2", 152, "res = foo.y" },
+    { "match_imported_trait_2", 154, "res = -1" },
+    { "match_imported_trait_2", 156, "assert res == 10" },
+    { "member_class", 159, "assert MemberClass().a.b == \"hi\"" },
+    { "member_class", 160, "assert MemberClass().b[1].x == \"ho\"" },
+    { "member_class", 161, "assert MemberClass().c[0][5].y == \"ha\"" },
+    { "member_class", 162, "assert MemberClass().d.a.b == \"hu\"" },
+    { "my_error", 165, "try:" },
+    { "my_error", 166, "raised = False" },
+    { "my_error", 168, "raise MyError()" },
+    { "my_error", 170, "raised = True" },
+    { "my_error", 172, "assert raised" },
+    { "weak", 178, "weak = Weak()" },
+    { "weak", 179, "weak.x.z()" },
+    { "implicit_import", 182, "assert implicit_set_import() == {}" },
+    { "macro_import", 185, "assert MACRO() == 5" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Class2(");
+static const mys::String __constant_2 = mys::String("x=");
+static const mys::String __constant_3 = mys::String(", y=");
+static const mys::String __constant_4 = mys::String(")");
+static const mys::String __constant_10 = mys::String("\"");
+static const mys::String __constant_11 = mys::String("\"");
+static const mys::String __constant_12 = mys::String("Foo(");
+static const mys::String __constant_13 = mys::String("apa=");
+static const mys::String __constant_14 = mys::String(")");
+static const mys::String __constant_19 = mys::String("1");
+static const mys::String __constant_21 = mys::String("ImplementsTrait1(");
+static const mys::String __constant_22 = mys::String(")");
+static const mys::String __constant_27 = mys::String("base");
+static const mys::String __constant_30 = mys::String("2");
+static const mys::String __constant_32 = mys::String("3");
+static const mys::String __constant_34 = mys::String("ImplementsTrait2(");
+static const mys::String __constant_35 = mys::String(")");
+static const mys::String __constant_41 = mys::String("EnumMember(");
+static const mys::String __constant_42 = mys::String("a=");
+static const mys::String __constant_43 = mys::String(")");
+static const mys::String __constant_48 = mys::String("MatchBar(");
+static const mys::String __constant_49 = mys::String("y=");
+static const mys::String __constant_50 = mys::String(")");
+static const mys::String __constant_57 = mys::String("Circ(");
+static const mys::String __constant_58 = mys::String(")");
+static const mys::String __constant_98 = mys::String("hi");
+static const mys::String __constant_99 = mys::String("hi");
+static const mys::String __constant_104 = mys::String("1");
+static const mys::String __constant_107 = mys::String("2");
+static const mys::String __constant_110 = mys::String("base");
+static const mys::String __constant_113 = mys::String("3");
+static const mys::String __constant_116 = mys::String("1");
+static const mys::String __constant_119 = mys::String("2");
+static const mys::String __constant_137 = mys::String("hi");
+static const mys::String __constant_140 = mys::String("ho");
+static const mys::String __constant_143 = mys::String("ha");
+static const mys::String __constant_146 = mys::String("hu");
+static const mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> __constant_152 = mys::make_shared<Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>>(std::initializer_list<mys::shared_ptr<mys::mypkg::mod1::Imp1>>{});
+Class2::Class2(mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> x, mys::shared_ptr<mys::List<mys::shared_ptr<mys::mypkg2::lib::Class1>>> y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->x = x;
+    __MYS_TRACEBACK_SET(1);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+Class2::~Class2(void)
+{
+}
+mys::String Class2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_5 = (__constant_1 + __constant_2 + object_str(this->x) + __constant_3 + object_str(this->y) + __constant_4);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class2::__eq__(mys::shared_ptr<mys::mypkg::lib::Class2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Class2::__lt__(mys::shared_ptr<mys::mypkg::lib::Class2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    mys::Bool __res_7 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_7;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Class2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(5);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(6);
+    i64 __res_8 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::mypkg::lib::Foo> Foo::kalle(mys::shared_ptr<mys::mypkg::lib::Foo> a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::shared_ptr<mys::mypkg::lib::Foo> __res_9 = a;
+    __MYS_TRACEBACK_EXIT();
+    return __res_9;
+    __MYS_TRACEBACK_EXIT();
+}
+void Foo::bobo(mys::Bool a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::Foo(mys::String apa)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    this->apa = apa;
+    __MYS_TRACEBACK_EXIT();
+}
+Foo::~Foo(void)
+{
+}
+mys::String Foo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    mys::String apa = (__constant_10 + string_str(this->apa) + __constant_11);
+    __MYS_TRACEBACK_SET(11);
+    mys::String __res_15 = (__constant_12 + __constant_13 + string_str(apa) + __constant_14);
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__eq__(mys::shared_ptr<mys::mypkg::lib::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(12);
+    mys::Bool __res_16 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_16;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Foo::__lt__(mys::shared_ptr<mys::mypkg::lib::Foo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    mys::Bool __res_17 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_17;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Foo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(14);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(15);
+    i64 __res_18 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_18;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String ImplementsTrait1::foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(16);
+    mys::String __res_20 = __constant_19;
+    __MYS_TRACEBACK_EXIT();
+    return __res_20;
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait1::ImplementsTrait1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait1::~ImplementsTrait1(void)
+{
+}
+mys::String ImplementsTrait1::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(18);
+    mys::String __res_23 = (__constant_21 + __constant_22);
+    __MYS_TRACEBACK_EXIT();
+    return __res_23;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait1::__eq__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(19);
+    mys::Bool __res_24 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_24;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait1::__lt__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait1> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(20);
+    mys::Bool __res_25 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_25;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 ImplementsTrait1::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(21);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(22);
+    i64 __res_26 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_26;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String ImplementsTrait1::bar(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(23);
+    mys::String __res_28 = __constant_27;
+    __MYS_TRACEBACK_EXIT();
+    return __res_28;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Char ImplementsTrait1::fie(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(24);
+    mys::Char __res_29 = Char(97);
+    __MYS_TRACEBACK_EXIT();
+    return __res_29;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String ImplementsTrait2::foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(25);
+    mys::String __res_31 = __constant_30;
+    __MYS_TRACEBACK_EXIT();
+    return __res_31;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String ImplementsTrait2::bar(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(26);
+    mys::String __res_33 = __constant_32;
+    __MYS_TRACEBACK_EXIT();
+    return __res_33;
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait2::ImplementsTrait2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(27);
+
+    __MYS_TRACEBACK_EXIT();
+}
+ImplementsTrait2::~ImplementsTrait2(void)
+{
+}
+mys::String ImplementsTrait2::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(28);
+    mys::String __res_36 = (__constant_34 + __constant_35);
+    __MYS_TRACEBACK_EXIT();
+    return __res_36;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait2::__eq__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(29);
+    mys::Bool __res_37 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_37;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool ImplementsTrait2::__lt__(mys::shared_ptr<mys::mypkg::lib::ImplementsTrait2> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(30);
+    mys::Bool __res_38 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_38;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 ImplementsTrait2::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(31);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(32);
+    i64 __res_39 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_39;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Char ImplementsTrait2::fie(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(33);
+    mys::Char __res_40 = Char(97);
+    __MYS_TRACEBACK_EXIT();
+    return __res_40;
+    __MYS_TRACEBACK_EXIT();
+}
+void EnumMember::foo(i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(34);
+    this->a = b;
+    __MYS_TRACEBACK_EXIT();
+}
+EnumMember::EnumMember(i64 a)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(35);
+    this->a = a;
+    __MYS_TRACEBACK_EXIT();
+}
+EnumMember::~EnumMember(void)
+{
+}
+mys::String EnumMember::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(36);
+    mys::String __res_44 = (__constant_41 + __constant_42 + mys::String(this->a) + __constant_43);
+    __MYS_TRACEBACK_EXIT();
+    return __res_44;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EnumMember::__eq__(mys::shared_ptr<mys::mypkg::lib::EnumMember> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(37);
+    mys::Bool __res_45 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_45;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EnumMember::__lt__(mys::shared_ptr<mys::mypkg::lib::EnumMember> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(38);
+    mys::Bool __res_46 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_46;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 EnumMember::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(39);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(40);
+    i64 __res_47 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_47;
+    __MYS_TRACEBACK_EXIT();
+}
+MatchBar::MatchBar(i64 y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(41);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+MatchBar::~MatchBar(void)
+{
+}
+mys::String MatchBar::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(42);
+    mys::String __res_51 = (__constant_48 + __constant_49 + mys::String(this->y, 'd') + __constant_50);
+    __MYS_TRACEBACK_EXIT();
+    return __res_51;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MatchBar::__eq__(mys::shared_ptr<mys::mypkg::lib::MatchBar> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(43);
+    if (!(mys::Bool(this->y == other->y))) {
+        __MYS_TRACEBACK_SET(44);
+        mys::Bool __res_52 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_52;
+    }
+    __MYS_TRACEBACK_SET(45);
+    mys::Bool __res_53 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_53;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MatchBar::__lt__(mys::shared_ptr<mys::mypkg::lib::MatchBar> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(46);
+    if (mys::Bool(this->y != other->y)) {
+        __MYS_TRACEBACK_SET(47);
+        mys::Bool __res_54 = mys::Bool(this->y < other->y);
+        __MYS_TRACEBACK_EXIT();
+        return __res_54;
+    }
+    __MYS_TRACEBACK_SET(48);
+    mys::Bool __res_55 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_55;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MatchBar::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(49);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(50);
+    hash += std::hash<i64>{}(this->y);
+    __MYS_TRACEBACK_SET(51);
+    i64 __res_56 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_56;
+    __MYS_TRACEBACK_EXIT();
+}
+Circ::Circ(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(52);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Circ::~Circ(void)
+{
+}
+mys::String Circ::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(53);
+    mys::String __res_59 = (__constant_57 + __constant_58);
+    __MYS_TRACEBACK_EXIT();
+    return __res_59;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Circ::__eq__(mys::shared_ptr<mys::mypkg::lib::Circ> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(54);
+    mys::Bool __res_60 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_60;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Circ::__lt__(mys::shared_ptr<mys::mypkg::lib::Circ> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(55);
+    mys::Bool __res_61 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_61;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Circ::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(56);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(57);
+    i64 __res_62 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_62;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 func8(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(58);
+    i64 __res_63 = 5;
+    __MYS_TRACEBACK_EXIT();
+    return __res_63;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String trait_foo(mys::shared_ptr<mys::mypkg::mod1::Base> v)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(59);
+    mys::String __res_64 = v->foo();
+    __MYS_TRACEBACK_EXIT();
+    return __res_64;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 match_foo(mys::shared_ptr<mys::mypkg::mod1::MatchBase> base)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(60);
+    const auto& __subject_65 = base;
+    mys::shared_ptr<mys::mypkg::mod1::MatchFoo> __casted_66;
+    if ((__casted_66 = mys::dynamic_pointer_cast<mys::mypkg::mod1::MatchFoo>(__subject_65))) {
+        auto foo = std::move(__casted_66);
+        __MYS_TRACEBACK_SET(61);
+        i64 __res_67 = foo->x;
+        __MYS_TRACEBACK_EXIT();
+        return __res_67;
+    } else {
+        mys::shared_ptr<mys::mypkg::lib::MatchBar> __casted_68;
+        if ((__casted_68 = mys::dynamic_pointer_cast<mys::mypkg::lib::MatchBar>(__subject_65))) {
+            __MYS_TRACEBACK_SET(62);
+            i64 __res_69 = 20;
+            __MYS_TRACEBACK_EXIT();
+            return __res_69;
+        } else {
+                __MYS_TRACEBACK_SET(63);
+                i64 __res_71 = -1;
+                __MYS_TRACEBACK_EXIT();
+                return __res_71;
+        }
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_all(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(64);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_72 = mys::mypkg1::subpkg1::mod1::func1(1, 5);
+    const i32 __var_73 = 6;
+    if (!((__var_72 == __var_73))) {
+        std::cout << "./src/lib.mys:39: assert " << PrintString(mys::String(__var_72) + " == " + mys::String(__var_73)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_72) + " == " + mys::String(__var_73) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(65);
+    mys::shared_ptr<mys::mypkg1::subpkg1::mod1::Class1> class_1 = mys::make_shared<mys::mypkg1::subpkg1::mod1::Class1>(10);
+    __MYS_TRACEBACK_SET(66);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_74 = class_1->value;
+    const i32 __var_75 = 10;
+    if (!((__var_74 == __var_75))) {
+        std::cout << "./src/lib.mys:42: assert " << PrintString(mys::String(__var_74) + " == " + mys::String(__var_75)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_74) + " == " + mys::String(__var_75) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(67);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_76 = mys::mypkg2::lib::func2(99);
+    const i32 __var_77 = 99;
+    if (!((__var_76 == __var_77))) {
+        std::cout << "./src/lib.mys:44: assert " << PrintString(mys::String(__var_76) + " == " + mys::String(__var_77)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_76) + " == " + mys::String(__var_77) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(68);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_78 = mys::mypkg2::lib::VAR1->value;
+    const i32 __var_79 = 5;
+    if (!((__var_78 == __var_79))) {
+        std::cout << "./src/lib.mys:45: assert " << PrintString(mys::String(__var_78) + " == " + mys::String(__var_79)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_78) + " == " + mys::String(__var_79) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(69);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_80 = mys::mypkg2::lib::VAR1->value;
+    const i32 __var_81 = 5;
+    if (!((__var_80 == __var_81))) {
+        std::cout << "./src/lib.mys:46: assert " << PrintString(mys::String(__var_80) + " == " + mys::String(__var_81)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_80) + " == " + mys::String(__var_81) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(70);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_82 = mys::mypkg1::lib::VAR3;
+    const i32 __var_83 = 1;
+    if (!((__var_82 == __var_83))) {
+        std::cout << "./src/lib.mys:47: assert " << PrintString(mys::String(__var_82) + " == " + mys::String(__var_83)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_82) + " == " + mys::String(__var_83) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(71);
+    mys::mypkg1::lib::VAR3 += 1;
+    __MYS_TRACEBACK_SET(72);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_84 = mys::mypkg1::lib::VAR3;
+    const i32 __var_85 = 2;
+    if (!((__var_84 == __var_85))) {
+        std::cout << "./src/lib.mys:49: assert " << PrintString(mys::String(__var_84) + " == " + mys::String(__var_85)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_84) + " == " + mys::String(__var_85) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(73);
+    mys::mypkg1::lib::VAR3 = 0;
+    __MYS_TRACEBACK_SET(74);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_86 = mys::mypkg1::lib::VAR3;
+    const i32 __var_87 = 0;
+    if (!((__var_86 == __var_87))) {
+        std::cout << "./src/lib.mys:51: assert " << PrintString(mys::String(__var_86) + " == " + mys::String(__var_87)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_86) + " == " + mys::String(__var_87) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(75);
+    mys::shared_ptr<mys::mypkg2::lib::Class1> my_pkg_class_1 = mys::make_shared<mys::mypkg2::lib::Class1>(3);
+    __MYS_TRACEBACK_SET(76);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_88 = my_pkg_class_1->value;
+    const i32 __var_89 = 3;
+    if (!((__var_88 == __var_89))) {
+        std::cout << "./src/lib.mys:53: assert " << PrintString(mys::String(__var_88) + " == " + mys::String(__var_89)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_88) + " == " + mys::String(__var_89) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(77);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::mypkg::mod3::Fam> __var_90 = mys::mypkg::mod1::VAR4;
+    const mys::shared_ptr<mys::mypkg::mod3::Fam> __var_91 = nullptr;
+    if (!(is(__var_90, __var_91))) {
+        std::cout << "./src/lib.mys:54: assert " << PrintString(object_str(__var_90) + " is " + object_str(__var_91)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_90) + " is " + object_str(__var_91) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(78);
+    mys::mypkg::mod1::VAR4 = mys::make_shared<mys::mypkg::mod3::Fam>();
+    __MYS_TRACEBACK_SET(79);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::mypkg::mod3::Fam> __var_92 = mys::mypkg::mod1::VAR4;
+    const mys::shared_ptr<mys::mypkg::mod3::Fam> __var_93 = nullptr;
+    if (!(!is(__var_92, __var_93))) {
+        std::cout << "./src/lib.mys:56: assert " << PrintString(object_str(__var_92) + " is not " + object_str(__var_93)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_92) + " is not " + object_str(__var_93) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_all("lib::all", mys_test_all);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_no_import_needed_of_returned_class_nor_default_paramter_class(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(80);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_94 = mys::mypkg::mod1::func4(5, mys::make_shared<mys::mypkg::mod3::Fam>(), mys::mypkg::mod1::func4_kam_default())->a;
+    const i32 __var_95 = 5;
+    if (!((__var_94 == __var_95))) {
+        std::cout << "./src/lib.mys:73: assert " << PrintString(mys::String(__var_94) + " == " + mys::String(__var_95)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_94) + " == " + mys::String(__var_95) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(81);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const u8 __var_96 = mys::make_shared<mys::mypkg::mod1::Bar>()->fie(nullptr, mys::mypkg::mod1::Bar_fie_h_default())->fum();
+    const u8 __var_97 = 10;
+    if (!((__var_96 == __var_97))) {
+        std::cout << "./src/lib.mys:74: assert " << PrintString(mys::String(__var_96) + " == " + mys::String(__var_97)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_96) + " == " + mys::String(__var_97) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_no_import_needed_of_returned_class_nor_default_paramter_class("lib::no_import_needed_of_returned_class_nor_default_paramter_class", mys_test_no_import_needed_of_returned_class_nor_default_paramter_class);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_local_foo_not_returned_foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(82);
+    mys::shared_ptr<mys::mypkg::lib::Foo> v = mys::make_shared<mys::mypkg::lib::Foo>(__constant_98);
+    __MYS_TRACEBACK_SET(83);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_100 = v->apa;
+    const mys::String __var_101 = __constant_99;
+    if (!((__var_100 == __var_101))) {
+        std::cout << "./src/lib.mys:78: assert " << PrintString(string_with_quotes(__var_100) + " == " + string_with_quotes(__var_101)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_100) + " == " + string_with_quotes(__var_101) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_local_foo_not_returned_foo("lib::local_foo_not_returned_foo", mys_test_local_foo_not_returned_foo);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_enum_(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(84);
+    i64 v = (i64)mys::mypkg::mod1::Enum1::A;
+    __MYS_TRACEBACK_SET(85);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_102 = v;
+    const i64 __var_103 = mys::mypkg::mod1::Enum1_from_value(0);
+    if (!((__var_102 == __var_103))) {
+        std::cout << "./src/lib.mys:82: assert " << PrintString(mys::String(__var_102) + " == " + mys::String(__var_103)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_102) + " == " + mys::String(__var_103) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_enum_("lib::enum_", mys_test_enum_);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_imported_trait(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(86);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_105 = mys::make_shared<mys::mypkg::lib::ImplementsTrait1>()->foo();
+    const mys::String __var_106 = __constant_104;
+    if (!((__var_105 == __var_106))) {
+        std::cout << "./src/lib.mys:101: assert " << PrintString(string_with_quotes(__var_105) + " == " + string_with_quotes(__var_106)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_105) + " == " + string_with_quotes(__var_106) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(87);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_108 = mys::make_shared<mys::mypkg::lib::ImplementsTrait2>()->foo();
+    const mys::String __var_109 = __constant_107;
+    if (!((__var_108 == __var_109))) {
+        std::cout << "./src/lib.mys:102: assert " << PrintString(string_with_quotes(__var_108) + " == " + string_with_quotes(__var_109)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_108) + " == " + string_with_quotes(__var_109) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(88);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_111 = mys::make_shared<mys::mypkg::lib::ImplementsTrait1>()->bar();
+    const mys::String __var_112 = __constant_110;
+    if (!((__var_111 == __var_112))) {
+        std::cout << "./src/lib.mys:104: assert " << PrintString(string_with_quotes(__var_111) + " == " + string_with_quotes(__var_112)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_111) + " == " + string_with_quotes(__var_112) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(89);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_114 = mys::make_shared<mys::mypkg::lib::ImplementsTrait2>()->bar();
+    const mys::String __var_115 = __constant_113;
+    if (!((__var_114 == __var_115))) {
+        std::cout << "./src/lib.mys:105: assert " << PrintString(string_with_quotes(__var_114) + " == " + string_with_quotes(__var_115)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_114) + " == " + string_with_quotes(__var_115) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(90);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_117 = mys::mypkg::lib::trait_foo(mys::make_shared<mys::mypkg::lib::ImplementsTrait1>());
+    const mys::String __var_118 = __constant_116;
+    if (!((__var_117 == __var_118))) {
+        std::cout << "./src/lib.mys:107: assert " << PrintString(string_with_quotes(__var_117) + " == " + string_with_quotes(__var_118)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_117) + " == " + string_with_quotes(__var_118) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(91);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_120 = mys::mypkg::lib::trait_foo(mys::make_shared<mys::mypkg::lib::ImplementsTrait2>());
+    const mys::String __var_121 = __constant_119;
+    if (!((__var_120 == __var_121))) {
+        std::cout << "./src/lib.mys:108: assert " << PrintString(string_with_quotes(__var_120) + " == " + string_with_quotes(__var_121)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_120) + " == " + string_with_quotes(__var_121) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_imported_trait("lib::imported_trait", mys_test_imported_trait);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_no_import_needed_of_paramter_trait_type(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(92);
+    mys::mypkg::mod1::foo2(mys::make_shared<mys::mypkg::mod1::Foo2>());
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_no_import_needed_of_paramter_trait_type("lib::no_import_needed_of_paramter_trait_type", mys_test_no_import_needed_of_paramter_trait_type);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_genfunc_as_genfunc2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(93);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_122 = mys::mypkg::mod1::genfunc_i64();
+    const i64 __var_123 = 5;
+    if (!((__var_122 == __var_123))) {
+        std::cout << "./src/lib.mys:117: assert " << PrintString(mys::String(__var_122) + " == " + mys::String(__var_123)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_122) + " == " + mys::String(__var_123) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_genfunc_as_genfunc2("lib::genfunc_as_genfunc2", mys_test_genfunc_as_genfunc2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_genclass_as_mygenclass(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(94);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_124 = mys::make_shared<mys::mypkg::mod1::GenClass_i64>(5)->a;
+    const i64 __var_125 = 5;
+    if (!((__var_124 == __var_125))) {
+        std::cout << "./src/lib.mys:120: assert " << PrintString(mys::String(__var_124) + " == " + mys::String(__var_125)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_124) + " == " + mys::String(__var_125) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_genclass_as_mygenclass("lib::genclass_as_mygenclass", mys_test_genclass_as_mygenclass);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_genclass2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(95);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_126 = mys::make_shared<mys::mypkg::mod1::GenClass2_i64>(5)->b;
+    const i64 __var_127 = 5;
+    if (!((__var_126 == __var_127))) {
+        std::cout << "./src/lib.mys:123: assert " << PrintString(mys::String(__var_126) + " == " + mys::String(__var_127)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_126) + " == " + mys::String(__var_127) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_genclass2("lib::genclass2", mys_test_genclass2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_match_imported_trait(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(96);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_128 = mys::mypkg::lib::match_foo(mys::make_shared<mys::mypkg::mod1::MatchFoo>(5));
+    const i64 __var_129 = 5;
+    if (!((__var_128 == __var_129))) {
+        std::cout << "./src/lib.mys:144: assert " << PrintString(mys::String(__var_128) + " == " + mys::String(__var_129)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_128) + " == " + mys::String(__var_129) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(97);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_130 = mys::mypkg::lib::match_foo(mys::make_shared<mys::mypkg::lib::MatchBar>(10));
+    const i64 __var_131 = 20;
+    if (!((__var_130 == __var_131))) {
+        std::cout << "./src/lib.mys:145: assert " << PrintString(mys::String(__var_130) + " == " + mys::String(__var_131)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_130) + " == " + mys::String(__var_131) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_match_imported_trait("lib::match_imported_trait", mys_test_match_imported_trait);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_match_imported_trait_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(98);
+    i64 res = -1;
+    __MYS_TRACEBACK_SET(99);
+    const auto& __subject_132 = mys::mypkg::mod1::match_2(5);
+    mys::shared_ptr<mys::mypkg::mod1::Match2Foo> __casted_133;
+    if ((__casted_133 = mys::dynamic_pointer_cast<mys::mypkg::mod1::Match2Foo>(__subject_132))) {
+        auto foo = std::move(__casted_133);
+        __MYS_TRACEBACK_SET(100);
+        res = foo->y;
+    } else {
+            __MYS_TRACEBACK_SET(101);
+            res = -1;
+    }
+    __MYS_TRACEBACK_SET(102);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_135 = res;
+    const i64 __var_136 = 10;
+    if (!((__var_135 == __var_136))) {
+        std::cout << "./src/lib.mys:156: assert " << PrintString(mys::String(__var_135) + " == " + mys::String(__var_136)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_135) + " == " + mys::String(__var_136) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_match_imported_trait_2("lib::match_imported_trait_2", mys_test_match_imported_trait_2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_member_class(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(103);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_138 = mys::make_shared<mys::mypkg::mod1::MemberClass>()->a->b;
+    const mys::String __var_139 = __constant_137;
+    if (!((__var_138 == __var_139))) {
+        std::cout << "./src/lib.mys:159: assert " << PrintString(string_with_quotes(__var_138) + " == " + string_with_quotes(__var_139)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_138) + " == " + string_with_quotes(__var_139) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(104);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_141 = std::get<1>(mys::make_shared<mys::mypkg::mod1::MemberClass>()->b->m_tuple)->x;
+    const mys::String __var_142 = __constant_140;
+    if (!((__var_141 == __var_142))) {
+        std::cout << "./src/lib.mys:160: assert " << PrintString(string_with_quotes(__var_141) + " == " + string_with_quotes(__var_142)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_141) + " == " + string_with_quotes(__var_142) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(105);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_144 = (mys::make_shared<mys::mypkg::mod1::MemberClass>()->c->get(0))->get(5)->y;
+    const mys::String __var_145 = __constant_143;
+    if (!((__var_144 == __var_145))) {
+        std::cout << "./src/lib.mys:161: assert " << PrintString(string_with_quotes(__var_144) + " == " + string_with_quotes(__var_145)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_144) + " == " + string_with_quotes(__var_145) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(106);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_147 = mys::make_shared<mys::mypkg::mod1::MemberClass>()->d->a->b;
+    const mys::String __var_148 = __constant_146;
+    if (!((__var_147 == __var_148))) {
+        std::cout << "./src/lib.mys:162: assert " << PrintString(string_with_quotes(__var_147) + " == " + string_with_quotes(__var_148)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_147) + " == " + string_with_quotes(__var_148) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_member_class("lib::member_class", mys_test_member_class);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_my_error(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(107);
+    mys::Bool __raised_151;
+    try {
+        __MYS_TRACEBACK_SET(108);
+        mys::Bool raised = mys::Bool(false);
+        __MYS_TRACEBACK_SET(109);
+        mys::make_shared<mys::mypkg::mod1::MyError>()->__throw();
+    } catch (mypkg::mod1::__MyError __e_150) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(110);
+        mys::Bool raised = mys::Bool(true);
+        __raised_151 = raised;
+    }
+    auto raised = __raised_151;
+    __MYS_TRACEBACK_SET(111);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    if (!(raised)) {
+        std::cout << "./src/lib.mys:172: assert " << PrintString(mys::String("condition")) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String("condition") + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_my_error("lib::my_error", mys_test_my_error);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_weak(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(112);
+    mys::shared_ptr<mys::mypkg::mod1::Weak> weak = mys::make_shared<mys::mypkg::mod1::Weak>();
+    __MYS_TRACEBACK_SET(113);
+    weak->x.lock()->z();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_weak("lib::weak", mys_test_weak);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_implicit_import(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(114);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> __var_153 = mys::mypkg::mod1::implicit_set_import();
+    const mys::shared_ptr<mys::Set<mys::shared_ptr<mys::mypkg::mod1::Imp1>>> __var_154 = __constant_152;
+    if (!((__var_153 == __var_154))) {
+        std::cout << "./src/lib.mys:182: assert " << PrintString(object_str(__var_153) + " == " + object_str(__var_154)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_153) + " == " + object_str(__var_154) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_implicit_import("lib::implicit_import", mys_test_implicit_import);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_macro_import(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(115);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_155 = [&]() { mys__mypkg__mod1__MACRO() }();
+    const i64 __var_156 = 5;
+    if (!((__var_155 == __var_156))) {
+        std::cout << "./src/lib.mys:185: assert " << PrintString(mys::String(__var_155) + " == " + mys::String(__var_156)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_155) + " == " + mys::String(__var_156) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_macro_import("lib::macro_import", mys_test_macro_import);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
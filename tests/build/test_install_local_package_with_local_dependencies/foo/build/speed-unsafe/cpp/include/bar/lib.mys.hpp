@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_bar_lib_HPP
+#define mys_bar_lib_HPP
+#include "bar/lib.mys.early.hpp"
+namespace mys::bar::lib
+{
+}
+#endif
\ No newline at end of file
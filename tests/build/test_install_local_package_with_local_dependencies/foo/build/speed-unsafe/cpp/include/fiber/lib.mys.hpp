@@ -0,0 +1,159 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_fiber_lib_HPP
+#define mys_fiber_lib_HPP
+#include "fiber/lib.mys.early.hpp"
+namespace mys::fiber::lib
+{
+class CancelledError : public Error {
+public:
+    CancelledError(void);
+    virtual ~CancelledError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::CancelledError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::CancelledError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __CancelledError final : public __Error {
+public:
+    __CancelledError(const mys::shared_ptr<CancelledError>& error) : __Error(error)
+    {
+    }
+};
+class QueueError : public Error {
+public:
+    mys::String message;
+    QueueError(mys::String message);
+    virtual ~QueueError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::QueueError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::QueueError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __QueueError final : public __Error {
+public:
+    __QueueError(const mys::shared_ptr<QueueError>& error) : __Error(error)
+    {
+    }
+};
+class Lock : public mys::Object {
+public:
+    mys::Bool _is_acquired;
+    mys::shared_ptr<mys::List<mys::shared_ptr<Fiber>>> _waiters;
+    Lock(void);
+    void acquire(void);
+    void release(void);
+    virtual ~Lock(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::Lock> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::Lock> other);
+    i64 __hash__(void);
+};
+class EventError : public Error {
+public:
+    mys::String message;
+    EventError(mys::String message);
+    virtual ~EventError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::EventError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::EventError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __EventError final : public __Error {
+public:
+    __EventError(const mys::shared_ptr<EventError>& error) : __Error(error)
+    {
+    }
+};
+class Event : public mys::Object {
+public:
+    mys::Bool _is_set;
+    mys::shared_ptr<Fiber> _waiter;
+    void set(void);
+    void clear(void);
+    void wait(void);
+    Event(void);
+    virtual ~Event(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::Event> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::Event> other);
+    i64 __hash__(void);
+};
+mys::optional<f64> Timer_Timer_interval_default();
+class Timer : public mys::Object {
+public:
+    mys::shared_ptr<mys::fiber::lib::TimerHandler> _handler;
+    u64 _initial;
+    u64 _interval;
+    /* c-string start */
+    uv_timer_t m_handle;
+    /* c-string stop */
+    Timer(mys::shared_ptr<mys::fiber::lib::TimerHandler> handler, f64 initial, mys::optional<f64> interval);
+    virtual ~Timer(void);
+    void start(void);
+    void stop(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::Timer> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::Timer> other);
+    i64 __hash__(void);
+};
+class _TimerHandler : public mys::fiber::lib::TimerHandler {
+public:
+    mys::shared_ptr<mys::fiber::lib::MessageQueue> queue;
+    mys::shared_ptr<mys::fiber::lib::Message> message;
+    void on_timeout(void);
+    _TimerHandler(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message);
+    virtual ~_TimerHandler(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other);
+    i64 __hash__(void);
+};
+mys::optional<f64> MessageTimer_MessageTimer_interval_default();
+class MessageTimer : public mys::Object {
+public:
+    mys::shared_ptr<mys::fiber::lib::Timer> _timer;
+    MessageTimer(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message, f64 initial, mys::optional<f64> interval);
+    void start(void);
+    void stop(void);
+    virtual ~MessageTimer(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other);
+    i64 __hash__(void);
+};
+class MessageQueue : public mys::Object {
+public:
+    mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::Message>>> _values;
+    mys::shared_ptr<Fiber> _reader;
+    mys::Bool _is_closed;
+    MessageQueue(void);
+    void open(void);
+    void close(void);
+    i64 length(void);
+    void put(mys::shared_ptr<mys::fiber::lib::Message> value);
+    mys::shared_ptr<mys::fiber::lib::Message> get(void);
+    virtual ~MessageQueue(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other);
+    i64 __hash__(void);
+};
+class Bus : public mys::Object {
+public:
+    mys::shared_ptr<mys::Dict<i64, mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>>> _subscribers;
+    mys::shared_ptr<mys::fiber::lib::Lock> _lock;
+    Bus(void);
+    void broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message);
+    void subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue);
+    void unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue);
+    virtual ~Bus(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::fiber::lib::Bus> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::fiber::lib::Bus> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,30 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "bar/lib.mys.hpp"
+namespace mys::bar::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "hello", 2, "print(\"hello\")" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "../bar/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("hello");
+void hello(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ../bar/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,17 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_foo_EARLY_HPP
+#define mys_foo_foo_EARLY_HPP
+namespace mys::foo::foo
+{
+class Foo;
+}
+namespace mys::foo::foo
+{
+enum class A : i64 {
+    B = 1,
+};
+i64 A_from_value(i64 value);
+extern i64 V;
+void foo(void);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,17 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_foo_foo_HPP
+#define mys_foo_foo_HPP
+#include "foo/foo.mys.early.hpp"
+namespace mys::foo::foo
+{
+class Foo : public mys::Object {
+public:
+    Foo(void);
+    virtual ~Foo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::foo::foo::Foo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::foo::foo::Foo> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
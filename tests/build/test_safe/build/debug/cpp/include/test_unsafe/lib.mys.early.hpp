@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_unsafe_lib_EARLY_HPP
+#define mys_test_unsafe_lib_EARLY_HPP
+namespace mys::test_unsafe::lib
+{
+class AccessFoo;
+}
+namespace mys::test_unsafe::lib
+{
+}
+#endif
\ No newline at end of file
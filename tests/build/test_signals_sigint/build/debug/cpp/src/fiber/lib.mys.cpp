@@ -0,0 +1,1133 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "fiber/lib.mys.hpp"
+/* c-string-source-before-namespace start */
+static void timer_sleep_complete(uv_timer_t *handle_p)
+{
+    mys::fiber::lib::Timer *timer_p = (mys::fiber::lib::Timer *)handle_p->data;
+    timer_p->_handler->on_timeout();
+}
+/* c-string-source-before-namespace stop */
+namespace mys::fiber::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 9, "class CancelledError(Error):" },
+    { "__str__", 9, "class CancelledError(Error):" },
+    { "__eq__", 9, "class CancelledError(Error):" },
+    { "__lt__", 9, "class CancelledError(Error):" },
+    { "__hash__", 9, "class CancelledError(Error):" },
+    { "__hash__", 9, "class CancelledError(Error):" },
+    { "__init__", 92, "class QueueError(Error):" },
+    { "__str__", 92, "class QueueError(Error):" },
+    { "__str__", 92, "class QueueError(Error):" },
+    { "__eq__", 92, "class QueueError(Error):" },
+    { "__lt__", 92, "class QueueError(Error):" },
+    { "__hash__", 92, "class QueueError(Error):" },
+    { "__hash__", 92, "class QueueError(Error):" },
+    { "__init__", 181, "self._is_acquired = False" },
+    { "__init__", 182, "self._waiters = []" },
+    { "acquire", 190, "if self._is_acquired:" },
+    { "acquire", 191, "self._waiters.append(current())" },
+    { "acquire", 193, "try:" },
+    { "acquire", 194, "suspend()" },
+    { "acquire", 196, "self._waiters.remove(current())" },
+    { "acquire", 197, "raise" },
+    { "acquire", 199, "self._is_acquired = True" },
+    { "release", 207, "if self._waiters.length() > 0:" },
+    { "release", 208, "resume(self._waiters.pop())" },
+    { "release", 210, "self._is_acquired = False" },
+    { "__str__", 176, "class Lock:" },
+    { "__eq__", 176, "class Lock:" },
+    { "__lt__", 176, "class Lock:" },
+    { "__hash__", 176, "class Lock:" },
+    { "__hash__", 176, "class Lock:" },
+    { "__hash__", 176, "class Lock:" },
+    { "__init__", 212, "class EventError(Error):" },
+    { "__str__", 212, "class EventError(Error):" },
+    { "__str__", 212, "class EventError(Error):" },
+    { "__eq__", 212, "class EventError(Error):" },
+    { "__lt__", 212, "class EventError(Error):" },
+    { "__hash__", 212, "class EventError(Error):" },
+    { "__hash__", 212, "class EventError(Error):" },
+    { "set", 224, "self._is_set = True" },
+    { "set", 226, "if self._waiter is not None:" },
+    { "set", 227, "resume(self._waiter)" },
+    { "set", 228, "self._waiter = None" },
+    { "clear", 235, "self._is_set = False" },
+    { "wait", 242, "if self._is_set:" },
+    { "wait", 243, "return" },
+    { "wait", 245, "if self._waiter is not None:" },
+    { "wait", 246, "raise EventError(\"only one fiber can wait for an event\")" },
+    { "wait", 248, "self._waiter = current()" },
+    { "wait", 250, "try:" },
+    { "wait", 251, "suspend()" },
+    { "wait", 253, "self._waiter = None" },
+    { "wait", 254, "raise" },
+    { "__init__", 215, "class Event:" },
+    { "__init__", 215, "class Event:" },
+    { "__str__", 215, "class Event:" },
+    { "__eq__", 215, "class Event:" },
+    { "__lt__", 215, "class Event:" },
+    { "__hash__", 215, "class Event:" },
+    { "__hash__", 215, "class Event:" },
+    { "__hash__", 215, "class Event:" },
+    { "__init__", 280, "self._handler = handler" },
+    { "__init__", 281, "self._initial = u64(1000.0 * initial)" },
+    { "__init__", 283, "if interval is None:" },
+    { "__init__", 284, "interval = 0.0" },
+    { "__init__", 286, "self._interval = u64(1000.0 * interval)" },
+    { "__init__", 288, "c\"\"\"" },
+    { "start", 301, "c\"\"\"" },
+    { "stop", 310, "c\"\"\"" },
+    { "__str__", 263, "class Timer:" },
+    { "__eq__", 263, "class Timer:" },
+    { "__lt__", 263, "class Timer:" },
+    { "__hash__", 263, "class Timer:" },
+    { "__hash__", 263, "class Timer:" },
+    { "__hash__", 263, "class Timer:" },
+    { "__hash__", 263, "class Timer:" },
+    { "on_timeout", 324, "self.queue.put(self.message)" },
+    { "__init__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__init__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__str__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__eq__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__lt__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__hash__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__hash__", 319, "class _TimerHandler(TimerHandler):" },
+    { "__init__", 334, "self._timer = Timer(_TimerHandler(queue, message), initial, interval)" },
+    { "start", 337, "self._timer.start()" },
+    { "stop", 340, "self._timer.stop()" },
+    { "__str__", 326, "class MessageTimer:" },
+    { "__eq__", 326, "class MessageTimer:" },
+    { "__lt__", 326, "class MessageTimer:" },
+    { "__hash__", 326, "class MessageTimer:" },
+    { "__hash__", 326, "class MessageTimer:" },
+    { "__init__", 353, "self._values = []" },
+    { "__init__", 354, "self._reader = None" },
+    { "__init__", 355, "self._is_closed = False" },
+    { "open", 362, "self._is_closed = False" },
+    { "close", 370, "self._is_closed = True" },
+    { "close", 372, "if self._reader is not None:" },
+    { "close", 373, "resume(self._reader)" },
+    { "close", 374, "self._reader = None" },
+    { "length", 381, "return self._values.length()" },
+    { "put", 388, "if self._is_closed:" },
+    { "put", 389, "raise QueueError(\"Cannot put message on closed queue.\")" },
+    { "put", 391, "self._values.append(value)" },
+    { "put", 393, "if self._reader is not None:" },
+    { "put", 394, "resume(self._reader)" },
+    { "put", 395, "self._reader = None" },
+    { "get", 403, "if self._values.length() == 0:" },
+    { "get", 404, "if self._reader is not None:" },
+    { "get", 405, "raise QueueError(\"only one fiber can get for a queue\")" },
+    { "get", 407, "if self._is_closed:" },
+    { "get", 408, "raise QueueError(\"Cannot get message from closed queue.\")" },
+    { "get", 410, "self._reader = current()" },
+    { "get", 412, "try:" },
+    { "get", 413, "suspend()" },
+    { "get", 415, "self._reader = None" },
+    { "get", 416, "raise" },
+    { "get", 418, "if self._values.length() == 0:" },
+    { "get", 419, "raise QueueError(\"Cannot get message from closed queue.\")" },
+    { "get", 421, "return self._values.pop(0)" },
+    { "__str__", 343, "class MessageQueue:" },
+    { "__eq__", 343, "class MessageQueue:" },
+    { "__lt__", 343, "class MessageQueue:" },
+    { "__hash__", 343, "class MessageQueue:" },
+    { "__hash__", 343, "class MessageQueue:" },
+    { "__hash__", 343, "class MessageQueue:" },
+    { "__init__", 432, "self._subscribers = {}" },
+    { "__init__", 433, "self._lock = Lock()" },
+    { "broadcast", 436, "self._lock.acquire()" },
+    { "broadcast", 438, "try:" },
+    { "broadcast", 439, "queues = self._subscribers.get(message_id, None)" },
+    { "broadcast", 441, "if queues is not None:" },
+    { "broadcast", 442, "for queue in queues:" },
+    { "broadcast", 445, "self._lock.release()" },
+    { "subscribe", 448, "self._lock.acquire()" },
+    { "subscribe", 450, "try:" },
+    { "subscribe", 451, "if message_id not in self._subscribers:" },
+    { "subscribe", 452, "self._subscribers[message_id] = []" },
+    { "subscribe", 454, "self._subscribers[message_id].append(queue)" },
+    { "subscribe", 456, "self._lock.release()" },
+    { "unsubscribe", 459, "raise NotImplementedError(\"Unsubscribe not implemented.\")" },
+    { "__str__", 423, "class Bus:" },
+    { "__eq__", 423, "class Bus:" },
+    { "__lt__", 423, "class Bus:" },
+    { "__hash__", 423, "class Bus:" },
+    { "__hash__", 423, "class Bus:" },
+    { "suspend", 52, "cancelled: bool = False" },
+    { "suspend", 54, "c\"cancelled = mys::suspend();\"" },
+    { "suspend", 56, "if cancelled:" },
+    { "suspend", 57, "raise CancelledError()" },
+    { "resume", 67, "c\"mys::resume(fiber);\"" },
+    { "sleep", 74, "cancelled: bool = False" },
+    { "sleep", 76, "c\"cancelled = mys::sleep(seconds);\"" },
+    { "sleep", 78, "if cancelled:" },
+    { "sleep", 79, "raise CancelledError()" },
+    { "current", 86, "fiber: Fiber? = None" },
+    { "current", 88, "c\"fiber = mys::current();\"" },
+    { "current", 90, "return fiber" },
+    { "broadcast", 468, "_BUS.broadcast(message_id, message)" },
+    { "subscribe", 475, "_BUS.subscribe(message_id, queue)" },
+    { "unsubscribe", 482, "_BUS.unsubscribe(message_id, queue)" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "/root/package/mys/lib/packages/fiber/src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("CancelledError(");
+static const mys::String __constant_2 = mys::String(")");
+static const mys::String __constant_7 = mys::String("\"");
+static const mys::String __constant_8 = mys::String("\"");
+static const mys::String __constant_9 = mys::String("QueueError(");
+static const mys::String __constant_10 = mys::String("message=");
+static const mys::String __constant_11 = mys::String(")");
+static const mys::String __constant_18 = mys::String("Lock(");
+static const mys::String __constant_19 = mys::String("_is_acquired=");
+static const mys::String __constant_20 = mys::String(", _waiters=");
+static const mys::String __constant_21 = mys::String(")");
+static const mys::String __constant_26 = mys::String("\"");
+static const mys::String __constant_27 = mys::String("\"");
+static const mys::String __constant_28 = mys::String("EventError(");
+static const mys::String __constant_29 = mys::String("message=");
+static const mys::String __constant_30 = mys::String(")");
+static const mys::String __constant_35 = mys::String("only one fiber can wait for an event");
+static const mys::String __constant_38 = mys::String("Event(");
+static const mys::String __constant_39 = mys::String("_is_set=");
+static const mys::String __constant_40 = mys::String(", _waiter=");
+static const mys::String __constant_41 = mys::String(")");
+static const mys::String __constant_46 = mys::String("Timer(");
+static const mys::String __constant_47 = mys::String("_handler=");
+static const mys::String __constant_48 = mys::String(", _initial=");
+static const mys::String __constant_49 = mys::String(", _interval=");
+static const mys::String __constant_50 = mys::String(")");
+static const mys::String __constant_55 = mys::String("_TimerHandler(");
+static const mys::String __constant_56 = mys::String("queue=");
+static const mys::String __constant_57 = mys::String(", message=");
+static const mys::String __constant_58 = mys::String(")");
+static const mys::String __constant_63 = mys::String("MessageTimer(");
+static const mys::String __constant_64 = mys::String("_timer=");
+static const mys::String __constant_65 = mys::String(")");
+static const mys::String __constant_71 = mys::String("Cannot put message on closed queue.");
+static const mys::String __constant_72 = mys::String("only one fiber can get for a queue");
+static const mys::String __constant_73 = mys::String("Cannot get message from closed queue.");
+static const mys::String __constant_76 = mys::String("Cannot get message from closed queue.");
+static const mys::String __constant_78 = mys::String("MessageQueue(");
+static const mys::String __constant_79 = mys::String("_values=");
+static const mys::String __constant_80 = mys::String(", _reader=");
+static const mys::String __constant_81 = mys::String(", _is_closed=");
+static const mys::String __constant_82 = mys::String(")");
+static const mys::String __constant_92 = mys::String("Unsubscribe not implemented.");
+static const mys::String __constant_93 = mys::String("Bus(");
+static const mys::String __constant_94 = mys::String("_subscribers=");
+static const mys::String __constant_95 = mys::String(", _lock=");
+static const mys::String __constant_96 = mys::String(")");
+mys::shared_ptr<mys::fiber::lib::Bus> _BUS;
+CancelledError::CancelledError(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+
+    __MYS_TRACEBACK_EXIT();
+}
+CancelledError::~CancelledError(void)
+{
+}
+mys::String CancelledError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    mys::String __res_3 = (__constant_1 + __constant_2);
+    __MYS_TRACEBACK_EXIT();
+    return __res_3;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool CancelledError::__eq__(mys::shared_ptr<mys::fiber::lib::CancelledError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::Bool __res_4 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool CancelledError::__lt__(mys::shared_ptr<mys::fiber::lib::CancelledError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    mys::Bool __res_5 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 CancelledError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(4);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(5);
+    i64 __res_6 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+void CancelledError::__throw()
+{
+    throw __CancelledError(mys::shared_ptr<CancelledError>(this));
+}
+QueueError::QueueError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+QueueError::~QueueError(void)
+{
+}
+mys::String QueueError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(7);
+    mys::String message = (__constant_7 + string_str(this->message) + __constant_8);
+    __MYS_TRACEBACK_SET(8);
+    mys::String __res_12 = (__constant_9 + __constant_10 + string_str(message) + __constant_11);
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool QueueError::__eq__(mys::shared_ptr<mys::fiber::lib::QueueError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    mys::Bool __res_13 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_13;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool QueueError::__lt__(mys::shared_ptr<mys::fiber::lib::QueueError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(10);
+    mys::Bool __res_14 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_14;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 QueueError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(11);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(12);
+    i64 __res_15 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+void QueueError::__throw()
+{
+    throw __QueueError(mys::shared_ptr<QueueError>(this));
+}
+Lock::Lock(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    this->_is_acquired = mys::Bool(false);
+    __MYS_TRACEBACK_SET(14);
+    this->_waiters = mys::make_shared<mys::List<mys::shared_ptr<Fiber>>>(std::initializer_list<mys::shared_ptr<Fiber>>{});
+    __MYS_TRACEBACK_EXIT();
+}
+void Lock::acquire(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(15);
+    if (this->_is_acquired) {
+        __MYS_TRACEBACK_SET(16);
+        this->_waiters->append(mys::fiber::lib::current());
+        __MYS_TRACEBACK_SET(17);
+        try {
+            __MYS_TRACEBACK_SET(18);
+            mys::fiber::lib::suspend();
+        } catch (fiber::lib::__CancelledError __e_17) {
+            __MYS_TRACEBACK_RESTORE();
+            __MYS_TRACEBACK_SET(19);
+            this->_waiters->remove(mys::fiber::lib::current());
+            __MYS_TRACEBACK_SET(20);
+            throw;
+        }
+    } else {
+        __MYS_TRACEBACK_SET(21);
+        this->_is_acquired = mys::Bool(true);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void Lock::release(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(22);
+    if (mys::Bool(this->_waiters->length() > 0)) {
+        __MYS_TRACEBACK_SET(23);
+        mys::fiber::lib::resume(this->_waiters->pop(std::nullopt));
+    } else {
+        __MYS_TRACEBACK_SET(24);
+        this->_is_acquired = mys::Bool(false);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+Lock::~Lock(void)
+{
+}
+mys::String Lock::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(25);
+    mys::String __res_22 = (__constant_18 + __constant_19 + mys::String(this->_is_acquired) + __constant_20 + object_str(this->_waiters) + __constant_21);
+    __MYS_TRACEBACK_EXIT();
+    return __res_22;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Lock::__eq__(mys::shared_ptr<mys::fiber::lib::Lock> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(26);
+    mys::Bool __res_23 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_23;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Lock::__lt__(mys::shared_ptr<mys::fiber::lib::Lock> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(27);
+    mys::Bool __res_24 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_24;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Lock::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(28);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(29);
+    hash += std::hash<mys::Bool>{}(this->_is_acquired);
+    __MYS_TRACEBACK_SET(30);
+    i64 __res_25 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_25;
+    __MYS_TRACEBACK_EXIT();
+}
+EventError::EventError(mys::String message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(31);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+EventError::~EventError(void)
+{
+}
+mys::String EventError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(32);
+    mys::String message = (__constant_26 + string_str(this->message) + __constant_27);
+    __MYS_TRACEBACK_SET(33);
+    mys::String __res_31 = (__constant_28 + __constant_29 + string_str(message) + __constant_30);
+    __MYS_TRACEBACK_EXIT();
+    return __res_31;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EventError::__eq__(mys::shared_ptr<mys::fiber::lib::EventError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(34);
+    mys::Bool __res_32 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_32;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool EventError::__lt__(mys::shared_ptr<mys::fiber::lib::EventError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(35);
+    mys::Bool __res_33 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_33;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 EventError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(36);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(37);
+    i64 __res_34 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_34;
+    __MYS_TRACEBACK_EXIT();
+}
+void EventError::__throw()
+{
+    throw __EventError(mys::shared_ptr<EventError>(this));
+}
+void Event::set(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(38);
+    this->_is_set = mys::Bool(true);
+    __MYS_TRACEBACK_SET(39);
+    if (mys::Bool(!is(this->_waiter, nullptr))) {
+        __MYS_TRACEBACK_SET(40);
+        mys::fiber::lib::resume(this->_waiter);
+        __MYS_TRACEBACK_SET(41);
+        this->_waiter = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void Event::clear(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(42);
+    this->_is_set = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void Event::wait(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(43);
+    if (this->_is_set) {
+        __MYS_TRACEBACK_SET(44);
+        __MYS_TRACEBACK_EXIT();
+        return;
+    }
+    __MYS_TRACEBACK_SET(45);
+    if (mys::Bool(!is(this->_waiter, nullptr))) {
+        __MYS_TRACEBACK_SET(46);
+        mys::make_shared<mys::fiber::lib::EventError>(__constant_35)->__throw();
+    }
+    __MYS_TRACEBACK_SET(47);
+    this->_waiter = mys::fiber::lib::current();
+    __MYS_TRACEBACK_SET(48);
+    try {
+        __MYS_TRACEBACK_SET(49);
+        mys::fiber::lib::suspend();
+    } catch (fiber::lib::__CancelledError __e_37) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(50);
+        this->_waiter = nullptr;
+        __MYS_TRACEBACK_SET(51);
+        throw;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+Event::Event(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(52);
+    this->_is_set = mys::Bool(false);
+    __MYS_TRACEBACK_SET(53);
+    this->_waiter = nullptr;
+    __MYS_TRACEBACK_EXIT();
+}
+Event::~Event(void)
+{
+}
+mys::String Event::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(54);
+    mys::String __res_42 = (__constant_38 + __constant_39 + mys::String(this->_is_set) + __constant_40 + object_str(this->_waiter) + __constant_41);
+    __MYS_TRACEBACK_EXIT();
+    return __res_42;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Event::__eq__(mys::shared_ptr<mys::fiber::lib::Event> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(55);
+    mys::Bool __res_43 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_43;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Event::__lt__(mys::shared_ptr<mys::fiber::lib::Event> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(56);
+    mys::Bool __res_44 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_44;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Event::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(57);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(58);
+    hash += std::hash<mys::Bool>{}(this->_is_set);
+    __MYS_TRACEBACK_SET(59);
+    i64 __res_45 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_45;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::optional<f64> Timer_Timer_interval_default()
+{
+    return nullptr;
+}
+Timer::Timer(mys::shared_ptr<mys::fiber::lib::TimerHandler> handler, f64 initial, mys::optional<f64> interval)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(60);
+    this->_handler = handler;
+    __MYS_TRACEBACK_SET(61);
+    this->_initial = u64((1000.0 * initial));
+    __MYS_TRACEBACK_SET(62);
+    if (mys::Bool(is(interval, nullptr))) {
+        __MYS_TRACEBACK_SET(63);
+        interval = static_cast<f64>(0.0);
+    }
+    __MYS_TRACEBACK_SET(64);
+    this->_interval = u64((1000.0 * interval));
+    __MYS_TRACEBACK_SET(65);
+    /* c-string start */
+    uv_timer_init(uv_default_loop(), &m_handle);
+    m_handle.data = this;
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+Timer::~Timer(void)
+{
+    this->stop();
+}
+void Timer::start(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(66);
+    /* c-string start */
+    uv_timer_start(&m_handle, timer_sleep_complete, _initial, _interval);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void Timer::stop(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(67);
+    /* c-string start */
+    uv_timer_stop(&m_handle);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String Timer::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(68);
+    mys::String __res_51 = (__constant_46 + __constant_47 + object_str(this->_handler) + __constant_48 + mys::String(this->_initial, 'd') + __constant_49 + mys::String(this->_interval, 'd') + __constant_50);
+    __MYS_TRACEBACK_EXIT();
+    return __res_51;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Timer::__eq__(mys::shared_ptr<mys::fiber::lib::Timer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(69);
+    mys::Bool __res_52 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_52;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Timer::__lt__(mys::shared_ptr<mys::fiber::lib::Timer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(70);
+    mys::Bool __res_53 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_53;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Timer::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(71);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(72);
+    hash += std::hash<u64>{}(this->_initial);
+    __MYS_TRACEBACK_SET(73);
+    hash += std::hash<u64>{}(this->_interval);
+    __MYS_TRACEBACK_SET(74);
+    i64 __res_54 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_54;
+    __MYS_TRACEBACK_EXIT();
+}
+void _TimerHandler::on_timeout(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(75);
+    this->queue->put(this->message);
+    __MYS_TRACEBACK_EXIT();
+}
+_TimerHandler::_TimerHandler(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(76);
+    this->queue = queue;
+    __MYS_TRACEBACK_SET(77);
+    this->message = message;
+    __MYS_TRACEBACK_EXIT();
+}
+_TimerHandler::~_TimerHandler(void)
+{
+}
+mys::String _TimerHandler::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(78);
+    mys::String __res_59 = (__constant_55 + __constant_56 + object_str(this->queue) + __constant_57 + object_str(this->message) + __constant_58);
+    __MYS_TRACEBACK_EXIT();
+    return __res_59;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool _TimerHandler::__eq__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(79);
+    mys::Bool __res_60 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_60;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool _TimerHandler::__lt__(mys::shared_ptr<mys::fiber::lib::_TimerHandler> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(80);
+    mys::Bool __res_61 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_61;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 _TimerHandler::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(81);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(82);
+    i64 __res_62 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_62;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::optional<f64> MessageTimer_MessageTimer_interval_default()
+{
+    return nullptr;
+}
+MessageTimer::MessageTimer(mys::shared_ptr<mys::fiber::lib::MessageQueue> queue, mys::shared_ptr<mys::fiber::lib::Message> message, f64 initial, mys::optional<f64> interval)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(83);
+    this->_timer = mys::make_shared<mys::fiber::lib::Timer>(mys::make_shared<mys::fiber::lib::_TimerHandler>(queue, message), initial, interval);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageTimer::start(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(84);
+    this->_timer->start();
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageTimer::stop(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(85);
+    this->_timer->stop();
+    __MYS_TRACEBACK_EXIT();
+}
+MessageTimer::~MessageTimer(void)
+{
+}
+mys::String MessageTimer::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(86);
+    mys::String __res_66 = (__constant_63 + __constant_64 + object_str(this->_timer) + __constant_65);
+    __MYS_TRACEBACK_EXIT();
+    return __res_66;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageTimer::__eq__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(87);
+    mys::Bool __res_67 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_67;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageTimer::__lt__(mys::shared_ptr<mys::fiber::lib::MessageTimer> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(88);
+    mys::Bool __res_68 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_68;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageTimer::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(89);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(90);
+    i64 __res_69 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_69;
+    __MYS_TRACEBACK_EXIT();
+}
+MessageQueue::MessageQueue(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(91);
+    this->_values = mys::make_shared<mys::List<mys::shared_ptr<mys::fiber::lib::Message>>>(std::initializer_list<mys::shared_ptr<mys::fiber::lib::Message>>{});
+    __MYS_TRACEBACK_SET(92);
+    this->_reader = nullptr;
+    __MYS_TRACEBACK_SET(93);
+    this->_is_closed = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::open(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(94);
+    this->_is_closed = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::close(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(95);
+    this->_is_closed = mys::Bool(true);
+    __MYS_TRACEBACK_SET(96);
+    if (mys::Bool(!is(this->_reader, nullptr))) {
+        __MYS_TRACEBACK_SET(97);
+        mys::fiber::lib::resume(this->_reader);
+        __MYS_TRACEBACK_SET(98);
+        this->_reader = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageQueue::length(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(99);
+    i64 __res_70 = this->_values->length();
+    __MYS_TRACEBACK_EXIT();
+    return __res_70;
+    __MYS_TRACEBACK_EXIT();
+}
+void MessageQueue::put(mys::shared_ptr<mys::fiber::lib::Message> value)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(100);
+    if (this->_is_closed) {
+        __MYS_TRACEBACK_SET(101);
+        mys::make_shared<mys::fiber::lib::QueueError>(__constant_71)->__throw();
+    }
+    __MYS_TRACEBACK_SET(102);
+    this->_values->append(value);
+    __MYS_TRACEBACK_SET(103);
+    if (mys::Bool(!is(this->_reader, nullptr))) {
+        __MYS_TRACEBACK_SET(104);
+        mys::fiber::lib::resume(this->_reader);
+        __MYS_TRACEBACK_SET(105);
+        this->_reader = nullptr;
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<mys::fiber::lib::Message> MessageQueue::get(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(106);
+    if (mys::Bool(this->_values->length() == 0)) {
+        __MYS_TRACEBACK_SET(107);
+        if (mys::Bool(!is(this->_reader, nullptr))) {
+            __MYS_TRACEBACK_SET(108);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_72)->__throw();
+        }
+        __MYS_TRACEBACK_SET(109);
+        if (this->_is_closed) {
+            __MYS_TRACEBACK_SET(110);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_73)->__throw();
+        }
+        __MYS_TRACEBACK_SET(111);
+        this->_reader = mys::fiber::lib::current();
+        __MYS_TRACEBACK_SET(112);
+        try {
+            __MYS_TRACEBACK_SET(113);
+            mys::fiber::lib::suspend();
+        } catch (fiber::lib::__CancelledError __e_75) {
+            __MYS_TRACEBACK_RESTORE();
+            __MYS_TRACEBACK_SET(114);
+            this->_reader = nullptr;
+            __MYS_TRACEBACK_SET(115);
+            throw;
+        }
+        __MYS_TRACEBACK_SET(116);
+        if (mys::Bool(this->_values->length() == 0)) {
+            __MYS_TRACEBACK_SET(117);
+            mys::make_shared<mys::fiber::lib::QueueError>(__constant_76)->__throw();
+        }
+    }
+    __MYS_TRACEBACK_SET(118);
+    mys::shared_ptr<mys::fiber::lib::Message> __res_77 = this->_values->pop(0);
+    __MYS_TRACEBACK_EXIT();
+    return __res_77;
+    __MYS_TRACEBACK_EXIT();
+}
+MessageQueue::~MessageQueue(void)
+{
+}
+mys::String MessageQueue::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(119);
+    mys::String __res_83 = (__constant_78 + __constant_79 + object_str(this->_values) + __constant_80 + object_str(this->_reader) + __constant_81 + mys::String(this->_is_closed) + __constant_82);
+    __MYS_TRACEBACK_EXIT();
+    return __res_83;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageQueue::__eq__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(120);
+    mys::Bool __res_84 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_84;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MessageQueue::__lt__(mys::shared_ptr<mys::fiber::lib::MessageQueue> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(121);
+    mys::Bool __res_85 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_85;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MessageQueue::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(122);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(123);
+    hash += std::hash<mys::Bool>{}(this->_is_closed);
+    __MYS_TRACEBACK_SET(124);
+    i64 __res_86 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_86;
+    __MYS_TRACEBACK_EXIT();
+}
+Bus::Bus(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(125);
+    this->_subscribers = mys::make_shared<Dict<i64, mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>>>(std::initializer_list<std::pair<i64, mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>>>{});
+    __MYS_TRACEBACK_SET(126);
+    this->_lock = mys::make_shared<mys::fiber::lib::Lock>();
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(127);
+    this->_lock->acquire();
+    __MYS_TRACEBACK_SET(128);
+    mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>> __queues_90;
+    try {
+        __MYS_TRACEBACK_SET(129);
+        mys::shared_ptr<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>> queues = this->_subscribers->get(message_id, nullptr);
+        __MYS_TRACEBACK_SET(130);
+        if (mys::Bool(!is(queues, nullptr))) {
+            __MYS_TRACEBACK_SET(131);
+            auto __items_87 = queues;
+            for (auto __i_88 = 0; __i_88 < __items_87->length(); __i_88++) {
+                auto queue = __items_87->get(__i_88);
+                queue->put(message);
+            }
+        }
+            __queues_90 = queues;
+    } catch (...) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(132);
+        this->_lock->release();
+        throw;
+    }
+    __MYS_TRACEBACK_SET(132);
+    this->_lock->release();
+    auto queues = __queues_90;
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(133);
+    this->_lock->acquire();
+    __MYS_TRACEBACK_SET(134);
+    try {
+        __MYS_TRACEBACK_SET(135);
+        if (mys::Bool(!contains(message_id, this->_subscribers))) {
+            __MYS_TRACEBACK_SET(136);
+            this->_subscribers->__setitem__(message_id, mys::make_shared<mys::List<mys::shared_ptr<mys::fiber::lib::MessageQueue>>>(std::initializer_list<mys::shared_ptr<mys::fiber::lib::MessageQueue>>{}));
+        }
+        __MYS_TRACEBACK_SET(137);
+        (this->_subscribers)->get(message_id)->append(queue);
+    } catch (...) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(138);
+        this->_lock->release();
+        throw;
+    }
+    __MYS_TRACEBACK_SET(138);
+    this->_lock->release();
+    __MYS_TRACEBACK_EXIT();
+}
+void Bus::unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(139);
+    mys::make_shared<NotImplementedError>(__constant_92)->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+Bus::~Bus(void)
+{
+}
+mys::String Bus::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(140);
+    mys::String __res_97 = (__constant_93 + __constant_94 + object_str(this->_subscribers) + __constant_95 + object_str(this->_lock) + __constant_96);
+    __MYS_TRACEBACK_EXIT();
+    return __res_97;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bus::__eq__(mys::shared_ptr<mys::fiber::lib::Bus> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(141);
+    mys::Bool __res_98 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_98;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Bus::__lt__(mys::shared_ptr<mys::fiber::lib::Bus> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(142);
+    mys::Bool __res_99 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_99;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Bus::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(143);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(144);
+    i64 __res_100 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_100;
+    __MYS_TRACEBACK_EXIT();
+}
+void suspend(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(145);
+    mys::Bool cancelled = mys::Bool(false);
+    __MYS_TRACEBACK_SET(146);
+    /* c-string start */
+    cancelled = mys::suspend();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(147);
+    if (cancelled) {
+        __MYS_TRACEBACK_SET(148);
+        mys::make_shared<mys::fiber::lib::CancelledError>()->__throw();
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+void resume(mys::shared_ptr<Fiber> fiber)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(149);
+    /* c-string start */
+    mys::resume(fiber);
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void sleep(f64 seconds)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(150);
+    mys::Bool cancelled = mys::Bool(false);
+    __MYS_TRACEBACK_SET(151);
+    /* c-string start */
+    cancelled = mys::sleep(seconds);
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(152);
+    if (cancelled) {
+        __MYS_TRACEBACK_SET(153);
+        mys::make_shared<mys::fiber::lib::CancelledError>()->__throw();
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+mys::shared_ptr<Fiber> current(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(154);
+    mys::shared_ptr<Fiber> fiber = nullptr;
+    __MYS_TRACEBACK_SET(155);
+    /* c-string start */
+    fiber = mys::current();
+    /* c-string stop */;
+    __MYS_TRACEBACK_SET(156);
+    mys::shared_ptr<Fiber> __res_101 = fiber;
+    __MYS_TRACEBACK_EXIT();
+    return __res_101;
+    __MYS_TRACEBACK_EXIT();
+}
+void broadcast(i64 message_id, mys::shared_ptr<mys::fiber::lib::Message> message)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(157);
+    mys::fiber::lib::_BUS->broadcast(message_id, message);
+    __MYS_TRACEBACK_EXIT();
+}
+void subscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(158);
+    mys::fiber::lib::_BUS->subscribe(message_id, queue);
+    __MYS_TRACEBACK_EXIT();
+}
+void unsubscribe(i64 message_id, mys::shared_ptr<mys::fiber::lib::MessageQueue> queue)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(159);
+    mys::fiber::lib::_BUS->unsubscribe(message_id, queue);
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+;
+    _BUS = mys::make_shared<mys::fiber::lib::Bus>();
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: /root/package/mys/lib/packages/fiber/src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,92 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "signals/lib.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::signals::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::signals::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::signals::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::signals::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::signals::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "sigint", 4, "print(\"sigint started\", flush=True)" },
+    { "sigint", 6, "try:" },
+    { "sigint", 7, "ok = False" },
+    { "sigint", 8, "sleep(60.0)" },
+    { "sigint", 10, "print(error)" },
+    { "sigint", 11, "ok = True" },
+    { "sigint", 13, "assert ok" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("sigint started");
+#if defined(MYS_TEST)
+static void mys_test_sigint(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    if (mys::Bool(true)) {
+        std::cout << std::flush;
+    };
+    __MYS_TRACEBACK_SET(1);
+    mys::Bool __ok_4;
+    try {
+        __MYS_TRACEBACK_SET(2);
+        mys::Bool ok = mys::Bool(false);
+        __MYS_TRACEBACK_SET(3);
+        mys::fiber::lib::sleep(60.0);
+        __ok_4 = ok;
+    } catch (__InterruptError __e_3) {
+        __MYS_TRACEBACK_RESTORE();
+        auto error = static_cast<mys::shared_ptr<InterruptError>>(__e_3.m_error);
+        __MYS_TRACEBACK_SET(4);
+        std::cout << error << "\n";
+        __MYS_TRACEBACK_SET(5);
+        mys::Bool ok = mys::Bool(true);
+        __ok_4 = ok;
+    }
+    auto ok = __ok_4;
+    __MYS_TRACEBACK_SET(6);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    if (!(ok)) {
+        std::cout << "./src/lib.mys:13: assert " << PrintString(mys::String("condition")) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String("condition") + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_sigint("lib::sigint", mys_test_sigint);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
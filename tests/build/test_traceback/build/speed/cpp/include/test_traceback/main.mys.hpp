@@ -0,0 +1,25 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_traceback_main_HPP
+#define mys_test_traceback_main_HPP
+#include "test_traceback/main.mys.early.hpp"
+namespace mys::test_traceback::main
+{
+class AnError : public Error {
+public:
+    mys::String message;
+    AnError(mys::String message);
+    virtual ~AnError(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::test_traceback::main::AnError> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::test_traceback::main::AnError> other);
+    i64 __hash__(void);
+    [[ noreturn ]] void __throw();
+};
+class __AnError final : public __Error {
+public:
+    __AnError(const mys::shared_ptr<AnError>& error) : __Error(error)
+    {
+    }
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,555 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "test_traceback/lib.mys.hpp"
+namespace mys::test_traceback::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "__init__", 45, "class MyError(Error):" },
+    { "__init__", 45, "class MyError(Error):" },
+    { "__str__", 45, "class MyError(Error):" },
+    { "__eq__", 45, "class MyError(Error):" },
+    { "__eq__", 45, "class MyError(Error):" },
+    { "__eq__", 45, "class MyError(Error):" },
+    { "__eq__", 45, "class MyError(Error):" },
+    { "__eq__", 45, "class MyError(Error):" },
+    { "__lt__", 45, "class MyError(Error):" },
+    { "__lt__", 45, "class MyError(Error):" },
+    { "__lt__", 45, "class MyError(Error):" },
+    { "__lt__", 45, "class MyError(Error):" },
+    { "__lt__", 45, "class MyError(Error):" },
+    { "__hash__", 45, "class MyError(Error):" },
+    { "__hash__", 45, "class MyError(Error):" },
+    { "__hash__", 45, "class MyError(Error):" },
+    { "__hash__", 45, "class MyError(Error):" },
+    { "run", 55, "raise MyError(2, 3)" },
+    { "__init__", 52, "class MyFiber(Fiber):" },
+    { "__str__", 52, "class MyFiber(Fiber):" },
+    { "__eq__", 52, "class MyFiber(Fiber):" },
+    { "__lt__", 52, "class MyFiber(Fiber):" },
+    { "__hash__", 52, "class MyFiber(Fiber):" },
+    { "__hash__", 52, "class MyFiber(Fiber):" },
+    { "start", 24, "print(b\"\"[5])" },
+    { "join", 31, "" },
+    { "cancel", 42, "case 1:" },
+    { "__init__", 76, "class Desctuctor:" },
+    { "__str__", 76, "class Desctuctor:" },
+    { "__eq__", 76, "class Desctuctor:" },
+    { "__lt__", 76, "class Desctuctor:" },
+    { "__hash__", 76, "class Desctuctor:" },
+    { "__hash__", 76, "class Desctuctor:" },
+    { "panic_2", 7, "i = 10" },
+    { "panic_2", 8, "print(\"\"[i])" },
+    { "panic_in_except", 14, "raise ValueError()" },
+    { "modulo", 63, "return a % b" },
+    { "divide", 70, "return a / b" },
+    { "function_that_raises", 81, "raise ValueError()" },
+    { "panic", 4, "print(\"\"[1])" },
+    { "panic_2", 11, "panic_2()" },
+    { "panic_in_except", 17, "try:" },
+    { "panic_in_except", 18, "panic_in_except()" },
+    { "panic_in_except", 20, "print(b\"\"[11])" },
+    { "panic_in_if", 23, "if True:" },
+    { "panic_in_if", 24, "print(b\"\"[5])" },
+    { "panic_in_else", 27, "if False:" },
+    { "panic_in_else", 28, "pass" },
+    { "panic_in_else", 30, "print(b\"\"[6])" },
+    { "panic_in_for", 33, "for i in range(10):" },
+    { "panic_in_for", 34, "print(b\"123\"[i])" },
+    { "panic_in_while", 37, "while True:" },
+    { "panic_in_while", 38, "print(b\"\"[10])" },
+    { "panic_in_match", 41, "match 1:" },
+    { "panic_in_match", 43, "print(b\"\"[-1])" },
+    { "error_in_runtime", 50, "raise MyError(1, 2)" },
+    { "error_in_fiber", 58, "my_fiber = MyFiber()" },
+    { "error_in_fiber", 59, "my_fiber.start()" },
+    { "error_in_fiber", 60, "my_fiber.join()" },
+    { "modulo_zero", 66, "assert modulo(10, 2) == 0" },
+    { "modulo_zero", 67, "assert modulo(10, 0) == 0" },
+    { "division_by_zero", 73, "assert divide(10, 2) == 5" },
+    { "division_by_zero", 74, "assert divide(10, 0) == 5" },
+    { "destructor", 84, "desctuctor = Desctuctor()" },
+    { "destructor", 85, "function_that_raises()" },
+    { "destructor", 86, "print(desctuctor)" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("MyError(");
+static const mys::String __constant_2 = mys::String("x=");
+static const mys::String __constant_3 = mys::String(", y=");
+static const mys::String __constant_4 = mys::String(")");
+static const mys::String __constant_13 = mys::String("MyFiber(");
+static const mys::String __constant_14 = mys::String(")");
+static const mys::String __constant_19 = mys::String("Desctuctor(");
+static const mys::String __constant_20 = mys::String(")");
+static const mys::String __constant_25 = mys::String("");
+static const mys::String __constant_28 = mys::String("");
+MyError::MyError(i64 x, i64 y)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    this->x = x;
+    __MYS_TRACEBACK_SET(1);
+    this->y = y;
+    __MYS_TRACEBACK_EXIT();
+}
+MyError::~MyError(void)
+{
+}
+mys::String MyError::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_5 = (__constant_1 + __constant_2 + mys::String(this->x, 'd') + __constant_3 + mys::String(this->y, 'd') + __constant_4);
+    __MYS_TRACEBACK_EXIT();
+    return __res_5;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyError::__eq__(mys::shared_ptr<mys::test_traceback::lib::MyError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    if (!(mys::Bool(this->x == other->x))) {
+        __MYS_TRACEBACK_SET(4);
+        mys::Bool __res_6 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_6;
+    }
+    __MYS_TRACEBACK_SET(5);
+    if (!(mys::Bool(this->y == other->y))) {
+        __MYS_TRACEBACK_SET(6);
+        mys::Bool __res_7 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_7;
+    }
+    __MYS_TRACEBACK_SET(7);
+    mys::Bool __res_8 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyError::__lt__(mys::shared_ptr<mys::test_traceback::lib::MyError> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(8);
+    if (mys::Bool(this->x != other->x)) {
+        __MYS_TRACEBACK_SET(9);
+        mys::Bool __res_9 = mys::Bool(this->x < other->x);
+        __MYS_TRACEBACK_EXIT();
+        return __res_9;
+    }
+    __MYS_TRACEBACK_SET(10);
+    if (mys::Bool(this->y != other->y)) {
+        __MYS_TRACEBACK_SET(11);
+        mys::Bool __res_10 = mys::Bool(this->y < other->y);
+        __MYS_TRACEBACK_EXIT();
+        return __res_10;
+    }
+    __MYS_TRACEBACK_SET(12);
+    mys::Bool __res_11 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_11;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MyError::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(13);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(14);
+    hash += std::hash<i64>{}(this->x);
+    __MYS_TRACEBACK_SET(15);
+    hash += std::hash<i64>{}(this->y);
+    __MYS_TRACEBACK_SET(16);
+    i64 __res_12 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_12;
+    __MYS_TRACEBACK_EXIT();
+}
+void MyError::__throw()
+{
+    throw __MyError(mys::shared_ptr<MyError>(this));
+}
+void MyFiber::run(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+    mys::make_shared<mys::test_traceback::lib::MyError>(2, 3)->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+MyFiber::MyFiber(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(18);
+
+    __MYS_TRACEBACK_EXIT();
+}
+MyFiber::~MyFiber(void)
+{
+}
+mys::String MyFiber::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(19);
+    mys::String __res_15 = (__constant_13 + __constant_14);
+    __MYS_TRACEBACK_EXIT();
+    return __res_15;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyFiber::__eq__(mys::shared_ptr<mys::test_traceback::lib::MyFiber> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(20);
+    mys::Bool __res_16 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_16;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool MyFiber::__lt__(mys::shared_ptr<mys::test_traceback::lib::MyFiber> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(21);
+    mys::Bool __res_17 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_17;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 MyFiber::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(22);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(23);
+    i64 __res_18 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_18;
+    __MYS_TRACEBACK_EXIT();
+}
+void MyFiber::start(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(24);
+    /* c-string start */
+    mys::start(mys::shared_ptr<mys::Fiber>(this));
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void MyFiber::join(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(25);
+    /* c-string start */
+    if (mys::join(mys::shared_ptr<mys::Fiber>(this))) {
+        mys::make_shared<fiber::lib::CancelledError>()->__throw();
+    }
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+void MyFiber::cancel(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(26);
+    /* c-string start */
+    mys::cancel(mys::shared_ptr<mys::Fiber>(this));
+    /* c-string stop */;
+    __MYS_TRACEBACK_EXIT();
+}
+Desctuctor::Desctuctor(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(27);
+
+    __MYS_TRACEBACK_EXIT();
+}
+Desctuctor::~Desctuctor(void)
+{
+}
+mys::String Desctuctor::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(28);
+    mys::String __res_21 = (__constant_19 + __constant_20);
+    __MYS_TRACEBACK_EXIT();
+    return __res_21;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Desctuctor::__eq__(mys::shared_ptr<mys::test_traceback::lib::Desctuctor> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(29);
+    mys::Bool __res_22 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_22;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool Desctuctor::__lt__(mys::shared_ptr<mys::test_traceback::lib::Desctuctor> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(30);
+    mys::Bool __res_23 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_23;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 Desctuctor::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(31);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(32);
+    i64 __res_24 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_24;
+    __MYS_TRACEBACK_EXIT();
+}
+void panic_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(33);
+    i64 i = 10;
+    __MYS_TRACEBACK_SET(34);
+    std::cout << PrintChar(mys::string_not_none(__constant_25).get(i)) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+void panic_in_except(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(35);
+    mys::make_shared<ValueError>()->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+i64 modulo(i64 a, i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(36);
+    i64 __res_26 = (a % mys::denominator_not_zero(b));
+    __MYS_TRACEBACK_EXIT();
+    return __res_26;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 divide(i64 a, i64 b)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(37);
+    i64 __res_27 = (a / mys::denominator_not_zero(b));
+    __MYS_TRACEBACK_EXIT();
+    return __res_27;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::String function_that_raises(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(38);
+    mys::make_shared<ValueError>()->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_panic(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(39);
+    std::cout << PrintChar(mys::string_not_none(__constant_28).get(1)) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic("lib::panic", mys_test_panic);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(40);
+    mys::test_traceback::lib::panic_2();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_2("lib::panic_2", mys_test_panic_2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_except(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(41);
+    try {
+        __MYS_TRACEBACK_SET(42);
+        mys::test_traceback::lib::panic_in_except();
+    } catch (__Error __e_30) {
+        __MYS_TRACEBACK_RESTORE();
+        __MYS_TRACEBACK_SET(43);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({})).get(11) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_except("lib::panic_in_except", mys_test_panic_in_except);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_if(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(44);
+    if (mys::Bool(true)) {
+        __MYS_TRACEBACK_SET(45);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({})).get(5) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_if("lib::panic_in_if", mys_test_panic_in_if);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_else(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(46);
+    if (mys::Bool(false)) {
+        __MYS_TRACEBACK_SET(47);
+    } else {
+        __MYS_TRACEBACK_SET(48);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({})).get(6) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_else("lib::panic_in_else", mys_test_panic_in_else);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_for(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(49);
+    auto __range_31 = Range(i64(0), i64(10), i64(1));
+    auto __len_32 = __range_31.length();
+    __range_31.iter();
+    for (auto __i_33 = 0; __i_33 < __len_32; __i_33++) {
+        auto i = __range_31.next();
+        __MYS_TRACEBACK_SET(50);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({49, 50, 51})).get(i) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_for("lib::panic_in_for", mys_test_panic_in_for);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_while(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(51);
+    while (mys::Bool(true)) {
+        __MYS_TRACEBACK_SET(52);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({})).get(10) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_while("lib::panic_in_while", mys_test_panic_in_while);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_panic_in_match(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(53);
+    const auto& __subject_34 = 1;
+    if (__subject_34 == 1) {
+        __MYS_TRACEBACK_SET(54);
+        std::cout << (unsigned)mys::bytes_not_none(Bytes({})).get(-(1)) << "\n";
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_panic_in_match("lib::panic_in_match", mys_test_panic_in_match);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_error_in_runtime(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(55);
+    mys::make_shared<mys::test_traceback::lib::MyError>(1, 2)->__throw();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_error_in_runtime("lib::error_in_runtime", mys_test_error_in_runtime);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_error_in_fiber(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(56);
+    mys::shared_ptr<mys::test_traceback::lib::MyFiber> my_fiber = mys::make_shared<mys::test_traceback::lib::MyFiber>();
+    __MYS_TRACEBACK_SET(57);
+    my_fiber->start();
+    __MYS_TRACEBACK_SET(58);
+    my_fiber->join();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_error_in_fiber("lib::error_in_fiber", mys_test_error_in_fiber);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_modulo_zero(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(59);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_35 = mys::test_traceback::lib::modulo(10, 2);
+    const i64 __var_36 = 0;
+    if (!((__var_35 == __var_36))) {
+        std::cout << "./src/lib.mys:66: assert " << PrintString(mys::String(__var_35) + " == " + mys::String(__var_36)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_35) + " == " + mys::String(__var_36) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(60);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_37 = mys::test_traceback::lib::modulo(10, 0);
+    const i64 __var_38 = 0;
+    if (!((__var_37 == __var_38))) {
+        std::cout << "./src/lib.mys:67: assert " << PrintString(mys::String(__var_37) + " == " + mys::String(__var_38)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_37) + " == " + mys::String(__var_38) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_modulo_zero("lib::modulo_zero", mys_test_modulo_zero);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_division_by_zero(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(61);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_39 = mys::test_traceback::lib::divide(10, 2);
+    const i64 __var_40 = 5;
+    if (!((__var_39 == __var_40))) {
+        std::cout << "./src/lib.mys:73: assert " << PrintString(mys::String(__var_39) + " == " + mys::String(__var_40)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_39) + " == " + mys::String(__var_40) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(62);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i64 __var_41 = mys::test_traceback::lib::divide(10, 0);
+    const i64 __var_42 = 5;
+    if (!((__var_41 == __var_42))) {
+        std::cout << "./src/lib.mys:74: assert " << PrintString(mys::String(__var_41) + " == " + mys::String(__var_42)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_41) + " == " + mys::String(__var_42) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_division_by_zero("lib::division_by_zero", mys_test_division_by_zero);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_destructor(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(63);
+    mys::shared_ptr<mys::test_traceback::lib::Desctuctor> desctuctor = mys::make_shared<mys::test_traceback::lib::Desctuctor>();
+    __MYS_TRACEBACK_SET(64);
+    mys::test_traceback::lib::function_that_raises();
+    __MYS_TRACEBACK_SET(65);
+    std::cout << desctuctor << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_destructor("lib::destructor", mys_test_destructor);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_does_not_rewrite_unchanged_files_lib_EARLY_HPP
+#define mys_test_transpile_does_not_rewrite_unchanged_files_lib_EARLY_HPP
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib
+{
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib
+{
+i32 add(i32 first, i32 second);
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_does_not_rewrite_unchanged_files_lib_HPP
+#define mys_test_transpile_does_not_rewrite_unchanged_files_lib_HPP
+#include "test_transpile_does_not_rewrite_unchanged_files/lib.mys.early.hpp"
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_does_not_rewrite_unchanged_files_main_EARLY_HPP
+#define mys_test_transpile_does_not_rewrite_unchanged_files_main_EARLY_HPP
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main
+{
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main
+{
+void foo(void);
+}
+#endif
\ No newline at end of file
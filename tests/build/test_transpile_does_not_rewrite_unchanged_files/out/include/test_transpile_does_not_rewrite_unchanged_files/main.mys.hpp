@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_does_not_rewrite_unchanged_files_main_HPP
+#define mys_test_transpile_does_not_rewrite_unchanged_files_main_HPP
+#include "test_transpile_does_not_rewrite_unchanged_files/main.mys.early.hpp"
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main
+{
+}
+#endif
\ No newline at end of file
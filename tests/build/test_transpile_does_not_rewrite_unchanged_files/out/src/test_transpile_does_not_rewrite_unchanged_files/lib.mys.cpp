@@ -0,0 +1,49 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "test_transpile_does_not_rewrite_unchanged_files/lib.mys.hpp"
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "add", 6, "return first + second" },
+    { "add", 9, "assert add(1, 2) == 3" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+i32 add(i32 first, i32 second)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    i32 __res_1 = (first + second);
+    __MYS_TRACEBACK_EXIT();
+    return __res_1;
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_add(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const i32 __var_2 = mys::test_transpile_does_not_rewrite_unchanged_files::lib::add(1, 2);
+    const i32 __var_3 = 3;
+    if (!((__var_2 == __var_3))) {
+        std::cout << "./src/lib.mys:9: assert " << PrintString(mys::String(__var_2) + " == " + mys::String(__var_3)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(mys::String(__var_2) + " == " + mys::String(__var_3) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_add("lib::add", mys_test_add);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,69 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "test_transpile_does_not_rewrite_unchanged_files/main.mys.hpp"
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib {
+extern void __module_init();
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::test_transpile_does_not_rewrite_unchanged_files::lib::__module_init();
+    mys::test_transpile_does_not_rewrite_unchanged_files::main::__module_init();
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::lib {
+extern void __module_exit();
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::test_transpile_does_not_rewrite_unchanged_files::lib::__module_exit();
+    mys::test_transpile_does_not_rewrite_unchanged_files::main::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::test_transpile_does_not_rewrite_unchanged_files::main
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "main", 2, "print(\"Hello, world!\")" },
+    { "foo", 5, "pass" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/main.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("Hello, world!");
+void main(int __argc, char * const __argv[])
+{
+    (void)__argc;
+    (void)__argv;
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+    std::cout << PrintString(__constant_1) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+void foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+
+    __MYS_TRACEBACK_EXIT();
+}
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/main.mys" << "\n";
+#endif
+}
+}
+void package_main(int argc, char * const argv[])
+{
+    mys::test_transpile_does_not_rewrite_unchanged_files::main::main(argc, argv);
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_in_daemon_lib_EARLY_HPP
+#define mys_test_transpile_in_daemon_lib_EARLY_HPP
+namespace mys::test_transpile_in_daemon::lib
+{
+}
+namespace mys::test_transpile_in_daemon::lib
+{
+i32 add(i32 first, i32 second);
+}
+#endif
\ No newline at end of file
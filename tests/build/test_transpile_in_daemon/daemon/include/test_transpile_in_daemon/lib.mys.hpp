@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_in_daemon_lib_HPP
+#define mys_test_transpile_in_daemon_lib_HPP
+#include "test_transpile_in_daemon/lib.mys.early.hpp"
+namespace mys::test_transpile_in_daemon::lib
+{
+}
+#endif
\ No newline at end of file
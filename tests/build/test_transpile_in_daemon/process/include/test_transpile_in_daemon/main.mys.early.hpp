@@ -0,0 +1,10 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_in_daemon_main_EARLY_HPP
+#define mys_test_transpile_in_daemon_main_EARLY_HPP
+namespace mys::test_transpile_in_daemon::main
+{
+}
+namespace mys::test_transpile_in_daemon::main
+{
+}
+#endif
\ No newline at end of file
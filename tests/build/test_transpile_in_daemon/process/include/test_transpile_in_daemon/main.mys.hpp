@@ -0,0 +1,8 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_transpile_in_daemon_main_HPP
+#define mys_test_transpile_in_daemon_main_HPP
+#include "test_transpile_in_daemon/main.mys.early.hpp"
+namespace mys::test_transpile_in_daemon::main
+{
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,19 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#ifndef mys_test_unsafe_lib_HPP
+#define mys_test_unsafe_lib_HPP
+#include "test_unsafe/lib.mys.early.hpp"
+namespace mys::test_unsafe::lib
+{
+class AccessFoo : public mys::Object {
+public:
+    mys::Bool member;
+    void foo(void);
+    AccessFoo(mys::Bool member);
+    virtual ~AccessFoo(void);
+    mys::String __str__(void);
+    mys::Bool __eq__(mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> other);
+    mys::Bool __lt__(mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> other);
+    i64 __hash__(void);
+};
+}
+#endif
\ No newline at end of file
@@ -0,0 +1,439 @@
+// This file was generated by mys. DO NOT EDIT!!!
+#include "mys.hpp"
+#include "test_unsafe/lib.mys.hpp"
+namespace mys::fiber::lib {
+extern void __module_init();
+}
+namespace mys::test_unsafe::lib {
+extern void __module_init();
+}
+void __application_init(void)
+{
+    mys::fiber::lib::__module_init();
+    mys::test_unsafe::lib::__module_init();
+}
+namespace mys::fiber::lib {
+extern void __module_exit();
+}
+namespace mys::test_unsafe::lib {
+extern void __module_exit();
+}
+void __application_exit(void)
+{
+    mys::fiber::lib::__module_exit();
+    mys::test_unsafe::lib::__module_exit();
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file.close();
+#endif
+}
+namespace mys::test_unsafe::lib
+{
+static mys::TracebackEntryInfo __traceback_entries_info[] = {
+    { "foo", 5, "pass" },
+    { "__init__", 1, "class AccessFoo:" },
+    { "__str__", 1, "class AccessFoo:" },
+    { "__eq__", 1, "class AccessFoo:" },
+    { "__eq__", 1, "class AccessFoo:" },
+    { "__eq__", 1, "class AccessFoo:" },
+    { "__lt__", 1, "class AccessFoo:" },
+    { "__lt__", 1, "class AccessFoo:" },
+    { "__lt__", 1, "class AccessFoo:" },
+    { "__hash__", 1, "class AccessFoo:" },
+    { "__hash__", 1, "class AccessFoo:" },
+    { "__hash__", 1, "class AccessFoo:" },
+    { "class_none_1", 8, "foo: AccessFoo? = None" },
+    { "class_none_1", 9, "assert foo is None" },
+    { "class_none_1", 10, "print(foo.member)" },
+    { "class_none_2", 13, "foo: AccessFoo? = None" },
+    { "class_none_2", 14, "foo.foo()" },
+    { "compare_lists_3", 17, "values: [bool]? = None" },
+    { "compare_lists_3", 19, "if values == [True]:" },
+    { "compare_lists_3", 20, "pass" },
+    { "add_lists", 23, "l1: [i64]? = [1]" },
+    { "add_lists", 24, "l2 = [2]" },
+    { "add_lists", 26, "assert l1 + l2 == [1, 2]" },
+    { "add_lists", 28, "l1 = None" },
+    { "add_lists", 30, "if l1 + l2 == [1, 2]:" },
+    { "add_lists", 31, "pass" },
+    { "list_acces_none", 34, "v: [bool]? = None" },
+    { "list_acces_none", 36, "print(v[0])" },
+    { "list_len_of_none", 39, "v: [u8]? = None" },
+    { "list_len_of_none", 41, "print(v.length())" },
+    { "compare_tuples_3", 44, "values: (bool, i64)? = None" },
+    { "compare_tuples_3", 46, "if values == (False, 1):" },
+    { "compare_tuples_3", 47, "pass" },
+    { "tuple_acces_none", 50, "v: (bool, i32)? = None" },
+    { "tuple_acces_none", 52, "print(v[1])" },
+    { "string_none", 55, "v: string? = None" },
+    { "string_none", 57, "assert v is None" },
+    { "string_none", 59, "v += \"1\"" },
+    { "string_len_of_none", 62, "v: string? = None" },
+    { "string_len_of_none", 64, "print(v.length())" },
+    { "compare_dicts_3", 67, "values: {bool: i64}? = None" },
+    { "compare_dicts_3", 69, "if values == {False: 1}:" },
+    { "compare_dicts_3", 70, "pass" },
+    { "dict_acces_none", 73, "v: {bool: i32}? = None" },
+    { "dict_acces_none", 75, "print(v[True])" },
+    { "dict_len_of_none", 78, "v: {u8: string}? = None" },
+    { "dict_len_of_none", 80, "print(v.length())" },
+    { "set_none", 83, "m: {string: i64}? = None" },
+    { "set_none", 85, "m[\"a\"] = 1" },
+    { "bytes_index", 90, "values = b\"x12x34x56\"" },
+    { "bytes_index", 91, "print(values[-100000])" },
+    { "list_pop_index", 94, "d = [1, 2, 3]" },
+    { "list_pop_index", 95, "d.pop(1000)" },
+    { "negative_list_index", 98, "values = [0, 2, 4, 6]" },
+    { "negative_list_index", 99, "print(values[-100000])" },
+    { "string_get_char_at_index", 102, "a = \"cactus\"" },
+    { "string_get_char_at_index", 103, "print(a[-100000])" }
+};
+static mys::TracebackModuleInfo __traceback_module_info = {
+   .path_p = "./src/lib.mys",
+   .entries_info_p = &__traceback_entries_info[0]
+};
+static const mys::String __constant_1 = mys::String("AccessFoo(");
+static const mys::String __constant_2 = mys::String("member=");
+static const mys::String __constant_3 = mys::String(")");
+static const mys::shared_ptr<mys::List<mys::Bool>> __constant_12 = mys::make_shared<mys::List<mys::Bool>>(std::initializer_list<mys::Bool>{mys::Bool(true)});
+static const mys::shared_ptr<mys::List<i64>> __constant_13 = mys::make_shared<mys::List<i64>>(std::initializer_list<i64>{1, 2});
+static const mys::shared_ptr<mys::Tuple<mys::Bool, i64>> __constant_16 = mys::make_shared<mys::Tuple<mys::Bool, i64>>(mys::Bool(false), 1);
+static const mys::String __constant_19 = mys::String("1");
+static const mys::shared_ptr<mys::Dict<mys::Bool, i64>> __constant_20 = mys::make_shared<Dict<mys::Bool, i64>>(std::initializer_list<std::pair<mys::Bool, i64>>{{mys::Bool(false), 1}});
+static const mys::String __constant_21 = mys::String("a");
+static const mys::String __constant_22 = mys::String("cactus");
+void AccessFoo::foo(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(0);
+
+    __MYS_TRACEBACK_EXIT();
+}
+AccessFoo::AccessFoo(mys::Bool member)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(1);
+    this->member = member;
+    __MYS_TRACEBACK_EXIT();
+}
+AccessFoo::~AccessFoo(void)
+{
+}
+mys::String AccessFoo::__str__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(2);
+    mys::String __res_4 = (__constant_1 + __constant_2 + mys::String(this->member) + __constant_3);
+    __MYS_TRACEBACK_EXIT();
+    return __res_4;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool AccessFoo::__eq__(mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(3);
+    if (!(mys::Bool(this->member == other->member))) {
+        __MYS_TRACEBACK_SET(4);
+        mys::Bool __res_5 = mys::Bool(false);
+        __MYS_TRACEBACK_EXIT();
+        return __res_5;
+    }
+    __MYS_TRACEBACK_SET(5);
+    mys::Bool __res_6 = mys::Bool(true);
+    __MYS_TRACEBACK_EXIT();
+    return __res_6;
+    __MYS_TRACEBACK_EXIT();
+}
+mys::Bool AccessFoo::__lt__(mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> other)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(6);
+    if (mys::Bool(this->member != other->member)) {
+        __MYS_TRACEBACK_SET(7);
+        mys::Bool __res_7 = mys::Bool(this->member < other->member);
+        __MYS_TRACEBACK_EXIT();
+        return __res_7;
+    }
+    __MYS_TRACEBACK_SET(8);
+    mys::Bool __res_8 = mys::Bool(false);
+    __MYS_TRACEBACK_EXIT();
+    return __res_8;
+    __MYS_TRACEBACK_EXIT();
+}
+i64 AccessFoo::__hash__(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(9);
+    i64 hash = 0;
+    __MYS_TRACEBACK_SET(10);
+    hash += std::hash<mys::Bool>{}(this->member);
+    __MYS_TRACEBACK_SET(11);
+    i64 __res_9 = hash;
+    __MYS_TRACEBACK_EXIT();
+    return __res_9;
+    __MYS_TRACEBACK_EXIT();
+}
+#if defined(MYS_TEST)
+static void mys_test_class_none_1(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(12);
+    mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> foo = nullptr;
+    __MYS_TRACEBACK_SET(13);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> __var_10 = foo;
+    const mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> __var_11 = nullptr;
+    if (!(is(__var_10, __var_11))) {
+        std::cout << "./src/lib.mys:9: assert " << PrintString(object_str(__var_10) + " is " + object_str(__var_11)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_10) + " is " + object_str(__var_11) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(14);
+    std::cout << foo->member << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_class_none_1("lib::class_none_1", mys_test_class_none_1);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_class_none_2(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(15);
+    mys::shared_ptr<mys::test_unsafe::lib::AccessFoo> foo = nullptr;
+    __MYS_TRACEBACK_SET(16);
+    foo->foo();
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_class_none_2("lib::class_none_2", mys_test_class_none_2);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_compare_lists_3(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(17);
+    mys::shared_ptr<mys::List<mys::Bool>> values = nullptr;
+    __MYS_TRACEBACK_SET(18);
+    if (mys::Bool(values == __constant_12)) {
+        __MYS_TRACEBACK_SET(19);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_compare_lists_3("lib::compare_lists_3", mys_test_compare_lists_3);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_add_lists(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(20);
+    mys::shared_ptr<mys::List<i64>> l1 = static_cast<mys::shared_ptr<mys::List<i64>>>(mys::make_shared<mys::List<i64>>(std::initializer_list<i64>{1}));
+    __MYS_TRACEBACK_SET(21);
+    mys::shared_ptr<mys::List<i64>> l2 = mys::make_shared<mys::List<i64>>(std::initializer_list<i64>{2});
+    __MYS_TRACEBACK_SET(22);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::shared_ptr<mys::List<i64>> __var_14 = (l1 + l2);
+    const mys::shared_ptr<mys::List<i64>> __var_15 = __constant_13;
+    if (!((__var_14 == __var_15))) {
+        std::cout << "./src/lib.mys:26: assert " << PrintString(object_str(__var_14) + " == " + object_str(__var_15)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(object_str(__var_14) + " == " + object_str(__var_15) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(23);
+    l1 = nullptr;
+    __MYS_TRACEBACK_SET(24);
+    if (mys::Bool((l1 + l2) == __constant_13)) {
+        __MYS_TRACEBACK_SET(25);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_add_lists("lib::add_lists", mys_test_add_lists);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_list_acces_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(26);
+    mys::shared_ptr<mys::List<mys::Bool>> v = nullptr;
+    __MYS_TRACEBACK_SET(27);
+    std::cout << v->get(0) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_list_acces_none("lib::list_acces_none", mys_test_list_acces_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_list_len_of_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(28);
+    mys::shared_ptr<mys::List<u8>> v = nullptr;
+    __MYS_TRACEBACK_SET(29);
+    std::cout << v->length() << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_list_len_of_none("lib::list_len_of_none", mys_test_list_len_of_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_compare_tuples_3(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(30);
+    mys::shared_ptr<mys::Tuple<mys::Bool, i64>> values = nullptr;
+    __MYS_TRACEBACK_SET(31);
+    if (mys::Bool(values == __constant_16)) {
+        __MYS_TRACEBACK_SET(32);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_compare_tuples_3("lib::compare_tuples_3", mys_test_compare_tuples_3);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_tuple_acces_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(33);
+    mys::shared_ptr<mys::Tuple<mys::Bool, i32>> v = nullptr;
+    __MYS_TRACEBACK_SET(34);
+    std::cout << std::get<1>(v->m_tuple) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_tuple_acces_none("lib::tuple_acces_none", mys_test_tuple_acces_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_string_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(35);
+    mys::String v = nullptr;
+    __MYS_TRACEBACK_SET(36);
+    #if defined(MYS_TEST) || !defined(NDEBUG)
+    const mys::String __var_17 = v;
+    const mys::String __var_18 = nullptr;
+    if (!(is(__var_17.m_string, __var_18.m_string))) {
+        std::cout << "./src/lib.mys:57: assert " << PrintString(string_with_quotes(__var_17) + " is " + string_with_quotes(__var_18)) << " is not true" << std::endl;
+        mys::make_shared<AssertionError>(string_with_quotes(__var_17) + " is " + string_with_quotes(__var_18) + " is not true")->__throw();
+    }
+    #endif
+    __MYS_TRACEBACK_SET(37);
+    mys::string_not_none(v) += __constant_19;
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_string_none("lib::string_none", mys_test_string_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_string_len_of_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(38);
+    mys::String v = nullptr;
+    __MYS_TRACEBACK_SET(39);
+    std::cout << mys::string_not_none(v).length() << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_string_len_of_none("lib::string_len_of_none", mys_test_string_len_of_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_compare_dicts_3(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(40);
+    mys::shared_ptr<mys::Dict<mys::Bool, i64>> values = nullptr;
+    __MYS_TRACEBACK_SET(41);
+    if (mys::Bool(values == __constant_20)) {
+        __MYS_TRACEBACK_SET(42);
+    }
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_compare_dicts_3("lib::compare_dicts_3", mys_test_compare_dicts_3);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_dict_acces_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(43);
+    mys::shared_ptr<mys::Dict<mys::Bool, i32>> v = nullptr;
+    __MYS_TRACEBACK_SET(44);
+    std::cout << (v)->get(mys::Bool(true)) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_dict_acces_none("lib::dict_acces_none", mys_test_dict_acces_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_dict_len_of_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(45);
+    mys::shared_ptr<mys::Dict<u8, mys::String>> v = nullptr;
+    __MYS_TRACEBACK_SET(46);
+    std::cout << v->length() << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_dict_len_of_none("lib::dict_len_of_none", mys_test_dict_len_of_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_set_none(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(47);
+    mys::shared_ptr<mys::Dict<mys::String, i64>> m = nullptr;
+    __MYS_TRACEBACK_SET(48);
+    m->__setitem__(__constant_21, 1);
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_set_none("lib::set_none", mys_test_set_none);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_bytes_index(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(49);
+    mys::Bytes values = Bytes({18, 52, 86});
+    __MYS_TRACEBACK_SET(50);
+    std::cout << (unsigned)mys::bytes_not_none(values).get(-(100000)) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_bytes_index("lib::bytes_index", mys_test_bytes_index);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_list_pop_index(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(51);
+    mys::shared_ptr<mys::List<i64>> d = mys::make_shared<mys::List<i64>>(std::initializer_list<i64>{1, 2, 3});
+    __MYS_TRACEBACK_SET(52);
+    d->pop(1000);
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_list_pop_index("lib::list_pop_index", mys_test_list_pop_index);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_negative_list_index(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(53);
+    mys::shared_ptr<mys::List<i64>> values = mys::make_shared<mys::List<i64>>(std::initializer_list<i64>{0, 2, 4, 6});
+    __MYS_TRACEBACK_SET(54);
+    std::cout << values->get(-(100000)) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_negative_list_index("lib::negative_list_index", mys_test_negative_list_index);
+#endif
+#if defined(MYS_TEST)
+static void mys_test_string_get_char_at_index(void)
+{
+    __MYS_TRACEBACK_ENTER();
+    __MYS_TRACEBACK_SET(55);
+    mys::String a = __constant_22;
+    __MYS_TRACEBACK_SET(56);
+    std::cout << PrintChar(mys::string_not_none(a).get(-(100000))) << "\n";
+    __MYS_TRACEBACK_EXIT();
+}
+static Test __mys_test_string_get_char_at_index("lib::string_get_char_at_index", mys_test_string_get_char_at_index);
+#endif
+void __module_init()
+{
+}
+void __module_exit()
+{
+#if defined(MYS_COVERAGE)
+    mys::mys_coverage_file << "File: ./src/lib.mys" << "\n";
+#endif
+}
+}
\ No newline at end of file
@@ -0,0 +1,95 @@
+import json
+import os
+
+from .utils import Path
+from .utils import TestCase
+from .utils import create_new_package
+from .utils import remove_ansi
+from .utils import remove_build_directory
+from .utils import run_mys_command
+from .utils import transpile_source
+
+
+class Test(TestCase):
+
+    def test_bench(self):
+        name = 'test_bench'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            with open('src/lib.mys', 'w') as fout:
+                fout.write('@bench\n'
+                           'func sum():\n'
+                           '    value = 0\n'
+                           '\n'
+                           '    for i in range(100):\n'
+                           '        value += i\n'
+                           '\n'
+                           '    assert value == 4950\n'
+                           '\n'
+                           '@bench\n'
+                           'func join():\n'
+                           '    assert ",".join(["a", "b"]) == "a,b"\n')
+
+            stdout, _ = run_mys_command(
+                ['bench', '--time', '0.01', '--json', 'bench.json', 'sum'],
+                path)
+
+            with open('bench.json') as fin:
+                results = json.load(fin)
+
+        self.assert_in(' ✔ lib::sum: ', remove_ansi(stdout))
+        self.assertEqual(len(results['benchmarks']), 1)
+        result = results['benchmarks'][0]
+        self.assertEqual(result['name'], 'lib::sum')
+        self.assertTrue(result['passed'])
+        self.assertGreaterEqual(result['samples'], 5)
+        self.assertGreaterEqual(result['iterations'], 1)
+        self.assertLessEqual(result['min_ns'], result['median_ns'])
+        self.assertLessEqual(result['median_ns'], result['p90_ns'])
+        self.assertLessEqual(result['p90_ns'], result['p99_ns'])
+        self.assertLessEqual(result['p99_ns'], result['max_ns'])
+
+    def test_bench_definition(self):
+        source = transpile_source('@bench\n'
+                                  'func foo():\n'
+                                  '    pass\n')
+
+        self.assert_in('#if defined(MYS_BENCH)\n'
+                       'static void mys_bench_foo(void)\n',
+                       source)
+        self.assert_in('static Bench __mys_bench_foo("lib::foo", mys_bench_foo);',
+                       source)
+
+    def test_bench_with_parameter(self):
+        self.assert_transpile_raises(
+            '@bench\n'
+            'func foo(v: bool):\n'
+            '    pass\n',
+            '  File "", line 2\n'
+            '    func foo(v: bool):\n'
+            '    ^\n'
+            "CompileError: benchmarks cannot have parameters\n")
+
+    def test_bench_with_return_value(self):
+        self.assert_transpile_raises(
+            '@bench\n'
+            'func foo() -> bool:\n'
+            '    return True\n',
+            '  File "", line 2\n'
+            '    func foo() -> bool:\n'
+            '    ^\n'
+            "CompileError: benchmarks cannot return any value\n")
+
+    def test_bench_with_other_decorator(self):
+        self.assert_transpile_raises(
+            '@bench\n'
+            '@raises(ValueError)\n'
+            'func foo():\n'
+            '    pass\n',
+            '  File "", line 3\n'
+            '    func foo():\n'
+            '    ^\n'
+            "CompileError: benchmarks cannot have other decorators\n")
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+
+from .utils import TestCase
+
+# Slow to import and not needed by all subcommands.
+SLOW_MODULES = [
+    'gql',
+    'mys.coverage',
+    'requests',
+    'yaspin',
+    'humanfriendly'
+]
+
+# Only needed by subcommands transpiling or parsing sources. Builds
+# import them when creating the Makefile.
+TRANSPILER_MODULES = [
+    'mys.transpiler',
+    'mys.parser',
+    'pygments'
+]
+
+
+def run_python(args):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.getcwd()
+
+    return subprocess.run([sys.executable] + args,
+                          capture_output=True,
+                          text=True,
+                          env=env,
+                          check=True)
+
+
+def imported_modules(subcommand):
+    """Returns all modules imported when creating the command line parser
+    for given subcommand.
+
+    """
+
+    proc = run_python([
+        '-c',
+        'import sys\n'
+        'from mys.cli import create_parser\n'
+        f'create_parser({subcommand!r})\n'
+        'print("\\n".join(sys.modules))\n'
+    ])
+
+    return proc.stdout.splitlines()
+
+
+class Test(TestCase):
+
+    def assert_no_slow_modules(self, modules, slow_modules=None):
+        if slow_modules is None:
+            slow_modules = SLOW_MODULES + TRANSPILER_MODULES
+
+        for module in modules:
+            for slow_module in slow_modules:
+                self.assertFalse(
+                    module == slow_module or module.startswith(slow_module + '.'),
+                    f"'{module}' should not be imported")
+
+    def test_transpile(self):
+        modules = imported_modules('transpile')
+
+        self.assert_no_slow_modules(modules, SLOW_MODULES)
+        self.assertIn('mys.cli.subparsers.transpile', modules)
+        self.assertNotIn('mys.cli.subparsers.build', modules)
+
+    def test_build(self):
+        modules = imported_modules('build')
+
+        self.assert_no_slow_modules(modules)
+        self.assertIn('mys.cli.subparsers.build', modules)
+        self.assertNotIn('mys.cli.subparsers.transpile', modules)
+
+    def test_other_subcommands(self):
+        for subcommand in ['new', 'run', 'test', 'bench', 'clean', 'deps', 'daemon']:
+            self.assert_no_slow_modules(imported_modules(subcommand))
+
+    def test_help(self):
+        self.assert_no_slow_modules(imported_modules('help'))
+
+    def test_all_subcommands(self):
+        modules = imported_modules(None)
+
+        self.assertIn('mys.cli.subparsers.transpile', modules)
+        self.assertIn('mys.cli.subparsers.list', modules)
@@ -1,6 +1,8 @@
+import json
 import os
 import shutil
 import subprocess
+import sys
 import tarfile
 from io import BytesIO
 from io import StringIO
@@ -9,6 +11,13 @@ from unittest.mock import call
 from unittest.mock import patch
 
 import mys.cli
+from mys.cli.fingerprint import create_key
+from mys.cli.fingerprint import find_input_paths
+from mys.cli.fingerprint import find_makefile_variables
+from mys.cli.mys_dir import MYS_DIR
+from mys.cli.run import Status
+from mys.cli.run import parse_status_line
+from mys.cli.utils import BuildConfig
 
 from .utils import Path
 from .utils import TestCase
@@ -419,3 +428,351 @@ class Test(TestCase):
                            'hello_world = "0.5.0"\n'
                            'dep2 = "0.1.0-rc10"\n',
                            stdout.getvalue())
+
+    def test_transpile_does_not_rewrite_unchanged_files(self):
+        name = 'test_transpile_does_not_rewrite_unchanged_files'
+        remove_build_directory(name)
+        create_new_package(name)
+        command = [
+            'mys', 'transpile',
+            '-n', name, '-v', '0.1.0', '-p', '.', '-s', 'no', '-m', 'no',
+            '-n', name, '-v', '0.1.0', '-p', '.', '-s', 'no', '-m', 'yes',
+            '-o', 'out',
+            'lib.mys', 'main.mys'
+        ]
+        lib_cpp = f'out/src/{name}/lib.mys.cpp'
+        main_cpp = f'out/src/{name}/main.mys.cpp'
+
+        with Path(f'tests/build/{name}'):
+            with patch('sys.argv', command):
+                mys.cli.main()
+
+            os.utime(lib_cpp, (0, 0))
+            os.utime(main_cpp, (0, 0))
+
+            with open('src/main.mys', 'a') as fout:
+                fout.write('\nfunc foo():\n    pass\n')
+
+            with patch('sys.argv', command):
+                mys.cli.main()
+
+            self.assertEqual(os.stat(lib_cpp).st_mtime, 0)
+            self.assertNotEqual(os.stat(main_cpp).st_mtime, 0)
+
+            # No temporary files are left behind.
+            self.assertEqual(sorted(os.listdir(f'out/src/{name}')),
+                             ['lib.mys.cpp', 'main.mys.cpp'])
+
+    def test_test_in_parallel_and_sharded(self):
+        name = 'test_test_in_parallel_and_sharded'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            with open('src/lib.mys', 'w') as fout:
+                for i in range(5):
+                    fout.write(f'test test_{i}():\n'
+                               f'    print("test {i}")\n')
+
+            stdout, _ = run_mys_command(
+                ['test', '-v', '-j', '2', '--shard', '2/2'],
+                path)
+
+        stdout = remove_ansi(stdout)
+        self.assert_in('test 1\n ✔ lib::test_1', stdout)
+        self.assert_in('test 3\n ✔ lib::test_3', stdout)
+        self.assertNotIn('test 0', stdout)
+        self.assert_in('Tests: 2 passed, 3 skipped, 5 total', stdout)
+
+    def test_test_invalid_shard(self):
+        with self.assertRaises(SystemExit):
+            with patch('sys.argv', ['mys', 'test', '--shard', '3/2']):
+                mys.cli.main()
+
+    def test_test_unity(self):
+        name = 'test_test_unity'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            # Same names in all modules, compiled in the same
+            # translation unit.
+            for module in ['lib', 'foo', 'bar']:
+                with open(f'src/{module}.mys', 'w') as fout:
+                    fout.write(f'NAME: string = "{module}"\n'
+                               'func name() -> string:\n'
+                               '    return NAME\n'
+                               'test name():\n'
+                               f'    assert name() == "{module}"\n')
+
+            stdout, _ = run_mys_command(['test', '-v', '--unity', '2'], path)
+
+            unity = ''
+
+            for index in range(2):
+                with open(f'build/debug/cpp/unity/{index}.mys.cpp') as fin:
+                    unity += fin.read()
+
+            self.assertFalse(os.path.exists('build/debug/cpp/unity/2.mys.cpp'))
+
+        for module in ['lib', 'foo', 'bar', 'main']:
+            self.assert_in(f'#include "../src/{name}/{module}.mys.cpp"', unity)
+
+        self.assert_in('Tests: 3 passed, 3 total', remove_ansi(stdout))
+
+    def test_build_pgo(self):
+        name = 'test_build_pgo'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            with open('src/lib.mys', 'a') as fout:
+                fout.write('\n'
+                           '@bench\n'
+                           'func add():\n'
+                           '    assert add(1, 2) == 3\n')
+
+            run_mys_command(['build', '--pgo'], path)
+            profiles = os.listdir('build/speed-pgo/pgo')
+            proc = subprocess.run(['build/speed-pgo/app'],
+                                  capture_output=True,
+                                  text=True,
+                                  check=True)
+
+        self.assertTrue(any(profile.endswith('lib.mys.gcda')
+                            or profile.endswith('.profdata')
+                            for profile in profiles))
+        self.assertEqual(proc.stdout, 'Hello, world!\n')
+
+    def test_build_pgo_without_benchmarks(self):
+        name = 'test_build_pgo_without_benchmarks'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            stdout, _ = run_mys_command(['build', '--pgo'], path)
+            self.assert_in('Training with tests', remove_ansi(stdout))
+
+            # No benchmarks or tests to train with.
+            with open('src/lib.mys', 'w') as fout:
+                fout.write('func add(first: i32, second: i32) -> i32:\n'
+                           '    return first + second\n')
+
+            with self.assertRaises(SystemExit):
+                with patch('sys.argv', ['mys', 'build', '--pgo']):
+                    mys.cli.main()
+
+    def test_build_timings(self):
+        name = 'test_build_timings'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            stdout, _ = run_mys_command(['build', '--timings'], path)
+
+        stdout = remove_ansi(stdout)
+        self.assert_in('Timings:', stdout)
+        self.assertRegex(stdout, rf' s  Transpiling {name}.lib\n')
+        self.assertRegex(stdout, rf' s  Compiling build/speed/cpp/src/{name}/lib.mys.cpp\n')
+        self.assertRegex(stdout, r' s  Linking build/speed/app\n')
+        self.assertRegex(stdout, r' s  Compiling in total\n')
+
+    def test_status_is_read_incrementally(self):
+        name = 'test_status_is_read_incrementally'
+        remove_build_directory(name)
+        os.makedirs(f'tests/build/{name}')
+        status_path = f'tests/build/{name}/status.txt'
+        timings = []
+        status = Status(status_path, timings)
+
+        # No status file yet.
+        status.update()
+        self.assertEqual(status.get('Building'), 'Building')
+
+        with open(status_path, 'w') as fout:
+            fout.write('> 100.5 Compiling a.cpp\n'
+                       '> 100.75 Compiling b.cpp\n'
+                       '< 102.0 Compil')
+            fout.flush()
+            status.update()
+            self.assertEqual(status.get('Building'), 'Compiling b.cpp (2 ongoing)')
+            self.assertEqual(timings, [])
+            fout.write('ing a.cpp\n')
+            fout.flush()
+            status.update()
+            self.assertEqual(status.get('Building'), 'Compiling b.cpp')
+            self.assertEqual(timings, [('Compiling a.cpp', 100.5, 102.0)])
+            fout.write('< 103.25 Compiling b.cpp\n')
+            fout.flush()
+            status.update()
+            self.assertEqual(status.get('Building'), 'Building')
+            self.assertEqual(timings,
+                             [
+                                 ('Compiling a.cpp', 100.5, 102.0),
+                                 ('Compiling b.cpp', 100.75, 103.25)
+                             ])
+
+    def test_parse_status_line(self):
+        self.assertEqual(parse_status_line('> 1700000000.123456 Linking app', 5.0),
+                         ('>', 1700000000.123456, 'Linking app'))
+        self.assertEqual(parse_status_line('< Linking app', 5.0),
+                         ('<', 5.0, 'Linking app'))
+
+    def test_build_trace(self):
+        name = 'test_build_trace'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            run_mys_command(['build', '--trace', 'trace.json'], path)
+
+            with open('trace.json') as fin:
+                trace = json.load(fin)
+
+        events = {
+            (event['name'], event.get('cat'))
+            for event in trace['traceEvents']
+        }
+
+        for event in [
+                ('Downloading dependencies', 'download'),
+                (f'Parsing {name}.lib', 'parsing'),
+                ('Definitions', 'interface'),
+                (f'Transpiling {name}.lib', 'transpiling'),
+                ('Parse', 'transpile'),
+                ('Class transform', 'transpile'),
+                ('Definitions', 'transpile'),
+                ('Code generation', 'transpile'),
+                ('Specialization', 'transpile'),
+                (f'Compiling build/speed/cpp/src/{name}/lib.mys.cpp', 'compiling'),
+                ('Linking build/speed/app', 'linking')
+        ]:
+            self.assertIn(event, events)
+
+        # Build steps are timed when they run, not when the status file
+        # is read, so no two start at the same time.
+        steps = [
+            event
+            for event in trace['traceEvents']
+            if event.get('cat') in ['parsing', 'transpiling', 'compiling']
+        ]
+        start_times = [event['ts'] for event in steps]
+        self.assertEqual(len(set(start_times)), len(start_times))
+
+        for event in steps:
+            self.assertGreater(event['dur'], 0)
+
+        self.assertNotIn('MYS_TRACE_DIRECTORY', os.environ)
+
+    def test_build_runtime_libraries_are_shared(self):
+        name = 'test_build_runtime_libraries_are_shared'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            run_mys_command(['build'], path)
+            stdout, _ = run_mys_command(['build', '--unsafe'], path)
+            self.assert_not_in('Building pcre2', stdout)
+            self.assert_not_in('Building uv', stdout)
+            self.assertFalse(os.path.exists('build/speed/pcre2'))
+            self.assertFalse(os.path.exists('build/speed-unsafe/uv'))
+
+    def test_build_up_to_date(self):
+        name = 'test_build_up_to_date'
+        remove_build_directory(name)
+        create_new_package(name)
+        path = os.getcwd()
+
+        with Path(f'tests/build/{name}'):
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_not_in('up to date', stdout)
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_in('Building (up to date)', remove_ansi(stdout))
+            self.assert_not_in('Reading package configuration', stdout)
+
+            # Checking that the build is up to date does not import the
+            # transpiler, as that is slow.
+            proc = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-m', 'mys', 'build'],
+                capture_output=True,
+                text=True,
+                env=os.environ,
+                check=True)
+            self.assert_in('up to date', proc.stdout)
+
+            for module in ['mys.transpiler', 'mys.parser', 'pygments']:
+                self.assertNotRegex(proc.stderr, rf'\| +{module}\n')
+
+            # Other build configuration.
+            stdout, _ = run_mys_command(['build', '--unsafe'], path)
+            self.assert_not_in('up to date', stdout)
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_in('up to date', stdout)
+
+            # Added source file.
+            with open('src/foo.mys', 'w') as fout:
+                fout.write('func foo():\n'
+                           '    pass\n')
+
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_not_in('up to date', stdout)
+
+            # Modified source file.
+            with open('src/foo.mys', 'a') as fout:
+                fout.write('\n')
+
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_not_in('up to date', stdout)
+
+            # Removed application.
+            os.remove('build/speed/app')
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_not_in('up to date', stdout)
+            self.assertTrue(os.path.exists('build/speed/app'))
+
+            # Changed variable read by the Makefile.
+            stdout, _ = run_mys_command(['build'], path)
+            self.assert_in('up to date', stdout)
+
+            with patch.dict(os.environ, {'LDFLAGS_EXTRA': '-Wl,--as-needed'}):
+                stdout, _ = run_mys_command(['build'], path)
+                self.assert_not_in('up to date', stdout)
+                stdout, _ = run_mys_command(['build'], path)
+                self.assert_in('up to date', stdout)
+
+            # Any variable read by the Makefile.
+            variables = find_makefile_variables('build/speed/Makefile')
+
+            for name in ['CFLAGS_EXTRA', 'LDFLAGS_EXTRA', 'MYS', 'FIBER_THREADS']:
+                self.assertIn(name, variables)
+
+            for name in ['BUILD', 'LIB', 'MYS_DIR']:
+                self.assertNotIn(name, variables)
+
+            build_config = BuildConfig(False, False, 'speed', False, True,
+                                       False, False, 1, '', False, False)
+            key = create_key(build_config, 'build/speed')
+
+            for name in variables:
+                with patch.dict(os.environ, {name: 'changed'}):
+                    self.assertNotEqual(create_key(build_config, 'build/speed'),
+                                        key,
+                                        name)
+
+    def test_build_fingerprint_inputs(self):
+        # The build depends on the mys installation, not only on the
+        # runtime library.
+        paths = find_input_paths([])
+
+        for path in ['lib/mys.cpp',
+                     'transpiler/__init__.py',
+                     'cli/utils.py',
+                     'cli/templates/build/Makefile']:
+            self.assertIn(os.path.join(MYS_DIR, path), paths)
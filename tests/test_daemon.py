@@ -0,0 +1,150 @@
+import os
+import socket
+import subprocess
+import sys
+from unittest.mock import patch
+
+from mys.cli.daemon import DAEMON_CLIENT
+from mys.cli.daemon import is_daemon_running
+from mys.cli.daemon import is_peer_allowed
+from mys.cli.utils import BuildConfig
+from mys.cli.utils import create_makefile
+from mys.cli.utils import read_package_configuration
+
+from .utils import Path
+from .utils import TestCase
+from .utils import create_new_package
+from .utils import read_file
+from .utils import remove_build_directory
+
+
+class Test(TestCase):
+
+    def start_daemon(self, env, socket_path):
+        daemon = subprocess.Popen([sys.executable, '-m', 'mys', 'daemon'],
+                                  stdout=subprocess.PIPE,
+                                  text=True,
+                                  env=env)
+        self.assertEqual(daemon.stdout.readline(),
+                         f'Serving on {socket_path}.\n')
+        self.assertTrue(is_daemon_running(socket_path))
+
+        return daemon
+
+    def run_client(self, env, socket_path, command):
+        return subprocess.run(
+            [sys.executable, '-S', DAEMON_CLIENT, socket_path] + command,
+            capture_output=True,
+            text=True,
+            env=env)
+
+    def test_transpile_in_daemon(self):
+        name = 'test_transpile_in_daemon'
+        remove_build_directory(name)
+        create_new_package(name)
+        socket_path = os.path.abspath(f'tests/build/{name}/daemon.sock')
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.getcwd()
+        env['MYS_DAEMON_SOCKET'] = socket_path
+        transpile = [
+            'transpile',
+            '-n', name, '-v', '0.1.0', '-p', '.', '-s', 'no', '-m', 'no',
+            '-n', name, '-v', '0.1.0', '-p', '.', '-s', 'no', '-m', 'yes'
+        ]
+
+        with Path(f'tests/build/{name}'):
+            daemon = self.start_daemon(env, socket_path)
+
+            try:
+                # Same output as when transpiling in a new process.
+                proc = self.run_client(env,
+                                       socket_path,
+                                       transpile + ['-o', 'daemon',
+                                                    'lib.mys', 'main.mys'])
+                self.assertEqual(proc.returncode, 0, proc.stderr)
+                subprocess.run([sys.executable, '-m', 'mys']
+                               + transpile
+                               + ['-o', 'process', 'lib.mys', 'main.mys'],
+                               check=True,
+                               env=env)
+
+                for path in [f'src/{name}/lib.mys.cpp',
+                             f'src/{name}/main.mys.cpp',
+                             f'include/{name}/lib.mys.hpp']:
+                    self.assertEqual(read_file(f'daemon/{path}'),
+                                     read_file(f'process/{path}'))
+
+                # Errors are written to the client's standard error.
+                with open('src/lib.mys', 'a') as fout:
+                    fout.write('func foo(:\n')
+
+                proc = self.run_client(env,
+                                       socket_path,
+                                       transpile + ['-o', 'daemon',
+                                                    'lib.mys', 'main.mys'])
+                self.assertEqual(proc.returncode, 1)
+                self.assertIn('SyntaxError', proc.stderr)
+
+                # Only transpile commands are run by the daemon.
+                proc = self.run_client(env, socket_path, ['build'])
+                self.assertEqual(proc.returncode, 1)
+                self.assertEqual(
+                    proc.stderr,
+                    'error: the mys daemon only runs transpile commands\n')
+                self.assertFalse(os.path.exists('build'))
+
+                # Only the user running the daemon may connect to it.
+                self.assertEqual(os.stat(socket_path).st_mode & 0o077, 0)
+
+                subprocess.run([sys.executable, '-m', 'mys', 'daemon', '--stop'],
+                               check=True,
+                               env=env)
+                daemon.wait(10)
+            finally:
+                daemon.kill()
+                daemon.stdout.close()
+
+            self.assertFalse(is_daemon_running(socket_path))
+
+            # Commands are run in a new process when the daemon is not
+            # running.
+            proc = self.run_client(env, socket_path, ['--version'])
+            self.assertEqual(proc.returncode, 0)
+            self.assertRegex(proc.stdout, r'^\d+\.\d+\.\d+')
+
+    def test_peer_of_same_user_is_allowed(self):
+        client, server = socket.socketpair(socket.AF_UNIX)
+
+        try:
+            self.assertTrue(is_peer_allowed(server))
+        finally:
+            client.close()
+            server.close()
+
+    def test_makefile_uses_daemon_client(self):
+        name = 'test_makefile_uses_daemon_client'
+        remove_build_directory(name)
+        create_new_package(name)
+        socket_path = os.path.abspath(f'tests/build/{name}/daemon.sock')
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.getcwd()
+        env['MYS_DAEMON_SOCKET'] = socket_path
+
+        with Path(f'tests/build/{name}'):
+            daemon = self.start_daemon(env, socket_path)
+
+            try:
+                with patch.dict(os.environ, {'MYS_DAEMON_SOCKET': socket_path}):
+                    create_makefile(read_package_configuration(),
+                                    [],
+                                    BuildConfig(False, False, 'debug', False,
+                                                True, False, False, 1, '',
+                                                False, False))
+
+                makefile = read_file('build/debug/Makefile')
+            finally:
+                daemon.kill()
+                daemon.wait()
+                daemon.stdout.close()
+
+        self.assertIn(f'-S {DAEMON_CLIENT} {socket_path}\n', makefile)
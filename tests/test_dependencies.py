@@ -1,7 +1,18 @@
+import io
+import os
 import shutil
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path as PathlibPath
 from unittest.mock import patch
 
+import toml
+
 import mys.cli
+from mys.cli import packages_finder
+from mys.cli.package_config import PackageConfig
 
 from .utils import Path
 from .utils import TestCase
@@ -10,6 +21,68 @@ from .utils import read_file
 from .utils import remove_build_directory
 
 
+def create_archive(name, version, dependencies):
+    """Returns a package archive as created by mys publish.
+
+    """
+
+    config = '\n'.join([
+        '[package]',
+        f'name = "{name}"',
+        f'version = "{version}"',
+        'authors = ["Test Er <test.er@mys.com>"]',
+        '',
+        '[dependencies]'
+    ] + [f'{dependency} = "latest"' for dependency in dependencies]) + '\n'
+    data = config.encode('utf-8')
+    info = tarfile.TarInfo(f'{name}-{version}/package.toml')
+    info.size = len(data)
+    archive = io.BytesIO()
+
+    with tarfile.open(fileobj=archive, mode='w:gz') as fout:
+        fout.addfile(info, io.BytesIO(data))
+
+    return archive.getvalue()
+
+
+class Registry(ThreadingHTTPServer):
+    """Serves package archives like the package registry.
+
+    """
+
+    def __init__(self, archives):
+        super().__init__(('127.0.0.1', 0), RegistryRequestHandler)
+        self.archives = archives
+        self.requested_paths = []
+        self.url = f'http://127.0.0.1:{self.server_address[1]}'
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
+
+
+class RegistryRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.server.requested_paths.append(self.path)
+        archive = self.server.archives.get(self.path)
+
+        if archive is None:
+            self.send_response(404)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(archive)))
+            self.end_headers()
+            self.wfile.write(archive)
+
+    def log_message(self, *args):
+        pass
+
+
 class Test(TestCase):
 
     def assert_files_equal(self, actual, expected):
@@ -91,3 +164,184 @@ class Test(TestCase):
             with patch('sys.argv', ['mys', 'test']):
                 with self.assertRaises(SystemExit):
                     mys.cli.main()
+
+    def test_download_dependencies_from_registry(self):
+        name = 'test_download_dependencies_from_registry'
+        remove_build_directory(name)
+        cache_directory = PathlibPath(f'tests/build/{name}/cache').absolute()
+        registry = Registry({
+            '/package/alpha-0.1.0.tar.gz': create_archive('alpha',
+                                                          '0.1.0',
+                                                          ['beta', 'gamma']),
+            '/package/beta-latest.tar.gz': create_archive('beta', '0.2.0', ['gamma']),
+            '/package/gamma-latest.tar.gz': create_archive('gamma', '1.0.0', [])
+        })
+
+        try:
+            with patch.object(packages_finder,
+                              'DOWNLOADS_CACHE_DIRECTORY',
+                              cache_directory):
+                for package in ['foo', 'bar']:
+                    os.makedirs(f'tests/build/{name}/{package}')
+
+                    with Path(f'tests/build/{name}/{package}'):
+                        with open('package.toml', 'w') as fout:
+                            fout.write('[package]\n'
+                                       f'name = "{package}"\n'
+                                       'version = "0.1.0"\n'
+                                       'authors = ["Test Er <test.er@mys.com>"]\n'
+                                       '\n'
+                                       '[dependencies]\n'
+                                       'alpha = "0.1.0"\n')
+
+                        os.makedirs(packages_finder.DOWNLOAD_DIRECTORY)
+                        configs = packages_finder.download_dependencies(
+                            PackageConfig('.', None),
+                            registry.url,
+                            False)
+
+                        self.assertEqual(
+                            [
+                                (config.name, config.version, config.from_version)
+                                for config in configs
+                                if config.name != 'fiber'
+                            ],
+                            [
+                                ('alpha', '0.1.0', '0.1.0'),
+                                ('beta', '0.2.0', 'latest'),
+                                ('gamma', '1.0.0', 'latest')
+                            ])
+
+                        # Links to the extracted archives in the cache.
+                        for directory in ['alpha-0.1.0',
+                                          'beta-latest',
+                                          'gamma-latest']:
+                            path = f'build/dependencies/{directory}'
+                            self.assertTrue(os.path.islink(path))
+                            self.assertTrue(
+                                os.readlink(path).startswith(str(cache_directory)))
+        finally:
+            registry.stop()
+
+        # Each archive is only downloaded once, for the first package.
+        self.assertEqual(sorted(registry.requested_paths),
+                         [
+                             '/package/alpha-0.1.0.tar.gz',
+                             '/package/beta-latest.tar.gz',
+                             '/package/gamma-latest.tar.gz'
+                         ])
+        self.assertEqual(len(os.listdir(cache_directory / 'extracted')), 3)
+
+        # Archives are written to temporary files that are renamed into
+        # place, so none are left behind.
+        self.assertEqual(sorted(os.listdir(cache_directory)),
+                         [
+                             'alpha-0.1.0.tar.gz',
+                             'beta-latest.tar.gz',
+                             'extracted',
+                             'gamma-latest.tar.gz'
+                         ])
+
+    def test_package_lock(self):
+        name = 'test_package_lock'
+        remove_build_directory(name)
+        cache_directory = PathlibPath(f'tests/build/{name}/cache').absolute()
+        beta_0_2_0 = create_archive('beta', '0.2.0', [])
+        registry = Registry({
+            '/package/alpha-0.1.0.tar.gz': create_archive('alpha', '0.1.0', ['beta']),
+            '/package/beta-latest.tar.gz': beta_0_2_0,
+            '/package/beta-0.2.0.tar.gz': beta_0_2_0
+        })
+        os.makedirs(f'tests/build/{name}/foo')
+
+        def find_versions():
+            configs = packages_finder.download_dependencies(PackageConfig('.', None),
+                                                            registry.url,
+                                                            False)
+
+            return [
+                (config.name, config.version)
+                for config in configs
+                if config.name != 'fiber'
+            ]
+
+        try:
+            with patch.object(packages_finder,
+                              'DOWNLOADS_CACHE_DIRECTORY',
+                              cache_directory):
+                with Path(f'tests/build/{name}/foo'):
+                    with open('package.toml', 'w') as fout:
+                        fout.write('[package]\n'
+                                   'name = "foo"\n'
+                                   'version = "0.1.0"\n'
+                                   'authors = ["Test Er <test.er@mys.com>"]\n'
+                                   '\n'
+                                   '[dependencies]\n'
+                                   'alpha = "0.1.0"\n')
+
+                    with patch('sys.argv',
+                               ['mys', 'deps', '--lock', '--url', registry.url]):
+                        mys.cli.main()
+
+                    lock = toml.loads(read_file('package.lock'))
+                    self.assertEqual(lock['dependencies'], {'alpha': '0.1.0'})
+                    self.assertEqual(
+                        [
+                            (package['name'],
+                             package['from-version'],
+                             package['version'],
+                             package['dependencies'])
+                            for package in lock['package']
+                        ],
+                        [
+                            ('alpha', '0.1.0', '0.1.0', ['beta']),
+                            ('beta', 'latest', '0.2.0', [])
+                        ])
+                    self.assertEqual(len(registry.requested_paths), 2)
+
+                    # A new beta version is released, but the locked
+                    # version is still used.
+                    registry.archives['/package/beta-latest.tar.gz'] = (
+                        create_archive('beta', '0.3.0', []))
+                    shutil.rmtree('build')
+                    os.makedirs(packages_finder.DOWNLOAD_DIRECTORY)
+                    self.assertEqual(find_versions(),
+                                     [('alpha', '0.1.0'), ('beta', '0.2.0')])
+                    self.assertEqual(len(registry.requested_paths), 2)
+
+                    # The exact locked version is downloaded if not in
+                    # the cache.
+                    shutil.rmtree(cache_directory)
+                    shutil.rmtree('build')
+                    os.makedirs(packages_finder.DOWNLOAD_DIRECTORY)
+                    self.assertEqual(find_versions(),
+                                     [('alpha', '0.1.0'), ('beta', '0.2.0')])
+                    self.assertEqual(registry.requested_paths[2:],
+                                     [
+                                         '/package/alpha-0.1.0.tar.gz',
+                                         '/package/beta-0.2.0.tar.gz'
+                                     ])
+
+                    # The lock is not used once dependencies are
+                    # changed.
+                    with open('package.toml', 'a') as fout:
+                        fout.write('gamma = { path = "../gamma" }\n')
+
+                    os.makedirs('../gamma')
+
+                    with open('../gamma/package.toml', 'w') as fout:
+                        fout.write('[package]\n'
+                                   'name = "gamma"\n'
+                                   'version = "1.0.0"\n'
+                                   'authors = ["Test Er <test.er@mys.com>"]\n')
+
+                    shutil.rmtree('build')
+                    os.makedirs(packages_finder.DOWNLOAD_DIRECTORY)
+                    self.assertEqual(find_versions(),
+                                     [
+                                         ('gamma', '1.0.0'),
+                                         ('alpha', '0.1.0'),
+                                         ('beta', '0.3.0')
+                                     ])
+        finally:
+            registry.stop()
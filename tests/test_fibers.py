@@ -1,3 +1,6 @@
+import os
+from unittest.mock import patch
+
 from .utils import TestCase
 from .utils import build_and_test_module
 
@@ -6,3 +9,7 @@ class Test(TestCase):
 
     def test_fibers(self):
         build_and_test_module('fibers')
+
+    def test_fiber_threads(self):
+        with patch.dict(os.environ, {'FIBER_THREADS': 'yes'}):
+            build_and_test_module('fiber_threads')
@@ -1,4 +1,5 @@
 import os
+import select
 import subprocess
 import sys
 
@@ -6,8 +7,10 @@ from mys.transpiler import TranspilerError
 
 from .utils import Path
 from .utils import TestCase
+from .utils import create_new_package
 from .utils import create_new_package_with_files
 from .utils import remove_ansi
+from .utils import run_mys_command
 from .utils import transpile_source
 
 
@@ -70,6 +73,8 @@ class Test(TestCase):
                 'Age: 10\n'
                 'MyError(a=True, b="g")\n'
                 '[1, 4, 3]\n'
+                'Linköping € €\n'
+                + 'ö' * 3000 + '\n'
                 'END\n',
                 output)
             self.assertTrue(('{1: 2, 3: 4}\n' in output)
@@ -79,6 +84,60 @@ class Test(TestCase):
             self.assertTrue(('{7: 49, 1: 1}\n' in output)
                             or ('{1: 1, 7: 49}\n' in output))
 
+            outputs = []
+
+            for mode in ['', 'line', 'full']:
+                proc = subprocess.run(['build/speed/app'],
+                                      input="Lobster #1\n10\n",
+                                      capture_output=True,
+                                      text=True,
+                                      env={'MYS_STDOUT_BUFFERING': mode})
+                outputs.append(proc.stdout)
+
+            self.assertIn(outputs[0], output)
+            self.assertEqual(outputs[1], outputs[0])
+            self.assertEqual(outputs[2], outputs[0])
+
+    def test_stdout_buffering(self):
+        package_name = 'test_stdout_buffering'
+        create_new_package(package_name)
+        path = os.getcwd()
+
+        with Path('tests/build/' + package_name):
+            with open('src/main.mys', 'w') as fout:
+                fout.write('from fiber import sleep\n'
+                           '\n'
+                           'func main():\n'
+                           '    print("Hello!")\n'
+                           '    sleep(30.0)\n')
+
+            run_mys_command(['build'], path)
+
+            def is_line_readable_before_exit(env):
+                proc = subprocess.Popen(['build/speed/app'],
+                                        stdout=subprocess.PIPE,
+                                        text=True,
+                                        env=env)
+
+                try:
+                    readable, _, _ = select.select([proc.stdout], [], [], 2)
+
+                    if readable:
+                        self.assertEqual(proc.stdout.readline(), 'Hello!\n')
+                        self.assertIsNone(proc.poll())
+
+                    return bool(readable)
+                finally:
+                    proc.kill()
+                    proc.communicate()
+
+            # Fully buffered when piped by default.
+            self.assertFalse(is_line_readable_before_exit({}))
+            self.assertFalse(
+                is_line_readable_before_exit({'MYS_STDOUT_BUFFERING': 'full'}))
+            self.assertTrue(
+                is_line_readable_before_exit({'MYS_STDOUT_BUFFERING': 'line'}))
+
     def test_basic_print_function(self):
         source = transpile_source('func main():\n'
                                   '    print(1)\n',
@@ -79,3 +79,17 @@ class Test(TestCase):
             '    print(er"b")\n'
             "            ^\n"
             'SyntaxError: invalid syntax\n')
+
+    def test_regex_literal_compiled_once(self):
+        source = transpile_source('func foo(value: string) -> bool:\n'
+                                  '    return value.match(re"a+"i) is not None\n')
+
+        self.assert_in('static const Regex& __constant_1()\n'
+                       '{\n'
+                       '    static const Regex regex(mys::String("a+"), '
+                       'mys::String("i"));\n'
+                       '\n'
+                       '    return regex;\n'
+                       '}\n',
+                       source)
+        self.assert_in('.match(__constant_1())', source)
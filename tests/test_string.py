@@ -1,5 +1,6 @@
 from .utils import TestCase
 from .utils import build_and_test_module
+from .utils import transpile_source
 
 
 class Test(TestCase):
@@ -88,3 +89,18 @@ class Test(TestCase):
             '        print(+"hi")\n'
             '              ^\n'
             "CompileError: unary '+' can only operate on numbers\n")
+
+    def test_string_literal_created_once(self):
+        source = transpile_source('func foo():\n'
+                                  '    for i in range(10):\n'
+                                  '        print("hi", "hi")\n')
+
+        self.assert_in(
+            'static const mys::String __constant_4 = mys::String("hi");\n'
+            'static const mys::String __constant_5 = mys::String("hi");\n',
+            source)
+        self.assert_in(
+            'std::cout << PrintString(__constant_4) << " " '
+            '<< PrintString(__constant_5) << "\\n";',
+            source)
+        self.assertEqual(source.count('mys::String("hi")'), 2)
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+import mys.transpiler
+from mys.transpiler import Source
+from mys.transpiler import create_interface
+from mys.transpiler import transpile
+from mys.transpiler.cache import make_module_key
+from mys.transpiler.cache import read_interface
+from mys.transpiler.cache import write_interface
+
+from .utils import TestCase
+from .utils import remove_build_directory
+
+LIB_SOURCE = '''\
+@generic(T)
+func add(a: T, b: T) -> T:
+    return a + b
+
+func lib_value() -> i64:
+    return {lib_value}
+'''
+
+MOD_SOURCE = '''\
+from foo import add
+from foo import lib_value
+
+func mod_value() -> i64:
+    x = add[{add_type}]({add_type}(1), {add_type}(2))
+
+    return lib_value()
+'''
+
+MAIN_SOURCE = '''\
+from foo.mod import mod_value
+
+func main():
+    print(mod_value() + {main_value})
+'''
+
+
+def create_sources(lib_value=1, add_type='i64', main_value=1):
+    return [
+        Source(LIB_SOURCE.format(lib_value=lib_value),
+               module='foo.lib',
+               module_hpp='foo/lib.mys.hpp',
+               mys_path='foo/src/lib.mys'),
+        Source(MOD_SOURCE.format(add_type=add_type),
+               module='foo.mod',
+               module_hpp='foo/mod.mys.hpp',
+               mys_path='foo/src/mod.mys'),
+        Source(MAIN_SOURCE.format(main_value=main_value),
+               module='foo.main',
+               module_hpp='foo/main.mys.hpp',
+               mys_path='foo/src/main.mys',
+               has_main=True)
+    ]
+
+
+class Test(TestCase):
+
+    def assert_cached_transpile(self, cache_directory, expected_visited, **kwargs):
+        visited = []
+        transpile_file = mys.transpiler.transpile_file
+
+        def transpile_file_wrapper(tree, source_lines, filename, *args):
+            visited.append(filename)
+
+            return transpile_file(tree, source_lines, filename, *args)
+
+        with patch('mys.transpiler.transpile_file', transpile_file_wrapper):
+            generated = transpile(create_sources(**kwargs),
+                                  cache_directory=cache_directory)
+
+        self.assertEqual(sorted(visited), sorted(expected_visited))
+        self.assertEqual(generated, transpile(create_sources(**kwargs)))
+
+    def test_only_changed_modules_are_transpiled(self):
+        name = 'test_only_changed_modules_are_transpiled'
+        remove_build_directory(name)
+        cache_directory = f'tests/build/{name}'
+
+        self.assert_cached_transpile(cache_directory,
+                                     [
+                                         'foo/src/lib.mys',
+                                         'foo/src/mod.mys',
+                                         'foo/src/main.mys'
+                                     ])
+        self.assert_cached_transpile(cache_directory, [])
+        self.assert_cached_transpile(cache_directory,
+                                     ['foo/src/main.mys'],
+                                     main_value=2)
+
+    def test_changed_generic_function_owner(self):
+        name = 'test_changed_generic_function_owner'
+        remove_build_directory(name)
+        cache_directory = f'tests/build/{name}'
+
+        self.assert_cached_transpile(cache_directory,
+                                     [
+                                         'foo/src/lib.mys',
+                                         'foo/src/mod.mys',
+                                         'foo/src/main.mys'
+                                     ])
+        # The module calling add[i64]() is transpiled as well to
+        # specialize it in lib.
+        self.assert_cached_transpile(cache_directory,
+                                     ['foo/src/lib.mys', 'foo/src/mod.mys'],
+                                     lib_value=2)
+
+    def test_changed_specialization(self):
+        name = 'test_changed_specialization'
+        remove_build_directory(name)
+        cache_directory = f'tests/build/{name}'
+
+        self.assert_cached_transpile(cache_directory,
+                                     [
+                                         'foo/src/lib.mys',
+                                         'foo/src/mod.mys',
+                                         'foo/src/main.mys'
+                                     ])
+        # lib has to be transpiled again to add add[u8]().
+        self.assert_cached_transpile(cache_directory,
+                                     ['foo/src/lib.mys', 'foo/src/mod.mys'],
+                                     add_type='u8')
+
+    def test_transpile_with_interfaces(self):
+        name = 'test_transpile_with_interfaces'
+        remove_build_directory(name)
+        generated = transpile(create_sources())
+        interfaces = {}
+
+        for source in create_sources():
+            path = f'tests/build/{name}/{source.module}.pickle'
+            write_interface(path, create_interface(source))
+            interfaces[source.module] = read_interface(path)
+
+        # Imported modules are only given as interfaces.
+        lib_source, mod_source, main_source = create_sources()
+        self.assertEqual(transpile([mod_source],
+                                   modules=['foo.mod'],
+                                   application_init=False,
+                                   interfaces=[interfaces['foo.lib']]),
+                         [generated[1]])
+        self.assertEqual(transpile([main_source],
+                                   interfaces=[
+                                       interfaces['foo.lib'],
+                                       interfaces['foo.mod']
+                                   ]),
+                         [generated[2]])
+
+    def test_module_key_extra(self):
+        source = create_sources()[2]
+        key = make_module_key(source, False, {}, {})
+
+        self.assertEqual(make_module_key(source, False, {}, {}, []), key)
+        self.assertEqual(make_module_key(source, False, {}, {}, ()), key)
+        self.assertEqual(
+            make_module_key(source, False, {}, {}, ('foo.lib', 'foo.main')),
+            make_module_key(source, False, {}, {}, ['foo.lib', 'foo.main']))
+        self.assertNotEqual(
+            make_module_key(source, False, {}, {}, ['foo.lib']),
+            key)
@@ -0,0 +1,58 @@
+from mys.transpiler import Source
+from mys.transpiler import TranspilerError
+from mys.transpiler import transpile
+
+from .utils import TestCase
+
+
+def create_sources(mod_body='    return add[i64](1, 2)\n'):
+    return [
+        Source('@generic(T)\n'
+               'func add(a: T, b: T) -> T:\n'
+               '    return a + b\n',
+               module='foo.lib',
+               module_hpp='foo/lib.mys.hpp',
+               mys_path='foo/src/lib.mys'),
+        Source('from foo import add\n'
+               'func mod1() -> i64:\n'
+               + mod_body,
+               module='foo.mod1',
+               module_hpp='foo/mod1.mys.hpp',
+               mys_path='foo/src/mod1.mys'),
+        Source('from foo import add\n'
+               'func mod2() -> u8:\n'
+               '    return add[u8](1, 2)\n',
+               module='foo.mod2',
+               module_hpp='foo/mod2.mys.hpp',
+               mys_path='foo/src/mod2.mys'),
+        Source('from foo.mod1 import mod1\n'
+               'from foo.mod2 import mod2\n'
+               'func main():\n'
+               '    print(mod1(), mod2())\n',
+               module='foo.main',
+               module_hpp='foo/main.mys.hpp',
+               mys_path='foo/src/main.mys',
+               has_main=True)
+    ]
+
+
+class Test(TestCase):
+
+    def test_same_output_as_sequential(self):
+        self.assertEqual(transpile(create_sources(), jobs=2),
+                         transpile(create_sources()))
+
+    def test_same_output_as_sequential_coverage(self):
+        self.assertEqual(transpile(create_sources(), coverage=True, jobs=2),
+                         transpile(create_sources(), coverage=True))
+
+    def test_error_in_worker(self):
+        with self.assertRaises(TranspilerError) as cm:
+            transpile(create_sources('    return add[i64](1, True)\n'), jobs=2)
+
+        self.assert_exception_string(
+            cm,
+            '  File "foo/src/mod1.mys", line 3\n'
+            '        return add[i64](1, True)\n'
+            '                           ^\n'
+            "CompileError: expected a 'i64', got a 'bool'\n")
@@ -0,0 +1,78 @@
+from mys.transpiler import Source
+from mys.transpiler import find_module_dependencies
+from mys.transpiler import transpile
+
+from .utils import TestCase
+from .utils import remove_build_directory
+
+
+def create_sources():
+    return [
+        Source('@generic(T)\n'
+               'func add(a: T, b: T) -> T:\n'
+               '    return a + b\n',
+               module='foo.lib',
+               module_hpp='foo/lib.mys.hpp',
+               mys_path='foo/src/lib.mys'),
+        Source('from foo import add\n'
+               'func mod1() -> i64:\n'
+               '    return add[i64](1, 2)\n',
+               module='foo.mod1',
+               module_hpp='foo/mod1.mys.hpp',
+               mys_path='foo/src/mod1.mys'),
+        Source('from foo import add\n'
+               'func mod2() -> u8:\n'
+               '    return add[u8](1, 2)\n',
+               module='foo.mod2',
+               module_hpp='foo/mod2.mys.hpp',
+               mys_path='foo/src/mod2.mys'),
+        Source('from foo.mod1 import mod1\n'
+               'from foo.mod2 import mod2\n'
+               'func main():\n'
+               '    print(mod1(), mod2())\n',
+               module='foo.main',
+               module_hpp='foo/main.mys.hpp',
+               mys_path='foo/src/main.mys',
+               has_main=True)
+    ]
+
+
+class Test(TestCase):
+
+    def assert_modules(self, cache_directory=None):
+        generated = transpile(create_sources())
+
+        # Same sources per module as in the generated Makefile.
+        for i, sources in [(0, [0, 1, 2, 3]), (1, [0, 1]), (2, [0, 2])]:
+            module_generated = transpile(
+                [create_sources()[j] for j in sources],
+                cache_directory=cache_directory,
+                modules=[create_sources()[i].module],
+                application_init=False)
+            self.assertEqual(module_generated[sources.index(i)], generated[i])
+            self.assertEqual(module_generated.count(None), len(sources) - 1)
+
+        self.assertEqual(transpile(create_sources(),
+                                   cache_directory=cache_directory,
+                                   modules=['foo.main']),
+                         [None, None, None, generated[3]])
+
+    def test_transpile_one_module_at_a_time(self):
+        self.assert_modules()
+
+    def test_transpile_one_module_at_a_time_cached(self):
+        name = 'test_transpile_one_module_at_a_time_cached'
+        remove_build_directory(name)
+        cache_directory = f'tests/build/{name}'
+
+        self.assert_modules(cache_directory)
+        self.assert_modules(cache_directory)
+
+    def test_find_module_dependencies(self):
+        sources = create_sources()
+
+        self.assertEqual(find_module_dependencies(sources[0]), ([], True))
+        self.assertEqual(find_module_dependencies(sources[1]),
+                         (['foo.lib'], False))
+        self.assertEqual(find_module_dependencies(sources[3]),
+                         (['foo.mod1', 'foo.mod2'], False))
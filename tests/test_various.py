@@ -742,7 +742,9 @@ class Test(TestCase):
                                   'func bar():\n'
                                   '    foo()\n')
 
-        self.assert_in('foo(mys::String("hi"))', source)
+        self.assert_in('static const mys::String __constant_2 = mys::String("hi");',
+                       source)
+        self.assert_in('foo(__constant_2)', source)
 
     def test_inline_constant_default_class_parameter_value_none(self):
         source = transpile_source('class Foo:\n'